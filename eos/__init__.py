@@ -23,7 +23,7 @@ __all__ = [
     'JsonCacheHandler', 'TypeFetchError',
     'EffectMode', 'Restriction', 'State',
     'JsonDataHandler', 'SQLiteDataHandler',
-    'Fit',
+    'Fit', 'Fleet',
     'Booster', 'Character', 'Charge', 'Drone', 'EffectBeacon', 'FighterSquad',
     'Implant', 'ModuleHigh', 'ModuleMid', 'ModuleLow', 'Rig', 'Ship', 'Skill',
     'Stance', 'Subsystem',
@@ -32,41 +32,75 @@ __all__ = [
     'ValidationError',
     'SolarSystem',
     'SourceManager',
-    'Coordinates', 'DmgProfile', 'Orientation', 'ResistProfile'
+    'Coordinates', 'DmgProfile', 'Orientation', 'ResistProfile', 'TgtData'
 ]
 __version__ = '0.0.0.dev10'
 
 
-from eos.cache_handler import JsonCacheHandler
-from eos.cache_handler import TypeFetchError
-from eos.const.eos import EffectMode
-from eos.const.eos import Restriction
-from eos.const.eos import State
-from eos.data_handler import JsonDataHandler
-from eos.data_handler import SQLiteDataHandler
-from eos.fit import Fit
-from eos.item import Booster
-from eos.item import Character
-from eos.item import Charge
-from eos.item import Drone
-from eos.item import EffectBeacon
-from eos.item import FighterSquad
-from eos.item import Implant
-from eos.item import ModuleHigh
-from eos.item import ModuleLow
-from eos.item import ModuleMid
-from eos.item import Rig
-from eos.item import Ship
-from eos.item import Skill
-from eos.item import Stance
-from eos.item import Subsystem
-from eos.item.exception import NoSuchAbilityError
-from eos.item.exception import NoSuchSideEffectError
-from eos.item_container import SlotTakenError
-from eos.restriction import ValidationError
-from eos.solar_system import SolarSystem
-from eos.source import SourceManager
-from eos.stats_container import Coordinates
-from eos.stats_container import DmgProfile
-from eos.stats_container import Orientation
-from eos.stats_container import ResistProfile
+import sys
+from importlib import import_module
+
+
+# Public names are imported on first access, thus importing the package itself
+# is cheap
+# Format: {public name: name of module which defines it}
+_lazy_names = {
+    'JsonCacheHandler': 'eos.cache_handler',
+    'TypeFetchError': 'eos.cache_handler',
+    'EffectMode': 'eos.const.eos',
+    'Restriction': 'eos.const.eos',
+    'State': 'eos.const.eos',
+    'JsonDataHandler': 'eos.data_handler',
+    'SQLiteDataHandler': 'eos.data_handler',
+    'Fit': 'eos.fit',
+    'Fleet': 'eos.fleet',
+    'Booster': 'eos.item',
+    'Character': 'eos.item',
+    'Charge': 'eos.item',
+    'Drone': 'eos.item',
+    'EffectBeacon': 'eos.item',
+    'FighterSquad': 'eos.item',
+    'Implant': 'eos.item',
+    'ModuleHigh': 'eos.item',
+    'ModuleLow': 'eos.item',
+    'ModuleMid': 'eos.item',
+    'Rig': 'eos.item',
+    'Ship': 'eos.item',
+    'Skill': 'eos.item',
+    'Stance': 'eos.item',
+    'Subsystem': 'eos.item',
+    'NoSuchAbilityError': 'eos.item.exception',
+    'NoSuchSideEffectError': 'eos.item.exception',
+    'SlotTakenError': 'eos.item_container',
+    'ValidationError': 'eos.restriction',
+    'SolarSystem': 'eos.solar_system',
+    'SourceManager': 'eos.source',
+    'Coordinates': 'eos.stats_container',
+    'DmgProfile': 'eos.stats_container',
+    'Orientation': 'eos.stats_container',
+    'ResistProfile': 'eos.stats_container',
+    'TgtData': 'eos.stats_container'}
+
+
+def __getattr__(name):
+    try:
+        module_name = _lazy_names[name]
+    except KeyError:
+        msg = 'module {!r} has no attribute {!r}'.format(__name__, name)
+        raise AttributeError(msg) from None
+    value = getattr(import_module(module_name), name)
+    # Store imported object to avoid going through this function again
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()).union(__all__))
+
+
+# Module-level __getattr__ is supported only since python 3.7, older versions
+# get all the public names imported right away
+if sys.version_info < (3, 7):
+    for _name in __all__:
+        __getattr__(_name)
+    del _name
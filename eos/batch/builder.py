@@ -0,0 +1,102 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos.const.eos import State
+from eos.fit import Fit
+from eos.item import Booster
+from eos.item import Character
+from eos.item import Charge
+from eos.item import Drone
+from eos.item import FighterSquad
+from eos.item import Implant
+from eos.item import ModuleHigh
+from eos.item import ModuleLow
+from eos.item import ModuleMid
+from eos.item import Rig
+from eos.item import Ship
+from eos.item import Skill
+from eos.item import Stance
+from eos.item import Subsystem
+
+
+def build_fit(description, solar_system=None):
+    """Build fit according to passed description.
+
+    Args:
+        description: FitDescription instance.
+        solar_system (optional): Solar system fit should be added to. If not
+            specified, new solar system with default source is used.
+
+    Returns:
+        Fit instance.
+    """
+    fit = Fit(solar_system=solar_system)
+    if description.character_type_id is not None:
+        fit.character = Character(description.character_type_id)
+    if description.ship_type_id is not None:
+        fit.ship = Ship(description.ship_type_id)
+    if description.stance_type_id is not None:
+        fit.stance = Stance(description.stance_type_id)
+    for container, module_class, module_descriptions in (
+        (fit.modules.high, ModuleHigh, description.high),
+        (fit.modules.mid, ModuleMid, description.mid),
+        (fit.modules.low, ModuleLow, description.low)
+    ):
+        for index, module_description in enumerate(module_descriptions):
+            if module_description is None:
+                continue
+            container.place(index, _make_module(
+                module_class, module_description))
+    for container, item_class, type_ids in (
+        (fit.rigs, Rig, description.rigs),
+        (fit.subsystems, Subsystem, description.subsystems),
+        (fit.implants, Implant, description.implants),
+        (fit.boosters, Booster, description.boosters)
+    ):
+        for type_id in type_ids:
+            container.add(item_class(type_id))
+    for container, item_class, item_descriptions in (
+        (fit.drones, Drone, description.drones),
+        (fit.fighters, FighterSquad, description.fighters)
+    ):
+        for item_description in item_descriptions:
+            type_id, state = _unpack(item_description, 2)
+            container.add(item_class(type_id, state=state))
+    for type_id, level in description.skills.items():
+        fit.skills.add(Skill(type_id, level=level))
+    return fit
+
+
+def _make_module(module_class, module_description):
+    type_id, state, charge_type_id = _unpack(module_description, 3)
+    charge = Charge(charge_type_id) if charge_type_id is not None else None
+    return module_class(type_id, state=state, charge=charge)
+
+
+def _unpack(item_description, length):
+    """Unpack item description into (type ID, state, ...) tuple.
+
+    Fields which are not specified are filled with offline state and Nones.
+    """
+    if not isinstance(item_description, tuple):
+        item_description = (item_description,)
+    defaults = (None, State.offline) + (None,) * (length - 2)
+    return item_description + defaults[len(item_description):length]
@@ -0,0 +1,71 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos.util.repr import make_repr_str
+
+
+class FitDescription:
+    """Lightweight picklable description of a fit.
+
+    Contains only type IDs and states, and is used to build actual fits in
+    batch evaluation workers.
+
+    Args:
+        ship_type_id (optional): Type ID of ship.
+        high (optional): Iterable with high-slot module descriptions. Every
+            description can be type ID, (type ID, state) or (type ID, state,
+            charge type ID) tuple; None stands for empty slot.
+        mid (optional): Iterable with mid-slot module descriptions.
+        low (optional): Iterable with low-slot module descriptions.
+        rigs (optional): Iterable with rig type IDs.
+        subsystems (optional): Iterable with subsystem type IDs.
+        drones (optional): Iterable with drone descriptions. Every description
+            can be type ID or (type ID, state) tuple.
+        fighters (optional): Iterable with fighter squad descriptions, in the
+            same format as drone descriptions.
+        implants (optional): Iterable with implant type IDs.
+        boosters (optional): Iterable with booster type IDs.
+        skills (optional): Map in {skill type ID: skill level} format.
+        character_type_id (optional): Type ID of character.
+        stance_type_id (optional): Type ID of tactical destroyer stance.
+    """
+
+    def __init__(
+            self, ship_type_id=None, high=(), mid=(), low=(), rigs=(),
+            subsystems=(), drones=(), fighters=(), implants=(), boosters=(),
+            skills=None, character_type_id=None, stance_type_id=None):
+        self.ship_type_id = ship_type_id
+        self.high = tuple(high)
+        self.mid = tuple(mid)
+        self.low = tuple(low)
+        self.rigs = tuple(rigs)
+        self.subsystems = tuple(subsystems)
+        self.drones = tuple(drones)
+        self.fighters = tuple(fighters)
+        self.implants = tuple(implants)
+        self.boosters = tuple(boosters)
+        self.skills = dict(skills or {})
+        self.character_type_id = character_type_id
+        self.stance_type_id = stance_type_id
+
+    def __repr__(self):
+        spec = ['ship_type_id', 'high', 'mid', 'low']
+        return make_repr_str(self, spec)
@@ -0,0 +1,237 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import gc
+import multiprocessing
+from collections import deque
+from collections import namedtuple
+from itertools import islice
+from logging import getLogger
+
+from eos.restriction import ValidationError
+from eos.solar_system import SolarSystem
+from eos.source import SourceManager
+from .builder import build_fit
+
+
+logger = getLogger(__name__)
+
+
+FitResult = namedtuple(
+    'FitResult', ('valid', 'errors', 'stats', 'exception'))
+
+
+def _get_resource(name):
+    def getter(fit):
+        stats = getattr(fit.stats, name)
+        return (stats.used, stats.output)
+    return getter
+
+
+# Stats which are collected by default
+# Format: {stat name: function which takes fit and returns picklable value}
+STAT_GETTERS = {
+    'cpu': _get_resource('cpu'),
+    'powergrid': _get_resource('powergrid'),
+    'calibration': _get_resource('calibration'),
+    'dronebay': _get_resource('dronebay'),
+    'drone_bandwidth': _get_resource('drone_bandwidth'),
+    'hp': lambda fit: fit.stats.hp,
+    'ehp': lambda fit: fit.stats.get_ehp(),
+    'worst_case_ehp': lambda fit: fit.stats.worst_case_ehp,
+    'volley': lambda fit: fit.stats.get_volley(),
+    'dps': lambda fit: fit.stats.get_dps(),
+    'align_time': lambda fit: fit.stats.align_time}
+
+
+class _EvaluationConfig:
+    """Everything worker needs to know to evaluate fits."""
+
+    def __init__(self, source, stat_getters, skip_checks, collect_errors):
+        self.source = source
+        self.stat_getters = stat_getters
+        self.skip_checks = skip_checks
+        self.collect_errors = collect_errors
+
+
+# Evaluation config of worker process, set by pool initializer
+_worker_config = None
+
+
+def _init_worker(config):
+    global _worker_config
+    _worker_config = config
+
+
+def _evaluate_chunk(descriptions, config=None):
+    """Evaluate chunk of fit descriptions.
+
+    Returns:
+        List with FitResult instances, in the same order as descriptions.
+    """
+    if config is None:
+        config = _worker_config
+    return [_evaluate(description, config) for description in descriptions]
+
+
+def _evaluate(description, config):
+    try:
+        fit = build_fit(description, SolarSystem(config.source))
+        if config.collect_errors:
+            try:
+                fit.validate(config.skip_checks)
+            except ValidationError as e:
+                valid = False
+                # Items are bound to worker process, thus report only types
+                # of failed restrictions
+                errors = frozenset(
+                    restriction_type
+                    for item_errors in e.args[0].values()
+                    for restriction_type in item_errors)
+            else:
+                valid = True
+                errors = frozenset()
+        else:
+            valid = fit.is_valid(config.skip_checks)
+            errors = None
+        stats = {
+            name: getter(fit)
+            for name, getter in config.stat_getters.items()}
+    except Exception as e:
+        return FitResult(
+            valid=False, errors=None, stats=None, exception=repr(e))
+    return FitResult(valid=valid, errors=errors, stats=stats, exception=None)
+
+
+class BatchEvaluator:
+    """Evaluates many fits in parallel.
+
+    Source data is loaded only once in the parent process, and worker processes
+    are forked from it, sharing loaded data in copy-on-write fashion. Objects
+    which exist at fork time are frozen by garbage collector, to keep it from
+    touching (and thus copying) memory pages with source data in workers.
+
+    Args:
+        source (optional): Source instance or alias which is used to build
+            fits. If not specified, default source is used.
+        workers (optional): Quantity of worker processes. If not specified,
+            CPU count is used. If 0, fits are evaluated in current process.
+        stat_getters (optional): Map in {stat name: function} format, where
+            function takes fit and returns picklable stat value. By default,
+            STAT_GETTERS are used.
+        skip_checks (optional): Iterable with restriction types validation
+            should ignore.
+        collect_errors (optional): If True, types of failed restrictions are
+            collected. If False, fail-fast validity check is used and errors of
+            results are None.
+        chunk_size (optional): Quantity of fits sent to worker at once.
+        max_pending_chunks (optional): Maximum quantity of chunks which can be
+            submitted to workers but not yet consumed. When this limit is
+            reached, reading of fit descriptions is suspended until results
+            are consumed. By default, it is double quantity of workers.
+    """
+
+    def __init__(
+            self, source=None, workers=None, stat_getters=None,
+            skip_checks=(), collect_errors=True, chunk_size=64,
+            max_pending_chunks=None):
+        if source is None:
+            source = SourceManager.default
+        elif isinstance(source, str):
+            source = SourceManager.get(source)
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        if stat_getters is None:
+            stat_getters = STAT_GETTERS
+        if max_pending_chunks is None:
+            max_pending_chunks = max(workers, 1) * 2
+        self.__config = _EvaluationConfig(
+            source=source,
+            stat_getters=dict(stat_getters),
+            skip_checks=frozenset(skip_checks),
+            collect_errors=collect_errors)
+        self.__workers = workers
+        self.__chunk_size = chunk_size
+        self.__max_pending_chunks = max_pending_chunks
+
+    def evaluate(self, descriptions):
+        """Evaluate fits.
+
+        Args:
+            descriptions: Iterable with FitDescription instances. It is
+                consumed lazily, so it can be a generator.
+
+        Yields:
+            FitResult instances, in the same order as descriptions were passed.
+        """
+        chunks = self.__iter_chunks(descriptions)
+        if self.__workers == 0:
+            for chunk in chunks:
+                yield from _evaluate_chunk(chunk, self.__config)
+            return
+        try:
+            context = multiprocessing.get_context('fork')
+        except ValueError:
+            logger.warning(
+                'fork start method is not available, '
+                'evaluating fits in current process')
+            for chunk in chunks:
+                yield from _evaluate_chunk(chunk, self.__config)
+            return
+        pool = self.__start_pool(context)
+        try:
+            # Format: deque([async results])
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.apply_async(_evaluate_chunk, (chunk,)))
+                # Wait for results to be consumed before sending more work
+                if len(pending) >= self.__max_pending_chunks:
+                    yield from pending.popleft().get()
+            while pending:
+                yield from pending.popleft().get()
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def __start_pool(self, context):
+        # Move everything which exists now, including source data, into
+        # permanent generation, which is never scanned by garbage collector.
+        # Permanent generation is available only since python 3.7
+        freeze = hasattr(gc, 'freeze')
+        if freeze:
+            gc.collect()
+            gc.freeze()
+        try:
+            return context.Pool(
+                self.__workers,
+                initializer=_init_worker,
+                initargs=(self.__config,))
+        finally:
+            if freeze:
+                gc.unfreeze()
+
+    def __iter_chunks(self, descriptions):
+        descriptions = iter(descriptions)
+        while True:
+            chunk = list(islice(descriptions, self.__chunk_size))
+            if not chunk:
+                return
+            yield chunk
@@ -23,17 +23,21 @@ import bz2
 import json
 import os
 from logging import getLogger
+from weakref import WeakValueDictionary
 
 from eos.eve_obj.attribute import AttrFactory
 from eos.eve_obj.effect import EffectFactory
 from eos.eve_obj.modifier import DogmaModifier
 from eos.eve_obj.type import AbilityData
 from eos.eve_obj.type import TypeFactory
+from eos.util.dense_attrs import AttrIndexer
+from eos.util.dense_attrs import PackedAttrMap
 from eos.util.repr import make_repr_str
 from .base import BaseCacheHandler
 from .exception import AttrFetchError
 from .exception import EffectFetchError
 from .exception import TypeFetchError
+from .type_index import TypeIndex
 
 
 logger = getLogger(__name__)
@@ -47,16 +51,43 @@ class JsonCacheHandler(BaseCacheHandler):
     it provides extremely fast access, but has subpar initialization time and
     memory consumption.
 
+    Eve objects are shared between all instances of the handler: when contents
+    of an object are equal to contents of object loaded by another instance,
+    the latter is reused. As eve objects are never modified after they are
+    loaded, multiple sources with mostly identical data (e.g. Tranquility and
+    Singularity) take little memory on top of single source.
+
+    In dense attribute mode, every attribute ID is assigned dense index when
+    data is loaded, and attribute values of item types are packed into arrays.
+    Items based on such types store their calculated attribute values in arrays
+    keyed by the same indices. This mode takes considerably less memory, at the
+    cost of slightly slower attribute access.
+
     Args:
         cache_path: File path where persistent cache will be stored (.json.bz2).
+        dense_attrs (optional): Enables dense attribute mode. By default, it is
+            disabled.
     """
 
-    def __init__(self, cache_path):
+    # Objects which are no longer used by any instance are garbage collected
+    # Format: {(fingerprint, dense attribute mode): eve object}
+    _shared_objects = WeakValueDictionary()
+    # Indices are shared by all instances, as item types can be shared too
+    _attr_indexer = AttrIndexer()
+
+    def __init__(self, cache_path, dense_attrs=False):
         self._cache_path = os.path.abspath(cache_path)
+        self.__dense_attrs = dense_attrs
         # Initialize storage for objects
         self.__type_storage = {}
         self.__attr_storage = {}
         self.__effect_storage = {}
+        # Transitive skill requirements, calculated on demand
+        # Format: {type ID: {skill type ID: skill level}}
+        self.__skillrq_closures = {}
+        # Reverse indexes over item types, built on demand if they were not
+        # persisted with cache
+        self.__type_index = None
         self.__fingerprint = None
         # Fill memory cache with data, if possible
         self.__load_persistent_cache()
@@ -97,6 +128,124 @@ class JsonCacheHandler(BaseCacheHandler):
     def get_fingerprint(self):
         return self.__fingerprint
 
+    def find_type_ids(self, **criteria):
+        """Find item types which match all passed criteria.
+
+        Reverse indexes are used for search, they are built once per cache
+        fingerprint and persisted with the cache.
+
+        Args:
+            **criteria: Index names with keys to look for. Following indexes
+                are available: group, category, effect, charge_group,
+                charge_size, rig_size, can_fit_ship_type and
+                can_fit_ship_group. For example, find_type_ids(
+                effect=EffectId.hi_power, can_fit_ship_group=419) finds high
+                slot modules restricted to combat battlecruisers.
+
+        Returns:
+            Frozenset with IDs of matching item types.
+
+        Raises:
+            ValueError: If no criteria or unknown index name is passed.
+        """
+        if self.__type_index is None:
+            self.__type_index = TypeIndex.build(self.__type_storage.values())
+        return self.__type_index.find(**criteria)
+
+    def get_required_skills(self, type_id):
+        """Get transitive skill requirements of item type.
+
+        Besides direct requirements of the item type, requirements of required
+        skills are included, then requirements of their requirements, and so
+        on. Results are cached.
+
+        Args:
+            type_id: ID of item type.
+
+        Returns:
+            Map in {skill type ID: skill level} format, where level is the
+            highest level of the skill required anywhere in requirement tree.
+            Map is shared and should not be modified.
+
+        Raises:
+            TypeFetchError: If item type cannot be found.
+        """
+        try:
+            return self.__skillrq_closures[type_id]
+        except KeyError:
+            pass
+        return self.__get_skillrq_closure(self.get_type(type_id), set())[0]
+
+    def get_missing_skills(self, skill_levels, type_ids):
+        """Check skill levels against requirements of many item types at once.
+
+        Transitive requirements of item types are taken into account.
+
+        Args:
+            skill_levels: Map in {skill type ID: skill level} format, which
+                describes skills of a character.
+            type_ids: Iterable with IDs of item types to check.
+
+        Returns:
+            Map in {type ID: {skill type ID: required skill level}} format.
+            Only item types whose requirements are not met are included, and
+            only unmet requirements are listed for them.
+
+        Raises:
+            TypeFetchError: If any of item types cannot be found.
+        """
+        missing_skills = {}
+        for type_id in set(type_ids):
+            type_missing_skills = {}
+            for skill_type_id, skill_level in (
+                self.get_required_skills(type_id).items()
+            ):
+                if skill_levels.get(skill_type_id, 0) < skill_level:
+                    type_missing_skills[skill_type_id] = skill_level
+            if type_missing_skills:
+                missing_skills[type_id] = type_missing_skills
+        return missing_skills
+
+    def __get_skillrq_closure(self, item_type, path_type_ids):
+        """Get transitive skill requirements of item type.
+
+        Args:
+            item_type: Item type to get requirements for.
+            path_type_ids: Set with IDs of item types which are being resolved
+                on current requirement path, used to guard against circular
+                requirements in broken data.
+
+        Returns:
+            Tuple in (closure, completeness flag) format. Closures which were
+            cut short by circular requirement guard are not complete, and are
+            not cached.
+        """
+        try:
+            return self.__skillrq_closures[item_type.id], True
+        except KeyError:
+            pass
+        closure = dict(item_type.required_skills)
+        complete = True
+        path_type_ids.add(item_type.id)
+        for skill_type_id in item_type.required_skills:
+            if skill_type_id in path_type_ids:
+                complete = False
+                continue
+            try:
+                skill_type = self.__type_storage[skill_type_id]
+            except KeyError:
+                continue
+            skill_closure, skill_complete = self.__get_skillrq_closure(
+                skill_type, path_type_ids)
+            complete = complete and skill_complete
+            for skillrq_type_id, skillrq_level in skill_closure.items():
+                if skillrq_level > closure.get(skillrq_type_id, 0):
+                    closure[skillrq_type_id] = skillrq_level
+        path_type_ids.remove(item_type.id)
+        if complete:
+            self.__skillrq_closures[item_type.id] = closure
+        return closure, complete
+
     def __load_persistent_cache(self):
         # If cache file doesn't exist, bail out - we have nothing to read
         if not os.path.exists(self._cache_path):
@@ -123,8 +272,12 @@ class JsonCacheHandler(BaseCacheHandler):
             'attrs': [self.__attr_compress(attr) for attr in attrs],
             'effects': [self.__effect_compress(effect) for effect in effects],
             'fingerprint': fingerprint}
-        self.__update_persistent_cache(cache_data)
         self.__update_memory_cache(cache_data)
+        # Indexes are built from loaded item types, as they might be altered
+        # by customizations
+        self.__type_index = TypeIndex.build(self.__type_storage.values())
+        cache_data['type_index'] = self.__type_index.compress()
+        self.__update_persistent_cache(cache_data)
 
     def __update_persistent_cache(self, cache_data):
         """Write passed data to persistent storage."""
@@ -141,18 +294,47 @@ class JsonCacheHandler(BaseCacheHandler):
         self.__type_storage.clear()
         self.__attr_storage.clear()
         self.__effect_storage.clear()
+        self.__skillrq_closures.clear()
+        # Assign indices before item types are composed, in attribute ID order
+        # to make them independent from order of data
+        if self.__dense_attrs:
+            for attr_id in sorted(a[0] for a in cache_data['attrs']):
+                self._attr_indexer.get_index(attr_id)
         # Process effects first, as item types rely on effects being available
         for effect_data in cache_data['effects']:
-            effect = self.__effect_decompress(effect_data)
+            effect = self.__share(self.__effect_decompress(effect_data))
             self.__effect_storage[effect.id] = effect
         for type_data in cache_data['types']:
-            item_type = self.__type_decompress(type_data)
+            # Item types with packed attributes are shared only with item
+            # types which have them packed as well
+            item_type = self.__share(
+                self.__type_decompress(type_data), self.__dense_attrs)
             self.__type_storage[item_type.id] = item_type
         for attr_data in cache_data['attrs']:
-            attr = self.__attr_decompress(attr_data)
+            attr = self.__share(self.__attr_decompress(attr_data))
             self.__attr_storage[attr.id] = attr
+        # Caches written by older versions do not have indexes
+        try:
+            index_data = cache_data['type_index']
+        except KeyError:
+            self.__type_index = None
+        else:
+            self.__type_index = TypeIndex.decompress(index_data)
         self.__fingerprint = cache_data['fingerprint']
 
+    @classmethod
+    def __share(cls, eve_obj, dense_attrs=False):
+        """Get shared object with the same contents as passed object.
+
+        If there's no such object yet, passed object becomes shared.
+        """
+        key = (eve_obj._fingerprint, dense_attrs)
+        shared_obj = cls._shared_objects.get(key)
+        if shared_obj is None:
+            cls._shared_objects[key] = eve_obj
+            shared_obj = eve_obj
+        return shared_obj
+
     # Entity compression/decompression methods
     def __type_compress(self, item_type):
         """Compress item type into python primitives."""
@@ -177,11 +359,14 @@ class JsonCacheHandler(BaseCacheHandler):
             default_effect = None
         else:
             default_effect = self.get_effect(default_effect_id)
+        attrs = {k: v for k, v in type_data[3]}
+        if self.__dense_attrs:
+            attrs = PackedAttrMap(attrs, self._attr_indexer)
         item_type = TypeFactory.make(
             type_id=type_data[0],
             group_id=type_data[1],
             category_id=type_data[2],
-            attrs={k: v for k, v in type_data[3]},
+            attrs=attrs,
             effects=tuple(self.get_effect(eid) for eid in type_data[4]),
             default_effect=default_effect,
             abilities_data={k: AbilityData(*v) for k, v in type_data[6]})
@@ -0,0 +1,169 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos.const.eve import AttrId
+
+
+# Attributes whose values are used as index keys
+# Format: {index name: (attribute IDs)}
+ATTR_INDEXES = {
+    'charge_group': (
+        AttrId.charge_group_1,
+        AttrId.charge_group_2,
+        AttrId.charge_group_3,
+        AttrId.charge_group_4,
+        AttrId.charge_group_5),
+    'charge_size': (AttrId.charge_size,),
+    'rig_size': (AttrId.rig_size,),
+    'can_fit_ship_type': (
+        AttrId.can_fit_ship_type_1,
+        AttrId.can_fit_ship_type_2,
+        AttrId.can_fit_ship_type_3,
+        AttrId.can_fit_ship_type_4,
+        AttrId.can_fit_ship_type_5,
+        AttrId.can_fit_ship_type_6,
+        AttrId.can_fit_ship_type_7,
+        AttrId.can_fit_ship_type_8,
+        AttrId.can_fit_ship_type_9,
+        AttrId.can_fit_ship_type_10,
+        AttrId.fits_to_shiptype),
+    'can_fit_ship_group': (
+        AttrId.can_fit_ship_group_1,
+        AttrId.can_fit_ship_group_2,
+        AttrId.can_fit_ship_group_3,
+        AttrId.can_fit_ship_group_4,
+        AttrId.can_fit_ship_group_5,
+        AttrId.can_fit_ship_group_6,
+        AttrId.can_fit_ship_group_7,
+        AttrId.can_fit_ship_group_8,
+        AttrId.can_fit_ship_group_9,
+        AttrId.can_fit_ship_group_10,
+        AttrId.can_fit_ship_group_11,
+        AttrId.can_fit_ship_group_12,
+        AttrId.can_fit_ship_group_13,
+        AttrId.can_fit_ship_group_14,
+        AttrId.can_fit_ship_group_15,
+        AttrId.can_fit_ship_group_16,
+        AttrId.can_fit_ship_group_17,
+        AttrId.can_fit_ship_group_18,
+        AttrId.can_fit_ship_group_19,
+        AttrId.can_fit_ship_group_20)}
+
+INDEX_NAMES = (
+    'group', 'category', 'effect', *ATTR_INDEXES)
+
+
+class TypeIndex:
+    """Reverse indexes over item types.
+
+    Allows to find item types by group, category, effect and by values of some
+    attributes, e.g. charge group or ship group item type can be fitted to,
+    without going through all item types.
+
+    Args:
+        index_data: Map in {index name: {key: {type IDs}}} format.
+    """
+
+    def __init__(self, index_data):
+        self.__index_data = {
+            index_name: {
+                key: frozenset(type_ids)
+                for key, type_ids in index_data.get(index_name, {}).items()}
+            for index_name in INDEX_NAMES}
+
+    @classmethod
+    def build(cls, types):
+        """Build indexes from item types.
+
+        Args:
+            types: Iterable with item types.
+
+        Returns:
+            TypeIndex instance.
+        """
+        index_data = {index_name: {} for index_name in INDEX_NAMES}
+        for item_type in types:
+            type_keys = {
+                'group': (item_type.group_id,),
+                'category': (item_type.category_id,),
+                'effect': item_type.effects.keys()}
+            for index_name, attr_ids in ATTR_INDEXES.items():
+                type_keys[index_name] = (
+                    item_type.attrs[attr_id]
+                    for attr_id in attr_ids
+                    if attr_id in item_type.attrs)
+            for index_name, keys in type_keys.items():
+                index = index_data[index_name]
+                for key in keys:
+                    if key is None:
+                        continue
+                    index.setdefault(cls.__normalize_key(key), set()).add(
+                        item_type.id)
+        return cls(index_data)
+
+    def find(self, **criteria):
+        """Find item types which match all passed criteria.
+
+        Args:
+            **criteria: Index names with keys to look for, e.g. group=74,
+                effect=EffectId.hi_power.
+
+        Returns:
+            Frozenset with IDs of matching item types.
+
+        Raises:
+            ValueError: If no criteria or unknown index name is passed.
+        """
+        if not criteria:
+            raise ValueError('at least one criterion should be specified')
+        results = []
+        for index_name, key in criteria.items():
+            try:
+                index = self.__index_data[index_name]
+            except KeyError:
+                msg = 'unknown index "{}"'.format(index_name)
+                raise ValueError(msg)
+            results.append(index.get(self.__normalize_key(key), frozenset()))
+        # Start intersection from the smallest set
+        results.sort(key=len)
+        return frozenset(results[0]).intersection(*results[1:])
+
+    def compress(self):
+        """Compress indexes into JSON-serializable python primitives."""
+        return {
+            index_name: [
+                [key, sorted(type_ids)] for key, type_ids in index.items()]
+            for index_name, index in self.__index_data.items()}
+
+    @classmethod
+    def decompress(cls, index_data):
+        """Reconstruct indexes from python primitives."""
+        return cls({
+            index_name: {key: type_ids for key, type_ids in index}
+            for index_name, index in index_data.items()})
+
+    @staticmethod
+    def __normalize_key(key):
+        # Attribute values are floats in data, while in criteria integer IDs
+        # are normally passed
+        if isinstance(key, float) and key.is_integer():
+            return int(key)
+        return key
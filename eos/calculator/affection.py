@@ -19,6 +19,7 @@
 # ==============================================================================
 
 
+from itertools import chain
 from logging import getLogger
 
 from eos.const.eos import EosTypeId
@@ -34,81 +35,101 @@ from .exception import UnknownAffecteeFilterError
 logger = getLogger(__name__)
 
 
-class AffectionRegister:
-    """Keeps track of connections between affector specs and affectee items.
+class FitAffections:
+    """Keeps affection data which relates to items of single fit.
 
-    Having information about such connections is a hard requirement for
-    efficient partial attribute recalculation.
+    Affectee items are stored in partition of fit they belong to, as well as
+    affector specs which influence them, regardless of which fit affector items
+    belong to. Exceptions are 'other' and fleet-wide affector specs, which are
+    stored in partition of fit their affector items belong to.
     """
 
     def __init__(self):
         # All known affectee items
         # Format: {affectee items}
-        self.__affectees = set()
+        self.affectees = set()
 
-        # Items belonging to certain fit and domain
-        # Format: {(affectee fit, affectee domain): {affectee items}}
-        self.__affectees_domain = KeyedStorage()
+        # Items belonging to certain domain
+        # Format: {affectee domain: {affectee items}}
+        self.affectees_domain = KeyedStorage()
 
-        # Items belonging to certain fit, domain and group
-        # Format: {(affectee fit, affectee domain, affectee group ID): {affectee
-        # items}}
-        self.__affectees_domain_group = KeyedStorage()
+        # Items belonging to certain domain and group
+        # Format: {(affectee domain, affectee group ID): {affectee items}}
+        self.affectees_domain_group = KeyedStorage()
 
-        # Items belonging to certain fit and domain, and having certain skill
+        # Items belonging to certain domain, and having certain skill
         # requirement
-        # Format: {(affectee fit, affectee domain, affectee skill requirement
-        # type ID): {affectee items}}
-        self.__affectees_domain_skillrq = KeyedStorage()
+        # Format: {(affectee domain, affectee skill requirement type ID):
+        # {affectee items}}
+        self.affectees_domain_skillrq = KeyedStorage()
 
-        # Owner-modifiable items which belong to certain fit and have certain
-        # skill requirement
-        # Format: {(affectee fit, affectee skill requirement type ID): {affectee
-        # items}}
-        self.__affectees_owner_skillrq = KeyedStorage()
+        # Owner-modifiable items which have certain skill requirement
+        # Format: {affectee skill requirement type ID: {affectee items}}
+        self.affectees_owner_skillrq = KeyedStorage()
 
         # Affector specs with modifiers which affect 'other' location are always
         # stored here, regardless if they actually affect something or not
         # Format: {affector item: {affector specs}}
-        self.__affectors_item_other = KeyedStorage()
+        self.affectors_item_other = KeyedStorage()
 
         # Affector specs which should affect only one item (ship, character or
         # self), when this item is not registered as affectee
-        # Format: {affectee fit: {affector specs}}
-        self.__affectors_item_awaiting = KeyedStorage()
+        # Format: {affectee domain: {affector specs}}
+        self.affectors_item_awaiting = KeyedStorage()
 
         # All active affector specs which affect one specific item (via ship,
         # character, other reference or self) are kept here
         # Format: {affectee item: {affector specs}}
-        self.__affectors_item_active = KeyedStorage()
-
-        # Affector specs influencing all items belonging to certain fit and
-        # domain
-        # Format: {(affectee fit, affectee domain): {affector specs}}
-        self.__affectors_domain = KeyedStorage()
-
-        # Affector specs influencing items belonging to certain fit, domain and
-        # group
-        # Format: {(affectee fit, affectee domain, affectee group ID): {affector
-        # specs}}
-        self.__affectors_domain_group = KeyedStorage()
-
-        # Affector specs influencing items belonging to certain fit and domain,
-        # and having certain skill requirement
-        # Format: {(affectee fit, affectee domain, affectee skill requirement
-        # type ID): {affector specs}}
-        self.__affectors_domain_skillrq = KeyedStorage()
-
-        # Affector specs influencing owner-modifiable items belonging to certain
-        # fit and having certain skill requirement
-        # Format: {(affectee fit, affectee skill requirement type ID): {affector
-        # specs}}
-        self.__affectors_owner_skillrq = KeyedStorage()
+        self.affectors_item_active = KeyedStorage()
+
+        # Affector specs influencing all items belonging to certain domain
+        # Format: {affectee domain: {affector specs}}
+        self.affectors_domain = KeyedStorage()
+
+        # Affector specs influencing items belonging to certain domain and group
+        # Format: {(affectee domain, affectee group ID): {affector specs}}
+        self.affectors_domain_group = KeyedStorage()
+
+        # Affector specs influencing items belonging to certain domain, and
+        # having certain skill requirement
+        # Format: {(affectee domain, affectee skill requirement type ID):
+        # {affector specs}}
+        self.affectors_domain_skillrq = KeyedStorage()
+
+        # Affector specs influencing owner-modifiable items having certain skill
+        # requirement
+        # Format: {affectee skill requirement type ID: {affector specs}}
+        self.affectors_owner_skillrq = KeyedStorage()
+
+        # Affector specs which are broadcast to all fits of fleet the fit
+        # belongs to. They are stored just once, regardless of fleet size, and
+        # are matched against affectee items when affector specs of an item are
+        # requested
+        # Format: {affectee filter: {affector specs}}
+        self.affectors_fleet = KeyedStorage()
+
+
+class AffectionRegister:
+    """Keeps track of connections between affector specs and affectee items.
+
+    Having information about such connections is a hard requirement for
+    efficient partial attribute recalculation. All the data is partitioned per
+    fit, which allows to add and remove fits in bulk.
+    """
+
+    def __init__(self):
+        # Format: {fit: fit affections}
+        self.__partitions = {}
 
     # Query methods
     def get_local_affectee_items(self, affector_spec):
         """Get iterable with items influenced by passed local affector spec."""
         try:
+            # Fleet-wide modifications are resolved against all fleet members
+            if affector_spec.modifier.affectee_domain == ModDomain.fleet:
+                affectee_fits = self.__get_fleet_fits(affector_spec.item._fit)
+                return self.__get_fleet_affectee_items(
+                    affector_spec, affectee_fits)
             affectee_filter = affector_spec.modifier.affectee_filter
             # Direct item modification needs to use local-specific getters
             if affectee_filter == ModAffecteeFilter.item:
@@ -138,7 +159,7 @@ class AffectionRegister:
         affectee_filter = affector_spec.modifier.affectee_filter
         # Return targeted items when modification affects just them directly
         if affectee_filter == ModAffecteeFilter.item:
-            return {i for i in tgt_items if i in self.__affectees}
+            return {i for i in tgt_items if self.__is_affectee(i)}
         # En-masse modifications of items located on targeted items use shared
         # affectee item getters
         else:
@@ -149,65 +170,111 @@ class AffectionRegister:
             affectee_fits = {i._fit for i in tgt_items if isinstance(i, Ship)}
             return getter(self, affector_spec, ModDomain.ship, affectee_fits)
 
+    def get_fleet_affections(self, fit):
+        """Get fleet-wide affections between passed fit and its fleetmates.
+
+        Returns:
+            Iterable with (affector spec, affectee item) tuples, where either
+            affector spec or affectee item belongs to passed fit, and the other
+            one belongs to some other fit of the fleet.
+        """
+        affections = []
+        fleetmates = [f for f in self.__get_fleet_fits(fit) if f is not fit]
+        if not fleetmates:
+            return affections
+        # What passed fit does to its fleetmates
+        for affector_spec in self.__get_fleet_affector_specs(fit):
+            for affectee_item in self.__get_fleet_affectee_items(
+                affector_spec, fleetmates
+            ):
+                affections.append((affector_spec, affectee_item))
+        # What fleetmates do to passed fit
+        for fleetmate in fleetmates:
+            for affector_spec in self.__get_fleet_affector_specs(fleetmate):
+                for affectee_item in self.__get_fleet_affectee_items(
+                    affector_spec, (fit,)
+                ):
+                    affections.append((affector_spec, affectee_item))
+        return affections
+
     def get_affector_specs(self, affectee_item):
         """Get all affector specs, which influence passed item."""
         affectee_fit = affectee_item._fit
         affector_specs = set()
-        # Item
-        affector_storage = self.__affectors_item_active
-        key = affectee_item
-        affector_specs.update(affector_storage.get(key, ()))
-        affectee_domain = affectee_item._modifier_domain
-        if affectee_domain is not None:
-            # Domain
-            affector_storage = self.__affectors_domain
-            key = (affectee_fit, affectee_domain)
-            affector_specs.update(affector_storage.get(key, ()))
-            # Domain and group
-            affector_storage = self.__affectors_domain_group
-            key = (affectee_fit, affectee_domain, affectee_item._type.group_id)
+        partition = self.__partitions.get(affectee_fit)
+        if partition is not None:
+            # Item
+            affector_storage = partition.affectors_item_active
+            key = affectee_item
             affector_specs.update(affector_storage.get(key, ()))
-            # Domain and skill requirement
-            affector_storage = self.__affectors_domain_skillrq
-            for affectee_srq_type_id in affectee_item._type.required_skills:
-                key = (affectee_fit, affectee_domain, affectee_srq_type_id)
+            affectee_domain = affectee_item._modifier_domain
+            if affectee_domain is not None:
+                # Domain
+                affector_storage = partition.affectors_domain
+                key = affectee_domain
                 affector_specs.update(affector_storage.get(key, ()))
-        # Owner-modifiable and skill requirement
-        if affectee_item._owner_modifiable:
-            affector_storage = self.__affectors_owner_skillrq
-            for affectee_srq_type_id in affectee_item._type.required_skills:
-                key = (affectee_fit, affectee_srq_type_id)
+                # Domain and group
+                affector_storage = partition.affectors_domain_group
+                key = (affectee_domain, affectee_item._type.group_id)
                 affector_specs.update(affector_storage.get(key, ()))
+                # Domain and skill requirement
+                affector_storage = partition.affectors_domain_skillrq
+                for affectee_srq_type_id in affectee_item._type.required_skills:
+                    key = (affectee_domain, affectee_srq_type_id)
+                    affector_specs.update(affector_storage.get(key, ()))
+            # Owner-modifiable and skill requirement
+            if affectee_item._owner_modifiable:
+                affector_storage = partition.affectors_owner_skillrq
+                for affectee_srq_type_id in affectee_item._type.required_skills:
+                    key = affectee_srq_type_id
+                    affector_specs.update(affector_storage.get(key, ()))
+        # Fleet
+        for affector_fit in self.__get_fleet_fits(affectee_fit):
+            for affector_spec in self.__get_fleet_affector_specs(affector_fit):
+                if self.__is_fleet_affectee(affector_spec, affectee_item):
+                    affector_specs.add(affector_spec)
         return affector_specs
 
     # Maintenance methods
+    def register_fit(self, fit):
+        """Create storage partition for passed fit."""
+        self.__partitions[fit] = FitAffections()
+
+    def unregister_fit(self, fit):
+        """Remove all the data stored in partition of passed fit.
+
+        Affector specs of passed fit which are stored in partitions of other
+        fits, like projected ones, should be unregistered separately.
+        """
+        del self.__partitions[fit]
+
     def register_affectee_item(self, affectee_item):
         """Add passed affectee item to the register.
 
         We track affectee items to efficiently update attributes when set of
         items influencing them changes.
         """
-        self.__affectees.add(affectee_item)
-        affectee_fit = affectee_item._fit
+        partition = self.__partitions[affectee_item._fit]
+        partition.affectees.add(affectee_item)
         for key, storage in self.__get_affectee_storages(
-            affectee_fit, affectee_item
+            partition, affectee_item
         ):
             storage.add_data_entry(key, affectee_item)
         # Process special affector specs separately. E.g., when item like ship
         # is added, there might already be affector specs which should affect
         # it, and in this method we activate such affector specs
-        self.__activate_special_affector_specs(affectee_fit, affectee_item)
+        self.__activate_special_affector_specs(partition, affectee_item)
 
     def unregister_affectee_item(self, affectee_item):
         """Remove passed affectee item from the register."""
-        self.__affectees.remove(affectee_item)
-        affectee_fit = affectee_item._fit
+        partition = self.__partitions[affectee_item._fit]
+        partition.affectees.remove(affectee_item)
         for key, storage in self.__get_affectee_storages(
-            affectee_fit, affectee_item
+            partition, affectee_item
         ):
             storage.rm_data_entry(key, affectee_item)
         # Deactivate all special affector specs for item being unregistered
-        self.__deactivate_special_affector_specs(affectee_fit, affectee_item)
+        self.__deactivate_special_affector_specs(partition, affectee_item)
 
     def register_local_affector_spec(self, affector_spec):
         """Make the register aware of the local affector spec.
@@ -273,7 +340,7 @@ class AffectionRegister:
     def __get_local_affectees_character(self, affector_spec):
         affectee_fit = affector_spec.item._fit
         affectee_character = affectee_fit.character
-        if affectee_character in self.__affectees:
+        if self.__is_affectee(affectee_character):
             return affectee_character,
         else:
             return ()
@@ -281,13 +348,14 @@ class AffectionRegister:
     def __get_local_affectees_ship(self, affector_spec):
         affectee_fit = affector_spec.item._fit
         affectee_ship = affectee_fit.ship
-        if affectee_ship in self.__affectees:
+        if self.__is_affectee(affectee_ship):
             return affectee_ship,
         else:
             return ()
 
     def __get_local_affectees_other(self, affector_spec):
-        return [i for i in affector_spec.item._others if i in self.__affectees]
+        return [
+            i for i in affector_spec.item._others if self.__is_affectee(i)]
 
     __local_affectees_getters = {
         ModDomain.self: __get_local_affectees_self,
@@ -297,10 +365,9 @@ class AffectionRegister:
 
     def __get_affectees_domain(self, _, affectee_domain, affectee_fits):
         affectee_items = set()
-        storage = self.__affectees_domain
-        for affectee_fit in affectee_fits:
-            key = (affectee_fit, affectee_domain)
-            affectee_items.update(storage.get(key, ()))
+        key = affectee_domain
+        for partition in self.__iter_partitions(affectee_fits):
+            affectee_items.update(partition.affectees_domain.get(key, ()))
         return affectee_items
 
     def __get_affectees_domain_group(
@@ -308,34 +375,29 @@ class AffectionRegister:
     ):
         affectee_group_id = affector_spec.modifier.affectee_filter_extra_arg
         affectee_items = set()
-        storage = self.__affectees_domain_group
-        for affectee_fit in affectee_fits:
-            key = (affectee_fit, affectee_domain, affectee_group_id)
-            affectee_items.update(storage.get(key, ()))
+        key = (affectee_domain, affectee_group_id)
+        for partition in self.__iter_partitions(affectee_fits):
+            affectee_items.update(partition.affectees_domain_group.get(key, ()))
         return affectee_items
 
     def __get_affectees_domain_skillrq(
         self, affector_spec, affectee_domain, affectee_fits
     ):
-        affectee_srq_type_id = affector_spec.modifier.affectee_filter_extra_arg
-        if affectee_srq_type_id == EosTypeId.current_self:
-            affectee_srq_type_id = affector_spec.item._type_id
+        affectee_srq_type_id = self.__resolve_srq_type_id(affector_spec)
         affectee_items = set()
-        storage = self.__affectees_domain_skillrq
-        for affectee_fit in affectee_fits:
-            key = (affectee_fit, affectee_domain, affectee_srq_type_id)
-            affectee_items.update(storage.get(key, ()))
+        key = (affectee_domain, affectee_srq_type_id)
+        for partition in self.__iter_partitions(affectee_fits):
+            affectee_items.update(
+                partition.affectees_domain_skillrq.get(key, ()))
         return affectee_items
 
     def __get_affectees_owner_skillrq(self, affector_spec, _, affectee_fits):
-        affectee_srq_type_id = affector_spec.modifier.affectee_filter_extra_arg
-        if affectee_srq_type_id == EosTypeId.current_self:
-            affectee_srq_type_id = affector_spec.item._type_id
+        affectee_srq_type_id = self.__resolve_srq_type_id(affector_spec)
         affectee_items = set()
-        storage = self.__affectees_owner_skillrq
-        for affectee_fit in affectee_fits:
-            key = (affectee_fit, affectee_srq_type_id)
-            affectee_items.update(storage.get(key, ()))
+        key = affectee_srq_type_id
+        for partition in self.__iter_partitions(affectee_fits):
+            affectee_items.update(
+                partition.affectees_owner_skillrq.get(key, ()))
         return affectee_items
 
     __affectees_getters = {
@@ -344,8 +406,32 @@ class AffectionRegister:
         ModAffecteeFilter.domain_skillrq: __get_affectees_domain_skillrq,
         ModAffecteeFilter.owner_skillrq: __get_affectees_owner_skillrq}
 
+    def __get_fleet_affectee_items(self, affector_spec, affectee_fits):
+        """Get items on passed fits influenced by fleet affector spec.
+
+        Raises:
+            UnknownAffecteeFilterError: If modifier affectee filter type is not
+                supported.
+        """
+        affectee_filter = affector_spec.modifier.affectee_filter
+        # Modifier affects ships of fleet members directly
+        if affectee_filter == ModAffecteeFilter.item:
+            affectee_items = set()
+            for affectee_fit in affectee_fits:
+                affectee_ship = affectee_fit.ship
+                if self.__is_affectee(affectee_ship):
+                    affectee_items.add(affectee_ship)
+            return affectee_items
+        # Filtered modifications are applied to items located on ships of
+        # fleet members, just like projected ones
+        try:
+            getter = self.__affectees_getters[affectee_filter]
+        except KeyError as e:
+            raise UnknownAffecteeFilterError(affectee_filter) from e
+        return getter(self, affector_spec, ModDomain.ship, affectee_fits)
+
     # Helpers for affectee registering/unregistering
-    def __get_affectee_storages(self, affectee_fit, affectee_item):
+    def __get_affectee_storages(self, partition, affectee_item):
         """Return all places where passed affectee item should be stored.
 
         Returns:
@@ -356,92 +442,83 @@ class AffectionRegister:
         affectee_domain = affectee_item._modifier_domain
         if affectee_domain is not None:
             # Domain
-            key = (affectee_fit, affectee_domain)
-            storage = self.__affectees_domain
+            key = affectee_domain
+            storage = partition.affectees_domain
             storages.append((key, storage))
             # Domain and group
             affectee_group_id = affectee_item._type.group_id
             if affectee_group_id is not None:
-                key = (affectee_fit, affectee_domain, affectee_group_id)
-                storage = self.__affectees_domain_group
+                key = (affectee_domain, affectee_group_id)
+                storage = partition.affectees_domain_group
                 storages.append((key, storage))
             # Domain and skill requirement
-            storage = self.__affectees_domain_skillrq
+            storage = partition.affectees_domain_skillrq
             for affectee_srq_type_id in affectee_item._type.required_skills:
-                key = (affectee_fit, affectee_domain, affectee_srq_type_id)
+                key = (affectee_domain, affectee_srq_type_id)
                 storages.append((key, storage))
         # Owner-modifiable and skill requirement
         if affectee_item._owner_modifiable:
-            storage = self.__affectees_owner_skillrq
+            storage = partition.affectees_owner_skillrq
             for affectee_srq_type_id in affectee_item._type.required_skills:
-                key = (affectee_fit, affectee_srq_type_id)
+                key = affectee_srq_type_id
                 storages.append((key, storage))
         return storages
 
-    def __activate_special_affector_specs(self, affectee_fit, affectee_item):
+    def __activate_special_affector_specs(self, partition, affectee_item):
         """Activate special affector specs which should affect passed item."""
+        awaiting_storage = partition.affectors_item_awaiting
         awaiting_to_activate = set()
-        for affector_spec in self.__affectors_item_awaiting.get(
-            affectee_fit, ()
-        ):
-            affectee_domain = affector_spec.modifier.affectee_domain
-            # Ship
-            if (
-                affectee_domain == ModDomain.ship and
-                isinstance(affectee_item, Ship)
-            ):
-                awaiting_to_activate.add(affector_spec)
-            # Character
-            elif (
-                affectee_domain == ModDomain.character and
-                isinstance(affectee_item, Character)
-            ):
-                awaiting_to_activate.add(affector_spec)
-            # Self
-            elif (
-                affectee_domain == ModDomain.self and
-                affectee_item is affector_spec.item
-            ):
+        # Ship
+        if isinstance(affectee_item, Ship):
+            awaiting_to_activate.update(
+                awaiting_storage.get(ModDomain.ship, ()))
+        # Character
+        elif isinstance(affectee_item, Character):
+            awaiting_to_activate.update(
+                awaiting_storage.get(ModDomain.character, ()))
+        # Self
+        for affector_spec in awaiting_storage.get(ModDomain.self, ()):
+            if affectee_item is affector_spec.item:
                 awaiting_to_activate.add(affector_spec)
         # Move awaiting affector specs from awaiting storage to active storage
         if awaiting_to_activate:
-            self.__affectors_item_awaiting.rm_data_set(
-                affectee_fit, awaiting_to_activate)
-            self.__affectors_item_active.add_data_set(
+            for affector_spec in awaiting_to_activate:
+                awaiting_storage.rm_data_entry(
+                    affector_spec.modifier.affectee_domain, affector_spec)
+            partition.affectors_item_active.add_data_set(
                 affectee_item, awaiting_to_activate)
         # Other
         other_to_activate = set()
         for affector_item, affector_specs in (
-            self.__affectors_item_other.items()
+            partition.affectors_item_other.items()
         ):
             if affectee_item in affector_item._others:
                 other_to_activate.update(affector_specs)
         # Just add affector specs to active storage, 'other' affector specs
         # should never be removed from 'other'-specific storage
         if other_to_activate:
-            self.__affectors_item_active.add_data_set(
+            partition.affectors_item_active.add_data_set(
                 affectee_item, other_to_activate)
 
-    def __deactivate_special_affector_specs(self, affectee_fit, affectee_item):
+    def __deactivate_special_affector_specs(self, partition, affectee_item):
         """Deactivate special affector specs which affect passed item."""
-        if affectee_item not in self.__affectors_item_active:
+        active_storage = partition.affectors_item_active
+        if affectee_item not in active_storage:
             return
         awaitable_to_deactivate = set()
-        for affector_spec in (
-            self.__affectors_item_active.get(affectee_item, ())
-        ):
+        for affector_spec in active_storage.get(affectee_item, ()):
             if affector_spec.modifier.affectee_domain in (
                 ModDomain.ship, ModDomain.character, ModDomain.self
             ):
                 awaitable_to_deactivate.add(affector_spec)
         # Remove all affector specs influencing this item directly, including
         # 'other' affectors
-        del self.__affectors_item_active[affectee_item]
+        del active_storage[affectee_item]
         # And make sure awaitable affectors become awaiting - moved to
         # appropriate container for future use
-        if awaitable_to_deactivate:
-            self.__affectors_item_awaiting.add_data_set(
-                affectee_fit, awaitable_to_deactivate)
+        for affector_spec in awaitable_to_deactivate:
+            partition.affectors_item_awaiting.add_data_entry(
+                affector_spec.modifier.affectee_domain, affector_spec)
 
     # Helpers for affector spec registering/unregistering
     def __get_local_affector_storages(self, affector_spec):
@@ -454,6 +531,15 @@ class AffectionRegister:
                 supported.
         """
         affectee_filter = affector_spec.modifier.affectee_filter
+        # Fleet-wide affector specs are stored once per affector fit
+        if affector_spec.modifier.affectee_domain == ModDomain.fleet:
+            if (
+                affectee_filter != ModAffecteeFilter.item and
+                affectee_filter not in self.__affectees_getters
+            ):
+                raise UnknownAffecteeFilterError(affectee_filter)
+            partition = self.__partitions[affector_spec.item._fit]
+            return (affectee_filter, partition.affectors_fleet),
         if affectee_filter == ModAffecteeFilter.item:
             affectee_domain = affector_spec.modifier.affectee_domain
             try:
@@ -481,10 +567,11 @@ class AffectionRegister:
         # Modifier affects just targeted items directly
         if affectee_filter == ModAffecteeFilter.item:
             storages = []
-            storage = self.__affectors_item_active
             for tgt_item in tgt_items:
-                if tgt_item in self.__affectees:
+                if self.__is_affectee(tgt_item):
                     key = tgt_item
+                    storage = self.__partitions[
+                        tgt_item._fit].affectors_item_active
                     storages.append((key, storage))
             return storages
         # Modifier affects multiple items via affectee filter
@@ -499,46 +586,51 @@ class AffectionRegister:
 
     def __get_local_affector_storages_self(self, affector_spec):
         affectee_item = affector_spec.item
-        if affectee_item in self.__affectees:
+        partition = self.__partitions[affectee_item._fit]
+        if affectee_item in partition.affectees:
             key = affectee_item
-            storage = self.__affectors_item_active
+            storage = partition.affectors_item_active
         else:
-            key = affectee_item._fit
-            storage = self.__affectors_item_awaiting
+            key = ModDomain.self
+            storage = partition.affectors_item_awaiting
         return (key, storage),
 
     def __get_local_affector_storages_character(self, affector_spec):
         affectee_fit = affector_spec.item._fit
         affectee_character = affectee_fit.character
-        if affectee_character in self.__affectees:
+        partition = self.__partitions[affectee_fit]
+        if affectee_character in partition.affectees:
             key = affectee_character
-            storage = self.__affectors_item_active
+            storage = partition.affectors_item_active
         else:
-            key = affectee_fit
-            storage = self.__affectors_item_awaiting
+            key = ModDomain.character
+            storage = partition.affectors_item_awaiting
         return (key, storage),
 
     def __get_local_affector_storages_ship(self, affector_spec):
         affectee_fit = affector_spec.item._fit
         affectee_ship = affectee_fit.ship
-        if affectee_ship in self.__affectees:
+        partition = self.__partitions[affectee_fit]
+        if affectee_ship in partition.affectees:
             key = affectee_ship
-            storage = self.__affectors_item_active
+            storage = partition.affectors_item_active
         else:
-            key = affectee_fit
-            storage = self.__affectors_item_awaiting
+            key = ModDomain.ship
+            storage = partition.affectors_item_awaiting
         return (key, storage),
 
     def __get_local_affector_storages_other(self, affector_spec):
+        partition = self.__partitions[affector_spec.item._fit]
         # Affectors with 'other' modifiers are always stored in their special
         # place
-        storages = [(affector_spec.item, self.__affectors_item_other)]
+        storages = [(affector_spec.item, partition.affectors_item_other)]
         # And all those which have valid affectee item are also stored in
         # storage for active direct affectors
-        storage = self.__affectors_item_active
         for other_item in affector_spec.item._others:
-            if other_item in self.__affectees:
+            if self.__is_affectee(other_item):
                 key = other_item
+                storage = self.__partitions[
+                    other_item._fit].affectors_item_active
                 storages.append((key, storage))
         return storages
 
@@ -550,10 +642,9 @@ class AffectionRegister:
 
     def __get_affector_storages_domain(self, _, affectee_domain, affectee_fits):
         storages = []
-        storage = self.__affectors_domain
-        for affectee_fit in affectee_fits:
-            key = (affectee_fit, affectee_domain)
-            storages.append((key, storage))
+        key = affectee_domain
+        for partition in self.__iter_partitions(affectee_fits):
+            storages.append((key, partition.affectors_domain))
         return storages
 
     def __get_affector_storages_domain_group(
@@ -561,36 +652,29 @@ class AffectionRegister:
     ):
         affectee_group_id = affector_spec.modifier.affectee_filter_extra_arg
         storages = []
-        storage = self.__affectors_domain_group
-        for affectee_fit in affectee_fits:
-            key = (affectee_fit, affectee_domain, affectee_group_id)
-            storages.append((key, storage))
+        key = (affectee_domain, affectee_group_id)
+        for partition in self.__iter_partitions(affectee_fits):
+            storages.append((key, partition.affectors_domain_group))
         return storages
 
     def __get_affector_storages_domain_skillrq(
         self, affector_spec, affectee_domain, affectee_fits
     ):
-        affectee_srq_type_id = affector_spec.modifier.affectee_filter_extra_arg
-        if affectee_srq_type_id == EosTypeId.current_self:
-            affectee_srq_type_id = affector_spec.item._type_id
+        affectee_srq_type_id = self.__resolve_srq_type_id(affector_spec)
         storages = []
-        storage = self.__affectors_domain_skillrq
-        for affectee_fit in affectee_fits:
-            key = (affectee_fit, affectee_domain, affectee_srq_type_id)
-            storages.append((key, storage))
+        key = (affectee_domain, affectee_srq_type_id)
+        for partition in self.__iter_partitions(affectee_fits):
+            storages.append((key, partition.affectors_domain_skillrq))
         return storages
 
     def __get_affector_storages_owner_skillrq(
         self, affector_spec, _, affectee_fits
     ):
-        affectee_srq_type_id = affector_spec.modifier.affectee_filter_extra_arg
-        if affectee_srq_type_id == EosTypeId.current_self:
-            affectee_srq_type_id = affector_spec.item._type_id
+        affectee_srq_type_id = self.__resolve_srq_type_id(affector_spec)
         storages = []
-        storage = self.__affectors_owner_skillrq
-        for affectee_fit in affectee_fits:
-            key = (affectee_fit, affectee_srq_type_id)
-            storages.append((key, storage))
+        key = affectee_srq_type_id
+        for partition in self.__iter_partitions(affectee_fits):
+            storages.append((key, partition.affectors_owner_skillrq))
         return storages
 
     __affector_storages_getters = {
@@ -604,6 +688,73 @@ class AffectionRegister:
             __get_affector_storages_owner_skillrq}
 
     # Shared helpers
+    def __iter_partitions(self, fits):
+        """Iterate over storage partitions of passed fits.
+
+        Fits which have no partition, e.g. which are not attached to the solar
+        system anymore, are skipped.
+        """
+        for fit in fits:
+            partition = self.__partitions.get(fit)
+            if partition is not None:
+                yield partition
+
+    def __is_affectee(self, item):
+        """Check if passed item is registered as affectee."""
+        if item is None:
+            return False
+        partition = self.__partitions.get(item._fit)
+        if partition is None:
+            return False
+        return item in partition.affectees
+
+    def __get_fleet_affector_specs(self, fit):
+        """Get fleet-wide affector specs exerted by items of passed fit."""
+        partition = self.__partitions.get(fit)
+        if partition is None:
+            return ()
+        return chain.from_iterable(partition.affectors_fleet.values())
+
+    def __get_fleet_fits(self, fit):
+        """Get fits which exchange fleet-wide modifications with passed fit.
+
+        Fit which is not in any fleet is considered as fleet of its own.
+        """
+        fleet = fit.fleet
+        if fleet is None:
+            return fit,
+        return fleet.fits
+
+    def __is_fleet_affectee(self, affector_spec, affectee_item):
+        """Check if item matches filter of fleet-wide affector spec."""
+        affectee_filter = affector_spec.modifier.affectee_filter
+        if affectee_filter == ModAffecteeFilter.item:
+            return affectee_item is affectee_item._fit.ship
+        if affectee_filter == ModAffecteeFilter.owner_skillrq:
+            return (
+                affectee_item._owner_modifiable and
+                self.__resolve_srq_type_id(affector_spec) in
+                affectee_item._type.required_skills)
+        if affectee_item._modifier_domain != ModDomain.ship:
+            return False
+        if affectee_filter == ModAffecteeFilter.domain:
+            return True
+        if affectee_filter == ModAffecteeFilter.domain_group:
+            return (
+                affectee_item._type.group_id ==
+                affector_spec.modifier.affectee_filter_extra_arg)
+        if affectee_filter == ModAffecteeFilter.domain_skillrq:
+            return (
+                self.__resolve_srq_type_id(affector_spec) in
+                affectee_item._type.required_skills)
+        return False
+
+    def __resolve_srq_type_id(self, affector_spec):
+        affectee_srq_type_id = affector_spec.modifier.affectee_filter_extra_arg
+        if affectee_srq_type_id == EosTypeId.current_self:
+            affectee_srq_type_id = affector_spec.item._type_id
+        return affectee_srq_type_id
+
     def __resolve_local_domain(self, affector_spec):
         """Convert relative domain into absolute for local affector spec.
 
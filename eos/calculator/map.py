@@ -26,12 +26,13 @@ from logging import getLogger
 
 from eos.cache_handler import AttrFetchError
 from eos.const.eos import ModOperator
-from eos.const.eve import AttrId
 from eos.const.eve import TypeCategoryId
 from eos.pubsub.message import AttrsValueChanged
+from eos.util.dense_attrs import AttrValueArray
 from eos.util.keyed_storage import KeyedStorage
 from .exception import AttrMetadataError
 from .exception import BaseValueError
+from .plan import get_attr_plans
 
 
 OverrideData = namedtuple('OverrideData', ('value', 'persistent'))
@@ -43,22 +44,19 @@ logger = getLogger(__name__)
 # Stacking penalty base constant, used in attribute calculations
 PENALTY_BASE = 1 / math.exp((1 / 2.67) ** 2)
 
+# Stacking penalty coefficients, indexed by position of modification in
+# penalization chain. Modifications past the end of the table are ignored as
+# non-significant
+PENALTY_COEFFICIENTS = tuple(PENALTY_BASE ** (pos ** 2) for pos in range(11))
+
 # Items belonging to these categories never have their effects stacking
 # penalized
-PENALTY_IMMUNE_CATEGORY_IDS = (
+PENALTY_IMMUNE_CATEGORY_IDS = frozenset((
     TypeCategoryId.ship,
     TypeCategoryId.charge,
     TypeCategoryId.skill,
     TypeCategoryId.implant,
-    TypeCategoryId.subsystem)
-
-# Tuple with penalizable operators
-PENALIZABLE_OPERATORS = (
-    ModOperator.pre_mul,
-    ModOperator.post_mul,
-    ModOperator.post_percent,
-    ModOperator.pre_div,
-    ModOperator.post_div)
+    TypeCategoryId.subsystem))
 
 # Map which helps to normalize modifications
 NORMALIZATION_MAP = {
@@ -88,18 +86,64 @@ MULTIPLICATION_OPERATORS = (
     ModOperator.post_div,
     ModOperator.post_percent)
 
-# Following attributes have limited precision - only to second digit after
-# decimal separator
-LIMITED_PRECISION_ATTR_IDS = (
-    AttrId.cpu,
-    AttrId.power,
-    AttrId.cpu_output,
-    AttrId.power_output)
+# Kinds of operators, which define how normalized values are applied
+OPERATOR_KIND_ASSIGNMENT = 1
+OPERATOR_KIND_ADDITION = 2
+OPERATOR_KIND_MULTIPLICATION = 3
+
+# Everything calculation process needs to know about operators, to avoid
+# multiple lookups per modification
+# Format: {operator: (normalization function, operator kind)}
+OPERATOR_PLANS = {
+    operator: (NORMALIZATION_MAP[operator], kind)
+    for operators, kind in (
+        (ASSIGNMENT_OPERATORS, OPERATOR_KIND_ASSIGNMENT),
+        (ADDITION_OPERATORS, OPERATOR_KIND_ADDITION),
+        (MULTIPLICATION_OPERATORS, OPERATOR_KIND_MULTIPLICATION))
+    for operator in operators}
 
 # List of exceptions calculate method may throw
 CALCULATE_RAISABLE_EXCEPTIONS = (AttrMetadataError, BaseValueError)
 
 
+def penalize_values(mod_values):
+    """Calculate aggregated reduced multiplier.
+
+    Assuming all multipliers received should be stacking penalized, and that
+    they are normalized to reduced multiplier form, calculate final reduced
+    multiplier.
+
+    Args:
+        mod_values: List with reduced multipliers.
+
+    Returns:
+        Final aggregated reduced multiplier.
+    """
+    # Single modification always takes first position, where penalty does
+    # not apply
+    if len(mod_values) == 1:
+        return mod_values[0]
+    # Gather positive multipliers into one chain, negative into another
+    chain_positive = []
+    chain_negative = []
+    for mod_value in mod_values:
+        if mod_value >= 0:
+            chain_positive.append(mod_value)
+        else:
+            chain_negative.append(mod_value)
+    # Strongest modifications always go first. Modifications past the end of
+    # coefficient table are cut off by zip()
+    chain_positive.sort(reverse=True)
+    chain_negative.sort()
+    # Base final multiplier on 1
+    value = 1
+    for mod_value, coefficient in zip(chain_positive, PENALTY_COEFFICIENTS):
+        value *= 1 + mod_value * coefficient
+    for mod_value, coefficient in zip(chain_negative, PENALTY_COEFFICIENTS):
+        value *= 1 + mod_value * coefficient
+    return value - 1
+
+
 class MutableAttrMap:
     """Map which contains modified attribute values.
 
@@ -109,13 +153,17 @@ class MutableAttrMap:
 
     def __init__(self, item):
         self.__item = item
-        # Actual container of calculated attributes.
+        # Actual container of calculated attributes. When item type has its
+        # attributes packed using dense indices, values are stored in array
+        # keyed by the same indices
         # Format: {attribute ID: value}
         self.__modified_attrs = {}
         # Override and cap maps are initialized as None to save memory, as they
         # are not needed most of the time
         self.__override_callbacks = None
         self.__cap_map = None
+        # Calculation plans of attributes of item's source
+        self.__plans = None
 
     def __getitem__(self, attr_id):
         # Overridden values are priority. Access 'private' override callbacks
@@ -137,7 +185,7 @@ class MutableAttrMap:
             except CALCULATE_RAISABLE_EXCEPTIONS as e:
                 raise KeyError(attr_id) from e
             else:
-                self.__modified_attrs[attr_id] = value
+                self.__store(attr_id, value)
         return value
 
     def __len__(self):
@@ -182,7 +230,7 @@ class MutableAttrMap:
             except CALCULATE_RAISABLE_EXCEPTIONS:
                 return default
             else:
-                self.__modified_attrs[attr_id] = value
+                self.__store(attr_id, value)
         return value
 
     def keys(self):
@@ -194,6 +242,10 @@ class MutableAttrMap:
     def items(self):
         return set((attr_id, self.get(attr_id)) for attr_id in self.keys())
 
+    def _bind(self, plans):
+        """Set calculation plans of attributes of item's source."""
+        self.__plans = plans
+
     def _clear(self):
         """
         Reset map to its initial state.
@@ -202,6 +254,22 @@ class MutableAttrMap:
         """
         self.__modified_attrs.clear()
         self.__cap_map = None
+        self.__plans = None
+
+    def __store(self, attr_id, value):
+        """Store calculated attribute value."""
+        # Storage type is picked when it's empty, as item type can change
+        # only after the map is cleared
+        if not self.__modified_attrs:
+            self.__modified_attrs = self.__make_storage()
+        self.__modified_attrs[attr_id] = value
+
+    def __make_storage(self):
+        try:
+            indexer = self.__item._type_attrs._indexer
+        except AttributeError:
+            return {}
+        return AttrValueArray(indexer)
 
     def __calculate(self, attr_id):
         """Run calculations to find the actual value of attribute.
@@ -219,23 +287,14 @@ class MutableAttrMap:
                 be found.
         """
         item = self.__item
-        # Attribute object for attribute being calculated
-        try:
-            attr = item._fit.solar_system.source.cache_handler.get_attr(attr_id)
-        # Raise error if we can't get metadata for requested attribute
-        except (AttributeError, AttrFetchError) as e:
-            msg = (
-                'unable to fetch metadata for attribute {}, '
-                'requested for item type {}'
-            ).format(attr_id, item._type_id)
-            logger.warning(msg)
-            raise AttrMetadataError(attr_id) from e
+        # Plan of attribute being calculated
+        plan = self.__get_plan(attr_id)
         # Base attribute value which we'll use for modification
         try:
             value = item._type_attrs[attr_id]
         # If attribute isn't available on item type, base off its default value
         except KeyError:
-            value = attr.default_value
+            value = plan.default_value
             # If item type attribute is not specified and default value isn't
             # available, raise error - without valid base we can't keep going
             if value is None:
@@ -250,6 +309,9 @@ class MutableAttrMap:
         # Container for penalized modifications
         # Format: {operator: [values]}
         penalized_mods = {}
+        # Operators which are penalized for this attribute; empty when
+        # attribute is stackable
+        penalizable_operators = plan.penalizable_operators
         # Now, go through all affectors affecting our item
         for mod_data in item._fit.solar_system._calculator.get_modifications(
             item, attr_id
@@ -258,7 +320,7 @@ class MutableAttrMap:
             # Normalize operations to just three types: assignments, additions,
             # reduced multiplications
             try:
-                normalization_func = NORMALIZATION_MAP[mod_operator]
+                normalization_func = OPERATOR_PLANS[mod_operator][0]
             # Log error on any unknown operator types
             except KeyError:
                 msg = (
@@ -271,10 +333,9 @@ class MutableAttrMap:
             mod_value = normalization_func(mod_value) * resist_value
             # Decide if modification should be stacking penalized or not
             penalize = (
-                not attr.stackable and
+                mod_operator in penalizable_operators and
                 affector_item._type.category_id not in
-                PENALTY_IMMUNE_CATEGORY_IDS and
-                mod_operator in PENALIZABLE_OPERATORS)
+                PENALTY_IMMUNE_CATEGORY_IDS)
             if penalize:
                 mod_values = penalized_mods.setdefault(mod_operator, [])
             else:
@@ -283,29 +344,34 @@ class MutableAttrMap:
         # When data gathering is complete, process penalized modifications. They
         # are penalized on per-operator basis
         for mod_operator, mod_values in penalized_mods.items():
-            penalized_value = self.__penalize_values(mod_values)
+            penalized_value = penalize_values(mod_values)
             normal_mods.setdefault(mod_operator, []).append(penalized_value)
         # Calculate value of non-penalized modifications, according to operator
         # order
-        for mod_operator in sorted(normal_mods):
+        if len(normal_mods) > 1:
+            mod_operators = sorted(normal_mods)
+        else:
+            mod_operators = normal_mods
+        for mod_operator in mod_operators:
             mod_values = normal_mods[mod_operator]
+            operator_kind = OPERATOR_PLANS[mod_operator][1]
             # Pick best modification for assignments, based on high_is_good
             # value
-            if mod_operator in ASSIGNMENT_OPERATORS:
-                if attr.high_is_good:
+            if operator_kind == OPERATOR_KIND_ASSIGNMENT:
+                if plan.high_is_good:
                     value = max(mod_values)
                 else:
                     value = min(mod_values)
-            elif mod_operator in ADDITION_OPERATORS:
+            elif operator_kind == OPERATOR_KIND_ADDITION:
                 for mod_val in mod_values:
                     value += mod_val
-            elif mod_operator in MULTIPLICATION_OPERATORS:
+            elif operator_kind == OPERATOR_KIND_MULTIPLICATION:
                 for mod_val in mod_values:
                     value *= 1 + mod_val
         # If attribute has upper cap, do not let its value to grow above it
-        if attr.max_attr_id is not None:
+        if plan.max_attr_id is not None:
             try:
-                max_value = self[attr.max_attr_id]
+                max_value = self[plan.max_attr_id]
             # If max value isn't available, don't cap anything
             except KeyError:
                 pass
@@ -313,50 +379,35 @@ class MutableAttrMap:
                 value = min(value, max_value)
                 # Let map know that capping attribute restricts current
                 # attribute
-                self._cap_set(attr.max_attr_id, attr_id)
+                self._cap_set(plan.max_attr_id, attr_id)
         # Some of attributes are rounded for whatever reason, deal with it after
         # all the calculations
-        if attr_id in LIMITED_PRECISION_ATTR_IDS:
+        if plan.limited_precision:
             value = round(value, 2)
         return value
 
-    def __penalize_values(self, mod_values):
-        """Calculate aggregated reduced multiplier.
-
-        Assuming all multipliers received should be stacking penalized, and that
-        they are normalized to reduced multiplier form, calculate final
-        reduced multiplier.
+    def __get_plan(self, attr_id):
+        """Get calculation plan of attribute.
 
-        Args:
-            mod_values: Iterable with reduced multipliers.
-
-        Returns:
-            Final aggregated reduced multiplier.
+        Raises:
+            AttrMetadataError: If metadata of attribute cannot be fetched.
         """
-        # Gather positive multipliers into one chain, negative into another
-        chain_positive = []
-        chain_negative = []
-        for mod_value in mod_values:
-            if mod_value >= 0:
-                chain_positive.append(mod_value)
-            else:
-                chain_negative.append(mod_value)
-        # Strongest modifications always go first
-        chain_positive.sort(reverse=True)
-        chain_negative.sort()
-        # Base final multiplier on 1
-        value = 1
-        for penalization_chain in (chain_positive, chain_negative):
-            # Same for intermediate per-chain value
-            chain_value = 1
-            for pos, mod_value in enumerate(penalization_chain):
-                # Ignore 12th modification and further as non-significant
-                if pos > 10:
-                    break
-                # Apply stacking penalty based on modification position
-                chain_value *= 1 + mod_value * PENALTY_BASE ** (pos ** 2)
-            value *= chain_value
-        return value - 1
+        plans = self.__plans
+        try:
+            # Plans are bound when item is loaded; if they are not, try to
+            # reach them via item's fit
+            if plans is None:
+                plans = get_attr_plans(
+                    self.__item._fit.solar_system.source.cache_handler)
+            return plans.get(attr_id)
+        # Raise error if we can't get metadata for requested attribute
+        except (AttributeError, AttrFetchError) as e:
+            msg = (
+                'unable to fetch metadata for attribute {}, '
+                'requested for item type {}'
+            ).format(attr_id, self.__item._type_id)
+            logger.warning(msg)
+            raise AttrMetadataError(attr_id) from e
 
     # Override-related methods
     @property
@@ -405,7 +456,7 @@ class MutableAttrMap:
             except CALCULATE_RAISABLE_EXCEPTIONS:
                 return default
             else:
-                self.__modified_attrs[attr_id] = value
+                self.__store(attr_id, value)
         return value
 
     # Cap-related methods
@@ -0,0 +1,110 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from collections import namedtuple
+from weakref import WeakKeyDictionary
+from weakref import ref
+
+from eos.const.eos import ModOperator
+from eos.const.eve import AttrId
+
+
+# Tuple with penalizable operators
+PENALIZABLE_OPERATORS = (
+    ModOperator.pre_mul,
+    ModOperator.post_mul,
+    ModOperator.post_percent,
+    ModOperator.pre_div,
+    ModOperator.post_div)
+
+# Following attributes have limited precision - only to second digit after
+# decimal separator
+LIMITED_PRECISION_ATTR_IDS = (
+    AttrId.cpu,
+    AttrId.power,
+    AttrId.cpu_output,
+    AttrId.power_output)
+
+
+# Calculation plan of an attribute, which contains everything calculation
+# process needs to know about it
+AttrPlan = namedtuple('AttrPlan', (
+    'attr', 'default_value', 'high_is_good', 'max_attr_id',
+    'limited_precision', 'penalizable_operators'))
+
+
+_penalizable_operators = frozenset(PENALIZABLE_OPERATORS)
+_no_operators = frozenset()
+
+
+class AttrPlanCache:
+    """Compiles and keeps calculation plans of attributes of a source.
+
+    Plans are compiled on first request, and are kept as long as cache handler
+    they are compiled from is alive.
+
+    Args:
+        cache_handler: Cache handler, which provides attribute metadata.
+    """
+
+    def __init__(self, cache_handler):
+        self.__cache_handler_ref = ref(cache_handler)
+        # Format: {attribute ID: plan}
+        self.__plans = {}
+
+    def get(self, attr_id):
+        """Get calculation plan of an attribute.
+
+        Raises:
+            AttrFetchError: If attribute metadata cannot be fetched.
+            AttributeError: If cache handler is not available anymore.
+        """
+        try:
+            return self.__plans[attr_id]
+        except KeyError:
+            pass
+        attr = self.__cache_handler_ref().get_attr(attr_id)
+        if attr.stackable:
+            penalizable_operators = _no_operators
+        else:
+            penalizable_operators = _penalizable_operators
+        plan = AttrPlan(
+            attr=attr,
+            default_value=attr.default_value,
+            high_is_good=attr.high_is_good,
+            max_attr_id=attr.max_attr_id,
+            limited_precision=attr_id in LIMITED_PRECISION_ATTR_IDS,
+            penalizable_operators=penalizable_operators)
+        self.__plans[attr_id] = plan
+        return plan
+
+
+# Format: {cache handler: plan cache}
+_plan_caches = WeakKeyDictionary()
+
+
+def get_attr_plans(cache_handler):
+    """Get attribute plan cache shared by all users of cache handler."""
+    try:
+        return _plan_caches[cache_handler]
+    except KeyError:
+        plans = _plan_caches[cache_handler] = AttrPlanCache(cache_handler)
+        return plans
@@ -23,7 +23,12 @@ from eos.util.keyed_storage import KeyedStorage
 
 
 class ProjectionRegister:
-    """Keeps track of various projection-related connections."""
+    """Keeps track of various projection-related connections.
+
+    Unlike affection register, this register is shared by all fits of solar
+    system, as projections connect items of different fits. To be able to drop
+    fit data in bulk, projectors and target items are also indexed per fit.
+    """
 
     def __init__(self):
         # Format: {projectors}
@@ -45,6 +50,14 @@ class ProjectionRegister:
         # Format: {target item: {projectors}}
         self.__tgt_projectors = KeyedStorage()
 
+        # Projectors exerted by items of fit
+        # Format: {fit: {projectors}}
+        self.__fit_projectors = KeyedStorage()
+
+        # Fit items which are under effect of any projectors
+        # Format: {fit: {target items}}
+        self.__fit_tgts = KeyedStorage()
+
     # Query methods
     def get_projector_tgts(self, projector):
         """Get solar system items which are under effect of passed projector."""
@@ -62,9 +75,18 @@ class ProjectionRegister:
         """Get all known projectors."""
         return self.__projectors
 
+    def get_fit_projectors(self, fit):
+        """Get projectors which are exerted by items of passed fit."""
+        return self.__fit_projectors.get(fit, ())
+
+    def get_fit_tgts(self, fit):
+        """Get items of passed fit which are under effect of projectors."""
+        return self.__fit_tgts.get(fit, ())
+
     # Maintenance methods
     def register_projector(self, projector):
         self.__projectors.add(projector)
+        self.__fit_projectors.add_data_entry(projector.item._fit, projector)
         carrier_item = projector.item._solsys_carrier
         if carrier_item is not None:
             self.__carrier_projectors.add_data_entry(carrier_item, projector)
@@ -73,21 +95,26 @@ class ProjectionRegister:
 
     def unregister_projector(self, projector):
         self.__projectors.discard(projector)
+        self.__fit_projectors.rm_data_entry(projector.item._fit, projector)
         carrier_item = projector.item._solsys_carrier
         if carrier_item is not None:
             self.__carrier_projectors.rm_data_entry(carrier_item, projector)
-        else:
-            self.__carrierless_projectors.discard(projector)
+        # Carrier might have been unregistered already, in which case projector
+        # is stored as carrierless even though its item still refers it
+        self.__carrierless_projectors.discard(projector)
 
     def apply_projector(self, projector, tgt_items):
         self.__projector_tgts.add_data_set(projector, tgt_items)
         for tgt_item in tgt_items:
             self.__tgt_projectors.add_data_entry(tgt_item, projector)
+            self.__fit_tgts.add_data_entry(tgt_item._fit, tgt_item)
 
     def unapply_projector(self, projector, tgt_items):
         self.__projector_tgts.rm_data_set(projector, tgt_items)
         for tgt_item in tgt_items:
             self.__tgt_projectors.rm_data_entry(tgt_item, projector)
+            if tgt_item not in self.__tgt_projectors:
+                self.__fit_tgts.rm_data_entry(tgt_item._fit, tgt_item)
 
     def register_solsys_item(self, solsys_item):
         projectors = set()
@@ -103,3 +130,23 @@ class ProjectionRegister:
         if projectors:
             self.__carrierless_projectors.update(projectors)
             self.__carrier_projectors.rm_data_set(solsys_item, projectors)
+
+    def unregister_fit(self, fit):
+        """Remove all projection data related to passed fit.
+
+        Removes projectors exerted by items of the fit, and detaches projectors
+        of other fits from items of the fit.
+        """
+        for projector in self.__fit_projectors.pop(fit, ()):
+            self.__projectors.discard(projector)
+            self.__carrierless_projectors.discard(projector)
+            carrier_item = projector.item._solsys_carrier
+            if carrier_item is not None:
+                self.__carrier_projectors.rm_data_entry(carrier_item, projector)
+            for tgt_item in self.__projector_tgts.pop(projector, ()):
+                self.__tgt_projectors.rm_data_entry(tgt_item, projector)
+                if tgt_item not in self.__tgt_projectors:
+                    self.__fit_tgts.rm_data_entry(tgt_item._fit, tgt_item)
+        for tgt_item in self.__fit_tgts.pop(fit, ()):
+            for projector in self.__tgt_projectors.pop(tgt_item, ()):
+                self.__projector_tgts.rm_data_entry(projector, tgt_item)
@@ -19,7 +19,10 @@
 # ==============================================================================
 
 
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
 from eos.const.eve import EffectCategoryId
+from eos.eve_obj.effect.helper_func import get_range_mult
 from eos.eve_obj.modifier import BasePythonModifier
 from eos.eve_obj.modifier import DogmaModifier
 from eos.eve_obj.modifier import ModificationCalculationError
@@ -30,6 +33,7 @@ from eos.pubsub.message import EffectApplied
 from eos.pubsub.message import EffectUnapplied
 from eos.pubsub.message import EffectsStarted
 from eos.pubsub.message import EffectsStopped
+from eos.pubsub.message import ItemCoordinateChanged
 from eos.pubsub.message import ItemLoaded
 from eos.pubsub.message import ItemUnloaded
 from eos.pubsub.subscriber import BaseSubscriber
@@ -40,6 +44,18 @@ from .misc import Projector
 from .projection import ProjectionRegister
 
 
+# Operators whose modification values are scaled by range to target
+RANGE_SCALED_OPERATORS = frozenset((
+    ModOperator.pre_mul,
+    ModOperator.pre_div,
+    ModOperator.mod_add,
+    ModOperator.mod_sub,
+    ModOperator.post_mul,
+    ModOperator.post_mul_immune,
+    ModOperator.post_div,
+    ModOperator.post_percent))
+
+
 class CalculationService(BaseSubscriber):
     """Service which supports attribute calculation.
 
@@ -54,6 +70,12 @@ class CalculationService(BaseSubscriber):
         # Container with affector specs which will receive messages
         # Format: {message type: set(affector specs)}
         self.__subscribed_affectors = KeyedStorage()
+        # The same affector specs, partitioned by fit they belong to
+        # Format: {fit: {message type: set(affector specs)}}
+        self.__fit_subscribed_affectors = {}
+        # Strength multipliers of range-dependent projectors
+        # Format: {(projector, target item): multiplier}
+        self.__range_mults = {}
 
     def get_modifications(self, affectee_item, affectee_attr_id):
         """Get modifications of affectee attribute on affectee item.
@@ -94,28 +116,147 @@ class CalculationService(BaseSubscriber):
                     resist_value = 1
             else:
                 resist_value = 1
+            # Projected modifications lose strength with distance. Assignments
+            # cannot be weakened, thus they are applied in full as long as
+            # target is within reach
+            if (
+                affector_modifier.affectee_domain == ModDomain.target and
+                carrier_item is not None
+            ):
+                range_mult = self.__get_range_mult(affector_spec, carrier_item)
+                if range_mult == 0:
+                    continue
+                if mod_op in RANGE_SCALED_OPERATORS:
+                    resist_value *= range_mult
             mods.append((mod_op, mod_value, resist_value, affector_item))
         return mods
 
+    def __get_range_mult(self, affector_spec, tgt_item):
+        """Get strength multiplier of projected affector spec on target."""
+        effect = affector_spec.effect
+        if effect.range_attr_id is None:
+            return 1
+        projector = Projector(affector_spec.item, effect)
+        key = (projector, tgt_item)
+        try:
+            return self.__range_mults[key]
+        except KeyError:
+            pass
+        projector_item = projector.item
+        carrier_item = projector_item._solsys_carrier
+        if carrier_item is None:
+            range_mult = 1
+        else:
+            ctc_range = projector_item._fit.solar_system.get_ctc_range(
+                carrier_item, tgt_item)
+            range_mult = get_range_mult(
+                effect.get_optimal_range(projector_item),
+                effect.get_falloff_range(projector_item),
+                ctc_range)
+        self.__range_mults[key] = range_mult
+        return range_mult
+
     # Handle fits
     def _handle_fit_added(self, fit):
+        self.__affections.register_fit(fit)
         fit._subscribe(self, self._handler_map.keys())
 
     def _handle_fit_removed(self, fit):
-        fit._unsubscribe(self, self._handler_map.keys())
+        """Remove all the data related to passed fit in bulk.
+
+        Should be called before items of the fit are unloaded. Service stops
+        receiving messages from the fit right away, and drops its data without
+        processing per-item messages; only items of other fits, which lose
+        modifications coming from the fit, get their attributes revised.
+        """
+        fit_subscribed_affectors = self.__fit_subscribed_affectors.pop(
+            fit, {})
+        for msg_type, affector_specs in fit_subscribed_affectors.items():
+            self.__subscribed_affectors.rm_data_set(msg_type, affector_specs)
+        fit._unsubscribe(
+            self, set(self._handler_map).union(fit_subscribed_affectors))
+        affections = self.__affections
+        projections = self.__projections
+        range_mults = self.__range_mults
+        attr_changes = {}
+        # Fleetmates lose modifications exerted by the fit and vice versa
+        self.__revise_fleet_affections(fit, attr_changes)
+        # Items of other fits lose modifications projected by the fit
+        for projector in projections.get_fit_projectors(fit):
+            tgt_items = projections.get_projector_tgts(projector)
+            for affector_spec in self.__generate_projected_affectors(
+                projector.item, (projector.effect.id,)
+            ):
+                for affectee_item in affections.get_projected_affectee_items(
+                    affector_spec, tgt_items
+                ):
+                    attr_id = affector_spec.modifier.affectee_attr_id
+                    if affectee_item.attrs._force_recalc(attr_id):
+                        attr_changes.setdefault(affectee_item, set()).add(
+                            attr_id)
+                affections.unregister_projected_affector(
+                    affector_spec, tgt_items)
+            for tgt_item in tgt_items:
+                range_mults.pop((projector, tgt_item), None)
+        for tgt_item in projections.get_fit_tgts(fit):
+            for projector in projections.get_tgt_projectors(tgt_item):
+                range_mults.pop((projector, tgt_item), None)
+        projections.unregister_fit(fit)
+        affections.unregister_fit(fit)
+        # Items of the fit are about to be unloaded, do not notify about them
+        for item in [i for i in attr_changes if i._fit is fit]:
+            del attr_changes[item]
+        if attr_changes:
+            self.__publish_attr_changes(attr_changes)
 
     # Handle item changes which are significant for calculator
     def _handle_item_loaded(self, msg):
         item = msg.item
         self.__affections.register_affectee_item(item)
         if isinstance(item, SolarSystemItemMixin):
-            self.__projections.register_solsys_item(item)
+            projections = self.__projections
+            projections.register_solsys_item(item)
+            # Projectors which were carrierless are now carried by the item,
+            # and are located where it is
+            attr_changes = {}
+            for projector in projections.get_carrier_projectors(item):
+                self.__revise_range_dependents(
+                    projector, projections.get_projector_tgts(projector),
+                    attr_changes)
+            if attr_changes:
+                self.__publish_attr_changes(attr_changes)
 
     def _handle_item_unloaded(self, msg):
         item = msg.item
         self.__affections.unregister_affectee_item(item)
         if isinstance(item, SolarSystemItemMixin):
-            self.__projections.unregister_solsys_item(item)
+            projections = self.__projections
+            # Projectors carried by the item lose their location
+            attr_changes = {}
+            for projector in projections.get_carrier_projectors(item):
+                self.__revise_range_dependents(
+                    projector, projections.get_projector_tgts(projector),
+                    attr_changes)
+            for projector in projections.get_tgt_projectors(item):
+                self.__range_mults.pop((projector, item), None)
+            projections.unregister_solsys_item(item)
+            if attr_changes:
+                self.__publish_attr_changes(attr_changes)
+
+    def _handle_item_coordinate_changed(self, msg):
+        item = msg.item
+        projections = self.__projections
+        attr_changes = {}
+        # Projectors carried by moved item change distance to all their targets
+        for projector in projections.get_carrier_projectors(item):
+            self.__revise_range_dependents(
+                projector, projections.get_projector_tgts(projector),
+                attr_changes)
+        # Projectors which target moved item change distance just to it
+        for projector in projections.get_tgt_projectors(item):
+            self.__revise_range_dependents(projector, (item,), attr_changes)
+        if attr_changes:
+            self.__publish_attr_changes(attr_changes)
 
     def _handle_effects_started(self, msg):
         attr_changes = {}
@@ -205,9 +346,32 @@ class CalculationService(BaseSubscriber):
         # Un-apply projector
         for projector in self.__generate_projectors(msg.item, (msg.effect_id,)):
             self.__projections.unapply_projector(projector, msg.tgt_items)
+            for tgt_item in msg.tgt_items:
+                self.__range_mults.pop((projector, tgt_item), None)
+        if attr_changes:
+            self.__publish_attr_changes(attr_changes)
+
+    # Handle fleet membership changes
+    def _revise_fleet_dependents(self, fit):
+        """Remove calculated attribute values which rely on fleet membership.
+
+        Should be called right after fit joins fleet, and right before it leaves
+        it. Only attributes influenced by fleet-wide affector specs between
+        passed fit and its fleetmates are cleared.
+        """
+        attr_changes = {}
+        self.__revise_fleet_affections(fit, attr_changes)
         if attr_changes:
             self.__publish_attr_changes(attr_changes)
 
+    def __revise_fleet_affections(self, fit, attr_changes):
+        for affector_spec, affectee_item in (
+            self.__affections.get_fleet_affections(fit)
+        ):
+            attr_id = affector_spec.modifier.affectee_attr_id
+            if affectee_item.attrs._force_recalc(attr_id):
+                attr_changes.setdefault(affectee_item, set()).add(attr_id)
+
     # Methods to clear calculated child attributes when parent attributes change
     def _revise_regular_attr_dependents(self, msg):
         """Remove calculated attribute values which rely on passed attribute.
@@ -258,6 +422,15 @@ class CalculationService(BaseSubscriber):
                 # to clean anything
                 if not tgt_items:
                     continue
+                # Force recalculation when range which defines projected
+                # modification strength changes
+                effect = projector.effect
+                if (
+                    effect.range_attr_id in attr_ids or
+                    effect.falloff_attr_id in attr_ids
+                ):
+                    self.__revise_range_dependents(
+                        projector, tgt_items, attr_changes)
                 for affector_spec in self.__generate_projected_affectors(
                     item, (projector.effect.id,)
                 ):
@@ -336,6 +509,7 @@ class CalculationService(BaseSubscriber):
         EffectsStopped: _handle_effects_stopped,
         EffectApplied: _handle_effect_applied,
         EffectUnapplied: _handle_effect_unapplied,
+        ItemCoordinateChanged: _handle_item_coordinate_changed,
         AttrsValueChanged: _revise_regular_attr_dependents}
 
     def _notify(self, msg):
@@ -369,33 +543,41 @@ class CalculationService(BaseSubscriber):
 
     def __subscribe_python_affector_spec(self, fit, affector_spec):
         """Subscribe affector spec with python modifier."""
+        fit_subscribed_affectors = self.__fit_subscribed_affectors.setdefault(
+            fit, KeyedStorage())
         to_subscribe = set()
         for msg_type in affector_spec.modifier.revise_msg_types:
             # Subscribe service to new message type only if there's no such
-            # subscription yet
+            # subscription on the fit yet
             if (
                 msg_type not in self._handler_map and
-                msg_type not in self.__subscribed_affectors
+                msg_type not in fit_subscribed_affectors
             ):
                 to_subscribe.add(msg_type)
             # Add affector spec to subscriber map to let it receive messages
             self.__subscribed_affectors.add_data_entry(msg_type, affector_spec)
+            fit_subscribed_affectors.add_data_entry(msg_type, affector_spec)
         if to_subscribe:
             fit._subscribe(self, to_subscribe)
 
     def __unsubscribe_python_affector_spec(self, fit, affector_spec):
         """Unsubscribe affector spec with python modifier."""
+        fit_subscribed_affectors = self.__fit_subscribed_affectors.get(
+            fit, KeyedStorage())
         to_ubsubscribe = set()
         for msg_type in affector_spec.modifier.revise_msg_types:
             # Make sure affector spec will not receive messages anymore
             self.__subscribed_affectors.rm_data_entry(msg_type, affector_spec)
+            fit_subscribed_affectors.rm_data_entry(msg_type, affector_spec)
             # Unsubscribe service from message type if there're no recipients
-            # anymore
+            # on the fit anymore
             if (
                 msg_type not in self._handler_map and
-                msg_type not in self.__subscribed_affectors
+                msg_type not in fit_subscribed_affectors
             ):
                 to_ubsubscribe.add(msg_type)
+        if not fit_subscribed_affectors:
+            self.__fit_subscribed_affectors.pop(fit, None)
         if to_ubsubscribe:
             fit._unsubscribe(self, to_ubsubscribe)
 
@@ -417,6 +599,30 @@ class CalculationService(BaseSubscriber):
             projectors.add(projector)
         return projectors
 
+    def __revise_range_dependents(self, projector, tgt_items, attr_changes):
+        """Remove range multipliers and values of attributes relying on them.
+
+        Args:
+            projector: Projector whose range to targets changed.
+            tgt_items: Items whose range to projector changed.
+            attr_changes: Dictionary in {item: {attribute IDs}} format, which
+                will be filled with IDs of attributes whose values were removed.
+        """
+        effect = projector.effect
+        if effect.range_attr_id is None:
+            return
+        for tgt_item in tgt_items:
+            self.__range_mults.pop((projector, tgt_item), None)
+        for affector_spec in self.__generate_projected_affectors(
+            projector.item, (effect.id,)
+        ):
+            for affectee_item in self.__affections.get_projected_affectee_items(
+                affector_spec, tgt_items
+            ):
+                attr_id = affector_spec.modifier.affectee_attr_id
+                if affectee_item.attrs._force_recalc(attr_id):
+                    attr_changes.setdefault(affectee_item, set()).add(attr_id)
+
     # Auxiliary methods
     def __publish_attr_changes(self, attr_changes):
         # Format: {fit: {item: {attr_ids}}}
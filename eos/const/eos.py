@@ -106,6 +106,7 @@ class ModDomain(IntEnum):
     ship = 3
     target = 4
     other = 5  # Module for charge, charge for module
+    fleet = 6  # Every fit in fleet of the source item's fit, including its own
 
 
 @unique
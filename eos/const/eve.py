@@ -77,6 +77,8 @@ class AttrId(IntEnum):
     shield_capacity = 263
     # Repairing
     armor_dmg_amount = 84
+    shield_bonus = 68
+    structure_dmg_amount = 83
     charged_armor_dmg_mult = 1886
     # Charge-related
     ammo_loaded = 127
@@ -167,14 +169,25 @@ class AttrId(IntEnum):
     fighter_ability_kamikaze_dmg_therm = 2326
     fighter_ability_kamikaze_dmg_kin = 2327
     fighter_ability_kamikaze_dmg_expl = 2328
+    # Command bursts
+    warfare_buff_1_id = 2468
+    warfare_buff_1_value = 2469
+    warfare_buff_2_id = 2470
+    warfare_buff_2_value = 2471
+    warfare_buff_3_id = 2536
+    warfare_buff_3_value = 2537
+    warfare_buff_4_id = 2596
+    warfare_buff_4_value = 2597
     # Misc
     agility = 70
     aoe_cloud_size = 654
     aoe_cloud_size_bonus = 848
+    aoe_dmg_reduction_factor = 1353
     aoe_velocity = 653
     aoe_velocity_bonus = 847
     capacity = 38
     dmg_mult = 64
+    emp_field_range = 99
     explosion_delay = 281
     explosion_delay_bonus = 596
     falloff = 158
@@ -188,7 +201,9 @@ class AttrId(IntEnum):
     missile_dmg_mult = 212
     missile_velocity_bonus = 547
     module_reactivation_delay = 669
+    optimal_sig_radius = 620
     radius = 162
+    scan_resolution = 564
     signature_radius = 552
     signature_radius_bonus = 554
     speed_boost_factor = 567
@@ -259,11 +274,19 @@ class EffectId(IntEnum):
     module_bonus_afterburner = 6731
     module_bonus_ancillary_remote_armor_repairer = 6651
     module_bonus_microwarpdrive = 6730
+    module_bonus_warfare_link_armor = 6732
+    module_bonus_warfare_link_info = 6733
+    module_bonus_warfare_link_mining = 6736
+    module_bonus_warfare_link_shield = 6734
+    module_bonus_warfare_link_skirmish = 6735
     online = 16
     projectile_fired = 34
     remote_webifier_falloff = 6426
     rig_slot = 2663
     ship_module_guidance_disruptor = 6423
+    ship_module_remote_armor_repairer = 6188
+    ship_module_remote_hull_repairer = 6185
+    ship_module_remote_shield_booster = 6186
     ship_module_tracking_disruptor = 6424
     subsystem = 3772
     super_weapon_amarr = 4489
@@ -322,6 +345,18 @@ class FighterAbilityId(IntEnum):
     webs = 2
 
 
+@unique
+class WarfareBuffId(IntEnum):
+    """Command burst buff IDs."""
+    armor_energizing = 13
+    armor_reinforcement = 15
+    evasive_maneuvers = 20
+    evasive_maneuvers_agility = 60
+    sensor_optimization = 16
+    shield_extension = 12
+    shield_harmonizing = 10
+
+
 @unique
 class OperandId(IntEnum):
     """Expression operand IDs."""
@@ -17,9 +17,3 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Eos. If not, see <http://www.gnu.org/licenses/>.
 # ==============================================================================
-
-
-from .custom import load_customizations
-
-
-load_customizations()
@@ -37,6 +37,10 @@ class Attribute:
             penalized (False) or not (True).
     """
 
+    __slots__ = (
+        'id', 'max_attr_id', 'default_value', 'high_is_good', 'stackable',
+        '__weakref__')
+
     def __init__(
             self, attr_id, max_attr_id=None, default_value=None,
             high_is_good=True, stackable=True):
@@ -46,6 +50,20 @@ class Attribute:
         self.high_is_good = bool(high_is_good)
         self.stackable = bool(stackable)
 
+    @property
+    def _fingerprint(self):
+        """Get tuple which describes contents of the attribute.
+
+        Attributes with equal fingerprints are interchangeable.
+        """
+        return (
+            type(self),
+            self.id,
+            self.max_attr_id,
+            self.default_value,
+            self.high_is_good,
+            self.stackable)
+
     # Auxiliary methods
     def __repr__(self):
         spec = ['id']
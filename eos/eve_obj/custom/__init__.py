@@ -23,10 +23,3 @@
 This package contains all the customizations which should be applied to eve
 objects.
 """
-
-
-from eos.util.dynamic_load import load_submodules
-
-
-def load_customizations():
-    load_submodules(__path__, __name__)
@@ -33,6 +33,8 @@ from eos.pubsub.message import ItemRemoved
 
 class AncillaryRepAmountModifier(BasePythonModifier):
 
+    __slots__ = ()
+
     def __init__(self):
         BasePythonModifier.__init__(
             self,
@@ -0,0 +1,55 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+"""
+Command burst effects apply warfare buffs, which are defined outside of dogma,
+to all fits in fleet.
+"""
+
+
+from logging import getLogger
+
+from eos.const.eos import EffectBuildStatus
+from eos.const.eve import EffectId
+from eos.eve_obj.effect import EffectFactory
+from .modifier import make_command_burst_modifiers
+
+
+logger = getLogger(__name__)
+
+
+def add_command_burst_modifiers(effect):
+    if effect.modifiers:
+        msg = 'command burst effect has modifiers, overwriting them'
+        logger.info(msg)
+    effect.modifiers = make_command_burst_modifiers()
+    effect.build_status = EffectBuildStatus.custom
+
+
+for effect_id in (
+    EffectId.module_bonus_warfare_link_armor,
+    EffectId.module_bonus_warfare_link_info,
+    EffectId.module_bonus_warfare_link_mining,
+    EffectId.module_bonus_warfare_link_shield,
+    EffectId.module_bonus_warfare_link_skirmish
+):
+    EffectFactory.reg_cust_instance_by_id(
+        add_command_burst_modifiers, effect_id)
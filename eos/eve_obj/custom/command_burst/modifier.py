@@ -0,0 +1,130 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos.const.eos import ModAffecteeFilter
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eve import AttrId
+from eos.const.eve import WarfareBuffId
+from eos.eve_obj.modifier import BasePythonModifier
+from eos.eve_obj.modifier import ModificationCalculationError
+from eos.pubsub.message import AttrsValueChanged
+from eos.pubsub.message import ItemLoaded
+from eos.pubsub.message import ItemUnloaded
+
+
+# Charge attributes which define buffs applied by command burst
+# Format: ((buff ID attribute ID, buff value attribute ID), ...)
+BUFF_ATTR_IDS = (
+    (AttrId.warfare_buff_1_id, AttrId.warfare_buff_1_value),
+    (AttrId.warfare_buff_2_id, AttrId.warfare_buff_2_value),
+    (AttrId.warfare_buff_3_id, AttrId.warfare_buff_3_value),
+    (AttrId.warfare_buff_4_id, AttrId.warfare_buff_4_value))
+
+BUFF_VALUE_ATTR_IDS = frozenset(v for _, v in BUFF_ATTR_IDS)
+
+# Ship attributes modified by buffs
+# Format: {buff ID: (affectee attribute IDs)}
+BUFF_AFFECTEE_ATTR_IDS = {
+    WarfareBuffId.shield_harmonizing: (
+        AttrId.shield_em_dmg_resonance,
+        AttrId.shield_therm_dmg_resonance,
+        AttrId.shield_kin_dmg_resonance,
+        AttrId.shield_expl_dmg_resonance),
+    WarfareBuffId.shield_extension: (AttrId.shield_capacity,),
+    WarfareBuffId.armor_energizing: (
+        AttrId.armor_em_dmg_resonance,
+        AttrId.armor_therm_dmg_resonance,
+        AttrId.armor_kin_dmg_resonance,
+        AttrId.armor_expl_dmg_resonance),
+    WarfareBuffId.armor_reinforcement: (AttrId.armor_hp,),
+    WarfareBuffId.sensor_optimization: (AttrId.scan_resolution,),
+    WarfareBuffId.evasive_maneuvers: (AttrId.signature_radius,),
+    WarfareBuffId.evasive_maneuvers_agility: (AttrId.agility,)}
+
+
+class CommandBurstModifier(BasePythonModifier):
+    """Applies single attribute modification of a buff to fleet ships.
+
+    Buff ID and its value are taken from charge loaded into command burst
+    module.
+
+    Args:
+        buff_id: ID of buff this modifier applies.
+        affectee_attr_id: ID of ship attribute buff modifies.
+    """
+
+    __slots__ = ('__buff_id',)
+
+    def __init__(self, buff_id, affectee_attr_id):
+        BasePythonModifier.__init__(
+            self,
+            affectee_filter=ModAffecteeFilter.item,
+            affectee_domain=ModDomain.fleet,
+            affectee_filter_extra_arg=None,
+            affectee_attr_id=affectee_attr_id)
+        self.__buff_id = buff_id
+
+    def get_modification(self, affector_item):
+        charge = getattr(affector_item, 'charge', None)
+        if charge is None:
+            raise ModificationCalculationError
+        # Buff IDs are not modified by anything, thus take them right from
+        # charge type
+        charge_type_attrs = charge._type_attrs
+        for buff_id_attr_id, buff_value_attr_id in BUFF_ATTR_IDS:
+            if charge_type_attrs.get(buff_id_attr_id) != self.__buff_id:
+                continue
+            try:
+                buff_value = charge.attrs[buff_value_attr_id]
+            except KeyError as e:
+                raise ModificationCalculationError from e
+            return ModOperator.post_percent, buff_value
+        raise ModificationCalculationError
+
+    def __revise_on_attr_changed(self, msg, affector_item):
+        charge = getattr(affector_item, 'charge', None)
+        attr_ids = msg.attr_changes.get(charge)
+        return bool(attr_ids and BUFF_VALUE_ATTR_IDS.intersection(attr_ids))
+
+    def __revise_on_item_loaded(self, msg, affector_item):
+        # Buffs depend on loaded charge
+        return msg.item._container is affector_item
+
+    __revision_map = {
+        AttrsValueChanged: __revise_on_attr_changed,
+        ItemLoaded: __revise_on_item_loaded,
+        ItemUnloaded: __revise_on_item_loaded}
+
+    @property
+    def revise_msg_types(self):
+        return set(self.__revision_map)
+
+    def revise_modification(self, msg, affector_item):
+        revision_func = self.__revision_map[type(msg)]
+        return revision_func(self, msg, affector_item)
+
+
+def make_command_burst_modifiers():
+    return tuple(
+        CommandBurstModifier(buff_id, affectee_attr_id)
+        for buff_id, affectee_attr_ids in BUFF_AFFECTEE_ATTR_IDS.items()
+        for affectee_attr_id in affectee_attr_ids)
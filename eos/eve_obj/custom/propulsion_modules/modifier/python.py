@@ -35,6 +35,8 @@ logger = getLogger(__name__)
 
 class PropulsionModuleVelocityBoostModifier(BasePythonModifier):
 
+    __slots__ = ()
+
     def __init__(self):
         BasePythonModifier.__init__(
             self,
@@ -17,10 +17,3 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Eos. If not, see <http://www.gnu.org/licenses/>.
 # ==============================================================================
-
-
-from eos.util.dynamic_load import load_submodules
-
-
-def load_dmg_dealers():
-    load_submodules(__path__, __name__)
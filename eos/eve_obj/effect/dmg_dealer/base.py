@@ -28,9 +28,14 @@ from eos.stats_container import DmgStats
 
 class DmgDealerEffect(Effect, metaclass=ABCMeta):
 
+    __slots__ = ()
+
     # Flag which controls if this effect suppresses non-suppressor damage
     # dealers on its item
     suppress_dds = False
+    # Flag which tells if damage application to a target can be calculated for
+    # this effect
+    supports_application = True
 
     @abstractmethod
     def get_volley(self, item):
@@ -49,19 +54,44 @@ class DmgDealerEffect(Effect, metaclass=ABCMeta):
             1 / cycle_parameters.average_time)
         return dps
 
+    def get_aoe_tgts(self, item):
+        """Get items hit by single activation of this effect.
+
+        Returns:
+            Set with items, or None if effect does not hit specific items in
+            solar system.
+        """
+        return None
+
     @abstractmethod
     def get_applied_volley(self, item, tgt_data):
         ...
 
+    def get_applied_volley_batch(self, item, tgt_datas):
+        """Get applied volley against multiple targets.
+
+        Effects which can share calculations between targets should override
+        it.
+        """
+        return [
+            self.get_applied_volley(item, tgt_data)
+            for tgt_data in tgt_datas]
+
     def get_applied_dps(self, item, tgt_data, reload):
+        return self.get_applied_dps_batch(item, (tgt_data,), reload)[0]
+
+    def get_applied_dps_batch(self, item, tgt_datas, reload):
+        """Get applied DPS against multiple targets."""
         cycle_parameters = self.get_cycle_parameters(item, reload)
         if cycle_parameters is None:
-            return DmgStats(0, 0, 0, 0)
-        volley = self.get_applied_volley(item, tgt_data)
-        dps = DmgStats(
-            volley.em,
-            volley.thermal,
-            volley.kinetic,
-            volley.explosive,
-            1 / cycle_parameters.average_time)
-        return dps
+            return [DmgStats(0, 0, 0, 0) for _ in tgt_datas]
+        dpss = []
+        for volley in self.get_applied_volley_batch(item, tgt_datas):
+            dps = DmgStats(
+                volley.em,
+                volley.thermal,
+                volley.kinetic,
+                volley.explosive,
+                1 / cycle_parameters.average_time)
+            dpss.append(dps)
+        return dpss
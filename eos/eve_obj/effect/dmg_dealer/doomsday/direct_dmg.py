@@ -26,6 +26,10 @@ from eos.stats_container import DmgStats
 
 class DoomsdayDirect(DmgDealerEffect):
 
+    __slots__ = ()
+
+    supports_application = False
+
     def get_volley(self, item):
         em = item.attrs.get(AttrId.em_dmg, 0)
         therm = item.attrs.get(AttrId.therm_dmg, 0)
@@ -33,5 +37,11 @@ class DoomsdayDirect(DmgDealerEffect):
         expl = item.attrs.get(AttrId.expl_dmg, 0)
         return DmgStats(em, therm, kin, expl)
 
+    def get_aoe_tgts(self, item):
+        tgt = getattr(item, 'target', None)
+        if tgt is None:
+            return set()
+        return {tgt}
+
     def get_applied_volley(self, item, tgt_data):
         raise NotImplementedError
@@ -28,6 +28,10 @@ from .base import DmgDealerEffect
 
 class EmpWave(DmgDealerEffect):
 
+    __slots__ = ()
+
+    supports_application = False
+
     def get_volley(self, item):
         em = item.attrs.get(AttrId.em_dmg, 0)
         therm = item.attrs.get(AttrId.therm_dmg, 0)
@@ -35,6 +39,14 @@ class EmpWave(DmgDealerEffect):
         expl = item.attrs.get(AttrId.expl_dmg, 0)
         return DmgStats(em, therm, kin, expl)
 
+    def get_aoe_tgts(self, item):
+        # Smartbombs hit everything around the ship they are fitted to
+        carrier = item._solsys_carrier
+        aoe_range = self.get_optimal_range(item)
+        if carrier is None or aoe_range is None:
+            return set()
+        return carrier._fit.solar_system.items_within(carrier, aoe_range)
+
     def get_applied_volley(self, item, tgt_data):
         raise NotImplementedError
 
@@ -27,7 +27,10 @@ from eos.stats_container import DmgStats
 
 class FighterAbilityKamikaze(DmgDealerEffect, FighterEffect):
 
+    __slots__ = ()
+
     suppress_dds = True
+    supports_application = False
 
     def get_volley(self, item):
         if not self.get_cycles_until_reload(item):
@@ -45,8 +48,8 @@ class FighterAbilityKamikaze(DmgDealerEffect, FighterEffect):
     def get_applied_volley(self, item, tgt_data):
         raise NotImplementedError
 
-    def get_applied_dps(self, item, tgt_data, reload):
-        return DmgStats(0, 0, 0, 0)
+    def get_applied_dps_batch(self, item, tgt_datas, reload):
+        return [DmgStats(0, 0, 0, 0) for _ in tgt_datas]
 
     def get_cycles_until_reload(self, item):
         return 1
@@ -19,15 +19,22 @@
 # ==============================================================================
 
 
+import math
+
 from eos.const.eve import AttrId
 from eos.const.eve import EffectId
 from eos.eve_obj.effect.dmg_dealer.base import DmgDealerEffect
 from eos.eve_obj.effect.fighter_effect import FighterEffect
+from eos.stats_container import Coordinates
 from eos.stats_container import DmgStats
 
 
 class FighterAbilityLaunchBomb(DmgDealerEffect, FighterEffect):
 
+    __slots__ = ()
+
+    supports_application = False
+
     def get_volley(self, item):
         if not self.get_cycles_until_reload(item):
             return DmgStats(0, 0, 0, 0)
@@ -47,6 +54,28 @@ class FighterAbilityLaunchBomb(DmgDealerEffect, FighterEffect):
         squad_size = self.get_squad_size(item)
         return DmgStats(em, therm, kin, expl, squad_size)
 
+    def get_aoe_tgts(self, item):
+        charge = self.get_charge(item)
+        if charge is None:
+            return set()
+        aoe_range = charge.attrs.get(AttrId.emp_field_range)
+        if aoe_range is None:
+            return set()
+        # Bombs fly straight in direction squad is facing, and explode after
+        # their flight time passes
+        velocity = charge.attrs.get(AttrId.max_velocity, 0)
+        flight_time = charge.attrs.get(AttrId.explosion_delay, 0) / 1000
+        flight_range = velocity * flight_time
+        x, y, z = item.coordinate
+        dir_x, dir_y, dir_z = item.orientation
+        dir_len = math.sqrt(dir_x ** 2 + dir_y ** 2 + dir_z ** 2)
+        explosion_coordinate = Coordinates(
+            x + dir_x / dir_len * flight_range,
+            y + dir_y / dir_len * flight_range,
+            z + dir_z / dir_len * flight_range)
+        return item._fit.solar_system.items_within_point(
+            explosion_coordinate, aoe_range)
+
     def get_applied_volley(self, item, tgt_data):
         raise NotImplementedError
 
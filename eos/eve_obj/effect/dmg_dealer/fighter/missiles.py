@@ -27,6 +27,10 @@ from eos.stats_container import DmgStats
 
 class FighterAbilityMissiles(DmgDealerEffect, FighterEffect):
 
+    __slots__ = ()
+
+    supports_application = False
+
     def get_volley(self, item):
         if not self.get_cycles_until_reload(item):
             return DmgStats(0, 0, 0, 0)
@@ -29,6 +29,8 @@ from eos.stats_container import DmgStats
 
 class TurretDmgEffect(DmgDealerEffect, metaclass=ABCMeta):
 
+    __slots__ = ()
+
     @abstractmethod
     def _get_base_dmg_item(self, item):
         """Get item which carries base damage attributes."""
@@ -48,4 +50,67 @@ class TurretDmgEffect(DmgDealerEffect, metaclass=ABCMeta):
         return DmgStats(em, therm, kin, expl, mult)
 
     def get_applied_volley(self, item, tgt_data):
-        raise NotImplementedError
+        return self.get_applied_volley_batch(item, (tgt_data,))[0]
+
+    def get_applied_volley_batch(self, item, tgt_datas):
+        volley = self.get_volley(item)
+        # Fetch attacker-side data just once for all the targets
+        optimal = self.get_optimal_range(item) or 0
+        falloff = self.get_falloff_range(item) or 0
+        tracking = self.get_tracking_speed(item) or 0
+        sig_res = item.attrs.get(AttrId.optimal_sig_radius)
+        applied_volleys = []
+        for tgt_data in tgt_datas:
+            if tgt_data is None:
+                applied_volleys.append(volley)
+                continue
+            cth = self.__get_chance_to_hit(
+                optimal, falloff, tracking, sig_res, tgt_data)
+            applied_volley = DmgStats(
+                volley.em,
+                volley.thermal,
+                volley.kinetic,
+                volley.explosive,
+                self.__get_dmg_mult(cth))
+            applied_volleys.append(applied_volley)
+        return applied_volleys
+
+    @staticmethod
+    def __get_chance_to_hit(optimal, falloff, tracking, sig_res, tgt_data):
+        """Calculate chance to hit target described by passed data."""
+        exponent = 0
+        # Range component
+        if tgt_data.range is not None and tgt_data.range > optimal:
+            if falloff <= 0:
+                return 0
+            exponent += ((tgt_data.range - optimal) / falloff) ** 2
+        # Tracking component
+        if tgt_data.angular_speed:
+            if tracking <= 0:
+                return 0
+            tracking_ratio = tgt_data.angular_speed / tracking
+            # Signature resolution is taken into account only when we know
+            # both turret and target sides
+            if sig_res is not None and tgt_data.sig_radius is not None:
+                if tgt_data.sig_radius <= 0:
+                    return 0
+                tracking_ratio *= sig_res / tgt_data.sig_radius
+            exponent += tracking_ratio ** 2
+        return 0.5 ** exponent
+
+    @staticmethod
+    def __get_dmg_mult(cth):
+        """Convert chance to hit into average damage multiplier.
+
+        Wrecking shots (1% chance, 300% damage) are taken into account, rest of
+        hits deal random damage which depends on chance to hit.
+        """
+        wrecking_chance = min(cth, 0.01)
+        wrecking_part = wrecking_chance * 3
+        normal_chance = cth - wrecking_chance
+        if normal_chance > 0:
+            avg_dmg_mult = (0.01 + cth) / 2 + 0.49
+            normal_part = normal_chance * avg_dmg_mult
+        else:
+            normal_part = 0
+        return wrecking_part + normal_part
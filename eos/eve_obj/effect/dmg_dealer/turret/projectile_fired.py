@@ -25,6 +25,8 @@ from .base import TurretDmgEffect
 
 class ProjectileFired(TurretDmgEffect):
 
+    __slots__ = ()
+
     def _get_base_dmg_item(self, item):
         return self.get_charge(item)
 
@@ -28,6 +28,8 @@ from .base import TurretDmgEffect
 
 class TargetAttack(TurretDmgEffect):
 
+    __slots__ = ()
+
     def _get_base_dmg_item(self, item):
         charge = self.get_charge(item)
         dmg_attr_ids = {
@@ -23,12 +23,15 @@ from eos.const.eve import AttrId
 from eos.const.eve import EffectId
 from eos.eve_obj.effect import EffectFactory
 from eos.eve_obj.effect.helper_func import get_cycles_until_reload_generic
+from eos.eve_obj.effect.helper_func import get_missile_dmg_mult
 from eos.stats_container import DmgStats
 from .base import DmgDealerEffect
 
 
 class UseMissiles(DmgDealerEffect):
 
+    __slots__ = ()
+
     def get_cycles_until_reload(self, item):
         return get_cycles_until_reload_generic(item)
 
@@ -55,7 +58,44 @@ class UseMissiles(DmgDealerEffect):
         return DmgStats(em, therm, kin, expl)
 
     def get_applied_volley(self, item, tgt_data):
-        raise NotImplementedError
+        return self.get_applied_volley_batch(item, (tgt_data,))[0]
+
+    def get_applied_volley_batch(self, item, tgt_datas):
+        volley = self.get_volley(item)
+        if volley.total == 0:
+            return [volley for _ in tgt_datas]
+        # Fetch missile data just once for all the targets; missile attributes
+        # already include modifications applied to them, e.g. by guidance
+        # disruptors projected onto owner of launcher
+        charge = self.get_charge(item)
+        flight_range = self.__get_flight_range(charge)
+        aoe_cloud_size = charge.attrs.get(AttrId.aoe_cloud_size)
+        aoe_velocity = charge.attrs.get(AttrId.aoe_velocity)
+        aoe_drf = charge.attrs.get(AttrId.aoe_dmg_reduction_factor)
+        applied_volleys = []
+        for tgt_data in tgt_datas:
+            if tgt_data is None:
+                applied_volleys.append(volley)
+                continue
+            mult = get_missile_dmg_mult(
+                flight_range, aoe_cloud_size, aoe_velocity, aoe_drf, tgt_data)
+            applied_volley = DmgStats(
+                volley.em,
+                volley.thermal,
+                volley.kinetic,
+                volley.explosive,
+                mult)
+            applied_volleys.append(applied_volley)
+        return applied_volleys
+
+    @staticmethod
+    def __get_flight_range(charge):
+        """Get max distance missile can fly, or None if it is unknown."""
+        velocity = charge.attrs.get(AttrId.max_velocity)
+        flight_time_ms = charge.attrs.get(AttrId.explosion_delay)
+        if velocity is None or flight_time_ms is None:
+            return None
+        return velocity * flight_time_ms / 1000
 
 
 EffectFactory.reg_cust_class_by_id(
@@ -66,6 +66,14 @@ class Effect:
             attribute calculation may be improper in several edge cases.
     """
 
+    __slots__ = (
+        'id', 'category_id', 'is_offensive', 'is_assistance',
+        'duration_attr_id', 'discharge_attr_id', 'range_attr_id',
+        'falloff_attr_id', 'tracking_speed_attr_id',
+        'fitting_usage_chance_attr_id', 'resist_attr_id', 'build_status',
+        'modifiers', '_cached_fingerprint', '_cached_local_modifiers',
+        '_cached_projected_modifiers', '_cached_state', '__weakref__')
+
     def __init__(
             self, effect_id, category_id=None, is_offensive=False,
             is_assistance=False, duration_attr_id=None,
@@ -87,6 +95,28 @@ class Effect:
         self.build_status = build_status
         self.modifiers = modifiers
 
+    @cached_property
+    def _fingerprint(self):
+        """Get tuple which describes contents of the effect.
+
+        Effects with equal fingerprints are interchangeable.
+        """
+        return (
+            type(self),
+            self.id,
+            self.category_id,
+            self.is_offensive,
+            self.is_assistance,
+            self.duration_attr_id,
+            self.discharge_attr_id,
+            self.range_attr_id,
+            self.falloff_attr_id,
+            self.tracking_speed_attr_id,
+            self.fitting_usage_chance_attr_id,
+            self.resist_attr_id,
+            self.build_status,
+            tuple(m._fingerprint for m in self.modifiers))
+
     @property
     def is_projectable(self):
         return self.category_id == EffectCategoryId.target
@@ -32,6 +32,8 @@ from eos.eve_obj.modifier import DogmaModifier
 
 class ShipModuleGundanceDisruptor(Effect):
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         Effect.__init__(self, *args, **kwargs)
         aoe_cloud_size_modifier = DogmaModifier(
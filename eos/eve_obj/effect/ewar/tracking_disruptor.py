@@ -32,6 +32,8 @@ from eos.eve_obj.modifier import DogmaModifier
 
 class ShipModuleTrackingDisruptor(Effect):
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         Effect.__init__(self, *args, **kwargs)
         max_range_modifier = DogmaModifier(
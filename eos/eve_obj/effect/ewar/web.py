@@ -31,6 +31,8 @@ from eos.eve_obj.modifier import DogmaModifier
 
 class RemoteWebifierFalloff(Effect):
 
+    __slots__ = ()
+
     def __init__(self, *args, resist_attr_id=None, **kwargs):
         Effect.__init__(
             self, *args, resist_attr_id=AttrId.stasis_webifier_resistance,
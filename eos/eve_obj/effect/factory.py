@@ -19,6 +19,7 @@
 # ==============================================================================
 
 
+from eos.eve_obj.registry import CustomizationRegistry
 from .effect import Effect
 
 
@@ -44,6 +45,7 @@ class EffectFactory:
         Returns:
             Effect instance.
         """
+        CustomizationRegistry.load()
         effect_class = cls._class_id_map.get(effect_id, Effect)
         effect = effect_class(effect_id, *args, **kwargs)
         for cust_func in cls._instance_id_map.get(effect.id, ()):
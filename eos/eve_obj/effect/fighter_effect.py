@@ -24,6 +24,8 @@ from .effect import Effect
 
 class FighterEffect(Effect):
 
+    __slots__ = ()
+
     def get_cycles_until_reload(self, item):
         try:
             ability_data = item._type.effects_data[self.id]
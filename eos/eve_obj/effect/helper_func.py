@@ -69,3 +69,59 @@ def get_cycles_until_reload_crystal(item):
     if cycles == 0:
         return None
     return cycles
+
+
+def get_missile_dmg_mult(
+        flight_range, aoe_cloud_size, aoe_velocity, aoe_drf, tgt_data):
+    """Get damage multiplier of missile-like entity against target.
+
+    Args:
+        flight_range: Max distance explosion can reach, or None if it's
+            unknown.
+        aoe_cloud_size: Explosion radius, or None if it's unknown.
+        aoe_velocity: Explosion velocity, or None if it's unknown.
+        aoe_drf: Damage reduction factor, or None if it's unknown.
+        tgt_data: TgtData helper container instance.
+
+    Returns:
+        Damage multiplier in range [0, 1]. Parts of formula for which there's
+        not enough data are not taken into account.
+    """
+    if (
+        flight_range is not None and
+        tgt_data.range is not None and
+        tgt_data.range > flight_range
+    ):
+        return 0
+    mults = [1]
+    sig_ratio = 1
+    if tgt_data.sig_radius is not None and aoe_cloud_size:
+        sig_ratio = tgt_data.sig_radius / aoe_cloud_size
+        mults.append(sig_ratio)
+    if (
+        tgt_data.velocity and
+        aoe_velocity is not None and
+        aoe_drf is not None
+    ):
+        mults.append((sig_ratio * aoe_velocity / tgt_data.velocity) ** aoe_drf)
+    return min(mults)
+
+
+def get_range_mult(optimal_range, falloff_range, distance):
+    """Get strength multiplier of range-dependent effect against target.
+
+    Args:
+        optimal_range: Range within which effect is applied at full strength,
+            or None if it's unknown.
+        falloff_range: Falloff range, or None if it's unknown. When it is not
+            defined, effect does not reach targets beyond optimal range.
+        distance: Distance to target.
+
+    Returns:
+        Strength multiplier in range [0, 1].
+    """
+    if optimal_range is None or distance <= optimal_range:
+        return 1
+    if not falloff_range:
+        return 0
+    return 0.5 ** (((distance - optimal_range) / falloff_range) ** 2)
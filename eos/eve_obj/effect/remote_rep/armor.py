@@ -19,20 +19,21 @@
 # ==============================================================================
 
 
-from importlib import import_module
-from pkgutil import iter_modules
+from eos.const.eve import AttrId
+from eos.const.eve import EffectId
+from eos.eve_obj.effect import EffectFactory
+from eos.stats_container import ItemHP
+from .base import RemoteRepEffect
 
 
-def load_submodules(path_fs, path_mod):
-    """Walk through package and load all child modules within it.
+class ShipModuleRemoteArmorRepairer(RemoteRepEffect):
 
-    Loads just direct children, their children and anything below it should be
-    loaded by packages themselves.
+    __slots__ = ()
 
-    Args:
-        path_fs: Location of package on filesystem.
-        path_mod: Location of package within running python instance.
-    """
-    prefix = '{}.'.format(path_mod)
-    for _, name, _ in iter_modules(path_fs, prefix):
-        import_module(name)
+    def get_rep_amount(self, item):
+        return ItemHP(0, item.attrs.get(AttrId.armor_dmg_amount, 0), 0)
+
+
+EffectFactory.reg_cust_class_by_id(
+    ShipModuleRemoteArmorRepairer,
+    EffectId.ship_module_remote_armor_repairer)
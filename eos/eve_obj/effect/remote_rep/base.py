@@ -0,0 +1,57 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from abc import ABCMeta
+from abc import abstractmethod
+
+from eos.eve_obj.effect import Effect
+from eos.stats_container import ItemHP
+
+
+class RemoteRepEffect(Effect, metaclass=ABCMeta):
+    """Effect which repairs HP of its target."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def get_rep_amount(self, item):
+        """Get amount of HP repaired by single cycle.
+
+        Returns:
+            ItemHP helper container instance.
+        """
+        ...
+
+    def get_rps(self, item, reload):
+        """Get amount of HP repaired per second.
+
+        Returns:
+            ItemHP helper container instance.
+        """
+        cycle_parameters = self.get_cycle_parameters(item, reload)
+        if cycle_parameters is None:
+            return ItemHP(0, 0, 0)
+        rep_amount = self.get_rep_amount(item)
+        cycle_time = cycle_parameters.average_time
+        return ItemHP(
+            rep_amount.hull / cycle_time,
+            rep_amount.armor / cycle_time,
+            rep_amount.shield / cycle_time)
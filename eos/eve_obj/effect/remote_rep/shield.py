@@ -0,0 +1,39 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos.const.eve import AttrId
+from eos.const.eve import EffectId
+from eos.eve_obj.effect import EffectFactory
+from eos.stats_container import ItemHP
+from .base import RemoteRepEffect
+
+
+class ShipModuleRemoteShieldBooster(RemoteRepEffect):
+
+    __slots__ = ()
+
+    def get_rep_amount(self, item):
+        return ItemHP(0, 0, item.attrs.get(AttrId.shield_bonus, 0))
+
+
+EffectFactory.reg_cust_class_by_id(
+    ShipModuleRemoteShieldBooster,
+    EffectId.ship_module_remote_shield_booster)
@@ -34,6 +34,10 @@ class BaseModifier(metaclass=ABCMeta):
     when it should be applied, on which items, how to apply it, and so on.
     """
 
+    __slots__ = (
+        'affectee_filter', 'affectee_domain', 'affectee_filter_extra_arg',
+        'affectee_attr_id')
+
     def __init__(
             self, affectee_filter, affectee_domain,
             affectee_filter_extra_arg, affectee_attr_id):
@@ -42,6 +46,19 @@ class BaseModifier(metaclass=ABCMeta):
         self.affectee_filter_extra_arg = affectee_filter_extra_arg
         self.affectee_attr_id = affectee_attr_id
 
+    @property
+    def _fingerprint(self):
+        """Get tuple which describes contents of the modifier.
+
+        Modifiers with equal fingerprints are interchangeable.
+        """
+        return (
+            type(self),
+            self.affectee_filter,
+            self.affectee_domain,
+            self.affectee_filter_extra_arg,
+            self.affectee_attr_id)
+
     @abstractmethod
     def get_modification(self, affector_item):
         """Get modification parameters.
@@ -87,21 +104,21 @@ class BaseModifier(metaclass=ABCMeta):
         return all((
             self.affectee_domain in (
                 ModDomain.self, ModDomain.character, ModDomain.ship,
-                ModDomain.target, ModDomain.other),
+                ModDomain.target, ModDomain.other, ModDomain.fleet),
             self.affectee_filter_extra_arg is None))
 
     def __validate_affectee_filter_domain(self):
         return all((
             self.affectee_domain in (
                 ModDomain.self, ModDomain.character,
-                ModDomain.ship, ModDomain.target),
+                ModDomain.ship, ModDomain.target, ModDomain.fleet),
             self.affectee_filter_extra_arg is None))
 
     def __validate_affectee_filter_domain_group(self):
         return all((
             self.affectee_domain in (
                 ModDomain.self, ModDomain.character,
-                ModDomain.ship, ModDomain.target),
+                ModDomain.ship, ModDomain.target, ModDomain.fleet),
             # References group via ID
             isinstance(self.affectee_filter_extra_arg, Integral)))
 
@@ -109,12 +126,12 @@ class BaseModifier(metaclass=ABCMeta):
         return all((
             self.affectee_domain in (
                 ModDomain.self, ModDomain.character,
-                ModDomain.ship, ModDomain.target),
+                ModDomain.ship, ModDomain.target, ModDomain.fleet),
             # References skill via ID
             isinstance(self.affectee_filter_extra_arg, Integral)))
 
     def __validate_affectee_filter_owner_skillrq(self):
         return all((
-            self.affectee_domain == ModDomain.character,
+            self.affectee_domain in (ModDomain.character, ModDomain.fleet),
             # References skill via ID
             isinstance(self.affectee_filter_extra_arg, Integral)))
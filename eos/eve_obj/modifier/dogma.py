@@ -36,6 +36,8 @@ class DogmaModifier(BaseModifier):
     efficiently.
     """
 
+    __slots__ = ('operator', 'affector_attr_id')
+
     def __init__(
         self,
         affectee_filter=None,
@@ -65,6 +67,11 @@ class DogmaModifier(BaseModifier):
         else:
             return self.operator, value
 
+    @property
+    def _fingerprint(self):
+        return super()._fingerprint + (
+            self.operator, self.affector_attr_id)
+
     # Validation-related methods
     @property
     def _valid(self):
@@ -33,6 +33,8 @@ class BasePythonModifier(BaseModifier, metaclass=ABCMeta):
     at performance cost.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         affectee_filter=None,
@@ -0,0 +1,79 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+"""
+Static registry of modules which customize eve objects.
+
+When imported, these modules register custom effect classes and customization
+functions in eve object factories. To keep import of the package cheap, they
+are imported only when any factory produces its first object.
+"""
+
+
+from importlib import import_module
+
+
+CUSTOMIZATION_MODULES = (
+    # Custom effect classes
+    'eos.eve_obj.effect.dmg_dealer.doomsday',
+    'eos.eve_obj.effect.dmg_dealer.emp_wave',
+    'eos.eve_obj.effect.dmg_dealer.fighter',
+    'eos.eve_obj.effect.dmg_dealer.turret',
+    'eos.eve_obj.effect.dmg_dealer.use_missiles',
+    'eos.eve_obj.effect.ewar.guidance_disruptor',
+    'eos.eve_obj.effect.ewar.tracking_disruptor',
+    'eos.eve_obj.effect.ewar.web',
+    'eos.eve_obj.effect.remote_rep.armor',
+    'eos.eve_obj.effect.remote_rep.hull',
+    'eos.eve_obj.effect.remote_rep.shield',
+    # Customizations of eve objects
+    'eos.eve_obj.custom.ancillary_armor_repairer',
+    'eos.eve_obj.custom.character_missile_dmg',
+    'eos.eve_obj.custom.command_burst',
+    'eos.eve_obj.custom.online_effect_category',
+    'eos.eve_obj.custom.propulsion_modules',
+    'eos.eve_obj.custom.reactive_armor_hardener')
+
+
+class CustomizationRegistry:
+    """Imports customization modules on demand."""
+
+    _loaded = False
+    _loading = False
+
+    @classmethod
+    def load(cls):
+        """Import all customization modules, if not imported yet.
+
+        If any module fails to import, the error is propagated, and import is
+        attempted again on next call.
+        """
+        # Customization modules produce eve objects too, thus do nothing when
+        # requested during import
+        if cls._loaded or cls._loading:
+            return
+        cls._loading = True
+        try:
+            for module_name in CUSTOMIZATION_MODULES:
+                import_module(module_name)
+        finally:
+            cls._loading = False
+        cls._loaded = True
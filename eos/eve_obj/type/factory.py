@@ -19,6 +19,7 @@
 # ==============================================================================
 
 
+from eos.eve_obj.registry import CustomizationRegistry
 from .type import Type
 
 
@@ -40,6 +41,7 @@ class TypeFactory:
         Returns:
             Item type instance.
         """
+        CustomizationRegistry.load()
         item_type = Type(*args, **kwargs)
         for cust_func in cls._instance_funcs:
             cust_func(item_type)
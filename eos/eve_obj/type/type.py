@@ -52,6 +52,11 @@ class Type:
             (cooldown time, charge quantity)} format.
     """
 
+    __slots__ = (
+        'id', 'group_id', 'category_id', 'attrs', 'effects', 'default_effect',
+        'abilities_data', '_cached_fingerprint', '_cached_effects_data',
+        '_cached_required_skills', '_cached_max_state', '__weakref__')
+
     def __init__(
             self, type_id, group_id=None, category_id=None, attrs=None,
             effects=(), default_effect=None, abilities_data=None):
@@ -67,6 +72,29 @@ class Type:
             abilities_data = {}
         self.abilities_data = abilities_data
 
+    @cached_property
+    def _fingerprint(self):
+        """Get tuple which describes contents of the item type.
+
+        Item types with equal fingerprints are interchangeable, e.g. when item
+        is switched between sources.
+        """
+        if self.default_effect is None:
+            default_effect_id = None
+        else:
+            default_effect_id = self.default_effect.id
+        return (
+            type(self),
+            self.id,
+            self.group_id,
+            self.category_id,
+            tuple(sorted(self.attrs.items())),
+            tuple(
+                self.effects[effect_id]._fingerprint
+                for effect_id in sorted(self.effects)),
+            default_effect_id,
+            tuple(sorted(self.abilities_data.items())))
+
     @cached_property
     def effects_data(self):
         """Get extended effect data."""
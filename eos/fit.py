@@ -109,6 +109,7 @@ class Fit(FitMsgBroker):
         # here. It has to be assigned after fit starts to track list of items
         # to make sure it's part of it
         self.character = Character(TypeId.character_static)
+        self._fleet = None
         # Add fit to solar system
         self.solar_system = None
         if solar_system is None:
@@ -134,6 +135,39 @@ class Fit(FitMsgBroker):
         """
         self._restriction.validate(skip_checks)
 
+    def is_valid(self, skip_checks=()):
+        """Check if fit is valid.
+
+        Cheaper alternative to validate(), which stops on the first failure and
+        doesn't provide any data about it.
+
+        Args:
+            skip_checks (optional): Iterable with restriction types check
+                should ignore. By default, nothing is ignored.
+
+        Returns:
+            True if fit passes validation, False otherwise.
+        """
+        return self._restriction.is_valid(skip_checks)
+
+    @property
+    def validation_timings(self):
+        """Access point for timing counters of fit restrictions.
+
+        Returns:
+            Dictionary in {restriction type: RestrictionTiming helper container
+            instance} format.
+        """
+        return self._restriction.timings
+
+    @property
+    def fleet(self):
+        """Fleet this fit belongs to, or None.
+
+        Membership is controlled via fleet's fits container.
+        """
+        return self._fleet
+
     @property
     def default_incoming_dmg(self):
         """Access point for default incoming damage profile.
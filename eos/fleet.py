@@ -19,5 +19,105 @@
 # ==============================================================================
 
 
+from eos.util.repr import make_repr_str
+
+
 class Fleet:
-    pass
+    """Defines fleet.
+
+    Fits which belong to the same fleet receive fleet-wide modifications (e.g.
+    command bursts) from each other. Such modifications are registered only
+    once by fit which carries them, regardless of fleet size, and are applied
+    to members which are located in the same solar system.
+
+    Attributes:
+        fits: Set for fits which belong to the fleet.
+    """
+
+    def __init__(self):
+        self.fits = FleetFitSet(self)
+
+    # Auxiliary methods
+    def __repr__(self):
+        spec = ['fits']
+        return make_repr_str(self, spec)
+
+
+class FleetFitSet:
+    """Unordered container for fleet members.
+
+    Implements set-like interface.
+
+    Args:
+        fleet: Fleet this container is attached to.
+    """
+
+    def __init__(self, fleet):
+        self.__fleet = fleet
+        self.__set = set()
+
+    # Modifying methods
+    def add(self, fit):
+        """Add fit to the container.
+
+        Args:
+            fit: Fit to add.
+
+        Raises:
+            ValueError: If fit cannot be added to the container (e.g. already
+                belongs to some fleet).
+        """
+        if fit.fleet is not None:
+            raise ValueError(fit)
+        self.__set.add(fit)
+        fit._fleet = self.__fleet
+        calculator = self.__get_calculator(fit)
+        if calculator is not None:
+            calculator._revise_fleet_dependents(fit)
+
+    def remove(self, fit):
+        """Remove fit from the container.
+
+        Args:
+            fit: Fit to remove.
+
+        Raises:
+            KeyError: If fit cannot be removed from the container (e.g. it
+                doesn't belong to it).
+        """
+        if fit not in self.__set:
+            raise KeyError(fit)
+        self.__handle_fit_removal(fit)
+
+    def clear(self):
+        """Remove everything from the container."""
+        for fit in set(self.__set):
+            self.__handle_fit_removal(fit)
+
+    def __handle_fit_removal(self, fit):
+        calculator = self.__get_calculator(fit)
+        if calculator is not None:
+            calculator._revise_fleet_dependents(fit)
+        self.__set.remove(fit)
+        fit._fleet = None
+
+    @staticmethod
+    def __get_calculator(fit):
+        solar_system = fit.solar_system
+        if solar_system is None:
+            return None
+        return solar_system._calculator
+
+    # Non-modifying methods
+    def __iter__(self):
+        return iter(self.__set)
+
+    def __contains__(self, fit):
+        return fit in self.__set
+
+    def __len__(self):
+        return len(self.__set)
+
+    # Auxiliary methods
+    def __repr__(self):
+        return repr(self.__set)
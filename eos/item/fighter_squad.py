@@ -30,17 +30,19 @@ from .mixin.effect_stats import EffectStatsMixin
 from .mixin.solar_system import SolarSystemItemMixin
 from .mixin.state import MutableStateMixin
 from .mixin.tanking import BufferTankingMixin
+from .mixin.targetable import MultiTargetableMixin
 
 
 ABILITY_EFFECT_STATE = State.active
 
 
 class FighterSquad(
-        MutableStateMixin, BufferTankingMixin,
+        MutableStateMixin, BufferTankingMixin, MultiTargetableMixin,
         EffectStatsMixin, SolarSystemItemMixin):
     """Represents a fighter squad.
 
-    Unlike drones, fighter squad is single entity.
+    Unlike drones, fighter squad is single entity. It can project its effects
+    onto multiple targets at once.
 
     Args:
         type_id: Identifier of item type which should serve as base for this
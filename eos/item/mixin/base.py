@@ -25,6 +25,7 @@ from collections import namedtuple
 
 from eos.cache_handler import TypeFetchError
 from eos.calculator.map import MutableAttrMap
+from eos.calculator.plan import get_attr_plans
 from eos.const.eos import EffectMode
 from eos.item_container import ItemDict
 from eos.pubsub.message.helper import MsgHelper
@@ -248,14 +249,15 @@ class BaseItemMixin(metaclass=ABCMeta):
         fit = self._fit
         # Do nothing if we cannot reach cache handler
         try:
-            getter = fit.solar_system.source.cache_handler.get_type
+            cache_handler = fit.solar_system.source.cache_handler
         except AttributeError:
             return
         # Do nothing if cache handler doesn't have item type we need
         try:
-            self._type = getter(self._type_id)
+            self._type = cache_handler.get_type(self._type_id)
         except TypeFetchError:
             return
+        self.attrs._bind(get_attr_plans(cache_handler))
         # If fetch is successful, launch bunch of messages
         if fit is not None:
             msgs = MsgHelper.get_item_loaded_msgs(self)
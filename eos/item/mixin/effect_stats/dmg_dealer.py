@@ -22,12 +22,13 @@
 from eos.eve_obj.effect.dmg_dealer.base import DmgDealerEffect
 from eos.item.mixin.base import BaseItemMixin
 from eos.stats_container import DmgStats
+from eos.stats_container import TgtData
 
 
 class DmgDealerMixin(BaseItemMixin):
     """Expose damage dealing effect stats to item."""
 
-    def __dd_effect_iter(self):
+    def _dd_effect_iter(self):
         effects = []
         suppressor_effects = []
         for effect in self._type_effects.values():
@@ -47,20 +48,87 @@ class DmgDealerMixin(BaseItemMixin):
 
     def get_volley(self, tgt_resists=None):
         volleys = []
-        for effect in self.__dd_effect_iter():
+        for effect in self._dd_effect_iter():
             volley = effect.get_volley(self)
             volleys.append(volley)
         return DmgStats._combine(volleys, tgt_resists)
 
     def get_dps(self, reload=False, tgt_resists=None):
         dpss = []
-        for effect in self.__dd_effect_iter():
+        for effect in self._dd_effect_iter():
             dps = effect.get_dps(self, reload)
             dpss.append(dps)
         return DmgStats._combine(dpss, tgt_resists)
 
     def get_applied_volley(self, tgt_data=None, tgt_resists=None):
-        raise NotImplementedError
+        volleys = []
+        for effect in self._dd_effect_iter():
+            volley = effect.get_applied_volley(self, tgt_data)
+            volleys.append(volley)
+        return DmgStats._combine(volleys, tgt_resists)
+
+    def get_applied_volley_batch(self, tgt_datas, tgt_resists=None):
+        """Get volley applied to multiple targets.
+
+        Args:
+            tgt_datas: Iterable with target data. Every entry can be TgtData
+                helper container instance or any sequence of numbers in (range,
+                angular speed, signature radius, velocity) format, e.g. row of
+                2-dimensional numpy array.
+            tgt_resists (optional): ResistProfile helper container instance.
+
+        Returns:
+            List with DmgStats helper container instances, in the same order
+            as target data was passed.
+        """
+        tgt_datas = self.__normalize_tgt_datas(tgt_datas)
+        # Format: [[volley of effect1, volley of effect2], ...]
+        tgts_volleys = [[] for _ in tgt_datas]
+        for effect in self._dd_effect_iter():
+            effect_volleys = effect.get_applied_volley_batch(self, tgt_datas)
+            for tgt_volleys, volley in zip(tgts_volleys, effect_volleys):
+                tgt_volleys.append(volley)
+        return [
+            DmgStats._combine(tgt_volleys, tgt_resists)
+            for tgt_volleys in tgts_volleys]
 
     def get_applied_dps(self, reload=False, tgt_data=None, tgt_resists=None):
-        raise NotImplementedError
+        dpss = []
+        for effect in self._dd_effect_iter():
+            dps = effect.get_applied_dps(self, tgt_data, reload)
+            dpss.append(dps)
+        return DmgStats._combine(dpss, tgt_resists)
+
+    def get_applied_dps_batch(self, tgt_datas, reload=False, tgt_resists=None):
+        """Get DPS applied to multiple targets.
+
+        Args:
+            tgt_datas: Iterable with target data, in the same format as for
+                get_applied_volley_batch().
+            reload (optional): Boolean flag which controls if reload should be
+                taken into consideration or not.
+            tgt_resists (optional): ResistProfile helper container instance.
+
+        Returns:
+            List with DmgStats helper container instances, in the same order
+            as target data was passed.
+        """
+        tgt_datas = self.__normalize_tgt_datas(tgt_datas)
+        # Format: [[dps of effect1, dps of effect2], ...]
+        tgts_dpss = [[] for _ in tgt_datas]
+        for effect in self._dd_effect_iter():
+            effect_dpss = effect.get_applied_dps_batch(self, tgt_datas, reload)
+            for tgt_dpss, dps in zip(tgts_dpss, effect_dpss):
+                tgt_dpss.append(dps)
+        return [
+            DmgStats._combine(tgt_dpss, tgt_resists)
+            for tgt_dpss in tgts_dpss]
+
+    @staticmethod
+    def __normalize_tgt_datas(tgt_datas):
+        normalized = []
+        for tgt_data in tgt_datas:
+            if tgt_data is not None and not isinstance(tgt_data, TgtData):
+                tgt_data = TgtData(*tgt_data)
+            normalized.append(tgt_data)
+        return normalized
@@ -19,7 +19,11 @@
 # ==============================================================================
 
 
+from eos.pubsub.message import ItemCoordinateChanged
 from eos.stats_container import Coordinates
+from eos.stats_container import DmgStats
+from eos.stats_container import IncomingStats
+from eos.stats_container import ItemHP
 from eos.stats_container import Orientation
 
 
@@ -41,7 +45,31 @@ class SolarSystemItemMixin:
 
     @coordinate.setter
     def coordinate(self, new_coordinate):
+        old_coordinate = self.__coordinate
+        if new_coordinate == old_coordinate:
+            return
         self.__coordinate = new_coordinate
+        fit = self._fit
+        if fit is not None:
+            fit._publish(ItemCoordinateChanged(self))
+
+    @property
+    def incoming(self):
+        """Get stats of effects which other items project onto this item.
+
+        Damage is applied according to range to the projecting item, repairs
+        and electronic warfare strengths are reduced when target is beyond
+        optimal range of projecting item. Resistances of this item are not
+        taken into account.
+
+        Returns:
+            IncomingStats helper container instance.
+        """
+        try:
+            incoming_register = self._fit.solar_system._incoming
+        except AttributeError:
+            return IncomingStats(DmgStats(0, 0, 0, 0), ItemHP(0, 0, 0), {})
+        return incoming_register.get_incoming(self)
 
     @property
     def orientation(self):
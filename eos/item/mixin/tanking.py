@@ -20,6 +20,7 @@
 
 
 from eos.const.eve import AttrId
+from eos.stats_container import DmgProfile
 from eos.stats_container import ItemHP
 from eos.stats_container import ResistProfile
 from eos.stats_container import TankingLayers
@@ -93,6 +94,45 @@ class BufferTankingMixin(BaseItemMixin):
             self.hp.shield, self.resists.shield, dmg_profile)
         return ItemHP(hull_ehp, armor_ehp, shield_ehp)
 
+    def get_ehp_batch(self, dmg_profiles):
+        """Get effective HP of an item against multiple damage profiles.
+
+        HP and resistances are fetched only once for all the profiles, which
+        makes it much cheaper than calling get_ehp() for each of them.
+
+        Args:
+            dmg_profiles: Iterable with damage profiles. Every profile can be
+                DmgProfile helper container instance or any sequence of 4
+                numbers in (em, thermal, kinetic, explosive) format, e.g. row of
+                2-dimensional numpy array.
+
+        Returns:
+            List with TankingLayersTotal helper container instances, in the
+            same order as damage profiles were passed.
+        """
+        hp = self.hp
+        resists = self.resists
+        # Format: ((layer HP, (em, therm, kin, expl resistances)), ...)
+        layers = (
+            (hp.hull, tuple(resists.hull)),
+            (hp.armor, tuple(resists.armor)),
+            (hp.shield, tuple(resists.shield)))
+        results = []
+        for dmg_profile in dmg_profiles:
+            if not isinstance(dmg_profile, DmgProfile):
+                dmg_profile = DmgProfile(*dmg_profile)
+            dmgs = tuple(dmg_profile)
+            dealt = sum(dmgs)
+            layers_ehp = []
+            for layer_hp, layer_resists in layers:
+                if not layer_hp:
+                    layers_ehp.append(layer_hp)
+                    continue
+                absorbed = sum(d * r for d, r in zip(dmgs, layer_resists))
+                layers_ehp.append(layer_hp * dealt / (dealt - absorbed))
+            results.append(ItemHP(*layers_ehp))
+        return results
+
     def __get_layer_ehp(self, layer_hp, layer_resists, dmg_profile):
         """Calculate layer EHP according to passed data.
 
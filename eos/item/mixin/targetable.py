@@ -84,5 +84,91 @@ class SingleTargetableMixin(BaseItemMixin, BaseTargetableMixin):
         return effect_tgts
 
 
-class MultiTargetableMixin(BaseTargetableMixin):
-    ...
+class MultiTargetableMixin(BaseItemMixin, BaseTargetableMixin):
+    """Allows item to project its effects onto multiple targets at once.
+
+    When set of targets changes, only difference between old and new sets is
+    applied/unapplied, so that retargeting one of many targets does not touch
+    registrations related to other targets.
+    """
+
+    def __init__(self, **kwargs):
+        self.__targets = set()
+        super().__init__(**kwargs)
+
+    @property
+    def targets(self):
+        """Get items which are targeted by this item.
+
+        Returns:
+            Frozen set with targeted items.
+        """
+        return frozenset(self.__targets)
+
+    @targets.setter
+    def targets(self, new_tgts):
+        new_tgts = set(new_tgts)
+        old_tgts = self.__targets
+        self.__update_targets(new_tgts - old_tgts, old_tgts - new_tgts)
+
+    def add_target(self, tgt):
+        """Add item to set of targets.
+
+        Args:
+            tgt: Item which should be targeted. If it is already targeted,
+                nothing happens.
+        """
+        if tgt in self.__targets:
+            return
+        self.__update_targets({tgt}, set())
+
+    def remove_target(self, tgt):
+        """Remove item from set of targets.
+
+        Args:
+            tgt: Item which should not be targeted anymore. If it is not
+                targeted, nothing happens.
+        """
+        if tgt not in self.__targets:
+            return
+        self.__update_targets(set(), {tgt})
+
+    def __update_targets(self, added_tgts, removed_tgts):
+        if not added_tgts and not removed_tgts:
+            return
+        fit = self._fit
+        if fit is None:
+            self.__targets.difference_update(removed_tgts)
+            self.__targets.update(added_tgts)
+            return
+        projectable_effects = set()
+        item_effects = self._type_effects
+        for effect_id in self._running_effect_ids:
+            effect = item_effects[effect_id]
+            if effect.is_projectable:
+                projectable_effects.add(effect_id)
+        if removed_tgts:
+            msgs = []
+            for effect_id in projectable_effects:
+                msgs.append(EffectUnapplied(
+                    self, effect_id, frozenset(removed_tgts)))
+            fit._publish_bulk(msgs)
+            self.__targets.difference_update(removed_tgts)
+        if added_tgts:
+            self.__targets.update(added_tgts)
+            msgs = []
+            for effect_id in projectable_effects:
+                msgs.append(EffectApplied(
+                    self, effect_id, frozenset(added_tgts)))
+            fit._publish_bulk(msgs)
+
+    def _get_effects_tgts(self, effect_ids):
+        effect_tgts = {}
+        tgts = self.__targets
+        if tgts:
+            item_effects = self._type_effects
+            for effect_id in effect_ids:
+                effect = item_effects[effect_id]
+                if effect.category_id == EffectCategoryId.target:
+                    effect_tgts[effect_id] = frozenset(tgts)
+        return effect_tgts
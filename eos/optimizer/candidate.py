@@ -0,0 +1,85 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos.cache_handler import TypeFetchError
+from eos.cache_handler.type_index import ATTR_INDEXES
+from eos.const.eve import EffectId
+
+
+def find_candidates(fit, container, **criteria):
+    """Find types of modules which can be put into container of the fit.
+
+    Reverse type indexes of the fit's source are used to find modules for
+    container's slot type, then modules which cannot be fitted to fit's ship
+    are filtered out.
+
+    Args:
+        fit: Fit, whose source and ship are used.
+        container: One of fit's module containers.
+        **criteria: Extra criteria for type search, as accepted by cache
+            handler's find_type_ids() method.
+
+    Returns:
+        Sorted list with item type IDs.
+
+    Raises:
+        ValueError: If passed container is not module container of the fit.
+    """
+    slot_effect_ids = {
+        id(fit.modules.high): EffectId.hi_power,
+        id(fit.modules.mid): EffectId.med_power,
+        id(fit.modules.low): EffectId.lo_power}
+    try:
+        slot_effect_id = slot_effect_ids[id(container)]
+    except KeyError:
+        raise ValueError('container is not module container of the fit')
+    cache_handler = fit.solar_system.source.cache_handler
+    type_ids = cache_handler.find_type_ids(effect=slot_effect_id, **criteria)
+    ship = fit.ship
+    if ship is None or not ship._is_loaded:
+        return sorted(type_ids)
+    candidates = []
+    for type_id in type_ids:
+        try:
+            item_type = cache_handler.get_type(type_id)
+        except TypeFetchError:
+            continue
+        if _can_fit_ship(item_type, ship._type):
+            candidates.append(type_id)
+    return sorted(candidates)
+
+
+def _can_fit_ship(item_type, ship_type):
+    allowed_type_ids = _get_attr_values(item_type, 'can_fit_ship_type')
+    allowed_group_ids = _get_attr_values(item_type, 'can_fit_ship_group')
+    # Items without restriction can be fitted to any ship
+    if not allowed_type_ids and not allowed_group_ids:
+        return True
+    return (
+        ship_type.id in allowed_type_ids or
+        ship_type.group_id in allowed_group_ids)
+
+
+def _get_attr_values(item_type, index_name):
+    return {
+        item_type.attrs[attr_id]
+        for attr_id in ATTR_INDEXES[index_name]
+        if attr_id in item_type.attrs}
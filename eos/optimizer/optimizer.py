@@ -0,0 +1,292 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import gc
+import multiprocessing
+from collections import namedtuple
+
+from eos.cache_handler import TypeFetchError
+from eos.const.eos import Restriction
+from eos.const.eos import State
+from eos.const.eve import AttrId
+from eos.item import ModuleHigh
+from eos.item import ModuleLow
+from eos.item import ModuleMid
+
+
+OptimizationResult = namedtuple(
+    'OptimizationResult', ('score', 'type_ids', 'evaluated', 'pruned'))
+
+
+# Resources which are checked before fit validation and objective calculation
+# Format: ((stat name, restriction type, use attribute ID, output attribute
+#   ID), ...)
+RESOURCES = (
+    ('cpu', Restriction.cpu, AttrId.cpu, AttrId.cpu_output),
+    ('powergrid', Restriction.powergrid, AttrId.power, AttrId.power_output))
+
+
+# Optimizer which is used by worker processes, set before pool is forked
+_worker_optimizer = None
+
+
+def _search_branch(branch):
+    return _worker_optimizer._search_branch(branch)
+
+
+def _free_slot(container, index):
+    """Free slot of the container, if it exists."""
+    if index < len(container):
+        container.free(index)
+
+
+class FitOptimizer:
+    """Searches for module assignment which maximizes objective.
+
+    Candidates are evaluated on the passed fit itself: modules are swapped in
+    place and the fit is returned to its original state afterwards. For every
+    complete assignment, resource use is checked first, then fail-fast fit
+    validation is run, and only then objective is calculated.
+
+    Branch is pruned as soon as partial assignment overuses CPU or power grid,
+    unless some candidate modifies resource attributes - in this case, module
+    added later could compensate overuse. Slots of the same container which
+    share candidate list are treated as interchangeable, thus only one
+    permutation of modules across them is evaluated.
+
+    Args:
+        fit: Fit to optimize.
+        slots: Iterable with (container, index, candidates) tuples, where
+            container is one of fit's module containers, index is position in
+            it, and candidates is iterable with item type IDs to try; None in
+            candidates stands for empty slot.
+        objective: Function which takes fit and returns number, the higher the
+            better.
+        state (optional): State of candidate modules. By default, they are
+            active.
+        skip_checks (optional): Iterable with restriction types which should
+            be ignored.
+    """
+
+    def __init__(
+            self, fit, slots, objective, state=State.active, skip_checks=()):
+        self.__fit = fit
+        self.__objective = objective
+        self.__skip_checks = frozenset(skip_checks)
+        module_classes = {
+            id(fit.modules.high): ModuleHigh,
+            id(fit.modules.mid): ModuleMid,
+            id(fit.modules.low): ModuleLow}
+        # Format: [(container, index, (type IDs), {type ID: module})]
+        self.__slots = []
+        for container, index, candidates in slots:
+            try:
+                module_class = module_classes[id(container)]
+            except KeyError:
+                raise ValueError(
+                    'container is not module container of the fit')
+            candidates = tuple(candidates)
+            # Modules are created once and reused during search
+            modules = {
+                type_id: module_class(type_id, state=state)
+                for type_id in candidates
+                if type_id is not None}
+            self.__slots.append((container, index, candidates, modules))
+        # For every slot, flag which tells if it's interchangeable with
+        # previous one
+        self.__symmetric = [
+            i > 0 and
+            slot[0] is self.__slots[i - 1][0] and
+            slot[2] == self.__slots[i - 1][2]
+            for i, slot in enumerate(self.__slots)]
+        self.__prunable_resources = self.__get_prunable_resources()
+        self.__best_score = None
+        self.__best_type_ids = None
+        self.__evaluated = 0
+        self.__pruned = 0
+
+    def optimize(self, processes=1):
+        """Run search.
+
+        Args:
+            processes (optional): Quantity of processes to distribute search
+                across. Branches are defined by candidates of the first slot,
+                and are evaluated in processes forked from the current one.
+
+        Returns:
+            OptimizationResult helper container instance. If no valid
+            assignment has been found, its score and type IDs are None.
+        """
+        if not self.__slots:
+            return OptimizationResult(None, None, 0, 0)
+        branches = range(len(self.__slots[0][2]))
+        if processes > 1:
+            results = self.__run_processes(branches, processes)
+        else:
+            results = [self._search_branch(branch) for branch in branches]
+        best_score = None
+        best_type_ids = None
+        for score, type_ids, _, _ in results:
+            if score is not None and (best_score is None or score > best_score):
+                best_score = score
+                best_type_ids = type_ids
+        return OptimizationResult(
+            score=best_score,
+            type_ids=best_type_ids,
+            evaluated=sum(r.evaluated for r in results),
+            pruned=sum(r.pruned for r in results))
+
+    def apply(self, result):
+        """Put modules from optimization result onto the fit.
+
+        Modules which are currently in optimized slots are replaced.
+
+        Raises:
+            ValueError: If result does not contain valid assignment.
+        """
+        if result.type_ids is None:
+            raise ValueError('result does not contain valid assignment')
+        for (container, index, _, modules), type_id in zip(
+            self.__slots, result.type_ids
+        ):
+            _free_slot(container, index)
+            if type_id is not None:
+                container.place(index, modules[type_id])
+
+    def _search_branch(self, branch):
+        """Search assignments with the first slot's candidate fixed."""
+        self.__best_score = None
+        self.__best_type_ids = None
+        self.__evaluated = 0
+        self.__pruned = 0
+        # Format: [module or None]
+        original_modules = []
+        for container, index, _, _ in self.__slots:
+            try:
+                original_module = container[index]
+            except IndexError:
+                original_module = None
+            original_modules.append(original_module)
+            _free_slot(container, index)
+        try:
+            self.__search(0, [], branch)
+        finally:
+            for (container, index, _, _), original_module in zip(
+                self.__slots, original_modules
+            ):
+                _free_slot(container, index)
+                if original_module is not None:
+                    container.place(index, original_module)
+        return OptimizationResult(
+            score=self.__best_score,
+            type_ids=self.__best_type_ids,
+            evaluated=self.__evaluated,
+            pruned=self.__pruned)
+
+    def __search(self, depth, type_ids, branch=None):
+        if depth == len(self.__slots):
+            self.__evaluate(type_ids)
+            return
+        container, index, candidates, modules = self.__slots[depth]
+        if branch is not None:
+            positions = (branch,)
+        # For interchangeable slots, only non-descending positions of
+        # candidates are checked
+        elif self.__symmetric[depth]:
+            positions = range(type_ids[-1][1], len(candidates))
+        else:
+            positions = range(len(candidates))
+        for position in positions:
+            type_id = candidates[position]
+            module = modules.get(type_id)
+            if module is not None:
+                container.place(index, module)
+            type_ids.append((type_id, position))
+            if self.__is_within_bounds(self.__prunable_resources):
+                self.__search(depth + 1, type_ids)
+            else:
+                self.__pruned += 1
+            type_ids.pop()
+            # Roll back the swap
+            if module is not None:
+                container.free(module)
+
+    def __evaluate(self, type_ids):
+        self.__evaluated += 1
+        fit = self.__fit
+        if not self.__is_within_bounds(RESOURCES):
+            return
+        if not fit.is_valid(self.__skip_checks):
+            return
+        score = self.__objective(fit)
+        if self.__best_score is None or score > self.__best_score:
+            self.__best_score = score
+            self.__best_type_ids = tuple(t for t, _ in type_ids)
+
+    def __is_within_bounds(self, resources):
+        stats = self.__fit.stats
+        for stat_name, restriction_type, _, _ in resources:
+            if restriction_type in self.__skip_checks:
+                continue
+            resource_stats = getattr(stats, stat_name)
+            if resource_stats.used > (resource_stats.output or 0):
+                return False
+        return True
+
+    def __get_prunable_resources(self):
+        """Get resources whose use cannot decrease when modules are added."""
+        try:
+            cache_handler = self.__fit.solar_system.source.cache_handler
+        except AttributeError:
+            return ()
+        modified_attr_ids = set()
+        for _, _, candidates, _ in self.__slots:
+            for type_id in candidates:
+                if type_id is None:
+                    continue
+                try:
+                    item_type = cache_handler.get_type(type_id)
+                except TypeFetchError:
+                    continue
+                for effect in item_type.effects.values():
+                    for modifier in effect.modifiers:
+                        modified_attr_ids.add(modifier.affectee_attr_id)
+        return tuple(
+            resource for resource in RESOURCES
+            if not modified_attr_ids.intersection(resource[2:]))
+
+    def __run_processes(self, branches, processes):
+        global _worker_optimizer
+        context = multiprocessing.get_context('fork')
+        _worker_optimizer = self
+        # Keep garbage collector from touching memory pages shared with
+        # workers. Permanent generation is available only since python 3.7
+        freeze = hasattr(gc, 'freeze')
+        if freeze:
+            gc.collect()
+            gc.freeze()
+        try:
+            with context.Pool(processes) as pool:
+                return pool.map(_search_branch, branches, chunksize=1)
+        finally:
+            if freeze:
+                gc.unfreeze()
+            _worker_optimizer = None
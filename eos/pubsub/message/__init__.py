@@ -24,6 +24,7 @@ from .attr import AttrsValueChangedMasked
 from .fit import DefaultIncomingDmgChanged
 from .fit import RahIncomingDmgChanged
 from .item import ItemAdded
+from .item import ItemCoordinateChanged
 from .item import ItemRemoved
 from .item import StatesActivated
 from .item import StatesDeactivated
@@ -83,7 +83,7 @@ class MsgHelper:
         running_effect_ids = item._running_effect_ids
         if running_effect_ids:
             # Unapply effects before stopping them
-            tgt_getter = getattr(item, '_get_effects_targets', None)
+            tgt_getter = getattr(item, '_get_effects_tgts', None)
             if tgt_getter:
                 effects_tgts = tgt_getter(running_effect_ids)
                 for effect_id, tgt_items in effects_tgts.items():
@@ -142,16 +142,16 @@ class MsgHelper:
             # Start effects
             msgs.append(EffectsStarted(item, start_ids))
             # Apply effects to targets
-            tgt_getter = getattr(item, '_get_effects_targets', None)
+            tgt_getter = getattr(item, '_get_effects_tgts', None)
             if tgt_getter:
                 effects_tgts = tgt_getter(start_ids)
                 for effect_id, tgt_items in effects_tgts.items():
                     msgs.append(EffectApplied(item, effect_id, tgt_items))
         if stop_ids:
             # Unapply effects from targets
-            tgt_getter = getattr(item, '_get_effects_targets', None)
+            tgt_getter = getattr(item, '_get_effects_tgts', None)
             if tgt_getter:
-                effects_tgts = tgt_getter(start_ids)
+                effects_tgts = tgt_getter(stop_ids)
                 for effect_id, tgt_items in effects_tgts.items():
                     msgs.append(EffectUnapplied(item, effect_id, tgt_items))
             # Stop effects
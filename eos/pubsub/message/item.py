@@ -24,6 +24,8 @@ from eos.util.repr import make_repr_str
 
 class ItemAdded:
 
+    __slots__ = ('fit', 'item')
+
     def __init__(self, item):
         self.fit = None
         self.item = item
@@ -35,6 +37,8 @@ class ItemAdded:
 
 class ItemRemoved:
 
+    __slots__ = ('fit', 'item')
+
     def __init__(self, item):
         self.fit = None
         self.item = item
@@ -46,6 +50,8 @@ class ItemRemoved:
 
 class StatesActivated:
 
+    __slots__ = ('fit', 'item', 'states')
+
     def __init__(self, item, states):
         self.fit = None
         self.item = item
@@ -59,6 +65,8 @@ class StatesActivated:
 
 class StatesDeactivated:
 
+    __slots__ = ('fit', 'item', 'states')
+
     def __init__(self, item, states):
         self.fit = None
         self.item = item
@@ -68,3 +76,16 @@ class StatesDeactivated:
     def __repr__(self):
         spec = ['fit', 'item', 'states']
         return make_repr_str(self, spec)
+
+
+class ItemCoordinateChanged:
+
+    __slots__ = ('fit', 'item')
+
+    def __init__(self, item):
+        self.fit = None
+        self.item = item
+
+    def __repr__(self):
+        spec = ['fit', 'item']
+        return make_repr_str(self, spec)
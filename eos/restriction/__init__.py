@@ -21,3 +21,4 @@
 
 from .exception import ValidationError
 from .service import RestrictionService
+from .service import RestrictionTiming
@@ -23,11 +23,18 @@ from abc import ABCMeta
 from abc import abstractmethod
 
 from eos.pubsub.subscriber import BaseSubscriber
+from eos.restriction.exception import RestrictionValidationError
 
 
 class BaseRestriction(metaclass=ABCMeta):
     """Base class for all restrictions."""
 
+    # Types of messages which may change outcome of validation. Restriction
+    # service caches results of validation, and re-runs it only when restriction
+    # is notified by any of these messages. Registers are also revalidated when
+    # any of messages they are subscribed to is received
+    _dirty_msg_types = ()
+
     @abstractmethod
     def validate(self):
         """Check all registered items for validity.
@@ -37,6 +44,23 @@ class BaseRestriction(metaclass=ABCMeta):
         """
         ...
 
+    def _check(self):
+        """Check if restriction is satisfied, without collecting error data.
+
+        Restrictions which can tell it cheaper than via full validation should
+        override this method.
+
+        Returns:
+            True if validation would pass, False otherwise.
+        """
+        try:
+            self.validate()
+        except RestrictionValidationError as e:
+            # Restriction can report failure without any erroneous items, it
+            # does not fail validation
+            return not e.args[0]
+        return True
+
     @property
     @abstractmethod
     def type(self):
@@ -41,6 +41,8 @@ from eos.item import Ship
 from eos.item import Skill
 from eos.item import Stance
 from eos.item import Subsystem
+from eos.pubsub.message import ItemLoaded
+from eos.pubsub.message import ItemUnloaded
 from eos.restriction.exception import RestrictionValidationError
 from .base import BaseRestriction
 
@@ -105,6 +107,7 @@ class ItemClassRestriction(BaseRestriction):
     """
 
     type = Restriction.item_class
+    _dirty_msg_types = (ItemLoaded, ItemUnloaded)
 
     def __init__(self, fit):
         self.__fit = fit
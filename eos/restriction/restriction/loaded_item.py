@@ -22,6 +22,10 @@
 from collections import namedtuple
 
 from eos.const.eos import Restriction
+from eos.pubsub.message import ItemAdded
+from eos.pubsub.message import ItemLoaded
+from eos.pubsub.message import ItemRemoved
+from eos.pubsub.message import ItemUnloaded
 from eos.restriction.exception import RestrictionValidationError
 from .base import BaseRestriction
 
@@ -37,6 +41,7 @@ class LoadedItemRestriction(BaseRestriction):
     """
 
     type = Restriction.loaded_item
+    _dirty_msg_types = (ItemAdded, ItemRemoved, ItemLoaded, ItemUnloaded)
 
     def __init__(self, fit):
         self.__fit = fit
@@ -49,3 +54,9 @@ class LoadedItemRestriction(BaseRestriction):
                 tainted_items[item] = LoadedItemErrorData()
         if tainted_items:
             raise RestrictionValidationError(tainted_items)
+
+    def _check(self):
+        for item in self.__fit._item_iter(skip_autoitems=True):
+            if not item._is_loaded:
+                return False
+        return True
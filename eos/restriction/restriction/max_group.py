@@ -105,6 +105,13 @@ class MaxGroupRestrictionRegister(BaseRestrictionRegister, metaclass=ABCMeta):
         if tainted_items:
             raise RestrictionValidationError(tainted_items)
 
+    def _check(self):
+        for item in self.__restricted_items:
+            quantity = len(self.__group_item_map.get(item._type.group_id, ()))
+            if quantity > item._type_attrs[self._max_group_attr_id]:
+                return False
+        return True
+
 
 class MaxGroupFittedRestrictionRegister(MaxGroupRestrictionRegister):
     """Prohibit to fit items of certain groups beyond limit.
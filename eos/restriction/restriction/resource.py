@@ -25,6 +25,13 @@ from collections import namedtuple
 
 from eos.const.eos import Restriction
 from eos.const.eve import AttrId
+from eos.pubsub.message import AttrsValueChanged
+from eos.pubsub.message import EffectsStarted
+from eos.pubsub.message import EffectsStopped
+from eos.pubsub.message import ItemLoaded
+from eos.pubsub.message import ItemUnloaded
+from eos.pubsub.message import StatesActivatedLoaded
+from eos.pubsub.message import StatesDeactivatedLoaded
 from eos.restriction.exception import RestrictionValidationError
 from .base import BaseRestriction
 
@@ -40,6 +47,17 @@ class ResourceRestriction(BaseRestriction, metaclass=ABCMeta):
     consumed by other items.
     """
 
+    # Resource users are tracked by stats registers, which rely on various
+    # item-related messages; use and output are taken from modified attributes
+    _dirty_msg_types = (
+        ItemLoaded,
+        ItemUnloaded,
+        StatesActivatedLoaded,
+        StatesDeactivatedLoaded,
+        EffectsStarted,
+        EffectsStopped,
+        AttrsValueChanged)
+
     def __init__(self, fit):
         self.__fit = fit
 
@@ -75,6 +93,16 @@ class ResourceRestriction(BaseRestriction, metaclass=ABCMeta):
                 item_use=resource_use)
         raise RestrictionValidationError(tainted_items)
 
+    def _check(self):
+        stats = getattr(self.__fit.stats, self._stat_name)
+        if stats.used <= (stats.output or 0):
+            return True
+        # Overuse is not an error when nothing actually consumes resource
+        for item in stats._users:
+            if item.attrs[self._use_attr_id] > 0:
+                return False
+        return True
+
 
 class CpuRestriction(ResourceRestriction):
     """CPU use by items should not exceed ship CPU output.
@@ -26,6 +26,8 @@ from eos.const.eve import AttrId
 from eos.const.eve import EffectId
 from eos.pubsub.message import EffectsStarted
 from eos.pubsub.message import EffectsStopped
+from eos.pubsub.message import ItemLoaded
+from eos.pubsub.message import ItemUnloaded
 from eos.restriction.exception import RestrictionValidationError
 from .base import BaseRestrictionRegister
 
@@ -42,6 +44,8 @@ class RigSizeRestrictionRegister(BaseRestrictionRegister):
     """
 
     type = Restriction.rig_size
+    # Allowed rig size depends on ship
+    _dirty_msg_types = (ItemLoaded, ItemUnloaded)
 
     def __init__(self, fit):
         self.__fit = fit
@@ -23,6 +23,7 @@ from collections import namedtuple
 
 from eos.const.eos import Restriction
 from eos.item import Rig
+from eos.pubsub.message import AttrsValueChanged
 from eos.pubsub.message import ItemLoaded
 from eos.pubsub.message import ItemUnloaded
 from eos.restriction.exception import RestrictionValidationError
@@ -48,6 +49,8 @@ class SkillRequirementRestrictionRegister(BaseRestrictionRegister):
     """
 
     type = Restriction.skill_requirement
+    # Skills notify about level changes via attribute value change messages
+    _dirty_msg_types = (AttrsValueChanged,)
 
     def __init__(self, fit):
         self.__fit = fit
@@ -104,3 +107,20 @@ class SkillRequirementRestrictionRegister(BaseRestrictionRegister):
                 tainted_items[item] = tuple(skillrq_errors)
         if tainted_items:
             raise RestrictionValidationError(tainted_items)
+
+    def _check(self):
+        skills = self.__fit.skills
+        for item in self.__restricted_items:
+            for skillrq_type_id, skillrq_level in (
+                item._type.required_skills.items()
+            ):
+                try:
+                    skill = skills[skillrq_type_id]
+                except KeyError:
+                    return False
+                if not skill._is_loaded:
+                    return False
+                skill_level = skill.level
+                if skill_level is None or skill_level < skillrq_level:
+                    return False
+        return True
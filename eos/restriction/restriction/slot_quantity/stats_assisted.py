@@ -23,6 +23,13 @@ from abc import ABCMeta
 from abc import abstractmethod
 
 from eos.const.eos import Restriction
+from eos.pubsub.message import AttrsValueChanged
+from eos.pubsub.message import EffectsStarted
+from eos.pubsub.message import EffectsStopped
+from eos.pubsub.message import ItemLoaded
+from eos.pubsub.message import ItemUnloaded
+from eos.pubsub.message import StatesActivated
+from eos.pubsub.message import StatesDeactivated
 from eos.restriction.exception import RestrictionValidationError
 from eos.restriction.restriction.base import BaseRestriction
 from .error_data import SlotQuantityErrorData
@@ -30,6 +37,17 @@ from .error_data import SlotQuantityErrorData
 
 class StatsAssistedSlotRestriction(BaseRestriction, metaclass=ABCMeta):
 
+    # Slot users are tracked by stats registers, slot quantity is taken from
+    # modified attribute of ship
+    _dirty_msg_types = (
+        ItemLoaded,
+        ItemUnloaded,
+        StatesActivated,
+        StatesDeactivated,
+        EffectsStarted,
+        EffectsStopped,
+        AttrsValueChanged)
+
     def __init__(self, fit):
         self._fit = fit
 
@@ -47,6 +65,10 @@ class StatsAssistedSlotRestriction(BaseRestriction, metaclass=ABCMeta):
                     used=stats.used, total=stats.total)
             raise RestrictionValidationError(tainted_items)
 
+    def _check(self):
+        stats = self._slot_stats
+        return stats.used <= stats.total
+
 
 class TurretSlotRestriction(StatsAssistedSlotRestriction):
     """Quantity of turrets should not exceed limit.
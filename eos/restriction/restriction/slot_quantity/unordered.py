@@ -23,6 +23,11 @@ from abc import ABCMeta
 from abc import abstractmethod
 
 from eos.const.eos import Restriction
+from eos.pubsub.message import AttrsValueChanged
+from eos.pubsub.message import ItemAdded
+from eos.pubsub.message import ItemLoaded
+from eos.pubsub.message import ItemRemoved
+from eos.pubsub.message import ItemUnloaded
 from eos.restriction.exception import RestrictionValidationError
 from eos.restriction.restriction.base import BaseRestriction
 from .error_data import SlotQuantityErrorData
@@ -30,6 +35,15 @@ from .error_data import SlotQuantityErrorData
 
 class UnorderedSlotRestriction(BaseRestriction, metaclass=ABCMeta):
 
+    # Items occupy slots regardless of their loaded status, slot quantity is
+    # taken from modified attribute of ship
+    _dirty_msg_types = (
+        ItemAdded,
+        ItemRemoved,
+        ItemLoaded,
+        ItemUnloaded,
+        AttrsValueChanged)
+
     def __init__(self, fit):
         self._fit = fit
 
@@ -52,6 +66,10 @@ class UnorderedSlotRestriction(BaseRestriction, metaclass=ABCMeta):
                     used=used, total=total)
             raise RestrictionValidationError(tainted_items)
 
+    def _check(self):
+        used, total = self._slot_stats
+        return used <= total
+
 
 class RigSlotRestriction(UnorderedSlotRestriction):
     """Quantity of rig items should not exceed limit.
@@ -72,3 +72,9 @@ class StateRestrictionRegister(BaseRestrictionRegister):
                     allowed_states=allowed_states)
         if tainted_items:
             raise RestrictionValidationError(tainted_items)
+
+    def _check(self):
+        for item in self.__restricted_items:
+            if item.state > item._type.max_state:
+                return False
+        return True
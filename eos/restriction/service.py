@@ -19,6 +19,10 @@
 # ==============================================================================
 
 
+from collections import namedtuple
+from time import perf_counter
+
+from eos.pubsub.subscriber import BaseSubscriber
 from .exception import RestrictionValidationError
 from .exception import ValidationError
 from .restriction import BoosterIndexRestrictionRegister
@@ -57,12 +61,18 @@ from .restriction import SubsystemSlotRestriction
 from .restriction import TurretSlotRestriction
 
 
+RestrictionTiming = namedtuple(
+    'RestrictionTiming', ('runs', 'failures', 'time'))
+
+
 class RestrictionService:
     """
     Track all restrictions applicable to fit.
 
     Works as middle-layer between fit and restriction registers, managing them
-    and providing results to fit.
+    and providing results to fit. Results of validation are cached on per-
+    restriction basis; restriction is validated again only after it receives
+    message which may change its outcome.
 
     Args:
         fit: Fit instance which this service is attached to.
@@ -105,6 +115,33 @@ class RestrictionService:
             SubsystemIndexRestrictionRegister(fit),
             SubsystemSlotRestriction(fit),
             TurretSlotRestriction(fit)}
+        # Error data from the last validation run of restrictions which are not
+        # dirty; restrictions which were satisfied are not stored
+        # Format: {restriction: error data}
+        self.__errors = {}
+        # Restrictions which have to be validated again
+        # Format: {restrictions}
+        self.__dirty_restrictions = set(self.__restrictions)
+        # Format: {message type: {restrictions}}
+        self.__msg_type_restrictions = {}
+        for restriction in self.__restrictions:
+            msg_types = set(restriction._dirty_msg_types)
+            if isinstance(restriction, BaseSubscriber):
+                msg_types.update(restriction._handler_map)
+            for msg_type in msg_types:
+                self.__msg_type_restrictions.setdefault(
+                    msg_type, set()).add(restriction)
+        # Counters which are used to order restrictions for fail-fast checks
+        # Format: {restriction: [runs, failures, time]}
+        self.__timings = {r: [0, 0, 0.0] for r in self.__restrictions}
+        fit._subscribe(self, self.__msg_type_restrictions.keys())
+
+    def _notify(self, msg):
+        # Service does not handle messages itself, it just marks restrictions
+        # which may be affected by them as dirty and drops their cached results
+        for restriction in self.__msg_type_restrictions.get(type(msg), ()):
+            self.__dirty_restrictions.add(restriction)
+            self.__errors.pop(restriction, None)
 
     def validate(self, skip_checks=()):
         """Validate fit.
@@ -128,18 +165,104 @@ class RestrictionService:
             restriction_type = restriction.type
             if restriction_type in skip_checks:
                 continue
-            # Run validation for current register, if validation failure
-            # exception is raised - add it to container
+            # Run validation only for restrictions whose outcome may have
+            # changed since the last run, use cached data for the rest
+            if restriction in self.__dirty_restrictions:
+                self.__run_restriction(restriction)
             try:
-                restriction.validate()
-            except RestrictionValidationError as e:
-                # All erroneous items should be in 1st argument of raised
-                # exception
-                exception_data = e.args[0]
-                for item in exception_data:
-                    item_error = exception_data[item]
-                    item_errors = invalid_items.setdefault(item, {})
-                    item_errors[restriction_type] = item_error
+                exception_data = self.__errors[restriction]
+            except KeyError:
+                continue
+            for item in exception_data:
+                item_error = exception_data[item]
+                item_errors = invalid_items.setdefault(item, {})
+                item_errors[restriction_type] = item_error
         # Raise validation error only if we got any failures
         if invalid_items:
             raise ValidationError(invalid_items)
+
+    def is_valid(self, skip_checks=()):
+        """Check if fit is valid.
+
+        Unlike validation, does not collect any error data, and stops as soon
+        as the first failed restriction is found. Restrictions are checked in
+        order of their historical cost to failure rate ratio.
+
+        Args:
+            skip_checks (optional): Iterable with restriction types check
+                should ignore. By default, nothing is ignored.
+
+        Returns:
+            True if fit passes validation, False otherwise.
+        """
+        dirty_restrictions = []
+        for restriction in self.__restrictions:
+            if restriction.type in skip_checks:
+                continue
+            # Cached failure is enough to tell that fit is invalid
+            if restriction in self.__errors:
+                return False
+            if restriction in self.__dirty_restrictions:
+                dirty_restrictions.append(restriction)
+        dirty_restrictions.sort(key=self.__get_check_priority)
+        for restriction in dirty_restrictions:
+            time_start = perf_counter()
+            passed = restriction._check()
+            self.__update_timing(
+                restriction, perf_counter() - time_start, passed)
+            if not passed:
+                # Restriction stays dirty, error data will be collected on the
+                # next validation run
+                return False
+            self.__dirty_restrictions.discard(restriction)
+        return True
+
+    @property
+    def timings(self):
+        """Access point for restriction timing counters.
+
+        Returns:
+            Dictionary in {restriction type: RestrictionTiming helper container
+            instance} format. Time is total time in seconds spent on checks and
+            validations of the restriction.
+        """
+        return {
+            restriction.type: RestrictionTiming(*counters)
+            for restriction, counters in self.__timings.items()}
+
+    def __run_restriction(self, restriction):
+        """Validate restriction and store its error data, if any."""
+        time_start = perf_counter()
+        # Run validation for current register, if validation failure exception
+        # is raised - all erroneous items should be in 1st argument of raised
+        # exception
+        try:
+            restriction.validate()
+        except RestrictionValidationError as e:
+            exception_data = e.args[0]
+        else:
+            exception_data = None
+        # Do not store empty error data, it doesn't fail validation
+        if exception_data:
+            self.__errors[restriction] = exception_data
+        self.__dirty_restrictions.discard(restriction)
+        self.__update_timing(
+            restriction, perf_counter() - time_start, not exception_data)
+
+    def __update_timing(self, restriction, time, passed):
+        counters = self.__timings[restriction]
+        counters[0] += 1
+        if not passed:
+            counters[1] += 1
+        counters[2] += time
+
+    def __get_check_priority(self, restriction):
+        """Get restriction priority, lower values should be checked first.
+
+        Priority is average check time divided by failure probability, both
+        smoothed to give meaningful values for restrictions with short history.
+        """
+        runs, failures, time = self.__timings[restriction]
+        avg_time = (time + 0.00001) / (runs + 1)
+        failure_probability = (failures + 1) / (runs + 2)
+        return avg_time / failure_probability
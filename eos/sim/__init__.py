@@ -19,4 +19,5 @@
 # ==============================================================================
 
 
+from .dmg_timeline import simulate_dmg_timeline
 from .reactive_armor_hardener import ReactiveArmorHardenerSimulator
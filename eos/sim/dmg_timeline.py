@@ -0,0 +1,125 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import heapq
+import math
+
+from eos.eve_obj.effect.cycle import CycleSequence
+from eos.stats_container import DmgTimeline
+
+
+def simulate_dmg_timeline(dealers, times):
+    """Calculate cumulative damage dealt by passed dealers over time.
+
+    Every dealer is described by its cycle parameters, which are expanded into
+    sequence of shots, and then shots of all dealers are merged into single
+    timeline. All dealers are assumed to start their first cycle at time 0,
+    and damage is dealt at the start of each cycle.
+
+    Args:
+        dealers: Iterable with (cycle parameters, volley) tuples, where cycle
+            parameters are CycleInfo or CycleSequence instance, and volley is
+            DmgStats instance.
+        times: Iterable with moments of time in seconds, at which cumulative
+            damage should be sampled.
+
+    Returns:
+        DmgTimeline helper container instance.
+    """
+    times = tuple(times)
+    if not times:
+        return DmgTimeline((), (), (), (), (), ())
+    max_time = max(times)
+    # Format: [iterable of (shot time, dealer index, volley), ...]
+    shot_streams = []
+    for dealer_idx, (cycle_parameters, volley) in enumerate(dealers):
+        # Dealers whose cycles do not take any time would produce infinite
+        # amount of shots at time 0, ignore them
+        if cycle_parameters is None or cycle_parameters.average_time <= 0:
+            continue
+        if volley.total == 0:
+            continue
+        shot_streams.append(_iter_shots(
+            cycle_parameters, dealer_idx, volley, max_time))
+    # Format: {sample time: (em, therm, kin, expl)}
+    samples = {}
+    sample_times = sorted(set(times))
+    sample_iter = iter(sample_times)
+    sample_time = next(sample_iter)
+    em = therm = kin = expl = 0
+    for shot_time, _, volley in heapq.merge(*shot_streams):
+        # Record all samples which precede current shot
+        while sample_time is not None and sample_time < shot_time:
+            samples[sample_time] = (em, therm, kin, expl)
+            sample_time = next(sample_iter, None)
+        if sample_time is None:
+            break
+        em += volley.em
+        therm += volley.thermal
+        kin += volley.kinetic
+        expl += volley.explosive
+    # Record samples after the last shot
+    while sample_time is not None:
+        samples[sample_time] = (em, therm, kin, expl)
+        sample_time = next(sample_iter, None)
+    ems = tuple(samples[t][0] for t in times)
+    therms = tuple(samples[t][1] for t in times)
+    kins = tuple(samples[t][2] for t in times)
+    expls = tuple(samples[t][3] for t in times)
+    totals = tuple(sum(samples[t]) for t in times)
+    return DmgTimeline(times, ems, therms, kins, expls, totals)
+
+
+def _iter_shots(cycle_parameters, dealer_idx, volley, max_time):
+    """Generate shots of single dealer until passed time is reached.
+
+    Dealer index is included into shot data to make shots of different dealers
+    which happen at the same time orderable without comparing volleys.
+    """
+    for shot_time in _iter_cycle_starts(cycle_parameters, 0):
+        if shot_time > max_time:
+            return
+        yield shot_time, dealer_idx, volley
+
+
+def _iter_cycle_starts(cycle_parameters, start_time):
+    """Expand cycle parameters into sequence of cycle start times.
+
+    Returns time when the last cycle of sequence ends, to let sequences which
+    contain this one continue from it.
+    """
+    time = start_time
+    repeats = 0
+    if isinstance(cycle_parameters, CycleSequence):
+        while repeats < cycle_parameters.quantity:
+            for sub_parameters in cycle_parameters.sequence:
+                time = yield from _iter_cycle_starts(sub_parameters, time)
+            repeats += 1
+        return time
+    cycle_time = cycle_parameters.active_time + cycle_parameters.inactive_time
+    quantity = cycle_parameters.quantity
+    if cycle_time <= 0 and quantity == math.inf:
+        return time
+    while repeats < quantity:
+        yield time
+        time += cycle_time
+        repeats += 1
+    return time
@@ -48,6 +48,8 @@ class FitSet:
         self.__set.add(fit)
         fit.solar_system = self.__solar_system
         self.__solar_system._calculator._handle_fit_added(fit)
+        self.__solar_system._spatial_index._handle_fit_added(fit)
+        self.__solar_system._incoming._handle_fit_added(fit)
         fit._load_items()
 
     def remove(self, fit):
@@ -70,8 +72,15 @@ class FitSet:
             self.__handle_fit_removal(fit)
 
     def __handle_fit_removal(self, fit):
-        fit._unload_items()
+        # Solar system services drop data of the fit in bulk before its items
+        # are unloaded. Fit-level services (stats, restrictions, RAH simulator)
+        # still process per-item unload messages, as they have to be kept in
+        # consistent state for the case when the fit is added to some solar
+        # system again
         self.__solar_system._calculator._handle_fit_removed(fit)
+        self.__solar_system._spatial_index._handle_fit_removed(fit)
+        self.__solar_system._incoming._handle_fit_removed(fit)
+        fit._unload_items()
         self.__set.remove(fit)
         fit.solar_system = None
 
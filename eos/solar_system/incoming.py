@@ -0,0 +1,248 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos.eve_obj.effect.dmg_dealer.base import DmgDealerEffect
+from eos.eve_obj.effect.helper_func import get_range_mult
+from eos.eve_obj.effect.remote_rep.base import RemoteRepEffect
+from eos.eve_obj.modifier import ModificationCalculationError
+from eos.item.mixin.base import BaseItemMixin
+from eos.item.mixin.solar_system import SolarSystemItemMixin
+from eos.pubsub.message import AttrsValueChanged
+from eos.pubsub.message import EffectApplied
+from eos.pubsub.message import EffectUnapplied
+from eos.pubsub.message import ItemCoordinateChanged
+from eos.pubsub.message import ItemLoaded
+from eos.pubsub.message import ItemUnloaded
+from eos.pubsub.subscriber import BaseSubscriber
+from eos.stats_container import DmgStats
+from eos.stats_container import IncomingStats
+from eos.stats_container import ItemHP
+from eos.stats_container import TgtData
+from eos.util.keyed_storage import KeyedStorage
+from .exception import ItemSolarSystemMismatchError
+
+
+class IncomingRegister(BaseSubscriber):
+    """Keeps track of effects projected onto solar system items.
+
+    Aggregated stats are cached per target item. Messages about changes drop
+    cached stats only for targets which are influenced by the change, thus
+    repeated reads of stats are cheap.
+
+    Args:
+        solar_system: Solar system this register is attached to.
+    """
+
+    def __init__(self, solar_system):
+        self.__solar_system = solar_system
+        # Format: {target item: {(projector item, effect ID)}}
+        self.__tgt_projections = KeyedStorage()
+        # Format: {projector item: {(effect ID, target item)}}
+        self.__projector_projections = KeyedStorage()
+        # Format: {target item: incoming stats}
+        self.__stats = {}
+        # Items whose position was used to calculate cached stats
+        # Format: {carrier item: {target items}}
+        self.__carrier_tgts = KeyedStorage()
+        # Format: {target item: {carrier items}}
+        self.__tgt_carriers = KeyedStorage()
+
+    def get_incoming(self, tgt_item):
+        """Get aggregated stats of effects projected onto passed item.
+
+        Returns:
+            IncomingStats helper container instance.
+        """
+        try:
+            return self.__stats[tgt_item]
+        except KeyError:
+            pass
+        carrier_items = set()
+        stats = self.__calc_incoming(tgt_item, carrier_items)
+        # Unloaded items never get messages which would remove their stats
+        if tgt_item._is_loaded:
+            self.__stats[tgt_item] = stats
+            if carrier_items:
+                self.__tgt_carriers.add_data_set(tgt_item, carrier_items)
+                for carrier_item in carrier_items:
+                    self.__carrier_tgts.add_data_entry(carrier_item, tgt_item)
+        return stats
+
+    def __calc_incoming(self, tgt_item, carrier_items):
+        dpss = []
+        rpss = []
+        ewar = {}
+        for projector_item, effect_id in self.__tgt_projections.get(
+            tgt_item, ()
+        ):
+            effect = projector_item._type_effects[effect_id]
+            carrier_item = projector_item._solsys_carrier
+            if carrier_item is not None:
+                carrier_items.add(carrier_item)
+            ctc_range = self.__get_ctc_range(carrier_item, tgt_item)
+            # Damage dealers have their own range-dependent application rules
+            if isinstance(effect, DmgDealerEffect):
+                # Skip effects whose damage application cannot be calculated
+                if not effect.supports_application:
+                    continue
+                dpss.append(effect.get_applied_dps(
+                    projector_item, TgtData(range=ctc_range), False))
+                continue
+            range_mult = self.__get_range_mult(
+                projector_item, effect, ctc_range)
+            if isinstance(effect, RemoteRepEffect):
+                rps = effect.get_rps(projector_item, False)
+                rpss.append((rps.hull, rps.armor, rps.shield, range_mult))
+                continue
+            for modifier in effect.projected_modifiers:
+                try:
+                    mod_op, mod_value = modifier.get_modification(
+                        projector_item)
+                except ModificationCalculationError:
+                    continue
+                # Range multiplier is reported separately, as the way it
+                # applies depends on modification operator
+                ewar.setdefault(modifier.affectee_attr_id, []).append(
+                    (mod_op, mod_value, range_mult))
+        rps = ItemHP(
+            sum(hull * mult for hull, _, _, mult in rpss),
+            sum(armor * mult for _, armor, _, mult in rpss),
+            sum(shield * mult for _, _, shield, mult in rpss))
+        return IncomingStats(
+            DmgStats._combine(dpss), rps,
+            {k: tuple(v) for k, v in ewar.items()})
+
+    def __get_ctc_range(self, carrier_item, tgt_item):
+        if carrier_item is None:
+            return None
+        try:
+            return self.__solar_system.get_ctc_range(carrier_item, tgt_item)
+        except ItemSolarSystemMismatchError:
+            return None
+
+    def __get_range_mult(self, projector_item, effect, ctc_range):
+        if effect.range_attr_id is None or ctc_range is None:
+            return 1
+        return get_range_mult(
+            effect.get_optimal_range(projector_item),
+            effect.get_falloff_range(projector_item),
+            ctc_range)
+
+    def __clear_stats(self, tgt_item):
+        self.__stats.pop(tgt_item, None)
+        for carrier_item in self.__tgt_carriers.pop(tgt_item, ()):
+            self.__carrier_tgts.rm_data_entry(carrier_item, tgt_item)
+
+    def __clear_projector_stats(self, projector_item):
+        for _, tgt_item in self.__projector_projections.get(
+            projector_item, ()
+        ):
+            self.__clear_stats(tgt_item)
+
+    def __clear_container_stats(self, item):
+        # Charge attributes define stats of items they are loaded into
+        container = item._container
+        if isinstance(container, BaseItemMixin):
+            self.__clear_projector_stats(container)
+
+    # Handle fits
+    def _handle_fit_added(self, fit):
+        fit._subscribe(self, self._handler_map.keys())
+
+    def _handle_fit_removed(self, fit):
+        fit._unsubscribe(self, self._handler_map.keys())
+        for item in fit._item_iter():
+            # Effects projected by items of the fit
+            for effect_id, tgt_item in self.__projector_projections.pop(
+                item, ()
+            ):
+                self.__tgt_projections.rm_data_entry(
+                    tgt_item, (item, effect_id))
+                self.__clear_stats(tgt_item)
+            # Effects projected onto items of the fit
+            for projector_item, effect_id in self.__tgt_projections.pop(
+                item, ()
+            ):
+                self.__projector_projections.rm_data_entry(
+                    projector_item, (effect_id, item))
+            self.__clear_stats(item)
+            # Stats which depend on position of items of the fit
+            for tgt_item in tuple(self.__carrier_tgts.get(item, ())):
+                self.__clear_stats(tgt_item)
+
+    # Message handling
+    def _handle_effect_applied(self, msg):
+        projector_item = msg.item
+        effect_id = msg.effect_id
+        for tgt_item in msg.tgt_items:
+            self.__tgt_projections.add_data_entry(
+                tgt_item, (projector_item, effect_id))
+            self.__projector_projections.add_data_entry(
+                projector_item, (effect_id, tgt_item))
+            self.__clear_stats(tgt_item)
+
+    def _handle_effect_unapplied(self, msg):
+        projector_item = msg.item
+        effect_id = msg.effect_id
+        for tgt_item in msg.tgt_items:
+            self.__tgt_projections.rm_data_entry(
+                tgt_item, (projector_item, effect_id))
+            self.__projector_projections.rm_data_entry(
+                projector_item, (effect_id, tgt_item))
+            self.__clear_stats(tgt_item)
+
+    def _handle_attrs_changed(self, msg):
+        for item in msg.attr_changes:
+            self.__clear_projector_stats(item)
+            self.__clear_container_stats(item)
+
+    def _handle_item_coordinate_changed(self, msg):
+        item = msg.item
+        self.__clear_stats(item)
+        # Stats of targets of effects projected from moved item
+        for tgt_item in tuple(self.__carrier_tgts.get(item, ())):
+            self.__clear_stats(tgt_item)
+
+    def _handle_item_loaded(self, msg):
+        item = msg.item
+        self.__clear_container_stats(item)
+        # Loaded item might become carrier for projectors of its fit, which
+        # were without location before
+        if isinstance(item, SolarSystemItemMixin):
+            for fit_item in item._fit._item_iter():
+                if fit_item._solsys_carrier is item:
+                    self.__clear_projector_stats(fit_item)
+
+    def _handle_item_unloaded(self, msg):
+        item = msg.item
+        self.__clear_stats(item)
+        self.__clear_container_stats(item)
+        # Stats of targets of effects projected from unloaded item
+        for tgt_item in tuple(self.__carrier_tgts.get(item, ())):
+            self.__clear_stats(tgt_item)
+
+    _handler_map = {
+        EffectApplied: _handle_effect_applied,
+        EffectUnapplied: _handle_effect_unapplied,
+        AttrsValueChanged: _handle_attrs_changed,
+        ItemCoordinateChanged: _handle_item_coordinate_changed,
+        ItemLoaded: _handle_item_loaded,
+        ItemUnloaded: _handle_item_unloaded}
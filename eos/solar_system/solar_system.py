@@ -21,14 +21,22 @@
 
 from math import sqrt
 
+from eos.cache_handler import AttrFetchError
+from eos.cache_handler import TypeFetchError
+from eos.calculator.plan import get_attr_plans
 from eos.calculator.service import CalculationService
 from eos.const.eve import AttrId
+from eos.item import Autocharge
+from eos.pubsub.message import AttrsValueChanged
 from eos.source import Source
 from eos.source import SourceManager
+from eos.stats_container import DmgStats
 from eos.util.default import DEFAULT
 from eos.util.repr import make_repr_str
 from .exception import ItemSolarSystemMismatchError
 from .fit_set import FitSet
+from .incoming import IncomingRegister
+from .spatial_index import SpatialIndex
 
 
 class SolarSystem:
@@ -43,6 +51,8 @@ class SolarSystem:
     def __init__(self, source=DEFAULT):
         self.__source = None
         self._calculator = CalculationService()
+        self._spatial_index = SpatialIndex()
+        self._incoming = IncomingRegister(self)
         self.fits = FitSet(self)
         # Initialize defaults
         if source is DEFAULT:
@@ -66,6 +76,9 @@ class SolarSystem:
         old_source = self.source
         if new_source is old_source:
             return
+        if old_source is not None and new_source is not None:
+            self.__switch_source(old_source, new_source)
+            return
         if old_source is not None:
             for fit in self.fits:
                 fit._unload_items()
@@ -74,24 +87,93 @@ class SolarSystem:
             for fit in self.fits:
                 fit._load_items()
 
+    def __switch_source(self, old_source, new_source):
+        """Replace one source with another.
+
+        Only items whose types differ between sources are reloaded. Other items
+        keep their types and calculated attribute values, except for values of
+        attributes whose metadata differs between sources.
+        """
+        new_type_getter = new_source.cache_handler.get_type
+        reload_items = []
+        reload_item_set = set()
+        keep_items = []
+        for fit in self.fits:
+            for item in fit._item_iter():
+                # Autocharges are reloaded along with their parents
+                if isinstance(item, Autocharge) and (
+                    item._container in reload_item_set
+                ):
+                    continue
+                if self.__is_type_kept(item, new_type_getter):
+                    keep_items.append(item)
+                else:
+                    reload_items.append(item)
+                    reload_item_set.add(item)
+        for item in reload_items:
+            item._unload()
+        self.__source = new_source
+        # Items which keep their types switch to attribute calculation plans
+        # of the new source
+        new_plans = get_attr_plans(new_source.cache_handler)
+        for item in keep_items:
+            item.attrs._bind(new_plans)
+        attr_changes = self.__get_attr_metadata_changes(
+            old_source, new_source, keep_items)
+        for fit, fit_attr_changes in attr_changes.items():
+            fit._publish(AttrsValueChanged(fit_attr_changes))
+        for item in reload_items:
+            item._load()
+
+    @staticmethod
+    def __is_type_kept(item, new_type_getter):
+        if not item._is_loaded:
+            return False
+        try:
+            new_type = new_type_getter(item._type_id)
+        except TypeFetchError:
+            return False
+        return (
+            new_type is item._type or
+            new_type._fingerprint == item._type._fingerprint)
+
+    @staticmethod
+    def __get_attr_metadata_changes(old_source, new_source, items):
+        """Remove values of attributes whose metadata changed.
+
+        Returns:
+            Dictionary in {fit: {item: {attribute IDs}}} format with removed
+            values.
+        """
+        # Format: {attribute ID: is changed flag}
+        attrs_changed = {}
+        attr_changes = {}
+        for item in items:
+            item_attr_ids = set()
+            for attr_id in item.attrs.keys():
+                try:
+                    attr_changed = attrs_changed[attr_id]
+                except KeyError:
+                    fingerprints = []
+                    for source in (old_source, new_source):
+                        try:
+                            attr = source.cache_handler.get_attr(attr_id)
+                        except AttrFetchError:
+                            fingerprints.append(None)
+                        else:
+                            fingerprints.append(attr._fingerprint)
+                    attr_changed = fingerprints[0] != fingerprints[1]
+                    attrs_changed[attr_id] = attr_changed
+                if attr_changed and item.attrs._force_recalc(attr_id):
+                    item_attr_ids.add(attr_id)
+            if item_attr_ids:
+                attr_changes.setdefault(item._fit, {})[item] = item_attr_ids
+        return attr_changes
+
     def get_ctc_range(self, item1, item2):
         """Calculate center-to-center range between two items."""
-        try:
-            item1_ss = item1._fit.solar_system
-        except AttributeError:
-            item1_ss = None
-        try:
-            item2_ss = item2._fit.solar_system
-        except AttributeError:
-            item2_ss = None
-        if item1_ss is not self or item2_ss is not self:
-            msg = 'both passed items must belong to this solar system'
-            raise ItemSolarSystemMismatchError(msg)
-        ctc_range = sqrt(
-            (item1.x - item2.x) ** 2 +
-            (item1.y - item2.y) ** 2 +
-            (item1.z - item2.z) ** 2)
-        return ctc_range
+        self.__check_items_solsys(item1, item2)
+        return self.__calc_ctc_range(item1.coordinate, item2.coordinate)
 
     def get_sts_range(self, item1, item2):
         """Calculate surface-to-surface range between two items."""
@@ -100,6 +182,121 @@ class SolarSystem:
         item2_radius = item2._type_attrs.get(AttrId.radius, 0)
         return max(0, ctc_range - item1_radius - item2_radius)
 
+    def items_within(self, item, range):
+        """Get items located within specified range from passed item.
+
+        Only loaded items are taken into consideration.
+
+        Args:
+            item: Item which serves as center of the query.
+            range: Center-to-center range in meters.
+
+        Returns:
+            Set with items, not including passed item.
+
+        Raises:
+            ItemSolarSystemMismatchError: If passed item does not belong to
+                this solar system.
+        """
+        self.__check_items_solsys(item)
+        items = self._spatial_index.get_items_within(item.coordinate, range)
+        items.discard(item)
+        return items
+
+    def items_within_point(self, coordinate, range):
+        """Get items located within specified range from passed point.
+
+        Only loaded items are taken into consideration.
+
+        Args:
+            coordinate: Coordinates helper container instance.
+            range: Range from point to item center in meters.
+
+        Returns:
+            Set with items.
+        """
+        return self._spatial_index.get_items_within(coordinate, range)
+
+    def get_aoe_volley(self):
+        """Get volley which items receive from area damage dealers.
+
+        Every activation of area effect (smartbombs, fighter bombs, direct
+        doomsdays) is resolved into set of items it hits, and damage is
+        aggregated per hit item.
+
+        Returns:
+            Dictionary in {item: DmgStats helper container instance} format.
+        """
+        return self.__combine_aoe_dmg(
+            fit.stats.get_aoe_volley() for fit in self.fits)
+
+    def get_aoe_dps(self, reload=False):
+        """Get DPS which items receive from area damage dealers.
+
+        Args:
+            reload (optional): Boolean flag which controls if reload should be
+                taken into consideration or not. By default, reload is ignored.
+
+        Returns:
+            Dictionary in {item: DmgStats helper container instance} format.
+        """
+        return self.__combine_aoe_dmg(
+            fit.stats.get_aoe_dps(reload=reload) for fit in self.fits)
+
+    @staticmethod
+    def __combine_aoe_dmg(fits_aoe_dmg):
+        # Format: {item: [damage stats]}
+        tgts_dmgs = {}
+        for fit_aoe_dmg in fits_aoe_dmg:
+            for tgt_item, dmg in fit_aoe_dmg.items():
+                tgts_dmgs.setdefault(tgt_item, []).append(dmg)
+        return {
+            tgt_item: DmgStats._combine(dmgs)
+            for tgt_item, dmgs in tgts_dmgs.items()}
+
+    def get_ctc_range_matrix(self, items):
+        """Calculate center-to-center ranges between all passed items.
+
+        Args:
+            items: Iterable with items.
+
+        Returns:
+            List of lists with ranges, where value at [i][j] is range between
+            i-th and j-th passed items.
+
+        Raises:
+            ItemSolarSystemMismatchError: If any of passed items does not
+                belong to this solar system.
+        """
+        items = tuple(items)
+        self.__check_items_solsys(*items)
+        coordinates = [tuple(item.coordinate) for item in items]
+        matrix = [[0] * len(coordinates) for _ in coordinates]
+        # Matrix is symmetric, calculate every range just once
+        for i, coordinate1 in enumerate(coordinates):
+            row = matrix[i]
+            for j in range(i + 1, len(coordinates)):
+                ctc_range = self.__calc_ctc_range(coordinate1, coordinates[j])
+                row[j] = ctc_range
+                matrix[j][i] = ctc_range
+        return matrix
+
+    def __check_items_solsys(self, *items):
+        for item in items:
+            try:
+                item_ss = item._fit.solar_system
+            except AttributeError:
+                item_ss = None
+            if item_ss is not self:
+                msg = 'all passed items must belong to this solar system'
+                raise ItemSolarSystemMismatchError(msg)
+
+    @staticmethod
+    def __calc_ctc_range(coordinate1, coordinate2):
+        x1, y1, z1 = coordinate1
+        x2, y2, z2 = coordinate2
+        return sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2 + (z1 - z2) ** 2)
+
     def __repr__(self):
         spec = ['source', 'fits']
         return make_repr_str(self, spec)
@@ -0,0 +1,155 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import math
+
+from eos.item.mixin.solar_system import SolarSystemItemMixin
+from eos.pubsub.message import ItemCoordinateChanged
+from eos.pubsub.message import ItemLoaded
+from eos.pubsub.message import ItemUnloaded
+from eos.pubsub.subscriber import BaseSubscriber
+from eos.util.keyed_storage import KeyedStorage
+
+
+DEFAULT_CELL_SIZE = 10000
+
+
+class SpatialIndex(BaseSubscriber):
+    """Tracks positions of solar system items using uniform grid.
+
+    Only loaded items are tracked, like in the rest of solar system services.
+
+    Args:
+        cell_size (optional): Length of grid cell edge in meters. Should be
+            comparable with typical ranges of neighbourhood queries.
+    """
+
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        self.__cell_size = cell_size
+        # Format: {cell key: {items}}
+        self.__cell_items = KeyedStorage()
+        # Format: {item: cell key}
+        self.__item_cells = {}
+
+    def get_items_within(self, coordinate, distance):
+        """Get items whose center is within distance from passed coordinate.
+
+        Args:
+            coordinate: Coordinates helper container instance.
+            distance: Distance in meters.
+
+        Returns:
+            Set with items.
+        """
+        x, y, z = coordinate
+        distance_sq = distance ** 2
+        items = set()
+        for cell_items in self.__iter_cells_within(x, y, z, distance):
+            for item in cell_items:
+                item_x, item_y, item_z = item.coordinate
+                dist_sq = (
+                    (item_x - x) ** 2 +
+                    (item_y - y) ** 2 +
+                    (item_z - z) ** 2)
+                if dist_sq <= distance_sq:
+                    items.add(item)
+        return items
+
+    def __iter_cells_within(self, x, y, z, distance):
+        """Iterate over item sets of cells which may contain items in range."""
+        min_key = self.__get_cell_key(
+            x - distance, y - distance, z - distance)
+        max_key = self.__get_cell_key(
+            x + distance, y + distance, z + distance)
+        cell_qty = 1
+        for min_coord, max_coord in zip(min_key, max_key):
+            cell_qty *= max_coord - min_coord + 1
+        # When query covers more cells than there are occupied cells, it is
+        # cheaper to check occupied cells
+        if cell_qty > len(self.__cell_items):
+            for cell_key, cell_items in self.__cell_items.items():
+                if all(
+                    min_coord <= coord <= max_coord for
+                    coord, min_coord, max_coord in
+                    zip(cell_key, min_key, max_key)
+                ):
+                    yield cell_items
+            return
+        for cell_x in range(min_key[0], max_key[0] + 1):
+            for cell_y in range(min_key[1], max_key[1] + 1):
+                for cell_z in range(min_key[2], max_key[2] + 1):
+                    cell_items = self.__cell_items.get(
+                        (cell_x, cell_y, cell_z))
+                    if cell_items:
+                        yield cell_items
+
+    def __get_cell_key(self, x, y, z):
+        cell_size = self.__cell_size
+        return (
+            math.floor(x / cell_size),
+            math.floor(y / cell_size),
+            math.floor(z / cell_size))
+
+    def __add_item(self, item):
+        cell_key = self.__get_cell_key(*item.coordinate)
+        self.__item_cells[item] = cell_key
+        self.__cell_items.add_data_entry(cell_key, item)
+
+    def __remove_item(self, item):
+        cell_key = self.__item_cells.pop(item, None)
+        if cell_key is not None:
+            self.__cell_items.rm_data_entry(cell_key, item)
+
+    # Handle fits
+    def _handle_fit_added(self, fit):
+        fit._subscribe(self, self._handler_map.keys())
+
+    def _handle_fit_removed(self, fit):
+        fit._unsubscribe(self, self._handler_map.keys())
+        for item in fit._item_iter():
+            self.__remove_item(item)
+
+    # Message handling
+    def _handle_item_loaded(self, msg):
+        if isinstance(msg.item, SolarSystemItemMixin):
+            self.__add_item(msg.item)
+
+    def _handle_item_unloaded(self, msg):
+        if isinstance(msg.item, SolarSystemItemMixin):
+            self.__remove_item(msg.item)
+
+    def _handle_item_coordinate_changed(self, msg):
+        item = msg.item
+        old_cell_key = self.__item_cells.get(item)
+        # Item is not tracked, e.g. when it's not loaded
+        if old_cell_key is None:
+            return
+        new_cell_key = self.__get_cell_key(*item.coordinate)
+        if new_cell_key == old_cell_key:
+            return
+        self.__cell_items.rm_data_entry(old_cell_key, item)
+        self.__item_cells[item] = new_cell_key
+        self.__cell_items.add_data_entry(new_cell_key, item)
+
+    _handler_map = {
+        ItemLoaded: _handle_item_loaded,
+        ItemUnloaded: _handle_item_unloaded,
+        ItemCoordinateChanged: _handle_item_coordinate_changed}
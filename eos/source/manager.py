@@ -22,7 +22,6 @@
 from logging import getLogger
 
 from eos import __version__ as eos_version
-from eos.eve_obj_builder import EveObjBuilder
 from eos.util.repr import make_repr_str
 from .exception import ExistingSourceError
 from .exception import UnknownSourceError
@@ -81,6 +80,9 @@ class SourceManager:
                 ).format(cache_fp, current_fp)
                 logger.info(msg)
 
+            # Builder is imported only when needed, as it pulls heavy
+            # dependencies which are not used when cache is up to date
+            from eos.eve_obj_builder import EveObjBuilder
             # Generate eve objects and cache them, as generation takes
             # significant amount of time
             eve_objects = EveObjBuilder.run(data_handler)
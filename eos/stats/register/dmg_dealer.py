@@ -22,7 +22,10 @@
 from eos.eve_obj.effect.dmg_dealer.base import DmgDealerEffect
 from eos.pubsub.message import EffectsStarted
 from eos.pubsub.message import EffectsStopped
+from eos.sim.dmg_timeline import simulate_dmg_timeline
+from eos.stats_container import DmgCurve
 from eos.stats_container import DmgStats
+from eos.stats_container import TgtData
 from eos.util.keyed_storage import KeyedStorage
 from .base import BaseStatRegister
 
@@ -52,11 +55,98 @@ class DmgDealerRegister(BaseStatRegister):
             dpss.append(dps)
         return DmgStats._combine(dpss)
 
+    def get_dps_curve(self, ranges, tgt_data, item_filter, reload, tgt_resists):
+        ranges = tuple(ranges)
+        if tgt_data is None:
+            tgt_data = TgtData()
+        tgt_datas = [
+            TgtData(
+                rng,
+                tgt_data.angular_speed,
+                tgt_data.sig_radius,
+                tgt_data.velocity)
+            for rng in ranges]
+        # Format: [[dps of effect1, dps of effect2], ...]
+        rngs_dpss = [[] for _ in ranges]
+        for item, effect in self.__applied_dd_iter(item_filter):
+            # Effects fetch all the data they need once, and then apply it to
+            # all the ranges
+            effect_dpss = effect.get_applied_dps_batch(item, tgt_datas, reload)
+            for rng_dpss, dps in zip(rngs_dpss, effect_dpss):
+                rng_dpss.append(dps)
+        dpss = [
+            DmgStats._combine(rng_dpss, tgt_resists)
+            for rng_dpss in rngs_dpss]
+        return DmgCurve(
+            ranges,
+            tuple(dps.em for dps in dpss),
+            tuple(dps.thermal for dps in dpss),
+            tuple(dps.kinetic for dps in dpss),
+            tuple(dps.explosive for dps in dpss),
+            tuple(dps.total for dps in dpss))
+
+    def get_dmg_timeline(self, times, tgt_data, item_filter, tgt_resists):
+        # Format: [(cycle parameters, volley), ...]
+        dealers = []
+        if tgt_data is None:
+            item_effects = self.__all_dd_iter(item_filter)
+        else:
+            item_effects = self.__applied_dd_iter(item_filter)
+        for item, effect in item_effects:
+            cycle_parameters = effect.get_cycle_parameters(item, True)
+            if cycle_parameters is None:
+                continue
+            if tgt_data is None:
+                volley = effect.get_volley(item)
+            else:
+                volley = effect.get_applied_volley(item, tgt_data)
+            volley = DmgStats._combine((volley,), tgt_resists)
+            dealers.append((cycle_parameters, volley))
+        return simulate_dmg_timeline(dealers, times)
+
+    def get_aoe_volley(self, item_filter):
+        return self.__get_aoe_dmg(
+            item_filter, lambda item, effect: effect.get_volley(item))
+
+    def get_aoe_dps(self, item_filter, reload):
+        return self.__get_aoe_dmg(
+            item_filter, lambda item, effect: effect.get_dps(item, reload))
+
+    def __get_aoe_dmg(self, item_filter, dmg_getter):
+        # Format: {target item: [damage stats]}
+        tgts_dmgs = {}
+        for item in self.__dd_iter(item_filter):
+            for effect in item._dd_effect_iter():
+                tgt_items = effect.get_aoe_tgts(item)
+                if not tgt_items:
+                    continue
+                dmg = dmg_getter(item, effect)
+                for tgt_item in tgt_items:
+                    tgts_dmgs.setdefault(tgt_item, []).append(dmg)
+        return {
+            tgt_item: DmgStats._combine(dmgs)
+            for tgt_item, dmgs in tgts_dmgs.items()}
+
     def __dd_iter(self, item_filter):
         for item in self.__dmg_dealers:
             if item_filter is None or item_filter(item):
                 yield item
 
+    def __all_dd_iter(self, item_filter):
+        for item in self.__dd_iter(item_filter):
+            for effect in item._dd_effect_iter():
+                yield item, effect
+
+    def __applied_dd_iter(self, item_filter):
+        """Iterate over effects whose damage application can be calculated.
+
+        Damage of other effects is not taken into account in applied stats.
+        """
+        for item in self.__dd_iter(item_filter):
+            for effect in item._dd_effect_iter():
+                if effect.supports_application:
+                    yield item, effect
+
     # Message handling
     def _handle_effects_started(self, msg):
         item_effects = msg.item._type_effects
@@ -146,6 +146,24 @@ class StatService:
         except AttributeError:
             return ItemHP(0, 0, 0)
 
+    def get_ehp_batch(self, dmg_profiles):
+        """Get effective HP of an item against multiple damage profiles.
+
+        Args:
+            dmg_profiles: Iterable with damage profiles. Every profile can be
+                DmgProfile helper container instance or any sequence of 4
+                numbers in (em, thermal, kinetic, explosive) format.
+
+        Returns:
+            List with TankingLayersTotal helper container instances, in the
+            same order as damage profiles were passed. If ship data cannot be
+            fetched, EHP values will be 0.
+        """
+        try:
+            return self.__fit.ship.get_ehp_batch(dmg_profiles)
+        except AttributeError:
+            return [ItemHP(0, 0, 0) for _ in dmg_profiles]
+
     @property
     def worst_case_ehp(self):
         """Get eve-style effective HP for the item.
@@ -200,6 +218,99 @@ class StatService:
         """
         return self.__dd_reg.get_dps(item_filter, reload, tgt_resists)
 
+    def get_dps_curve(
+            self, ranges, target=None, item_filter=None, reload=False,
+            tgt_resists=None):
+        """
+        Get DPS of the fit applied to target at multiple distances.
+
+        Damage dealers whose damage application cannot be calculated, like
+        smartbombs, fighters and doomsdays, are not taken into account.
+
+        Args:
+            ranges: Iterable with distances to target in meters.
+            target (optional): TgtData helper container instance, which
+                describes target. Its range is ignored, distances from ranges
+                argument are used instead. If not specified, only range-based
+                damage reduction is taken into account.
+            item_filter (optional): When iterating over fit items, this function
+                is called. If evaluated as True, this item is taken into
+                consideration, else not. If argument is None, all items 'pass
+                filter'. By default None.
+            reload (optional): Boolean flag which controls if reload should be
+                taken into consideration or not. By default, reload is ignored.
+            tgt_resists (optional): ResistanceProfile helper container instance.
+                If specified, effective damage against these resistances is
+                calculated.
+
+        Returns:
+            DmgCurve helper container instance.
+        """
+        return self.__dd_reg.get_dps_curve(
+            ranges, target, item_filter, reload, tgt_resists)
+
+    def get_dmg_timeline(
+            self, times, target=None, item_filter=None, tgt_resists=None):
+        """
+        Get cumulative damage dealt by the fit by specific moments of time.
+
+        Unlike DPS, which averages damage over cycles, this stat simulates
+        every cycle of every damage dealer, including reloads, reactivation
+        delays and fighter ability cooldowns. All weapons are assumed to fire
+        their first shot at time 0.
+
+        Args:
+            times: Iterable with moments of time in seconds.
+            target (optional): TgtData helper container instance. If
+                specified, damage applied to this target is calculated, and
+                damage dealers whose damage application cannot be calculated
+                are not taken into account.
+            item_filter (optional): When iterating over fit items, this function
+                is called. If evaluated as True, this item is taken into
+                consideration, else not. If argument is None, all items 'pass
+                filter'. By default None.
+            tgt_resists (optional): ResistanceProfile helper container instance.
+                If specified, effective damage against these resistances is
+                calculated.
+
+        Returns:
+            DmgTimeline helper container instance.
+        """
+        return self.__dd_reg.get_dmg_timeline(
+            times, target, item_filter, tgt_resists)
+
+    def get_aoe_volley(self, item_filter=None):
+        """
+        Get volley of area damage dealers of the fit, per hit item.
+
+        Args:
+            item_filter (optional): When iterating over fit items, this function
+                is called. If evaluated as True, this item is taken into
+                consideration, else not. If argument is None, all items 'pass
+                filter'. By default None.
+
+        Returns:
+            Dictionary in {item: DmgStats helper container instance} format.
+        """
+        return self.__dd_reg.get_aoe_volley(item_filter)
+
+    def get_aoe_dps(self, item_filter=None, reload=False):
+        """
+        Get DPS of area damage dealers of the fit, per hit item.
+
+        Args:
+            item_filter (optional): When iterating over fit items, this function
+                is called. If evaluated as True, this item is taken into
+                consideration, else not. If argument is None, all items 'pass
+                filter'. By default None.
+            reload (optional): Boolean flag which controls if reload should be
+                taken into consideration or not. By default, reload is ignored.
+
+        Returns:
+            Dictionary in {item: DmgStats helper container instance} format.
+        """
+        return self.__dd_reg.get_aoe_dps(item_filter, reload)
+
     @property
     def agility_factor(self):
         try:
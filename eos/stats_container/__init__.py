@@ -21,9 +21,13 @@
 
 from .coordinates import Coordinates
 from .coordinates import Orientation
+from .dmg_curve import DmgCurve
+from .dmg_timeline import DmgTimeline
 from .dmg_types import DmgProfile
 from .dmg_types import DmgStats
 from .dmg_types import ResistProfile
+from .incoming import IncomingStats
 from .slots import SlotStats
 from .tanking_layers import ItemHP
 from .tanking_layers import TankingLayers
+from .tgt_data import TgtData
@@ -31,6 +31,8 @@ class Coordinates:
         TypeError: If any of passed values is not a number.
     """
 
+    __slots__ = ('__x', '__y', '__z')
+
     def __init__(self, x, y, z):
         if not all((
             isinstance(x, Real),
@@ -88,6 +90,8 @@ class Orientation(Coordinates):
         ValueError: If all passed values are zero.
     """
 
+    __slots__ = ()
+
     def __init__(self, x, y, z):
         Coordinates.__init__(self, x, y, z)
         if all((
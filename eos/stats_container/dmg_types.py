@@ -21,13 +21,14 @@
 
 from numbers import Real
 
-from eos.util.cached_property import cached_property
 from eos.util.repr import make_repr_str
 
 
 class DmgTypes:
     """Container for damage data stats."""
 
+    __slots__ = ('__em', '__thermal', '__kinetic', '__explosive')
+
     def __init__(self, em, thermal, kinetic, explosive):
         self.__em = em
         self.__thermal = thermal
@@ -82,9 +83,15 @@ class DmgTypes:
 class DmgTypesTotal(DmgTypes):
     """Container for damage data stats, which also calculates total damage."""
 
-    @cached_property
+    __slots__ = ('__total',)
+
+    def __init__(self, em, thermal, kinetic, explosive):
+        DmgTypes.__init__(self, em, thermal, kinetic, explosive)
+        self.__total = em + thermal + kinetic + explosive
+
+    @property
     def total(self):
-        return self.em + self.thermal + self.kinetic + self.explosive
+        return self.__total
 
     def __iter__(self):
         for item in DmgTypes.__iter__(self):
@@ -99,6 +106,8 @@ class DmgTypesTotal(DmgTypes):
 class DmgStats(DmgTypesTotal):
     """Container for damage stats."""
 
+    __slots__ = ()
+
     def __init__(self, em, thermal, kinetic, explosive, mult=None):
         if mult is not None:
             em *= mult
@@ -152,6 +161,8 @@ class DmgProfile(DmgTypes):
             is not strictly greater than zero.
     """
 
+    __slots__ = ()
+
     def __init__(self, em, thermal, kinetic, explosive):
         if not all((
             isinstance(em, Real),
@@ -182,6 +193,8 @@ class ResistProfile(DmgTypes):
         ValueError: If any of passed values are less than 0 or greater than 1.
     """
 
+    __slots__ = ()
+
     def __init__(self, em, thermal, kinetic, explosive):
         if not all((
             isinstance(em, Real),
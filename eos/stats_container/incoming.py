@@ -0,0 +1,32 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from collections import namedtuple
+
+
+# Container for aggregated stats of effects projected onto an item. Damage is
+# DmgStats instance, repairs are ItemHP instance with HP repaired per second,
+# and electronic warfare is dictionary in {affectee attribute ID:
+# ((modification operator, modification value, range multiplier), ...)}
+# format. Modification values are not scaled; range multiplier applies to them
+# the same way as in attribute calculation, i.e. only to non-assignment
+# operators, after modification value is normalized
+IncomingStats = namedtuple('IncomingStats', ('dps', 'rps', 'ewar'))
@@ -21,13 +21,14 @@
 
 from numbers import Real
 
-from eos.util.cached_property import cached_property
 from eos.util.repr import make_repr_str
 
 
 class TankingLayers:
     """Container for various tanking layer attributes."""
 
+    __slots__ = ('__hull', '__armor', '__shield')
+
     def __init__(self, hull, armor, shield):
         self.__hull = hull
         self.__armor = armor
@@ -74,6 +75,8 @@ class TankingLayers:
 class ItemHP(TankingLayers):
     """Container for HP stats, which also calculates total HP."""
 
+    __slots__ = ('__total',)
+
     def __init__(self, hull, armor, shield):
         if not all((
             isinstance(hull, Real),
@@ -88,10 +91,11 @@ class ItemHP(TankingLayers):
         )):
             raise ValueError('all HP values must be non-negative numbers')
         TankingLayers.__init__(self, hull, armor, shield)
+        self.__total = hull + armor + shield
 
-    @cached_property
+    @property
     def total(self):
-        return self.hull + self.armor + self.shield
+        return self.__total
 
     def __iter__(self):
         for item in TankingLayers.__iter__(self):
@@ -0,0 +1,102 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from numbers import Real
+
+from eos.util.repr import make_repr_str
+
+
+class TgtData:
+    """Container for data which describes target of damage dealer.
+
+    All the values are optional; if some value is not specified, its influence
+    on damage application is not taken into account.
+
+    Args:
+        range (optional): Distance to target in meters.
+        angular_speed (optional): Angular speed of target relatively to
+            attacker in radians per second.
+        sig_radius (optional): Signature radius of target in meters.
+        velocity (optional): Velocity of target in meters per second.
+
+    Raises:
+        TypeError: If any of passed values is not a number.
+        ValueError: If any of passed values is less than zero.
+    """
+
+    __slots__ = ('__range', '__angular_speed', '__sig_radius', '__velocity')
+
+    def __init__(
+            self, range=None, angular_speed=None, sig_radius=None,
+            velocity=None):
+        values = (range, angular_speed, sig_radius, velocity)
+        if not all(v is None or isinstance(v, Real) for v in values):
+            raise TypeError('all target values must be numbers or None')
+        if not all(v is None or v >= 0 for v in values):
+            raise ValueError('all target values must be non-negative numbers')
+        self.__range = range
+        self.__angular_speed = angular_speed
+        self.__sig_radius = sig_radius
+        self.__velocity = velocity
+
+    @property
+    def range(self):
+        return self.__range
+
+    @property
+    def angular_speed(self):
+        return self.__angular_speed
+
+    @property
+    def sig_radius(self):
+        return self.__sig_radius
+
+    @property
+    def velocity(self):
+        return self.__velocity
+
+    # Iterator is needed to support tuple-style unpacking
+    def __iter__(self):
+        yield self.range
+        yield self.angular_speed
+        yield self.sig_radius
+        yield self.velocity
+
+    def __eq__(self, other):
+        if not isinstance(other, TgtData):
+            return NotImplemented
+        return all((
+            self.range == other.range,
+            self.angular_speed == other.angular_speed,
+            self.sig_radius == other.sig_radius,
+            self.velocity == other.velocity))
+
+    def __hash__(self):
+        return hash((
+            TgtData.__qualname__,
+            self.range,
+            self.angular_speed,
+            self.sig_radius,
+            self.velocity))
+
+    def __repr__(self):
+        spec = ['range', 'angular_speed', 'sig_radius', 'velocity']
+        return make_repr_str(self, spec)
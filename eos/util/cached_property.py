@@ -31,18 +31,33 @@ class cached_property:
     which decorated method belongs. As python, when getting attribute with
     certain name, seeks for class instance's attributes first, then for methods,
     it gets cached result. To clear cache, just delete cached attribute.
+
+    Instances without dictionary cannot store arbitrary attributes. For them,
+    value is stored in slot named after decorated method, with '_cached_'
+    prefix and without leading underscores - e.g. value of _fingerprint is
+    stored in _cached_fingerprint - which has to be declared by the class.
     """
 
     def __init__(self, method):
         self.__method = method
+        self.__slot_name = '_cached_{}'.format(method.__name__.lstrip('_'))
 
     def __get__(self, instance, _):
         # Return descriptor if called from class
         if instance is None:
             return self
+        # Instances with slots get here on every access, check if value has
+        # been cached already
+        try:
+            return getattr(instance, self.__slot_name)
+        except AttributeError:
+            pass
         # If called from instance, execute decorated method and store returned
         # value as class attribute, which has the same name as method, then
         # return it to caller
         value = self.__method(instance)
-        setattr(instance, self.__method.__name__, value)
+        try:
+            instance.__dict__[self.__method.__name__] = value
+        except AttributeError:
+            setattr(instance, self.__slot_name, value)
         return value
@@ -0,0 +1,201 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+
+
+try:
+    _popcount = int.bit_count
+# Fall back to slower implementation on python versions before 3.10
+except AttributeError:
+    def _popcount(value):
+        return bin(value).count('1')
+
+
+class AttrIndexer:
+    """Assigns dense indices to attribute IDs.
+
+    Indices start from 0 and are assigned in order in which attribute IDs are
+    seen, and never change afterwards.
+    """
+
+    def __init__(self):
+        # Format: {attribute ID: index}
+        self.__indices = {}
+        # Format: [attribute ID]
+        self.__attr_ids = []
+
+    def get_index(self, attr_id):
+        """Get index of attribute ID, assigning new one if needed."""
+        try:
+            return self.__indices[attr_id]
+        except KeyError:
+            index = len(self.__attr_ids)
+            self.__indices[attr_id] = index
+            self.__attr_ids.append(attr_id)
+            return index
+
+    def find_index(self, attr_id):
+        """Get index of attribute ID, or None if it has no index."""
+        return self.__indices.get(attr_id)
+
+    def get_attr_id(self, index):
+        return self.__attr_ids[index]
+
+    def __len__(self):
+        return len(self.__attr_ids)
+
+
+class PackedAttrMap(Mapping):
+    """Read-only map with attribute values packed into array.
+
+    Presence of attributes is stored as bitmap, where every bit corresponds to
+    dense index of attribute. Values of present attributes are stored in array
+    of floats in order of their indices, thus position of value is amount of
+    bits set below the attribute's bit.
+
+    Args:
+        attrs: Map with attribute values in {attribute ID: value} format.
+        indexer: Attribute indexer which assigns indices to attribute IDs.
+    """
+
+    __slots__ = ('__indexer', '__bitmap', '__values')
+
+    def __init__(self, attrs, indexer):
+        self.__indexer = indexer
+        indexed_values = sorted(
+            (indexer.get_index(attr_id), value)
+            for attr_id, value in attrs.items())
+        bitmap = 0
+        for index, _ in indexed_values:
+            bitmap |= 1 << index
+        self.__bitmap = bitmap
+        self.__values = array('d', (value for _, value in indexed_values))
+
+    @property
+    def _indexer(self):
+        return self.__indexer
+
+    def __getitem__(self, attr_id):
+        index = self.__indexer.find_index(attr_id)
+        if index is None:
+            raise KeyError(attr_id)
+        bit = 1 << index
+        bitmap = self.__bitmap
+        if not bitmap & bit:
+            raise KeyError(attr_id)
+        return self.__values[_popcount(bitmap & (bit - 1))]
+
+    def __contains__(self, attr_id):
+        index = self.__indexer.find_index(attr_id)
+        return index is not None and bool(self.__bitmap >> index & 1)
+
+    def __iter__(self):
+        indexer = self.__indexer
+        bitmap = self.__bitmap
+        while bitmap:
+            lowest_bit = bitmap & -bitmap
+            yield indexer.get_attr_id(lowest_bit.bit_length() - 1)
+            bitmap ^= lowest_bit
+
+    def __len__(self):
+        return len(self.__values)
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, dict(self.items()))
+
+
+class AttrValueArray:
+    """Mutable storage for attribute values keyed by their dense indices.
+
+    Exposes subset of dictionary interface, and is used by items to store
+    calculated attribute values. Indices of stored attributes are kept sorted
+    in array of integers, and values are kept in array of floats at the same
+    positions, thus memory footprint does not depend on magnitude of indices.
+
+    Values are stored as C doubles, thus integer values (e.g. skill level
+    overrides) are returned as floats.
+
+    Args:
+        indexer: Attribute indexer which assigns indices to attribute IDs.
+    """
+
+    __slots__ = ('__indexer', '__indices', '__values')
+
+    def __init__(self, indexer):
+        self.__indexer = indexer
+        self.__indices = array('I')
+        self.__values = array('d')
+
+    @property
+    def _indexer(self):
+        return self.__indexer
+
+    def __find_pos(self, attr_id):
+        """Get position of attribute value, or None if it is not stored."""
+        index = self.__indexer.find_index(attr_id)
+        if index is None:
+            return None
+        indices = self.__indices
+        pos = bisect_left(indices, index)
+        if pos < len(indices) and indices[pos] == index:
+            return pos
+        return None
+
+    def __getitem__(self, attr_id):
+        pos = self.__find_pos(attr_id)
+        if pos is None:
+            raise KeyError(attr_id)
+        return self.__values[pos]
+
+    def __setitem__(self, attr_id, value):
+        index = self.__indexer.get_index(attr_id)
+        indices = self.__indices
+        pos = bisect_left(indices, index)
+        if pos < len(indices) and indices[pos] == index:
+            self.__values[pos] = value
+        else:
+            indices.insert(pos, index)
+            self.__values.insert(pos, value)
+
+    def __delitem__(self, attr_id):
+        pos = self.__find_pos(attr_id)
+        if pos is None:
+            raise KeyError(attr_id)
+        del self.__indices[pos]
+        del self.__values[pos]
+
+    def __contains__(self, attr_id):
+        return self.__find_pos(attr_id) is not None
+
+    def __iter__(self):
+        get_attr_id = self.__indexer.get_attr_id
+        for index in self.__indices:
+            yield get_attr_id(index)
+
+    def __len__(self):
+        return len(self.__indices)
+
+    def clear(self):
+        del self.__indices[:]
+        del self.__values[:]
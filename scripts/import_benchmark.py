@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+"""
+Measure how long it takes to import eos in fresh interpreter.
+
+Every measurement is done in separate process, to make sure nothing is cached
+in sys.modules. Besides bare package import, time to access fit class (which
+pulls most of the package) and time to produce first eve object (which loads
+customizations) are measured.
+"""
+
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+SCENARIOS = (
+    ('import', 'import eos'),
+    ('access', 'import eos; eos.Fit'),
+    ('factory', (
+        'import eos; eos.Fit; '
+        'from eos.eve_obj.effect import EffectFactory; '
+        'EffectFactory.make(1)')))
+
+TIMER_TEMPLATE = (
+    'import time; start = time.perf_counter(); {}; '
+    'print(time.perf_counter() - start)')
+
+
+def measure(code, runs):
+    """Run passed code in fresh interpreters and return timings in ms."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    timings = []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            (sys.executable, '-c', TIMER_TEMPLATE.format(code)), cwd=root)
+        timings.append(float(output) * 1000)
+    return timings
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Measure import time of eos package.')
+    parser.add_argument(
+        '-r', '--runs', type=int, default=10,
+        help='number of runs per scenario')
+    parser.add_argument(
+        '-m', '--max-import-ms', type=float, default=None,
+        help='exit with error if median bare import time exceeds this value')
+    args = parser.parse_args()
+    results = {}
+    for name, code in SCENARIOS:
+        timings = measure(code, args.runs)
+        results[name] = statistics.median(timings)
+        print('{:<8} median {:8.2f} ms, min {:8.2f} ms'.format(
+            name, results[name], min(timings)))
+    if (
+        args.max_import_ms is not None and
+        results['import'] > args.max_import_ms
+    ):
+        print('bare import is slower than {} ms'.format(args.max_import_ms))
+        sys.exit(1)
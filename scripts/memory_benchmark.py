@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+"""
+Measure memory use and attribute access speed on synthetic data.
+
+Synthetic data set, comparable in size with full eve cache, is written into
+temporary cache file. Then, in fresh interpreter, cache is loaded and solar
+system with many fits is composed; growth of resident set size of process and
+of memory allocated by python objects which are still alive is recorded for
+every stage. Finally, access to attributes of eve objects, items, stats
+containers and messages is timed.
+"""
+
+
+import argparse
+import gc
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def get_rss():
+    """Get resident set size of current process in MiB."""
+    gc.collect()
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    # Fall back to peak RSS where procfs is not available
+    except OSError:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == 'darwin':
+            return rss / 2 ** 20
+        return rss / 2 ** 10
+
+
+def get_heap():
+    """Get size of traced memory blocks which are still allocated in MiB."""
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0] / 2 ** 20
+
+
+def get_memory(trace):
+    """Get memory use metric, depending on measurement mode."""
+    if trace:
+        return get_heap()
+    return get_rss()
+
+
+def make_cache(cache_path, type_qty, attr_qty, effect_qty, seed):
+    from eos.cache_handler import JsonCacheHandler
+    from eos.const.eos import ModAffecteeFilter
+    from eos.const.eos import ModDomain
+    from eos.const.eos import ModOperator
+    from eos.const.eve import EffectCategoryId
+    from eos.eve_obj.attribute import Attribute
+    from eos.eve_obj.effect import Effect
+    from eos.eve_obj.modifier import DogmaModifier
+    from eos.eve_obj.type import Type
+    rng = random.Random(seed)
+    # Attribute IDs are taken from range which is not used by well-known
+    # attributes, to avoid collisions with customizations
+    attr_ids = list(range(100000, 100000 + attr_qty))
+    attrs = [
+        Attribute(attr_id, default_value=rng.choice((None, 0.0, 1.0)))
+        for attr_id in attr_ids]
+    # Modifiers use separate sets of affector and affectee attributes, to
+    # avoid circular dependencies during calculation
+    affector_attr_ids = attr_ids[:attr_qty // 2]
+    affectee_attr_ids = attr_ids[attr_qty // 2:]
+    effects = []
+    for effect_id in range(100000, 100000 + effect_qty):
+        modifiers = tuple(
+            DogmaModifier(
+                affectee_filter=ModAffecteeFilter.item,
+                affectee_domain=ModDomain.self,
+                affectee_attr_id=rng.choice(affectee_attr_ids),
+                operator=ModOperator.post_percent,
+                affector_attr_id=rng.choice(affector_attr_ids))
+            for _ in range(2))
+        effects.append(Effect(
+            effect_id, category_id=EffectCategoryId.passive,
+            modifiers=modifiers))
+    types = []
+    for type_id in range(100000, 100000 + type_qty):
+        types.append(Type(
+            type_id, group_id=rng.randrange(1000), category_id=7,
+            attrs={
+                attr_id: rng.random() * 100
+                for attr_id in rng.sample(attr_ids, 40)},
+            effects=rng.sample(effects, 3)))
+    JsonCacheHandler(cache_path).update_cache((types, attrs, effects), 'bench')
+
+
+def measure(cache_path, fit_qty, seed, trace):
+    """Measure memory use of every stage, and timings.
+
+    When memory allocations are traced, timings are skipped, as tracing slows
+    everything down.
+    """
+    from eos import Fit
+    from eos import ModuleHigh
+    from eos import Ship
+    from eos import SolarSystem
+    from eos import State
+    from eos.cache_handler import JsonCacheHandler
+    from eos.pubsub.message import AttrsValueChanged
+    from eos.source import Source
+    from eos.stats_container import DmgStats
+    suffix = 'heap_mib' if trace else 'rss_mib'
+    results = {}
+    if trace:
+        tracemalloc.start()
+    base = get_memory(trace)
+    cache_handler = JsonCacheHandler(cache_path)
+    results['cache_load_' + suffix] = get_memory(trace) - base
+    type_ids = sorted(cache_handler.find_type_ids(category=7))
+    rng = random.Random(seed)
+    base = get_memory(trace)
+    solar_system = SolarSystem(Source('bench', cache_handler))
+    items = []
+    for _ in range(fit_qty):
+        fit = Fit(solar_system)
+        fit.ship = Ship(rng.choice(type_ids))
+        items.append(fit.ship)
+        for _ in range(8):
+            module = ModuleHigh(rng.choice(type_ids), state=State.online)
+            fit.modules.high.append(module)
+            items.append(module)
+    # Calculate all attributes
+    for item in items:
+        for attr_id in item._type.attrs:
+            item.attrs.get(attr_id)
+    results['solar_system_' + suffix] = get_memory(trace) - base
+    if trace:
+        tracemalloc.stop()
+        return results
+    item_type = cache_handler.get_type(type_ids[0])
+    effect = next(iter(item_type.effects.values()))
+    modifier = effect.modifiers[0]
+    attr = cache_handler.get_attr(modifier.affectee_attr_id)
+    item = items[0]
+    calculated_attr_id = next(iter(item._type.attrs))
+    dmg_stats = DmgStats(1, 2, 3, 4)
+    changes = {item: {calculated_attr_id}}
+    number = 1000000
+    timings = (
+        ('type_attr_ns', lambda: item_type.group_id),
+        ('effect_attr_ns', lambda: effect.category_id),
+        ('modifier_attr_ns', lambda: modifier.affectee_attr_id),
+        ('attr_attr_ns', lambda: attr.default_value),
+        ('fingerprint_ns', lambda: effect._fingerprint),
+        ('item_attr_ns', lambda: item.attrs[calculated_attr_id]),
+        ('dmg_total_ns', lambda: dmg_stats.total),
+        ('dmg_stats_make_ns', lambda: DmgStats(1, 2, 3, 4).total),
+        ('msg_make_ns', lambda: AttrsValueChanged(changes)))
+    for name, func in timings:
+        time = min(timeit.repeat(func, number=number, repeat=5))
+        results[name] = time / number * 1e9
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Measure memory use and attribute access speed.')
+    parser.add_argument(
+        '-t', '--types', type=int, default=40000,
+        help='quantity of item types in synthetic data')
+    parser.add_argument(
+        '-a', '--attrs', type=int, default=2500,
+        help='quantity of attributes in synthetic data')
+    parser.add_argument(
+        '-e', '--effects', type=int, default=5000,
+        help='quantity of effects in synthetic data')
+    parser.add_argument(
+        '-f', '--fits', type=int, default=1000,
+        help='quantity of fits in solar system')
+    parser.add_argument('-s', '--seed', type=int, default=1)
+    parser.add_argument('--measure', help=argparse.SUPPRESS)
+    parser.add_argument('--trace', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.measure:
+        print(json.dumps(measure(
+            args.measure, args.fits, args.seed, args.trace)))
+        sys.exit()
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = os.path.join(tmp_dir, 'cache.json.bz2')
+        make_cache(cache_path, args.types, args.attrs, args.effects, args.seed)
+        # Measure in fresh interpreters, so that objects used to build cache
+        # do not affect results
+        for extra_args in ((), ('--trace',)):
+            output = subprocess.check_output(
+                (sys.executable, __file__, '--measure', cache_path,
+                 '--fits', str(args.fits), '--seed', str(args.seed),
+                 *extra_args),
+                cwd=ROOT)
+            results.update(json.loads(output))
+    for name, value in results.items():
+        print('{:<24} {:10.2f}'.format(name, value))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+"""
+Measure speed of stacking penalty application.
+
+Current penalization routine is compared with reference implementation, which
+sorts both chains fully and calculates penalty coefficient for every position.
+Chains of various length are generated; for every length, results of both
+implementations are checked to match before timing.
+"""
+
+
+import argparse
+import math
+import os
+import random
+import sys
+import timeit
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def reference_penalize_values(mod_values):
+    """Penalize values without any precomputation."""
+    chain_positive = []
+    chain_negative = []
+    for mod_value in mod_values:
+        if mod_value >= 0:
+            chain_positive.append(mod_value)
+        else:
+            chain_negative.append(mod_value)
+    chain_positive.sort(reverse=True)
+    chain_negative.sort()
+    value = 1
+    for penalization_chain in (chain_positive, chain_negative):
+        chain_value = 1
+        for pos, mod_value in enumerate(penalization_chain):
+            if pos > 10:
+                break
+            chain_value *= 1 + mod_value * math.exp(-(pos / 2.67) ** 2)
+        value *= chain_value
+    return value - 1
+
+
+def make_chain(length, rng):
+    """Make list of reduced multipliers with mixed signs."""
+    return [rng.uniform(-0.5, 0.5) for _ in range(length)]
+
+
+if __name__ == '__main__':
+    from eos.calculator.map import penalize_values
+    parser = argparse.ArgumentParser(
+        description='Measure speed of stacking penalty application.')
+    parser.add_argument(
+        '-l', '--lengths', type=int, nargs='+', default=(1, 2, 4, 8, 16, 64),
+        help='lengths of penalized chains')
+    parser.add_argument(
+        '-n', '--number', type=int, default=100000,
+        help='number of calls per measurement')
+    parser.add_argument(
+        '-s', '--seed', type=int, default=0,
+        help='seed for random number generator')
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    print('{:>6} {:>14} {:>14} {:>8}'.format(
+        'length', 'reference ns', 'current ns', 'speedup'))
+    for length in args.lengths:
+        chain = make_chain(length, rng)
+        expected = reference_penalize_values(chain)
+        if not math.isclose(
+            penalize_values(list(chain)), expected, abs_tol=1e-12
+        ):
+            print('results differ for chain length {}'.format(length))
+            sys.exit(1)
+        timings = []
+        for func in (reference_penalize_values, penalize_values):
+            timer = timeit.Timer(lambda: func(chain))
+            timing = min(timer.repeat(5, args.number)) / args.number * 1e9
+            timings.append(timing)
+        print('{:>6} {:>14.1f} {:>14.1f} {:>7.2f}x'.format(
+            length, timings[0], timings[1], timings[0] / timings[1]))
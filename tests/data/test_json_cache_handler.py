@@ -0,0 +1,299 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import bz2
+import json
+
+import pytest
+
+from eos.cache_handler import JsonCacheHandler
+from eos.cache_handler import TypeFetchError
+from eos.cache_handler.type_index import TypeIndex
+from eos.const.eos import ModAffecteeFilter
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eve import AttrId
+from eos.const.eve import EffectCategoryId
+from eos.const.eve import EffectId
+from eos.eve_obj.attribute import Attribute
+from eos.eve_obj.effect import Effect
+from eos.eve_obj.modifier import DogmaModifier
+from eos.eve_obj.type import Type
+from eos.util.dense_attrs import PackedAttrMap
+
+
+def make_eve_objects(attr_value):
+    modifier = DogmaModifier(
+        affectee_filter=ModAffecteeFilter.item,
+        affectee_domain=ModDomain.ship,
+        affectee_attr_id=1,
+        operator=ModOperator.post_percent,
+        affector_attr_id=2)
+    effect = Effect(
+        effect_id=100,
+        category_id=EffectCategoryId.passive,
+        modifiers=(modifier,))
+    types = (
+        Type(type_id=1000, attrs={2: 5.0}, effects=(effect,)),
+        Type(type_id=1001, attrs={2: attr_value}, effects=(effect,)))
+    attrs = (Attribute(attr_id=1), Attribute(attr_id=2))
+    return types, attrs, (effect,)
+
+
+def test_identical_objects_shared(tmp_path):
+    cache_handler1 = JsonCacheHandler(str(tmp_path / 'cache1.json.bz2'))
+    cache_handler1.update_cache(make_eve_objects(10.0), 'fp1')
+    cache_handler2 = JsonCacheHandler(str(tmp_path / 'cache2.json.bz2'))
+    cache_handler2.update_cache(make_eve_objects(10.0), 'fp2')
+
+    assert cache_handler1.get_type(1000) is cache_handler2.get_type(1000)
+    assert cache_handler1.get_type(1001) is cache_handler2.get_type(1001)
+    assert cache_handler1.get_effect(100) is cache_handler2.get_effect(100)
+    assert cache_handler1.get_attr(2) is cache_handler2.get_attr(2)
+
+
+def test_changed_objects_not_shared(tmp_path):
+    cache_handler1 = JsonCacheHandler(str(tmp_path / 'cache1.json.bz2'))
+    cache_handler1.update_cache(make_eve_objects(10.0), 'fp1')
+    cache_handler2 = JsonCacheHandler(str(tmp_path / 'cache2.json.bz2'))
+    cache_handler2.update_cache(make_eve_objects(20.0), 'fp2')
+
+    assert cache_handler1.get_type(1000) is cache_handler2.get_type(1000)
+    type1 = cache_handler1.get_type(1001)
+    type2 = cache_handler2.get_type(1001)
+    assert type1 is not type2
+    assert type1.attrs[2] == 10.0
+    assert type2.attrs[2] == 20.0
+    # Effect is the same in both sources, thus it's shared by types
+    assert type1.effects[100] is type2.effects[100]
+
+
+def test_persistent_cache_shared(tmp_path):
+    cache_path = str(tmp_path / 'cache.json.bz2')
+    cache_handler1 = JsonCacheHandler(cache_path)
+    cache_handler1.update_cache(make_eve_objects(10.0), 'fp1')
+    # Second handler loads the same data from disk
+    cache_handler2 = JsonCacheHandler(cache_path)
+
+    assert cache_handler2.get_fingerprint() == 'fp1'
+    assert cache_handler1.get_type(1001) is cache_handler2.get_type(1001)
+
+
+def test_dense_attrs(tmp_path):
+    cache_path = str(tmp_path / 'cache.json.bz2')
+    cache_handler = JsonCacheHandler(cache_path, dense_attrs=True)
+    cache_handler.update_cache(make_eve_objects(10.0), 'fp1')
+    item_type = cache_handler.get_type(1001)
+
+    assert isinstance(item_type.attrs, PackedAttrMap)
+    assert item_type.attrs == {2: 10.0}
+    assert item_type.attrs[2] == 10.0
+    assert 1 not in item_type.attrs
+    with pytest.raises(KeyError):
+        item_type.attrs[1]
+    # Handler which loads the same data from disk reuses packed item types
+    cache_handler2 = JsonCacheHandler(cache_path, dense_attrs=True)
+    assert cache_handler2.get_type(1001) is item_type
+
+
+def test_dense_attrs_not_shared_with_regular(tmp_path):
+    cache_path = str(tmp_path / 'cache.json.bz2')
+    cache_handler1 = JsonCacheHandler(cache_path)
+    cache_handler1.update_cache(make_eve_objects(10.0), 'fp1')
+    cache_handler2 = JsonCacheHandler(cache_path, dense_attrs=True)
+
+    type1 = cache_handler1.get_type(1001)
+    type2 = cache_handler2.get_type(1001)
+    assert type1 is not type2
+    assert type(type1.attrs) is dict
+    assert type1.attrs == type2.attrs
+    assert type1._fingerprint == type2._fingerprint
+    assert cache_handler1.get_effect(100) is cache_handler2.get_effect(100)
+
+
+def make_skillrq_type(type_id, *skillrqs):
+    attr_ids = (
+        (AttrId.required_skill_1, AttrId.required_skill_1_level),
+        (AttrId.required_skill_2, AttrId.required_skill_2_level))
+    attrs = {}
+    for (skill_attr_id, level_attr_id), (skill_type_id, level) in zip(
+        attr_ids, skillrqs
+    ):
+        attrs[skill_attr_id] = skill_type_id
+        attrs[level_attr_id] = level
+    return Type(type_id=type_id, attrs=attrs)
+
+
+def make_skillrq_cache_handler(tmp_path):
+    types = (
+        make_skillrq_type(10),
+        make_skillrq_type(11, (10, 4)),
+        make_skillrq_type(12, (11, 1), (10, 2)),
+        # Module which requires 2 skills with common requirement
+        make_skillrq_type(1000, (12, 3), (11, 2)),
+        make_skillrq_type(1001, (10, 1)))
+    cache_handler = JsonCacheHandler(str(tmp_path / 'cache.json.bz2'))
+    cache_handler.update_cache((types, (), ()), 'fp')
+    return cache_handler
+
+
+def test_required_skills_transitive(tmp_path):
+    cache_handler = make_skillrq_cache_handler(tmp_path)
+
+    assert cache_handler.get_required_skills(1000) == {12: 3, 11: 2, 10: 4}
+    assert cache_handler.get_required_skills(12) == {11: 1, 10: 4}
+    assert cache_handler.get_required_skills(10) == {}
+
+
+def test_required_skills_diamond(tmp_path):
+    # Both branches of module requirements depend on the same skill, whose
+    # requirements have to be included into closures of both branches
+    types = (
+        make_skillrq_type(5),
+        make_skillrq_type(4, (5, 5)),
+        make_skillrq_type(3, (4, 3)),
+        make_skillrq_type(2, (4, 3)),
+        make_skillrq_type(1000, (2, 1), (3, 1)))
+    cache_handler = JsonCacheHandler(str(tmp_path / 'cache.json.bz2'))
+    cache_handler.update_cache((types, (), ()), 'fp')
+
+    assert cache_handler.get_required_skills(1000) == {
+        2: 1, 3: 1, 4: 3, 5: 5}
+    assert cache_handler.get_required_skills(3) == {4: 3, 5: 5}
+    assert cache_handler.get_required_skills(2) == {4: 3, 5: 5}
+
+
+def test_required_skills_cached(tmp_path):
+    cache_handler = make_skillrq_cache_handler(tmp_path)
+
+    assert (
+        cache_handler.get_required_skills(1000) is
+        cache_handler.get_required_skills(1000))
+
+
+def test_required_skills_circular(tmp_path):
+    types = (
+        make_skillrq_type(10, (11, 1)),
+        make_skillrq_type(11, (10, 2)))
+    cache_handler = JsonCacheHandler(str(tmp_path / 'cache.json.bz2'))
+    cache_handler.update_cache((types, (), ()), 'fp')
+
+    assert cache_handler.get_required_skills(10) == {11: 1, 10: 2}
+    assert cache_handler.get_required_skills(11) == {10: 2, 11: 1}
+
+
+def test_required_skills_unknown_type(tmp_path):
+    cache_handler = make_skillrq_cache_handler(tmp_path)
+
+    with pytest.raises(TypeFetchError):
+        cache_handler.get_required_skills(5000)
+
+
+def test_missing_skills(tmp_path):
+    cache_handler = make_skillrq_cache_handler(tmp_path)
+    skill_levels = {10: 4, 11: 1, 12: 5}
+
+    missing_skills = cache_handler.get_missing_skills(
+        skill_levels, [1000, 1001, 1000, 12])
+
+    assert missing_skills == {1000: {11: 2}}
+
+
+def make_indexed_cache_handler(cache_path):
+    hi_power = Effect(
+        effect_id=EffectId.hi_power, category_id=EffectCategoryId.passive)
+    lo_power = Effect(
+        effect_id=EffectId.lo_power, category_id=EffectCategoryId.passive)
+    types = (
+        Type(
+            type_id=1000, group_id=55, category_id=7,
+            attrs={AttrId.charge_group_1: 85.0, AttrId.charge_size: 2.0},
+            effects=(hi_power,)),
+        Type(
+            type_id=1001, group_id=55, category_id=7,
+            attrs={
+                AttrId.charge_group_1: 86.0,
+                AttrId.charge_group_2: 85.0,
+                AttrId.can_fit_ship_group_1: 419.0},
+            effects=(hi_power,)),
+        Type(type_id=1002, group_id=60, category_id=7, effects=(lo_power,)))
+    cache_handler = JsonCacheHandler(cache_path)
+    cache_handler.update_cache((types, (), (hi_power, lo_power)), 'fp')
+    return cache_handler
+
+
+def test_find_type_ids(tmp_path):
+    cache_handler = make_indexed_cache_handler(str(tmp_path / 'c.json.bz2'))
+
+    assert cache_handler.find_type_ids(group=55) == {1000, 1001}
+    assert cache_handler.find_type_ids(category=7) == {1000, 1001, 1002}
+    assert cache_handler.find_type_ids(effect=EffectId.lo_power) == {1002}
+    assert cache_handler.find_type_ids(charge_group=85) == {1000, 1001}
+    assert cache_handler.find_type_ids(charge_size=2) == {1000}
+    assert cache_handler.find_type_ids(can_fit_ship_group=419) == {1001}
+    assert cache_handler.find_type_ids(rig_size=1) == set()
+
+
+def test_find_type_ids_intersection(tmp_path):
+    cache_handler = make_indexed_cache_handler(str(tmp_path / 'c.json.bz2'))
+
+    type_ids = cache_handler.find_type_ids(
+        effect=EffectId.hi_power, charge_group=86)
+
+    assert type_ids == {1001}
+
+
+def test_find_type_ids_errors(tmp_path):
+    cache_handler = make_indexed_cache_handler(str(tmp_path / 'c.json.bz2'))
+
+    with pytest.raises(ValueError):
+        cache_handler.find_type_ids()
+    with pytest.raises(ValueError):
+        cache_handler.find_type_ids(meta_level=5)
+
+
+def test_type_index_persisted(tmp_path, monkeypatch):
+    cache_path = str(tmp_path / 'c.json.bz2')
+    make_indexed_cache_handler(cache_path)
+
+    # Loaded handler should not need to build indexes
+    def build(*args, **kwargs):
+        raise AssertionError('index should not be rebuilt')
+
+    monkeypatch.setattr(TypeIndex, 'build', build)
+    cache_handler = JsonCacheHandler(cache_path)
+
+    assert cache_handler.find_type_ids(charge_group=85) == {1000, 1001}
+
+
+def test_type_index_legacy_cache(tmp_path):
+    cache_path = str(tmp_path / 'c.json.bz2')
+    make_indexed_cache_handler(cache_path)
+    # Strip indexes, as caches written by older versions do
+    with bz2.BZ2File(cache_path, 'r') as file:
+        cache_data = json.loads(file.read().decode('utf-8'))
+    del cache_data['type_index']
+    with bz2.BZ2File(cache_path, 'w') as file:
+        file.write(json.dumps(cache_data).encode('utf-8'))
+
+    cache_handler = JsonCacheHandler(cache_path)
+
+    assert cache_handler.find_type_ids(group=55, charge_size=2) == {1000}
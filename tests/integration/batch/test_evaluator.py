@@ -0,0 +1,145 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import gc
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from eos import Restriction
+from eos import State
+from eos.batch import BatchEvaluator
+from eos.batch import FitDescription
+from eos.batch import STAT_GETTERS
+from eos.const.eve import AttrId
+from eos.const.eve import EffectCategoryId
+from eos.const.eve import EffectId
+from tests.integration.testcase import IntegrationTestCase
+
+
+class TestBatchEvaluator(IntegrationTestCase):
+    """Check functionality of batch fit evaluator."""
+
+    def setUp(self):
+        IntegrationTestCase.setUp(self)
+        self.mkattr(attr_id=AttrId.cpu)
+        self.mkattr(attr_id=AttrId.cpu_output)
+        online_effect = self.mkeffect(
+            effect_id=EffectId.online,
+            category_id=EffectCategoryId.online)
+        self.ship_type = self.mktype(attrs={AttrId.cpu_output: 40})
+        self.module_type = self.mktype(
+            group_id=6,
+            attrs={AttrId.cpu: 15, AttrId.max_group_fitted: 2},
+            effects=[online_effect])
+        self.skip_checks = set(Restriction).difference([
+            Restriction.cpu, Restriction.max_group_fitted])
+        self.stat_getters = {'cpu': STAT_GETTERS['cpu']}
+
+    def get_log(self, name='eos.batch*'):
+        return IntegrationTestCase.get_log(self, name=name)
+
+    def make_description(self, module_qty):
+        module = (self.module_type.id, State.online)
+        return FitDescription(
+            ship_type_id=self.ship_type.id, high=[module] * module_qty)
+
+    def make_evaluator(self, **kwargs):
+        return BatchEvaluator(
+            stat_getters=self.stat_getters,
+            skip_checks=self.skip_checks,
+            **kwargs)
+
+    def verify_results(self, results):
+        self.assertEqual(len(results), 4)
+        for module_qty, result in enumerate(results):
+            self.assertIsNone(result.exception)
+            self.assertEqual(result.stats['cpu'], (15 * module_qty, 40))
+        self.assertIs(results[0].valid, True)
+        self.assertEqual(results[0].errors, frozenset())
+        self.assertIs(results[2].valid, True)
+        self.assertIs(results[3].valid, False)
+        self.assertEqual(
+            results[3].errors,
+            {Restriction.cpu, Restriction.max_group_fitted})
+
+    def test_in_process(self):
+        evaluator = self.make_evaluator(workers=0, chunk_size=3)
+        # Action
+        results = list(evaluator.evaluate(
+            self.make_description(qty) for qty in range(4)))
+        # Verification
+        self.verify_results(results)
+        # Cleanup
+        self.assert_log_entries(0)
+
+    def test_pool(self):
+        evaluator = self.make_evaluator(
+            workers=2, chunk_size=1, max_pending_chunks=1)
+        # Action
+        results = list(evaluator.evaluate(
+            self.make_description(qty) for qty in range(4)))
+        # Verification
+        self.verify_results(results)
+        # Cleanup
+        self.assert_log_entries(0)
+
+    def test_pool_no_gc_freeze(self):
+        evaluator = self.make_evaluator(workers=2, chunk_size=1)
+        # Garbage collector of python versions before 3.7 cannot freeze
+        # objects
+        gc_stub = SimpleNamespace(collect=gc.collect)
+        # Action
+        with patch('eos.batch.evaluator.gc', gc_stub):
+            results = list(evaluator.evaluate(
+                self.make_description(qty) for qty in range(4)))
+        # Verification
+        self.verify_results(results)
+        # Cleanup
+        self.assert_log_entries(0)
+
+    def test_pool_fail_fast(self):
+        evaluator = self.make_evaluator(workers=2, collect_errors=False)
+        # Action
+        results = list(evaluator.evaluate(
+            self.make_description(qty) for qty in range(4)))
+        # Verification
+        self.assertEqual(
+            [r.valid for r in results], [True, True, True, False])
+        for result in results:
+            self.assertIsNone(result.errors)
+        # Cleanup
+        self.assert_log_entries(0)
+
+    def test_exception(self):
+        # Fits which cannot be built should not break evaluation of others
+        descriptions = [
+            FitDescription(high=[(self.module_type.id, 'invalid')]),
+            self.make_description(1)]
+        evaluator = self.make_evaluator(workers=0)
+        # Action
+        results = list(evaluator.evaluate(descriptions))
+        # Verification
+        self.assertIs(results[0].valid, False)
+        self.assertIsNotNone(results[0].exception)
+        self.assertIsNone(results[0].stats)
+        self.assertIs(results[1].valid, True)
+        # Cleanup
+        self.assert_log_entries(0)
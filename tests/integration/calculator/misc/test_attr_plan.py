@@ -0,0 +1,112 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Rig
+from eos import Ship
+from eos.calculator.plan import get_attr_plans
+from eos.const.eos import ModAffecteeFilter
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eve import AttrId
+from eos.const.eve import EffectCategoryId
+from tests.integration.calculator.testcase import CalculatorTestCase
+
+
+class TestAttrPlan(CalculatorTestCase):
+    """Check compilation and sharing of attribute calculation plans."""
+
+    def setUp(self):
+        CalculatorTestCase.setUp(self)
+        self.tgt_attr = self.mkattr(stackable=False)
+        self.src_attr = self.mkattr()
+        modifier = self.mkmod(
+            affectee_filter=ModAffecteeFilter.item,
+            affectee_domain=ModDomain.ship,
+            affectee_attr_id=self.tgt_attr.id,
+            operator=ModOperator.post_percent,
+            affector_attr_id=self.src_attr.id)
+        self.effect = self.mkeffect(
+            category_id=EffectCategoryId.passive, modifiers=[modifier])
+
+    def get_plans(self):
+        return get_attr_plans(self.fit.solar_system.source.cache_handler)
+
+    def test_contents(self):
+        max_attr = self.mkattr(default_value=50)
+        attr = self.mkattr(
+            stackable=True, high_is_good=False, default_value=5,
+            max_attr_id=max_attr.id)
+        cpu_attr = self.mkattr(attr_id=AttrId.cpu)
+        plans = self.get_plans()
+        # Verification
+        plan = plans.get(attr.id)
+        self.assertIs(plan.attr, attr)
+        self.assertEqual(plan.default_value, 5)
+        self.assertIs(plan.high_is_good, False)
+        self.assertEqual(plan.max_attr_id, max_attr.id)
+        self.assertIs(plan.limited_precision, False)
+        self.assertEqual(len(plan.penalizable_operators), 0)
+        self.assertIn(
+            ModOperator.post_percent,
+            plans.get(self.tgt_attr.id).penalizable_operators)
+        self.assertIs(plans.get(cpu_attr.id).limited_precision, True)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_shared(self):
+        ship = Ship(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+        self.fit.ship = ship
+        rig1 = Rig(self.mktype(
+            attrs={self.src_attr.id: 20}, effects=[self.effect]).id)
+        rig2 = Rig(self.mktype(
+            attrs={self.src_attr.id: 20}, effects=[self.effect]).id)
+        self.fit.rigs.add(rig1)
+        self.fit.rigs.add(rig2)
+        # Action
+        plan = self.get_plans().get(self.tgt_attr.id)
+        # Verification
+        self.assertIs(self.get_plans().get(self.tgt_attr.id), plan)
+        # Modifications from rigs are stacking penalized
+        self.assertAlmostEqual(
+            ship.attrs[self.tgt_attr.id], 100 * 1.2 * (1 + 0.2 * 0.8691199806))
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_unloaded(self):
+        ship = Ship(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+        self.fit.ship = ship
+        rig = Rig(self.mktype(
+            attrs={self.src_attr.id: 20}, effects=[self.effect]).id)
+        self.fit.rigs.add(rig)
+        self.assertAlmostEqual(ship.attrs[self.tgt_attr.id], 120)
+        # Action
+        self.fit.solar_system.source = None
+        # Verification
+        self.assertEqual(len(ship.attrs), 0)
+        # Action
+        self.fit.solar_system.source = 'src1'
+        # Verification
+        self.assertAlmostEqual(ship.attrs[self.tgt_attr.id], 120)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
@@ -0,0 +1,112 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Rig
+from eos import Ship
+from eos.const.eos import ModAffecteeFilter
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eve import EffectCategoryId
+from eos.util.dense_attrs import AttrIndexer
+from eos.util.dense_attrs import PackedAttrMap
+from tests.integration.calculator.testcase import CalculatorTestCase
+
+
+class TestDenseAttrs(CalculatorTestCase):
+    """Check calculation for items whose types have packed attributes."""
+
+    def setUp(self):
+        CalculatorTestCase.setUp(self)
+        self.indexer = AttrIndexer()
+        self.tgt_attr = self.mkattr()
+        self.src_attr = self.mkattr()
+        self.other_attr = self.mkattr(default_value=7)
+        modifier = self.mkmod(
+            affectee_filter=ModAffecteeFilter.item,
+            affectee_domain=ModDomain.ship,
+            affectee_attr_id=self.tgt_attr.id,
+            operator=ModOperator.post_percent,
+            affector_attr_id=self.src_attr.id)
+        self.effect = self.mkeffect(
+            category_id=EffectCategoryId.passive, modifiers=[modifier])
+
+    def make_packed_type(self, attrs, **kwargs):
+        return self.mktype(
+            attrs=PackedAttrMap(attrs, self.indexer), **kwargs)
+
+    def test_modified(self):
+        ship = Ship(self.make_packed_type({self.tgt_attr.id: 100}).id)
+        self.fit.ship = ship
+        rig = Rig(self.make_packed_type(
+            {self.src_attr.id: 20}, effects=[self.effect]).id)
+        # Action
+        self.fit.rigs.add(rig)
+        # Verification
+        self.assertAlmostEqual(ship.attrs[self.tgt_attr.id], 120)
+        self.assertAlmostEqual(ship.attrs[self.other_attr.id], 7)
+        self.assertEqual(
+            set(ship.attrs), {self.tgt_attr.id, self.other_attr.id})
+        # Action
+        self.fit.rigs.remove(rig)
+        # Verification
+        self.assertAlmostEqual(ship.attrs[self.tgt_attr.id], 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_map_methods(self):
+        ship = Ship(self.make_packed_type(
+            {self.tgt_attr.id: 100, self.src_attr.id: 5}).id)
+        self.fit.ship = ship
+        # Verification
+        self.assertEqual(ship.attrs.get(self.tgt_attr.id), 100)
+        self.assertEqual(len(ship.attrs), 2)
+        self.assertIn(self.src_attr.id, ship.attrs)
+        self.assertNotIn(self.other_attr.id, ship.attrs)
+        self.assertEqual(
+            ship.attrs.items(),
+            {(self.tgt_attr.id, 100), (self.src_attr.id, 5)})
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_high_indices(self):
+        # Make attributes of the test get high indices
+        for attr_id in range(-3000, 0):
+            self.indexer.get_index(attr_id)
+        ship = Ship(self.make_packed_type(
+            {self.tgt_attr.id: 100, self.src_attr.id: 5}).id)
+        self.fit.ship = ship
+        rig = Rig(self.make_packed_type(
+            {self.src_attr.id: 20}, effects=[self.effect]).id)
+        self.fit.rigs.add(rig)
+        # Verification
+        self.assertAlmostEqual(ship.attrs[self.other_attr.id], 7)
+        self.assertAlmostEqual(ship.attrs[self.tgt_attr.id], 120)
+        self.assertAlmostEqual(ship.attrs[self.src_attr.id], 5)
+        # Action
+        self.fit.rigs.remove(rig)
+        # Verification
+        self.assertAlmostEqual(ship.attrs[self.tgt_attr.id], 100)
+        self.assertAlmostEqual(ship.attrs[self.other_attr.id], 7)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
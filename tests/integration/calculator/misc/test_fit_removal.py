@@ -0,0 +1,148 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Fit
+from eos import Fleet
+from eos import Implant
+from eos import ModuleMid
+from eos import Rig
+from eos import Ship
+from eos import State
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eos import ModAffecteeFilter
+from eos.const.eve import EffectCategoryId
+from tests.integration.calculator.testcase import CalculatorTestCase
+
+
+class TestFitRemoval(CalculatorTestCase):
+
+    def setUp(self):
+        CalculatorTestCase.setUp(self)
+        self.tgt_attr = self.mkattr()
+        self.src_attr = self.mkattr()
+        self.solar_system = self.fit.solar_system
+        self.fit2 = Fit(self.solar_system)
+
+    def make_projector(self, affectee_filter):
+        modifier = self.mkmod(
+            affectee_filter=affectee_filter,
+            affectee_domain=ModDomain.target,
+            affectee_attr_id=self.tgt_attr.id,
+            operator=ModOperator.post_percent,
+            affector_attr_id=self.src_attr.id)
+        effect = self.mkeffect(
+            category_id=EffectCategoryId.target,
+            modifiers=[modifier])
+        return ModuleMid(
+            self.mktype(
+                attrs={self.src_attr.id: 20},
+                effects=[effect],
+                default_effect=effect).id,
+            state=State.active)
+
+    def make_fleet_implant(self):
+        modifier = self.mkmod(
+            affectee_filter=ModAffecteeFilter.domain,
+            affectee_domain=ModDomain.fleet,
+            affectee_attr_id=self.tgt_attr.id,
+            operator=ModOperator.post_percent,
+            affector_attr_id=self.src_attr.id)
+        effect = self.mkeffect(
+            category_id=EffectCategoryId.passive,
+            modifiers=[modifier])
+        return Implant(self.mktype(
+            attrs={self.src_attr.id: 20},
+            effects=[effect]).id)
+
+    def test_projector_fit_item(self):
+        self.fit.ship = Ship(self.mktype().id)
+        self.fit2.ship = Ship(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+        projector = self.make_projector(ModAffecteeFilter.item)
+        self.fit.modules.mid.append(projector)
+        projector.target = self.fit2.ship
+        self.assertAlmostEqual(self.fit2.ship.attrs[self.tgt_attr.id], 120)
+        # Action
+        self.solar_system.fits.remove(self.fit)
+        # Verification
+        self.assertAlmostEqual(self.fit2.ship.attrs[self.tgt_attr.id], 100)
+        # Action
+        self.solar_system.fits.add(self.fit)
+        # Verification
+        self.assertAlmostEqual(self.fit2.ship.attrs[self.tgt_attr.id], 120)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_projector_fit_domain(self):
+        self.fit.ship = Ship(self.mktype().id)
+        self.fit2.ship = Ship(self.mktype().id)
+        influence_tgt = Rig(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+        self.fit2.rigs.add(influence_tgt)
+        projector = self.make_projector(ModAffecteeFilter.domain)
+        self.fit.modules.mid.append(projector)
+        projector.target = self.fit2.ship
+        self.assertAlmostEqual(influence_tgt.attrs[self.tgt_attr.id], 120)
+        # Action
+        self.solar_system.fits.remove(self.fit)
+        # Verification
+        self.assertAlmostEqual(influence_tgt.attrs[self.tgt_attr.id], 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_target_fit(self):
+        self.fit.ship = Ship(self.mktype().id)
+        self.fit2.ship = Ship(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+        projector = self.make_projector(ModAffecteeFilter.item)
+        self.fit.modules.mid.append(projector)
+        projector.target = self.fit2.ship
+        self.assertAlmostEqual(self.fit2.ship.attrs[self.tgt_attr.id], 120)
+        # Action
+        self.solar_system.fits.remove(self.fit2)
+        # Verification
+        self.assertIsNone(self.fit2.solar_system)
+        self.assertAlmostEqual(projector.attrs[self.src_attr.id], 20)
+        # Cleanup
+        projector.target = None
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_fleetmate(self):
+        fleet = Fleet()
+        fleet.fits.add(self.fit)
+        fleet.fits.add(self.fit2)
+        self.fit.ship = Ship(self.mktype().id)
+        influence_tgt = Rig(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+        self.fit.rigs.add(influence_tgt)
+        self.fit2.implants.add(self.make_fleet_implant())
+        self.assertAlmostEqual(influence_tgt.attrs[self.tgt_attr.id], 120)
+        # Action
+        self.solar_system.fits.remove(self.fit2)
+        # Verification
+        self.assertAlmostEqual(influence_tgt.attrs[self.tgt_attr.id], 100)
+        # Action
+        self.solar_system.fits.add(self.fit2)
+        # Verification
+        self.assertAlmostEqual(influence_tgt.attrs[self.tgt_attr.id], 120)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
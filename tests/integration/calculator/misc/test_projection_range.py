@@ -0,0 +1,246 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Coordinates
+from eos import Fit
+from eos import Implant
+from eos import ModuleMid
+from eos import Ship
+from eos import State
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eos import ModAffecteeFilter
+from eos.const.eve import EffectCategoryId
+from tests.integration.calculator.testcase import CalculatorTestCase
+
+
+class TestProjectionRange(CalculatorTestCase):
+
+    def setUp(self):
+        CalculatorTestCase.setUp(self)
+        self.tgt_attr = self.mkattr()
+        self.src_attr = self.mkattr()
+        self.optimal_attr = self.mkattr()
+        self.falloff_attr = self.mkattr()
+        self.modifier = self.mkmod(
+            affectee_filter=ModAffecteeFilter.item,
+            affectee_domain=ModDomain.target,
+            affectee_attr_id=self.tgt_attr.id,
+            operator=ModOperator.post_percent,
+            affector_attr_id=self.src_attr.id)
+        self.effect = self.mkeffect(
+            category_id=EffectCategoryId.target,
+            range_attr_id=self.optimal_attr.id,
+            falloff_attr_id=self.falloff_attr.id,
+            modifiers=[self.modifier])
+        self.fit.ship = Ship(self.mktype().id)
+        self.tgt_fit = Fit(self.fit.solar_system)
+        self.tgt_fit.ship = Ship(self.mktype(
+            attrs={self.tgt_attr.id: 100}).id)
+
+    def make_projector(self, attrs=None, effect=None):
+        if effect is None:
+            effect = self.effect
+        item_attrs = {
+            self.src_attr.id: -50,
+            self.optimal_attr.id: 10000,
+            self.falloff_attr.id: 5000}
+        item_attrs.update(attrs or {})
+        item = ModuleMid(
+            self.mktype(
+                attrs=item_attrs,
+                effects=[effect],
+                default_effect=effect).id,
+            state=State.active)
+        self.fit.modules.mid.append(item)
+        item.target = self.tgt_fit.ship
+        return item
+
+    def get_tgt_value(self):
+        return self.tgt_fit.ship.attrs[self.tgt_attr.id]
+
+    def test_optimal(self):
+        self.make_projector()
+        # Action
+        self.tgt_fit.ship.coordinate = Coordinates(10000, 0, 0)
+        # Verification
+        self.assertAlmostEqual(self.get_tgt_value(), 50)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_falloff(self):
+        self.make_projector()
+        # Action
+        self.tgt_fit.ship.coordinate = Coordinates(15000, 0, 0)
+        # Verification
+        self.assertAlmostEqual(self.get_tgt_value(), 75)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_tgt_movement(self):
+        self.make_projector()
+        self.assertAlmostEqual(self.get_tgt_value(), 50)
+        # Action
+        self.tgt_fit.ship.coordinate = Coordinates(0, 15000, 0)
+        # Verification
+        self.assertAlmostEqual(self.get_tgt_value(), 75)
+        # Action
+        self.tgt_fit.ship.coordinate = Coordinates(0, 0, 20000)
+        # Verification
+        self.assertAlmostEqual(self.get_tgt_value(), 96.875)
+        # Action
+        self.tgt_fit.ship.coordinate = Coordinates(0, 0, 0)
+        # Verification
+        self.assertAlmostEqual(self.get_tgt_value(), 50)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_carrier_movement(self):
+        self.make_projector()
+        self.tgt_fit.ship.coordinate = Coordinates(15000, 0, 0)
+        self.assertAlmostEqual(self.get_tgt_value(), 75)
+        # Action
+        self.fit.ship.coordinate = Coordinates(5000, 0, 0)
+        # Verification
+        self.assertAlmostEqual(self.get_tgt_value(), 50)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_carrier_replacement(self):
+        self.make_projector()
+        self.tgt_fit.ship.coordinate = Coordinates(15000, 0, 0)
+        self.assertAlmostEqual(self.get_tgt_value(), 75)
+        ship = Ship(self.mktype().id)
+        ship.coordinate = Coordinates(15000, 0, 0)
+        # Action
+        self.fit.ship = ship
+        # Verification
+        self.assertAlmostEqual(self.get_tgt_value(), 50)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_carrier_removal(self):
+        # Projectors without carrier have no location, and their modifications
+        # are not scaled
+        self.make_projector()
+        self.tgt_fit.ship.coordinate = Coordinates(15000, 0, 0)
+        self.assertAlmostEqual(self.get_tgt_value(), 75)
+        # Action
+        self.fit.ship = None
+        # Verification
+        self.assertAlmostEqual(self.get_tgt_value(), 50)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_range_attr_change(self):
+        # Range attributes can be modified, and projected modification should
+        # be updated accordingly
+        range_bonus_attr = self.mkattr()
+        modifier = self.mkmod(
+            affectee_filter=ModAffecteeFilter.domain,
+            affectee_domain=ModDomain.ship,
+            affectee_attr_id=self.falloff_attr.id,
+            operator=ModOperator.post_mul,
+            affector_attr_id=range_bonus_attr.id)
+        effect = self.mkeffect(
+            category_id=EffectCategoryId.passive,
+            modifiers=[modifier])
+        implant = Implant(self.mktype(
+            attrs={range_bonus_attr.id: 2},
+            effects=[effect]).id)
+        self.make_projector()
+        self.tgt_fit.ship.coordinate = Coordinates(20000, 0, 0)
+        self.assertAlmostEqual(self.get_tgt_value(), 96.875)
+        # Action
+        self.fit.implants.add(implant)
+        # Verification
+        self.assertAlmostEqual(self.get_tgt_value(), 75)
+        # Action
+        self.fit.implants.remove(implant)
+        # Verification
+        self.assertAlmostEqual(self.get_tgt_value(), 96.875)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_no_falloff(self):
+        self.make_projector(attrs={self.falloff_attr.id: 0})
+        self.tgt_fit.ship.coordinate = Coordinates(10000, 0, 0)
+        self.assertAlmostEqual(self.get_tgt_value(), 50)
+        # Action
+        self.tgt_fit.ship.coordinate = Coordinates(10001, 0, 0)
+        # Verification
+        self.assertAlmostEqual(self.get_tgt_value(), 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_no_range(self):
+        effect = self.mkeffect(
+            category_id=EffectCategoryId.target,
+            modifiers=[self.modifier])
+        self.make_projector(effect=effect)
+        # Action
+        self.tgt_fit.ship.coordinate = Coordinates(1000000, 0, 0)
+        # Verification
+        self.assertAlmostEqual(self.get_tgt_value(), 50)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_untargeting(self):
+        item = self.make_projector()
+        self.tgt_fit.ship.coordinate = Coordinates(15000, 0, 0)
+        self.assertAlmostEqual(self.get_tgt_value(), 75)
+        # Action
+        item.target = None
+        # Verification
+        self.assertAlmostEqual(self.get_tgt_value(), 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_assignment_falloff(self):
+        modifier = self.mkmod(
+            affectee_filter=ModAffecteeFilter.item,
+            affectee_domain=ModDomain.target,
+            affectee_attr_id=self.tgt_attr.id,
+            operator=ModOperator.post_assign,
+            affector_attr_id=self.src_attr.id)
+        effect = self.mkeffect(
+            category_id=EffectCategoryId.target,
+            range_attr_id=self.optimal_attr.id,
+            falloff_attr_id=self.falloff_attr.id,
+            modifiers=[modifier])
+        self.make_projector(effect=effect)
+        # Action
+        self.tgt_fit.ship.coordinate = Coordinates(15000, 0, 0)
+        # Verification
+        self.assertAlmostEqual(self.get_tgt_value(), -50)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
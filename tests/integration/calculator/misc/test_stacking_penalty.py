@@ -0,0 +1,101 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import math
+
+from eos import Implant
+from eos import Rig
+from eos.const.eos import ModAffecteeFilter
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eve import EffectCategoryId
+from tests.integration.calculator.testcase import CalculatorTestCase
+
+
+class TestStackingPenalty(CalculatorTestCase):
+    """Check stacking penalty application to long modification chains."""
+
+    def setUp(self):
+        CalculatorTestCase.setUp(self)
+        self.tgt_attr = self.mkattr(stackable=False)
+        self.src_attr = self.mkattr()
+        modifier = self.mkmod(
+            affectee_filter=ModAffecteeFilter.domain,
+            affectee_domain=ModDomain.ship,
+            affectee_attr_id=self.tgt_attr.id,
+            operator=ModOperator.post_percent,
+            affector_attr_id=self.src_attr.id)
+        self.effect = self.mkeffect(
+            category_id=EffectCategoryId.passive, modifiers=[modifier])
+        self.influence_tgt = Rig(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+        self.fit.rigs.add(self.influence_tgt)
+
+    def add_influence_srcs(self, mod_values):
+        for mod_value in mod_values:
+            self.fit.implants.add(Implant(self.mktype(
+                attrs={self.src_attr.id: mod_value},
+                effects=[self.effect]).id))
+
+    def get_expected(self, mod_values):
+        value = 100
+        for chain in (
+            sorted((v for v in mod_values if v >= 0), reverse=True),
+            sorted(v for v in mod_values if v < 0)
+        ):
+            for pos, mod_value in enumerate(chain[:11]):
+                value *= 1 + mod_value / 100 * math.exp(-(pos / 2.67) ** 2)
+        return value
+
+    def test_single(self):
+        self.add_influence_srcs([-35])
+        # Verification
+        self.assertAlmostEqual(self.influence_tgt.attrs[self.tgt_attr.id], 65)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_long_chains(self):
+        # Values are not ordered, and chains are longer than amount of
+        # significant positions
+        mod_values = [
+            3, 17, -4, 8, 25, -12, 1, 14, 9, -30, 22, 5, -1, 11, 6, -8, 19,
+            2, -16, 13, -2, -6, -20, -3, -9, -25, -5, -11, 4]
+        self.add_influence_srcs(mod_values)
+        # Verification
+        self.assertAlmostEqual(
+            self.influence_tgt.attrs[self.tgt_attr.id],
+            self.get_expected(mod_values))
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_insignificant_dropped(self):
+        mod_values = [10] * 11
+        self.add_influence_srcs(mod_values)
+        value = self.influence_tgt.attrs[self.tgt_attr.id]
+        # Action
+        self.add_influence_srcs([10])
+        # Verification
+        self.assertAlmostEqual(
+            self.influence_tgt.attrs[self.tgt_attr.id], value)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
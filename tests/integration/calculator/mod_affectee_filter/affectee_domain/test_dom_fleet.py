@@ -0,0 +1,124 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Drone
+from eos import Fit
+from eos import Fleet
+from eos import Implant
+from eos import Rig
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eos import ModAffecteeFilter
+from eos.const.eve import EffectCategoryId
+from tests.integration.calculator.testcase import CalculatorTestCase
+
+
+class TestAffecteeDomainDomainFleet(CalculatorTestCase):
+
+    def setUp(self):
+        CalculatorTestCase.setUp(self)
+        self.tgt_attr = self.mkattr()
+        self.src_attr = self.mkattr()
+        modifier = self.mkmod(
+            affectee_filter=ModAffecteeFilter.domain,
+            affectee_domain=ModDomain.fleet,
+            affectee_attr_id=self.tgt_attr.id,
+            operator=ModOperator.post_percent,
+            affector_attr_id=self.src_attr.id)
+        effect = self.mkeffect(
+            category_id=EffectCategoryId.passive,
+            modifiers=[modifier])
+        self.influence_src = Implant(self.mktype(
+            attrs={self.src_attr.id: 20},
+            effects=[effect]).id)
+        self.fit2 = Fit(self.fit.solar_system)
+        self.fleet = Fleet()
+        self.fleet.fits.add(self.fit)
+        self.fleet.fits.add(self.fit2)
+
+    def test_domain_ship(self):
+        influence_tgt1 = Rig(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+        self.fit.rigs.add(influence_tgt1)
+        influence_tgt2 = Rig(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+        self.fit2.rigs.add(influence_tgt2)
+        # Action
+        self.fit.implants.add(self.influence_src)
+        # Verification
+        self.assertAlmostEqual(influence_tgt1.attrs[self.tgt_attr.id], 120)
+        self.assertAlmostEqual(influence_tgt2.attrs[self.tgt_attr.id], 120)
+        # Action
+        self.fit.implants.remove(self.influence_src)
+        # Verification
+        self.assertAlmostEqual(influence_tgt1.attrs[self.tgt_attr.id], 100)
+        self.assertAlmostEqual(influence_tgt2.attrs[self.tgt_attr.id], 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_domain_ship_item_addition(self):
+        self.fit.implants.add(self.influence_src)
+        influence_tgt = Rig(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+        # Action
+        self.fit2.rigs.add(influence_tgt)
+        # Verification
+        self.assertAlmostEqual(influence_tgt.attrs[self.tgt_attr.id], 120)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_domain_other(self):
+        influence_tgt = Drone(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+        self.fit2.drones.add(influence_tgt)
+        # Action
+        self.fit.implants.add(self.influence_src)
+        # Verification
+        self.assertAlmostEqual(influence_tgt.attrs[self.tgt_attr.id], 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_affector_attr_change(self):
+        # When attribute of fleet-wide modification source changes, items of
+        # all fleet members should be recalculated
+        mult_attr = self.mkattr()
+        modifier = self.mkmod(
+            affectee_filter=ModAffecteeFilter.domain,
+            affectee_domain=ModDomain.character,
+            affectee_attr_id=self.src_attr.id,
+            operator=ModOperator.post_mul,
+            affector_attr_id=mult_attr.id)
+        effect = self.mkeffect(
+            category_id=EffectCategoryId.passive,
+            modifiers=[modifier])
+        mult_src = Implant(self.mktype(
+            attrs={mult_attr.id: 2},
+            effects=[effect]).id)
+        influence_tgt = Rig(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+        self.fit2.rigs.add(influence_tgt)
+        self.fit.implants.add(self.influence_src)
+        self.assertAlmostEqual(influence_tgt.attrs[self.tgt_attr.id], 120)
+        # Action
+        self.fit.implants.add(mult_src)
+        # Verification
+        self.assertAlmostEqual(influence_tgt.attrs[self.tgt_attr.id], 140)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
@@ -0,0 +1,182 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Fit
+from eos import Fleet
+from eos import Implant
+from eos import Rig
+from eos import Ship
+from eos import SolarSystem
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eos import ModAffecteeFilter
+from eos.const.eve import EffectCategoryId
+from tests.integration.calculator.testcase import CalculatorTestCase
+
+
+class TestAffecteeItemDomainFleet(CalculatorTestCase):
+
+    def setUp(self):
+        CalculatorTestCase.setUp(self)
+        self.tgt_attr = self.mkattr()
+        src_attr = self.mkattr()
+        modifier = self.mkmod(
+            affectee_filter=ModAffecteeFilter.item,
+            affectee_domain=ModDomain.fleet,
+            affectee_attr_id=self.tgt_attr.id,
+            operator=ModOperator.post_percent,
+            affector_attr_id=src_attr.id)
+        effect = self.mkeffect(
+            category_id=EffectCategoryId.passive,
+            modifiers=[modifier])
+        self.influence_src = Implant(self.mktype(
+            attrs={src_attr.id: 20},
+            effects=[effect]).id)
+        self.fit.ship = Ship(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+        self.fit2 = Fit(self.fit.solar_system)
+        self.fit2.ship = Ship(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+
+    def test_own_ship_no_fleet(self):
+        # Action
+        self.fit.implants.add(self.influence_src)
+        # Verification
+        self.assertAlmostEqual(self.fit.ship.attrs[self.tgt_attr.id], 120)
+        self.assertAlmostEqual(self.fit2.ship.attrs[self.tgt_attr.id], 100)
+        # Action
+        self.fit.implants.remove(self.influence_src)
+        # Verification
+        self.assertAlmostEqual(self.fit.ship.attrs[self.tgt_attr.id], 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_fleetmate_ship(self):
+        fleet = Fleet()
+        fleet.fits.add(self.fit)
+        fleet.fits.add(self.fit2)
+        # Action
+        self.fit.implants.add(self.influence_src)
+        # Verification
+        self.assertAlmostEqual(self.fit.ship.attrs[self.tgt_attr.id], 120)
+        self.assertAlmostEqual(self.fit2.ship.attrs[self.tgt_attr.id], 120)
+        # Action
+        self.fit.implants.remove(self.influence_src)
+        # Verification
+        self.assertAlmostEqual(self.fit.ship.attrs[self.tgt_attr.id], 100)
+        self.assertAlmostEqual(self.fit2.ship.attrs[self.tgt_attr.id], 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_fleetmate_join_leave(self):
+        fleet = Fleet()
+        fleet.fits.add(self.fit)
+        self.fit.implants.add(self.influence_src)
+        self.assertAlmostEqual(self.fit2.ship.attrs[self.tgt_attr.id], 100)
+        # Action
+        fleet.fits.add(self.fit2)
+        # Verification
+        self.assertAlmostEqual(self.fit.ship.attrs[self.tgt_attr.id], 120)
+        self.assertAlmostEqual(self.fit2.ship.attrs[self.tgt_attr.id], 120)
+        # Action
+        fleet.fits.remove(self.fit2)
+        # Verification
+        self.assertAlmostEqual(self.fit.ship.attrs[self.tgt_attr.id], 120)
+        self.assertAlmostEqual(self.fit2.ship.attrs[self.tgt_attr.id], 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_source_fit_join_leave(self):
+        # Fleet-wide modifications should be applied regardless of which
+        # fleet member joins or leaves
+        fleet = Fleet()
+        fleet.fits.add(self.fit2)
+        self.fit.implants.add(self.influence_src)
+        self.assertAlmostEqual(self.fit2.ship.attrs[self.tgt_attr.id], 100)
+        # Action
+        fleet.fits.add(self.fit)
+        # Verification
+        self.assertAlmostEqual(self.fit2.ship.attrs[self.tgt_attr.id], 120)
+        # Action
+        fleet.fits.clear()
+        # Verification
+        self.assertAlmostEqual(self.fit.ship.attrs[self.tgt_attr.id], 120)
+        self.assertAlmostEqual(self.fit2.ship.attrs[self.tgt_attr.id], 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_fleetmate_ship_replacement(self):
+        fleet = Fleet()
+        fleet.fits.add(self.fit)
+        fleet.fits.add(self.fit2)
+        self.fit.implants.add(self.influence_src)
+        # Action
+        self.fit2.ship = Ship(self.mktype(attrs={self.tgt_attr.id: 50}).id)
+        # Verification
+        self.assertAlmostEqual(self.fit2.ship.attrs[self.tgt_attr.id], 60)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_fleetmate_other_solar_system(self):
+        fit3 = Fit(SolarSystem())
+        fit3.ship = Ship(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+        fleet = Fleet()
+        fleet.fits.add(self.fit)
+        fleet.fits.add(fit3)
+        # Action
+        self.fit.implants.add(self.influence_src)
+        # Verification
+        self.assertAlmostEqual(self.fit.ship.attrs[self.tgt_attr.id], 120)
+        self.assertAlmostEqual(fit3.ship.attrs[self.tgt_attr.id], 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_solsys_buffers_empty(fit3.solar_system)
+        self.assert_log_entries(0)
+
+    def test_fleetmate_domain_ship(self):
+        influence_tgt = Rig(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+        self.fit2.rigs.add(influence_tgt)
+        fleet = Fleet()
+        fleet.fits.add(self.fit)
+        fleet.fits.add(self.fit2)
+        # Action
+        self.fit.implants.add(self.influence_src)
+        # Verification
+        self.assertAlmostEqual(influence_tgt.attrs[self.tgt_attr.id], 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_fit_fleet_read_only(self):
+        fleet = Fleet()
+        fleet.fits.add(self.fit)
+        # Action
+        with self.assertRaises(AttributeError):
+            self.fit2.fleet = fleet
+        # Verification
+        self.assertIs(self.fit.fleet, fleet)
+        self.assertIsNone(self.fit2.fleet)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
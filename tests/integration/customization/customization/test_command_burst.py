@@ -0,0 +1,163 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Charge
+from eos import Fit
+from eos import Fleet
+from eos import ModuleHigh
+from eos import Ship
+from eos import State
+from eos.const.eve import AttrId
+from eos.const.eve import EffectCategoryId
+from eos.const.eve import EffectId
+from eos.const.eve import WarfareBuffId
+from tests.integration.customization.testcase import CustomizationTestCase
+
+
+class TestCommandBurst(CustomizationTestCase):
+
+    def setUp(self):
+        CustomizationTestCase.setUp(self)
+        # Ship attrs
+        self.mkattr(attr_id=AttrId.shield_capacity)
+        self.mkattr(attr_id=AttrId.shield_em_dmg_resonance, stackable=False)
+        self.mkattr(attr_id=AttrId.shield_therm_dmg_resonance, stackable=False)
+        self.mkattr(attr_id=AttrId.shield_kin_dmg_resonance, stackable=False)
+        self.mkattr(attr_id=AttrId.shield_expl_dmg_resonance, stackable=False)
+        # Charge attrs
+        self.mkattr(attr_id=AttrId.warfare_buff_1_id)
+        self.mkattr(attr_id=AttrId.warfare_buff_1_value)
+        self.mkattr(attr_id=AttrId.warfare_buff_2_id)
+        self.mkattr(attr_id=AttrId.warfare_buff_2_value)
+        self.fit.ship = self.make_ship()
+        self.fit2 = Fit(self.fit.solar_system)
+        self.fit2.ship = self.make_ship()
+
+    def make_ship(self):
+        return Ship(self.mktype(attrs={
+            AttrId.shield_capacity: 1000,
+            AttrId.shield_em_dmg_resonance: 0.5,
+            AttrId.shield_therm_dmg_resonance: 0.6,
+            AttrId.shield_kin_dmg_resonance: 0.7,
+            AttrId.shield_expl_dmg_resonance: 0.8}).id)
+
+    def make_burst(self):
+        effect = self.mkeffect(
+            effect_id=EffectId.module_bonus_warfare_link_shield,
+            category_id=EffectCategoryId.active)
+        burst = ModuleHigh(
+            self.mktype(effects=[effect], default_effect=effect).id,
+            state=State.active)
+        burst.charge = Charge(self.mktype(attrs={
+            AttrId.warfare_buff_1_id: WarfareBuffId.shield_harmonizing,
+            AttrId.warfare_buff_1_value: -10,
+            AttrId.warfare_buff_2_id: WarfareBuffId.shield_extension,
+            AttrId.warfare_buff_2_value: 20}).id)
+        return burst
+
+    def test_fleetmate(self):
+        fleet = Fleet()
+        fleet.fits.add(self.fit)
+        fleet.fits.add(self.fit2)
+        # Action
+        self.fit.modules.high.append(self.make_burst())
+        # Verification
+        for ship in (self.fit.ship, self.fit2.ship):
+            self.assertAlmostEqual(
+                ship.attrs[AttrId.shield_em_dmg_resonance], 0.45)
+            self.assertAlmostEqual(
+                ship.attrs[AttrId.shield_therm_dmg_resonance], 0.54)
+            self.assertAlmostEqual(
+                ship.attrs[AttrId.shield_kin_dmg_resonance], 0.63)
+            self.assertAlmostEqual(
+                ship.attrs[AttrId.shield_expl_dmg_resonance], 0.72)
+            self.assertAlmostEqual(ship.attrs[AttrId.shield_capacity], 1200)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_no_fleet(self):
+        # Action
+        self.fit.modules.high.append(self.make_burst())
+        # Verification
+        self.assertAlmostEqual(
+            self.fit.ship.attrs[AttrId.shield_em_dmg_resonance], 0.45)
+        self.assertAlmostEqual(
+            self.fit2.ship.attrs[AttrId.shield_em_dmg_resonance], 0.5)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_fleet_leave(self):
+        fleet = Fleet()
+        fleet.fits.add(self.fit)
+        fleet.fits.add(self.fit2)
+        self.fit.modules.high.append(self.make_burst())
+        self.assertAlmostEqual(
+            self.fit2.ship.attrs[AttrId.shield_em_dmg_resonance], 0.45)
+        # Action
+        fleet.fits.remove(self.fit2)
+        # Verification
+        self.assertAlmostEqual(
+            self.fit.ship.attrs[AttrId.shield_em_dmg_resonance], 0.45)
+        self.assertAlmostEqual(
+            self.fit2.ship.attrs[AttrId.shield_em_dmg_resonance], 0.5)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_charge_removal(self):
+        fleet = Fleet()
+        fleet.fits.add(self.fit)
+        fleet.fits.add(self.fit2)
+        burst = self.make_burst()
+        self.fit.modules.high.append(burst)
+        self.assertAlmostEqual(
+            self.fit2.ship.attrs[AttrId.shield_em_dmg_resonance], 0.45)
+        # Action
+        burst.charge = None
+        # Verification
+        self.assertAlmostEqual(
+            self.fit.ship.attrs[AttrId.shield_em_dmg_resonance], 0.5)
+        self.assertAlmostEqual(
+            self.fit2.ship.attrs[AttrId.shield_em_dmg_resonance], 0.5)
+        self.assertAlmostEqual(
+            self.fit2.ship.attrs[AttrId.shield_capacity], 1000)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_state(self):
+        fleet = Fleet()
+        fleet.fits.add(self.fit)
+        fleet.fits.add(self.fit2)
+        burst = self.make_burst()
+        self.fit.modules.high.append(burst)
+        self.assertAlmostEqual(
+            self.fit2.ship.attrs[AttrId.shield_em_dmg_resonance], 0.45)
+        # Action
+        burst.state = State.online
+        # Verification
+        self.assertAlmostEqual(
+            self.fit2.ship.attrs[AttrId.shield_em_dmg_resonance], 0.5)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
@@ -0,0 +1,298 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Charge
+from eos import Fit
+from eos import ModuleHigh
+from eos import ModuleMid
+from eos import ResistProfile
+from eos import Ship
+from eos import State
+from eos import TgtData
+from eos.const.eve import AttrId
+from eos.const.eve import EffectCategoryId
+from eos.const.eve import EffectId
+from eos.const.eve import TypeId
+from tests.integration.item.testcase import ItemMixinTestCase
+
+
+class TestItemDmgMissileApplied(ItemMixinTestCase):
+
+    def setUp(self):
+        ItemMixinTestCase.setUp(self)
+        self.mkattr(attr_id=AttrId.capacity)
+        self.mkattr(attr_id=AttrId.volume)
+        self.mkattr(attr_id=AttrId.charge_rate)
+        self.mkattr(attr_id=AttrId.reload_time)
+        self.mkattr(attr_id=AttrId.em_dmg)
+        self.mkattr(attr_id=AttrId.therm_dmg)
+        self.mkattr(attr_id=AttrId.kin_dmg)
+        self.mkattr(attr_id=AttrId.expl_dmg)
+        self.mkattr(attr_id=AttrId.aoe_cloud_size)
+        self.mkattr(attr_id=AttrId.aoe_velocity)
+        self.mkattr(attr_id=AttrId.aoe_dmg_reduction_factor)
+        self.mkattr(attr_id=AttrId.max_velocity)
+        self.mkattr(attr_id=AttrId.explosion_delay)
+        self.mkattr(attr_id=AttrId.required_skill_1)
+        self.mkattr(attr_id=AttrId.required_skill_1_level)
+        self.cycle_attr = self.mkattr()
+        self.effect_item = self.mkeffect(
+            effect_id=EffectId.use_missiles,
+            category_id=EffectCategoryId.active,
+            duration_attr_id=self.cycle_attr.id)
+        self.effect_charge = self.mkeffect(
+            effect_id=EffectId.missile_launching,
+            category_id=EffectCategoryId.target)
+
+    def make_launcher(self, charge_attrs=None, charge_attrs_absent=()):
+        item = ModuleHigh(
+            self.mktype(
+                attrs={
+                    AttrId.capacity: 2.0,
+                    self.cycle_attr.id: 2000,
+                    AttrId.charge_rate: 1.0,
+                    AttrId.reload_time: 10000},
+                effects=[self.effect_item],
+                default_effect=self.effect_item).id,
+            state=State.active)
+        base_charge_attrs = {
+            AttrId.volume: 0.1,
+            AttrId.em_dmg: 5.2,
+            AttrId.therm_dmg: 6.3,
+            AttrId.kin_dmg: 7.4,
+            AttrId.expl_dmg: 8.5,
+            AttrId.aoe_cloud_size: 100,
+            AttrId.aoe_velocity: 50,
+            AttrId.aoe_dmg_reduction_factor: 0.5,
+            AttrId.max_velocity: 5000,
+            AttrId.explosion_delay: 2000,
+            AttrId.required_skill_1: TypeId.missile_launcher_operation,
+            AttrId.required_skill_1_level: 1}
+        if charge_attrs is not None:
+            base_charge_attrs.update(charge_attrs)
+        for attr_id in charge_attrs_absent:
+            del base_charge_attrs[attr_id]
+        item.charge = Charge(self.mktype(
+            attrs=base_charge_attrs,
+            effects=[self.effect_charge],
+            default_effect=self.effect_charge).id)
+        return item
+
+    def test_no_tgt_data(self):
+        fit = Fit()
+        item = self.make_launcher()
+        fit.modules.high.append(item)
+        # Verification
+        volley = item.get_applied_volley()
+        self.assertAlmostEqual(volley.em, 5.2)
+        self.assertAlmostEqual(volley.thermal, 6.3)
+        self.assertAlmostEqual(volley.kinetic, 7.4)
+        self.assertAlmostEqual(volley.explosive, 8.5)
+        self.assertAlmostEqual(volley.total, 27.4)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_sig_bigger(self):
+        fit = Fit()
+        item = self.make_launcher()
+        fit.modules.high.append(item)
+        # Verification
+        volley = item.get_applied_volley(TgtData(sig_radius=200, velocity=0))
+        self.assertAlmostEqual(volley.total, 27.4)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_sig_smaller(self):
+        fit = Fit()
+        item = self.make_launcher()
+        fit.modules.high.append(item)
+        # Verification
+        volley = item.get_applied_volley(TgtData(sig_radius=50))
+        self.assertAlmostEqual(volley.em, 2.6)
+        self.assertAlmostEqual(volley.thermal, 3.15)
+        self.assertAlmostEqual(volley.kinetic, 3.7)
+        self.assertAlmostEqual(volley.explosive, 4.25)
+        self.assertAlmostEqual(volley.total, 13.7)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_velocity(self):
+        fit = Fit()
+        item = self.make_launcher()
+        fit.modules.high.append(item)
+        # Verification
+        volley = item.get_applied_volley(
+            TgtData(sig_radius=100, velocity=200))
+        self.assertAlmostEqual(volley.total, 13.7)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_velocity_no_sig(self):
+        fit = Fit()
+        item = self.make_launcher()
+        fit.modules.high.append(item)
+        # Verification
+        volley = item.get_applied_volley(TgtData(velocity=200))
+        self.assertAlmostEqual(volley.total, 13.7)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_velocity_big_sig(self):
+        fit = Fit()
+        item = self.make_launcher()
+        fit.modules.high.append(item)
+        # Verification
+        # Big signature compensates part of speed
+        volley = item.get_applied_volley(
+            TgtData(sig_radius=400, velocity=800))
+        self.assertAlmostEqual(volley.total, 13.7)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_velocity_sig_limited(self):
+        fit = Fit()
+        item = self.make_launcher()
+        fit.modules.high.append(item)
+        # Verification
+        volley = item.get_applied_volley(TgtData(sig_radius=50, velocity=25))
+        self.assertAlmostEqual(volley.total, 13.7)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_drf_absent(self):
+        fit = Fit()
+        item = self.make_launcher(
+            charge_attrs_absent=(AttrId.aoe_dmg_reduction_factor,))
+        fit.modules.high.append(item)
+        # Verification
+        volley = item.get_applied_volley(
+            TgtData(sig_radius=100, velocity=200))
+        self.assertAlmostEqual(volley.total, 27.4)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_range(self):
+        fit = Fit()
+        item = self.make_launcher()
+        fit.modules.high.append(item)
+        # Verification
+        volleys = item.get_applied_volley_batch((
+            TgtData(range=10000), TgtData(range=10001)))
+        self.assertAlmostEqual(volleys[0].total, 27.4)
+        self.assertAlmostEqual(volleys[1].total, 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_batch(self):
+        fit = Fit()
+        item = self.make_launcher()
+        fit.modules.high.append(item)
+        # Verification
+        volleys = item.get_applied_volley_batch(
+            (None, None, sig, vel)
+            for sig in (50, 100, 400)
+            for vel in (0, 200))
+        self.assertEqual(len(volleys), 6)
+        self.assertAlmostEqual(volleys[0].total, 13.7)
+        self.assertAlmostEqual(volleys[1].total, 27.4 * 0.5 ** 1.5)
+        self.assertAlmostEqual(volleys[2].total, 27.4)
+        self.assertAlmostEqual(volleys[3].total, 13.7)
+        self.assertAlmostEqual(volleys[4].total, 27.4)
+        self.assertAlmostEqual(volleys[5].total, 27.4)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_batch_dps(self):
+        fit = Fit()
+        item = self.make_launcher()
+        fit.modules.high.append(item)
+        # Verification
+        dpss = item.get_applied_dps_batch(
+            ((None, None, 50), (None, None, 100)),
+            tgt_resists=ResistProfile(0.5, 0.5, 0.5, 0.5))
+        self.assertEqual(len(dpss), 2)
+        self.assertAlmostEqual(dpss[0].total, 3.425)
+        self.assertAlmostEqual(dpss[1].total, 6.85)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_guidance_disruptor(self):
+        self.mkattr(attr_id=AttrId.aoe_cloud_size_bonus)
+        self.mkattr(attr_id=AttrId.missile_velocity_bonus)
+        effect_gd = self.mkeffect(
+            effect_id=EffectId.ship_module_guidance_disruptor,
+            category_id=EffectCategoryId.target)
+        fit = Fit()
+        fit.ship = Ship(self.mktype().id)
+        item = self.make_launcher()
+        fit.modules.high.append(item)
+        fit_gd = Fit(fit.solar_system)
+        item_gd = ModuleMid(
+            self.mktype(
+                attrs={
+                    AttrId.aoe_cloud_size_bonus: 100,
+                    AttrId.missile_velocity_bonus: -50},
+                effects=[effect_gd],
+                default_effect=effect_gd).id,
+            state=State.active)
+        fit_gd.modules.mid.append(item_gd)
+        # Action
+        item_gd.target = fit.ship
+        # Verification
+        volleys = item.get_applied_volley_batch((
+            TgtData(range=4000, sig_radius=50),
+            TgtData(range=6000, sig_radius=50)))
+        self.assertAlmostEqual(volleys[0].total, 6.85)
+        self.assertAlmostEqual(volleys[1].total, 0)
+        # Action
+        item_gd.target = None
+        # Verification
+        volleys = item.get_applied_volley_batch((
+            TgtData(range=4000, sig_radius=50),
+            TgtData(range=6000, sig_radius=50)))
+        self.assertAlmostEqual(volleys[0].total, 13.7)
+        self.assertAlmostEqual(volleys[1].total, 13.7)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_charge_absent(self):
+        fit = Fit()
+        item = self.make_launcher()
+        item.charge = None
+        fit.modules.high.append(item)
+        # Verification
+        volley = item.get_applied_volley(TgtData(sig_radius=50))
+        self.assertAlmostEqual(volley.total, 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
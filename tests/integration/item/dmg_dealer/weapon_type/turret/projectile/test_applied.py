@@ -0,0 +1,269 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Charge
+from eos import Fit
+from eos import ModuleHigh
+from eos import ResistProfile
+from eos import State
+from eos import TgtData
+from eos.const.eve import AttrId
+from eos.const.eve import EffectCategoryId
+from eos.const.eve import EffectId
+from tests.integration.item.testcase import ItemMixinTestCase
+
+
+class TestItemDmgProjectileApplied(ItemMixinTestCase):
+
+    def setUp(self):
+        ItemMixinTestCase.setUp(self)
+        self.mkattr(attr_id=AttrId.capacity)
+        self.mkattr(attr_id=AttrId.volume)
+        self.mkattr(attr_id=AttrId.charge_rate)
+        self.mkattr(attr_id=AttrId.dmg_mult)
+        self.mkattr(attr_id=AttrId.em_dmg)
+        self.mkattr(attr_id=AttrId.therm_dmg)
+        self.mkattr(attr_id=AttrId.kin_dmg)
+        self.mkattr(attr_id=AttrId.expl_dmg)
+        self.mkattr(attr_id=AttrId.max_range)
+        self.mkattr(attr_id=AttrId.falloff)
+        self.mkattr(attr_id=AttrId.tracking_speed)
+        self.mkattr(attr_id=AttrId.optimal_sig_radius)
+        self.cycle_attr = self.mkattr()
+        self.dd_effect = self.mkeffect(
+            effect_id=EffectId.projectile_fired,
+            category_id=EffectCategoryId.target,
+            duration_attr_id=self.cycle_attr.id,
+            range_attr_id=AttrId.max_range,
+            falloff_attr_id=AttrId.falloff,
+            tracking_speed_attr_id=AttrId.tracking_speed)
+
+    def make_turret(self, attrs=None):
+        base_attrs = {
+            AttrId.capacity: 2.0,
+            AttrId.charge_rate: 1.0,
+            AttrId.dmg_mult: 2,
+            AttrId.max_range: 10000,
+            AttrId.falloff: 5000,
+            AttrId.tracking_speed: 0.05,
+            AttrId.optimal_sig_radius: 40000,
+            self.cycle_attr.id: 2000}
+        if attrs is not None:
+            base_attrs.update(attrs)
+        item = ModuleHigh(
+            self.mktype(
+                attrs=base_attrs,
+                effects=[self.dd_effect],
+                default_effect=self.dd_effect).id,
+            state=State.active)
+        item.charge = Charge(self.mktype(attrs={
+            AttrId.volume: 1.0,
+            AttrId.em_dmg: 1.2,
+            AttrId.therm_dmg: 2.4,
+            AttrId.kin_dmg: 4.8,
+            AttrId.expl_dmg: 9.6}).id)
+        return item
+
+    def test_no_tgt_data(self):
+        fit = Fit()
+        item = self.make_turret()
+        fit.modules.high.append(item)
+        # Verification
+        volley = item.get_applied_volley()
+        self.assertAlmostEqual(volley.em, 2.4)
+        self.assertAlmostEqual(volley.thermal, 4.8)
+        self.assertAlmostEqual(volley.kinetic, 9.6)
+        self.assertAlmostEqual(volley.explosive, 19.2)
+        self.assertAlmostEqual(volley.total, 36)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_perfect_hit(self):
+        fit = Fit()
+        item = self.make_turret()
+        fit.modules.high.append(item)
+        # Verification
+        # Even with 100% chance to hit, average damage is a bit higher than
+        # base due to wrecking shots
+        volley = item.get_applied_volley(TgtData(
+            range=5000, angular_speed=0, sig_radius=100))
+        self.assertAlmostEqual(volley.em, 2.43612)
+        self.assertAlmostEqual(volley.thermal, 4.87224)
+        self.assertAlmostEqual(volley.kinetic, 9.74448)
+        self.assertAlmostEqual(volley.explosive, 19.48896)
+        self.assertAlmostEqual(volley.total, 36.5418)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_range(self):
+        fit = Fit()
+        item = self.make_turret()
+        fit.modules.high.append(item)
+        # Verification
+        # Optimal + falloff gives 50% chance to hit
+        volley = item.get_applied_volley(TgtData(range=15000))
+        self.assertAlmostEqual(volley.total, 36 * 0.39505)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_range_wrecking_only(self):
+        fit = Fit()
+        item = self.make_turret()
+        fit.modules.high.append(item)
+        # Verification
+        # With chance to hit below 1%, all hits are wrecking
+        volley = item.get_applied_volley(TgtData(range=30000))
+        self.assertAlmostEqual(volley.total, 36 * 3 * 0.5 ** 16)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_range_no_falloff(self):
+        fit = Fit()
+        item = self.make_turret({AttrId.falloff: 0})
+        fit.modules.high.append(item)
+        # Verification
+        volley = item.get_applied_volley(TgtData(range=10001))
+        self.assertAlmostEqual(volley.total, 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_tracking(self):
+        fit = Fit()
+        item = self.make_turret()
+        fit.modules.high.append(item)
+        # Verification
+        # Half of tracking speed against half of signature resolution gives
+        # 50% chance to hit
+        volley = item.get_applied_volley(TgtData(
+            angular_speed=0.025, sig_radius=20000))
+        self.assertAlmostEqual(volley.total, 36 * 0.39505)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_tracking_no_sig(self):
+        fit = Fit()
+        item = self.make_turret()
+        fit.modules.high.append(item)
+        # Verification
+        # When target signature is unknown, only tracking speed is used
+        volley = item.get_applied_volley(TgtData(angular_speed=0.05))
+        self.assertAlmostEqual(volley.total, 36 * 0.39505)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_tracking_no_tracking_speed(self):
+        fit = Fit()
+        item = self.make_turret({AttrId.tracking_speed: 0})
+        fit.modules.high.append(item)
+        # Verification
+        volley = item.get_applied_volley(TgtData(angular_speed=0.01))
+        self.assertAlmostEqual(volley.total, 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_range_and_tracking(self):
+        fit = Fit()
+        item = self.make_turret()
+        fit.modules.high.append(item)
+        # Verification
+        volley = item.get_applied_volley(
+            TgtData(range=15000, angular_speed=0.05, sig_radius=40000),
+            tgt_resists=ResistProfile(0.5, 0.5, 0.5, 0.5))
+        self.assertAlmostEqual(volley.total, 18 * 0.1788)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_batch(self):
+        fit = Fit()
+        item = self.make_turret()
+        fit.modules.high.append(item)
+        # Verification
+        volleys = item.get_applied_volley_batch((
+            TgtData(range=15000, angular_speed=0.05, sig_radius=40000),
+            (15000, 0),
+            [5000, 0.05],
+            None))
+        self.assertEqual(len(volleys), 4)
+        self.assertAlmostEqual(volleys[0].total, 36 * 0.1788)
+        self.assertAlmostEqual(volleys[1].total, 36 * 0.39505)
+        self.assertAlmostEqual(volleys[2].total, 36 * 0.39505)
+        self.assertAlmostEqual(volleys[3].total, 36)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_batch_dps(self):
+        fit = Fit()
+        item = self.make_turret()
+        fit.modules.high.append(item)
+        # Verification
+        dpss = item.get_applied_dps_batch(((15000, 0), (5000, 0)))
+        self.assertEqual(len(dpss), 2)
+        self.assertAlmostEqual(dpss[0].total, 18 * 0.39505)
+        self.assertAlmostEqual(dpss[1].total, 18 * 1.01505)
+        dps = item.get_applied_dps(tgt_data=TgtData(range=15000))
+        self.assertAlmostEqual(dps.total, 18 * 0.39505)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_batch_empty(self):
+        fit = Fit()
+        item = self.make_turret()
+        fit.modules.high.append(item)
+        # Verification
+        self.assertEqual(item.get_applied_volley_batch(()), [])
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_batch_invalid_tgt_data(self):
+        fit = Fit()
+        item = self.make_turret()
+        fit.modules.high.append(item)
+        # Verification
+        with self.assertRaises(ValueError):
+            item.get_applied_volley_batch(((-1, 0),))
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_item_not_running(self):
+        fit = Fit()
+        item = self.make_turret()
+        item.state = State.online
+        fit.modules.high.append(item)
+        # Verification
+        volleys = item.get_applied_volley_batch(((5000, 0), (15000, 0)))
+        self.assertAlmostEqual(volleys[0].total, 0)
+        self.assertAlmostEqual(volleys[1].total, 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
@@ -0,0 +1,165 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import FighterSquad
+from eos import Fit
+from eos import Ship
+from eos import State
+from eos.const.eos import ModAffecteeFilter
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eve import EffectCategoryId
+from tests.integration.item.testcase import ItemMixinTestCase
+
+
+class TestItemFighterSquadTargets(ItemMixinTestCase):
+
+    def setUp(self):
+        ItemMixinTestCase.setUp(self)
+        self.tgt_attr = self.mkattr()
+        src_attr = self.mkattr()
+        modifier = self.mkmod(
+            affectee_filter=ModAffecteeFilter.item,
+            affectee_domain=ModDomain.target,
+            affectee_attr_id=self.tgt_attr.id,
+            operator=ModOperator.post_mul,
+            affector_attr_id=src_attr.id)
+        effect = self.mkeffect(
+            category_id=EffectCategoryId.target,
+            modifiers=[modifier])
+        self.fighter_type = self.mktype(
+            attrs={src_attr.id: 2},
+            effects=[effect],
+            default_effect=effect)
+        self.ship_type = self.mktype(attrs={self.tgt_attr.id: 100})
+        self.fit = Fit()
+        self.tgt_fits = []
+        self.tgt_ships = []
+        for _ in range(3):
+            tgt_fit = Fit(self.fit.solar_system)
+            tgt_fit.ship = Ship(self.ship_type.id)
+            self.tgt_fits.append(tgt_fit)
+            self.tgt_ships.append(tgt_fit.ship)
+
+    def get_tgt_values(self):
+        return [s.attrs[self.tgt_attr.id] for s in self.tgt_ships]
+
+    def test_targets_set(self):
+        item = FighterSquad(self.fighter_type.id, state=State.active)
+        self.fit.fighters.add(item)
+        ship1, ship2, ship3 = self.tgt_ships
+        # Action
+        item.targets = (ship1, ship2)
+        # Verification
+        self.assertEqual(item.targets, {ship1, ship2})
+        self.assertEqual(self.get_tgt_values(), [200, 200, 100])
+        # Action
+        item.targets = (ship2, ship3)
+        # Verification
+        self.assertEqual(item.targets, {ship2, ship3})
+        self.assertEqual(self.get_tgt_values(), [100, 200, 200])
+        # Action
+        item.targets = ()
+        # Verification
+        self.assertEqual(item.targets, set())
+        self.assertEqual(self.get_tgt_values(), [100, 100, 100])
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_targets_add_remove(self):
+        item = FighterSquad(self.fighter_type.id, state=State.active)
+        self.fit.fighters.add(item)
+        ship1, ship2, ship3 = self.tgt_ships
+        # Action
+        item.add_target(ship1)
+        item.add_target(ship3)
+        # Verification
+        self.assertEqual(item.targets, {ship1, ship3})
+        self.assertEqual(self.get_tgt_values(), [200, 100, 200])
+        # Action
+        item.remove_target(ship1)
+        # Verification
+        self.assertEqual(item.targets, {ship3})
+        self.assertEqual(self.get_tgt_values(), [100, 100, 200])
+        # Cleanup
+        item.remove_target(ship3)
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_targets_add_remove_repeated(self):
+        item = FighterSquad(self.fighter_type.id, state=State.active)
+        self.fit.fighters.add(item)
+        ship1, ship2, _ = self.tgt_ships
+        # Action
+        item.add_target(ship1)
+        item.add_target(ship1)
+        item.remove_target(ship2)
+        # Verification
+        self.assertEqual(item.targets, {ship1})
+        self.assertEqual(self.get_tgt_values(), [200, 100, 100])
+        # Action
+        item.remove_target(ship1)
+        item.remove_target(ship1)
+        # Verification
+        self.assertEqual(item.targets, set())
+        self.assertEqual(self.get_tgt_values(), [100, 100, 100])
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_targets_item_addition_removal(self):
+        item = FighterSquad(self.fighter_type.id, state=State.active)
+        ship1, ship2, _ = self.tgt_ships
+        # Action
+        item.targets = (ship1, ship2)
+        # Verification
+        self.assertEqual(self.get_tgt_values(), [100, 100, 100])
+        # Action
+        self.fit.fighters.add(item)
+        # Verification
+        self.assertEqual(self.get_tgt_values(), [200, 200, 100])
+        # Action
+        self.fit.fighters.remove(item)
+        # Verification
+        self.assertEqual(item.targets, {ship1, ship2})
+        self.assertEqual(self.get_tgt_values(), [100, 100, 100])
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_targets_state_switch(self):
+        item = FighterSquad(self.fighter_type.id, state=State.active)
+        self.fit.fighters.add(item)
+        ship1, _, ship3 = self.tgt_ships
+        item.targets = (ship1, ship3)
+        # Action
+        item.state = State.online
+        # Verification
+        self.assertEqual(self.get_tgt_values(), [100, 100, 100])
+        # Action
+        item.state = State.active
+        # Verification
+        self.assertEqual(self.get_tgt_values(), [200, 100, 200])
+        # Cleanup
+        item.targets = ()
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
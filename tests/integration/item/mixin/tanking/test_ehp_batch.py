@@ -0,0 +1,171 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import DmgProfile
+from eos import Fit
+from eos import Ship
+from eos.const.eve import AttrId
+from tests.integration.item.testcase import ItemMixinTestCase
+
+
+class TestItemMixinTankingEhpBatch(ItemMixinTestCase):
+
+    def setUp(self):
+        ItemMixinTestCase.setUp(self)
+        self.mkattr(attr_id=AttrId.hp)
+        self.mkattr(attr_id=AttrId.em_dmg_resonance)
+        self.mkattr(attr_id=AttrId.therm_dmg_resonance)
+        self.mkattr(attr_id=AttrId.kin_dmg_resonance)
+        self.mkattr(attr_id=AttrId.expl_dmg_resonance)
+        self.mkattr(attr_id=AttrId.armor_hp)
+        self.mkattr(attr_id=AttrId.armor_em_dmg_resonance)
+        self.mkattr(attr_id=AttrId.armor_therm_dmg_resonance)
+        self.mkattr(attr_id=AttrId.armor_kin_dmg_resonance)
+        self.mkattr(attr_id=AttrId.armor_expl_dmg_resonance)
+        self.mkattr(attr_id=AttrId.shield_capacity)
+        self.mkattr(attr_id=AttrId.shield_em_dmg_resonance)
+        self.mkattr(attr_id=AttrId.shield_therm_dmg_resonance)
+        self.mkattr(attr_id=AttrId.shield_kin_dmg_resonance)
+        self.mkattr(attr_id=AttrId.shield_expl_dmg_resonance)
+
+    def make_ship(self, **attrs):
+        base_attrs = {
+            AttrId.hp: 10,
+            AttrId.em_dmg_resonance: 0.9,
+            AttrId.therm_dmg_resonance: 0.8,
+            AttrId.kin_dmg_resonance: 0.7,
+            AttrId.expl_dmg_resonance: 0.6,
+            AttrId.armor_hp: 50,
+            AttrId.armor_em_dmg_resonance: 0.4,
+            AttrId.armor_therm_dmg_resonance: 0.6,
+            AttrId.armor_kin_dmg_resonance: 0.8,
+            AttrId.armor_expl_dmg_resonance: 0.9,
+            AttrId.shield_capacity: 600,
+            AttrId.shield_em_dmg_resonance: 1.0,
+            AttrId.shield_therm_dmg_resonance: 0.8,
+            AttrId.shield_kin_dmg_resonance: 0.6,
+            AttrId.shield_expl_dmg_resonance: 0.5}
+        base_attrs.update(attrs)
+        return Ship(self.mktype(attrs=base_attrs).id)
+
+    def test_profiles(self):
+        fit = Fit()
+        item = self.make_ship()
+        fit.ship = item
+        # Verification
+        results = item.get_ehp_batch((
+            DmgProfile(25, 6, 8.333, 1),
+            DmgProfile(1, 1, 1, 1)))
+        self.assertEqual(len(results), 2)
+        self.assertAlmostEqual(results[0].hull, 11.957, places=3)
+        self.assertAlmostEqual(results[0].armor, 95.276, places=3)
+        self.assertAlmostEqual(results[0].shield, 685.551, places=3)
+        self.assertAlmostEqual(results[0].total, 792.783, places=3)
+        self.assertAlmostEqual(results[1].hull, 13.333, places=3)
+        self.assertAlmostEqual(results[1].armor, 74.074, places=3)
+        self.assertAlmostEqual(results[1].shield, 827.586, places=3)
+        self.assertAlmostEqual(results[1].total, 914.994, places=3)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_sequences(self):
+        fit = Fit()
+        item = self.make_ship()
+        fit.ship = item
+        # Verification
+        results = item.get_ehp_batch([[25, 6, 8.333, 1], (1, 1, 1, 1)])
+        self.assertEqual(len(results), 2)
+        self.assertAlmostEqual(results[0].total, 792.783, places=3)
+        self.assertAlmostEqual(results[1].total, 914.994, places=3)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_consistency(self):
+        fit = Fit()
+        item = self.make_ship()
+        fit.ship = item
+        profiles = (
+            DmgProfile(25, 6, 8.333, 1),
+            DmgProfile(0, 0, 1, 0),
+            DmgProfile(3, 2, 0, 7))
+        # Verification
+        results = item.get_ehp_batch(profiles)
+        for profile, result in zip(profiles, results):
+            expected = item.get_ehp(profile)
+            self.assertAlmostEqual(result.hull, expected.hull)
+            self.assertAlmostEqual(result.armor, expected.armor)
+            self.assertAlmostEqual(result.shield, expected.shield)
+            self.assertAlmostEqual(result.total, expected.total)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_item_attr_hp_absent(self):
+        fit = Fit()
+        item = Ship(self.mktype(attrs={
+            AttrId.shield_capacity: 100}).id)
+        fit.ship = item
+        # Verification
+        results = item.get_ehp_batch((DmgProfile(1, 1, 1, 1),))
+        self.assertAlmostEqual(results[0].hull, 0)
+        self.assertAlmostEqual(results[0].armor, 0)
+        self.assertAlmostEqual(results[0].shield, 100)
+        self.assertAlmostEqual(results[0].total, 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_no_profiles(self):
+        fit = Fit()
+        item = self.make_ship()
+        fit.ship = item
+        # Verification
+        self.assertEqual(item.get_ehp_batch(()), [])
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_invalid_profile(self):
+        fit = Fit()
+        item = self.make_ship()
+        fit.ship = item
+        # Verification
+        with self.assertRaises(ValueError):
+            item.get_ehp_batch(((0, 0, 0, 0),))
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_item_not_loaded(self):
+        fit = Fit()
+        item = Ship(self.allocate_type_id())
+        fit.ship = item
+        # Verification
+        results = item.get_ehp_batch((DmgProfile(1, 1, 1, 1),))
+        self.assertAlmostEqual(results[0].hull, 0)
+        self.assertAlmostEqual(results[0].armor, 0)
+        self.assertAlmostEqual(results[0].shield, 0)
+        self.assertAlmostEqual(results[0].total, 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
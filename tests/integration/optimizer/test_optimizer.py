@@ -0,0 +1,241 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import gc
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from eos import ModuleHigh
+from eos import Restriction
+from eos import Ship
+from eos import State
+from eos.const.eos import ModAffecteeFilter
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eve import AttrId
+from eos.const.eve import EffectCategoryId
+from eos.const.eve import EffectId
+from eos.optimizer import FitOptimizer
+from tests.integration.restriction.testcase import RestrictionTestCase
+
+
+class TestFitOptimizer(RestrictionTestCase):
+    """Check functionality of fit optimizer."""
+
+    def setUp(self):
+        RestrictionTestCase.setUp(self)
+        self.mkattr(attr_id=AttrId.cpu)
+        self.mkattr(attr_id=AttrId.cpu_output)
+        self.mkattr(attr_id=AttrId.power)
+        self.mkattr(attr_id=AttrId.power_output)
+        self.dmg_attr = self.mkattr()
+        self.online_effect = self.mkeffect(
+            effect_id=EffectId.online,
+            category_id=EffectCategoryId.online)
+        self.fit.ship = Ship(self.mktype(attrs={
+            AttrId.cpu_output: 100, AttrId.power_output: 100}).id)
+        self.type_a = self.make_module_type(cpu=50, dmg=10)
+        self.type_b = self.make_module_type(cpu=30, dmg=7)
+        self.type_c = self.make_module_type(cpu=10, dmg=3)
+        self.skip_checks = set(Restriction).difference([
+            Restriction.cpu,
+            Restriction.powergrid,
+            Restriction.max_group_fitted])
+
+    def make_module_type(
+            self, cpu, dmg, attrs=None, effects=(), group_id=None):
+        type_attrs = {AttrId.cpu: cpu, AttrId.power: 0, self.dmg_attr.id: dmg}
+        type_attrs.update(attrs or {})
+        return self.mktype(
+            group_id=group_id, attrs=type_attrs,
+            effects=(self.online_effect, *effects))
+
+    def get_dmg(self, fit):
+        return sum(
+            item.attrs[self.dmg_attr.id] for item in fit.modules.high.items())
+
+    def make_optimizer(self, slot_qty, candidates):
+        slots = [
+            (self.fit.modules.high, index, candidates)
+            for index in range(slot_qty)]
+        return FitOptimizer(
+            self.fit, slots, self.get_dmg, skip_checks=self.skip_checks)
+
+    def test_best(self):
+        candidates = (self.type_a.id, self.type_b.id, self.type_c.id)
+        optimizer = self.make_optimizer(3, candidates)
+        # Action
+        result = optimizer.optimize()
+        # Verification
+        self.assertEqual(result.score, 21)
+        self.assertEqual(result.type_ids, (self.type_b.id,) * 3)
+        # Only one permutation per module combination is evaluated
+        self.assertLessEqual(result.evaluated, 10)
+        self.assertGreater(result.pruned, 0)
+        self.assertEqual(len(self.fit.modules.high), 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_restriction(self):
+        type_b = self.make_module_type(
+            cpu=30, dmg=7, attrs={AttrId.max_group_fitted: 1}, group_id=6)
+        candidates = (self.type_a.id, type_b.id, self.type_c.id)
+        optimizer = self.make_optimizer(3, candidates)
+        # Action
+        result = optimizer.optimize()
+        # Verification
+        self.assertEqual(result.score, 20)
+        self.assertEqual(
+            result.type_ids, (self.type_a.id, type_b.id, self.type_c.id))
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_empty_slot(self):
+        candidates = (None, self.type_a.id)
+        optimizer = self.make_optimizer(3, candidates)
+        # Action
+        result = optimizer.optimize()
+        # Verification
+        self.assertEqual(result.score, 20)
+        self.assertCountEqual(
+            result.type_ids, (None, self.type_a.id, self.type_a.id))
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_no_valid(self):
+        optimizer = self.make_optimizer(1, (self.make_module_type(
+            cpu=150, dmg=1).id,))
+        # Action
+        result = optimizer.optimize()
+        # Verification
+        self.assertIsNone(result.score)
+        self.assertIsNone(result.type_ids)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_output_modifier(self):
+        # When candidate modifies resource output, partial assignments which
+        # overuse resource should not be pruned
+        src_attr = self.mkattr()
+        modifier = self.mkmod(
+            affectee_filter=ModAffecteeFilter.item,
+            affectee_domain=ModDomain.ship,
+            affectee_attr_id=AttrId.cpu_output,
+            operator=ModOperator.post_percent,
+            affector_attr_id=src_attr.id)
+        mod_effect = self.mkeffect(
+            category_id=EffectCategoryId.passive,
+            modifiers=[modifier])
+        type_a = self.make_module_type(cpu=150, dmg=10)
+        type_d = self.make_module_type(
+            cpu=0, dmg=0, attrs={src_attr.id: 100}, effects=[mod_effect])
+        optimizer = self.make_optimizer(2, (type_a.id, type_d.id))
+        # Action
+        result = optimizer.optimize()
+        # Verification
+        self.assertEqual(result.score, 10)
+        self.assertEqual(result.type_ids, (type_a.id, type_d.id))
+        self.assertEqual(result.pruned, 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_rollback(self):
+        original = ModuleHigh(self.type_c.id, state=State.online)
+        self.fit.modules.high.place(2, original)
+        candidates = (self.type_a.id, self.type_b.id)
+        optimizer = self.make_optimizer(2, candidates)
+        # Action
+        result = optimizer.optimize()
+        # Verification
+        # Module outside of optimized slots is taken into account
+        self.assertEqual(result.score, 20)
+        self.assertEqual(result.type_ids, (self.type_a.id, self.type_b.id))
+        self.assertEqual(
+            list(self.fit.modules.high), [None, None, original])
+        self.assertEqual(self.fit.stats.cpu.used, 10)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_apply(self):
+        candidates = (self.type_a.id, self.type_b.id, self.type_c.id)
+        optimizer = self.make_optimizer(3, candidates)
+        result = optimizer.optimize()
+        # Action
+        optimizer.apply(result)
+        # Verification
+        self.assertEqual(
+            [m._type_id for m in self.fit.modules.high],
+            [self.type_b.id] * 3)
+        self.assertEqual(self.get_dmg(self.fit), 21)
+        self.assertIs(self.fit.is_valid(self.skip_checks), True)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_apply_no_valid(self):
+        original = ModuleHigh(self.type_c.id, state=State.online)
+        self.fit.modules.high.place(0, original)
+        optimizer = self.make_optimizer(1, (self.make_module_type(
+            cpu=150, dmg=1).id,))
+        result = optimizer.optimize()
+        # Action
+        with self.assertRaises(ValueError):
+            optimizer.apply(result)
+        # Verification
+        self.assertEqual(list(self.fit.modules.high), [original])
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_processes(self):
+        candidates = (self.type_a.id, self.type_b.id, self.type_c.id)
+        sequential_result = self.make_optimizer(3, candidates).optimize()
+        optimizer = self.make_optimizer(3, candidates)
+        # Action
+        result = optimizer.optimize(processes=2)
+        # Verification
+        self.assertEqual(result, sequential_result)
+        self.assertEqual(len(self.fit.modules.high), 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_processes_no_gc_freeze(self):
+        candidates = (self.type_a.id, self.type_b.id, self.type_c.id)
+        sequential_result = self.make_optimizer(3, candidates).optimize()
+        optimizer = self.make_optimizer(3, candidates)
+        # Garbage collector of python versions before 3.7 cannot freeze
+        # objects
+        gc_stub = SimpleNamespace(collect=gc.collect)
+        # Action
+        with patch('eos.optimizer.optimizer.gc', gc_stub):
+            result = optimizer.optimize(processes=2)
+        # Verification
+        self.assertEqual(result, sequential_result)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
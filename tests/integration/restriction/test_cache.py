@@ -0,0 +1,184 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from unittest.mock import patch
+
+from eos import ModuleHigh
+from eos import Restriction
+from eos import Ship
+from eos import Skill
+from eos import State
+from eos import ValidationError
+from eos.const.eos import ModAffecteeFilter
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eve import AttrId
+from eos.const.eve import EffectCategoryId
+from eos.const.eve import EffectId
+from eos.restriction.restriction import CpuRestriction
+from eos.restriction.restriction import MaxGroupFittedRestrictionRegister
+from tests.integration.restriction.testcase import RestrictionTestCase
+
+
+class TestRestrictionCache(RestrictionTestCase):
+    """Check that restriction service re-runs only dirty restrictions."""
+
+    def setUp(self):
+        RestrictionTestCase.setUp(self)
+        self.mkattr(attr_id=AttrId.cpu)
+        self.mkattr(attr_id=AttrId.cpu_output)
+        self.mkattr(attr_id=AttrId.skill_level)
+        self.online_effect = self.mkeffect(
+            effect_id=EffectId.online,
+            category_id=EffectCategoryId.online)
+        self.skip_checks = set(Restriction).difference([Restriction.cpu])
+
+    def make_cpu_skill(self):
+        # Skill which multiplies ship CPU output by skill level
+        modifier = self.mkmod(
+            affectee_filter=ModAffecteeFilter.item,
+            affectee_domain=ModDomain.ship,
+            affectee_attr_id=AttrId.cpu_output,
+            operator=ModOperator.post_mul,
+            affector_attr_id=AttrId.skill_level)
+        effect = self.mkeffect(
+            category_id=EffectCategoryId.passive,
+            modifiers=[modifier])
+        return self.mktype(effects=[effect])
+
+    def test_no_changes(self):
+        self.fit.ship = Ship(self.mktype(attrs={AttrId.cpu_output: 40}).id)
+        item = ModuleHigh(
+            self.mktype(
+                attrs={AttrId.cpu: 50},
+                effects=[self.online_effect]).id,
+            state=State.online)
+        self.fit.modules.high.append(item)
+        with patch.object(
+            CpuRestriction, 'validate', autospec=True,
+            side_effect=CpuRestriction.validate
+        ) as validate_mock:
+            # Action
+            with self.assertRaises(ValidationError) as cm1:
+                self.fit.validate(skip_checks=self.skip_checks)
+            with self.assertRaises(ValidationError) as cm2:
+                self.fit.validate(skip_checks=self.skip_checks)
+        # Verification
+        self.assertEqual(validate_mock.call_count, 1)
+        error_data1 = cm1.exception.args[0]
+        error_data2 = cm2.exception.args[0]
+        self.assertEqual(error_data1, error_data2)
+        self.assertIn(Restriction.cpu, error_data2[item])
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_unrelated_change(self):
+        # Messages which restriction does not depend on should not trigger
+        # its validation
+        item = ModuleHigh(
+            self.mktype(
+                group_id=6,
+                attrs={AttrId.max_group_fitted: 1},
+                effects=[self.online_effect]).id,
+            state=State.offline)
+        self.fit.modules.high.append(item)
+        self.assertIsNone(self.get_error(item, Restriction.max_group_fitted))
+        with patch.object(
+            MaxGroupFittedRestrictionRegister, 'validate', autospec=True,
+            side_effect=MaxGroupFittedRestrictionRegister.validate
+        ) as validate_mock:
+            # Action
+            item.state = State.online
+            error = self.get_error(item, Restriction.max_group_fitted)
+        # Verification
+        self.assertIsNone(error)
+        self.assertEqual(validate_mock.call_count, 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_attr_change(self):
+        # Change of modified attribute value should trigger re-validation
+        self.fit.ship = Ship(self.mktype(attrs={AttrId.cpu_output: 40}).id)
+        item = ModuleHigh(
+            self.mktype(
+                attrs={AttrId.cpu: 50},
+                effects=[self.online_effect]).id,
+            state=State.online)
+        self.fit.modules.high.append(item)
+        skill = Skill(self.make_cpu_skill().id, level=1)
+        self.fit.skills.add(skill)
+        self.assertIsNotNone(self.get_error(item, Restriction.cpu))
+        # Action
+        skill.level = 2
+        # Verification
+        self.assertIsNone(self.get_error(item, Restriction.cpu))
+        # Action
+        skill.level = 1
+        # Verification
+        error = self.get_error(item, Restriction.cpu)
+        self.assertIsNotNone(error)
+        self.assertEqual(error.output, 40)
+        self.assertEqual(error.total_use, 50)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_skill_level_change(self):
+        item = ModuleHigh(self.mktype(attrs={
+            AttrId.required_skill_1: 50,
+            AttrId.required_skill_1_level: 3}).id)
+        self.fit.modules.high.append(item)
+        skill = Skill(self.mktype(type_id=50).id, level=2)
+        self.fit.skills.add(skill)
+        self.assertIsNotNone(
+            self.get_error(item, Restriction.skill_requirement))
+        # Action
+        skill.level = 3
+        # Verification
+        self.assertIsNone(self.get_error(item, Restriction.skill_requirement))
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_skipped_dirty(self):
+        # Restrictions which were skipped when they became dirty should be
+        # validated on the first unskipped run
+        self.fit.ship = Ship(self.mktype(attrs={AttrId.cpu_output: 40}).id)
+        self.fit.validate(skip_checks=set(Restriction).difference(
+            [Restriction.cpu]))
+        item = ModuleHigh(
+            self.mktype(
+                attrs={AttrId.cpu: 50},
+                effects=[self.online_effect]).id,
+            state=State.online)
+        self.fit.modules.high.append(item)
+        self.fit.validate(skip_checks=set(Restriction).difference(
+            [Restriction.max_group_fitted]))
+        # Action
+        error = self.get_error(item, Restriction.cpu)
+        # Verification
+        self.assertIsNotNone(error)
+        self.assertEqual(error.total_use, 50)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
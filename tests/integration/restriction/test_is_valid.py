@@ -0,0 +1,147 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from unittest.mock import patch
+
+from eos import ModuleHigh
+from eos import Restriction
+from eos import Ship
+from eos import State
+from eos.const.eve import AttrId
+from eos.const.eve import EffectCategoryId
+from eos.const.eve import EffectId
+from eos.restriction.restriction import CpuRestriction
+from tests.integration.restriction.testcase import RestrictionTestCase
+
+
+class TestIsValid(RestrictionTestCase):
+    """Check functionality of fail-fast fit validity check."""
+
+    def setUp(self):
+        RestrictionTestCase.setUp(self)
+        self.mkattr(attr_id=AttrId.cpu)
+        self.mkattr(attr_id=AttrId.cpu_output)
+        self.online_effect = self.mkeffect(
+            effect_id=EffectId.online,
+            category_id=EffectCategoryId.online)
+        self.skip_checks = set(Restriction).difference([
+            Restriction.cpu, Restriction.max_group_fitted])
+
+    def make_item(self, cpu):
+        return ModuleHigh(
+            self.mktype(
+                attrs={AttrId.cpu: cpu},
+                effects=[self.online_effect]).id,
+            state=State.online)
+
+    def test_pass(self):
+        self.fit.ship = Ship(self.mktype(attrs={AttrId.cpu_output: 40}).id)
+        self.fit.modules.high.append(self.make_item(30))
+        # Action
+        is_valid = self.fit.is_valid(self.skip_checks)
+        # Verification
+        self.assertIs(is_valid, True)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_fail(self):
+        self.fit.ship = Ship(self.mktype(attrs={AttrId.cpu_output: 40}).id)
+        item = self.make_item(50)
+        self.fit.modules.high.append(item)
+        # Action
+        is_valid = self.fit.is_valid(self.skip_checks)
+        # Verification
+        self.assertIs(is_valid, False)
+        # Error data should still be available via full validation
+        error = self.get_error(item, Restriction.cpu)
+        self.assertIsNotNone(error)
+        self.assertEqual(error.total_use, 50)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_fail_skipped(self):
+        self.fit.ship = Ship(self.mktype(attrs={AttrId.cpu_output: 40}).id)
+        self.fit.modules.high.append(self.make_item(50))
+        # Action
+        is_valid = self.fit.is_valid(self.skip_checks.union([Restriction.cpu]))
+        # Verification
+        self.assertIs(is_valid, True)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_no_error_data(self):
+        # Failed restriction should be checked without running full validation
+        self.fit.ship = Ship(self.mktype(attrs={AttrId.cpu_output: 40}).id)
+        self.fit.modules.high.append(self.make_item(50))
+        with patch.object(
+            CpuRestriction, 'validate', autospec=True,
+            side_effect=CpuRestriction.validate
+        ) as validate_mock:
+            # Action
+            is_valid = self.fit.is_valid(self.skip_checks)
+        # Verification
+        self.assertIs(is_valid, False)
+        self.assertEqual(validate_mock.call_count, 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_cached_failure(self):
+        # When failure is known from previous validation, nothing should be
+        # checked again
+        self.fit.ship = Ship(self.mktype(attrs={AttrId.cpu_output: 40}).id)
+        item = self.make_item(50)
+        self.fit.modules.high.append(item)
+        self.assertIsNotNone(self.get_error(item, Restriction.cpu))
+        with patch.object(
+            CpuRestriction, '_check', autospec=True,
+            side_effect=CpuRestriction._check
+        ) as check_mock:
+            # Action
+            is_valid = self.fit.is_valid(self.skip_checks)
+        # Verification
+        self.assertIs(is_valid, False)
+        self.assertEqual(check_mock.call_count, 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_timings(self):
+        self.fit.ship = Ship(self.mktype(attrs={AttrId.cpu_output: 40}).id)
+        item = self.make_item(50)
+        self.fit.modules.high.append(item)
+        self.fit.is_valid(self.skip_checks)
+        self.fit.modules.high.remove(item)
+        self.fit.is_valid(self.skip_checks)
+        # Action
+        timings = self.fit.validation_timings
+        # Verification
+        cpu_timing = timings[Restriction.cpu]
+        self.assertEqual(cpu_timing.runs, 2)
+        self.assertEqual(cpu_timing.failures, 1)
+        self.assertGreater(cpu_timing.time, 0)
+        self.assertEqual(timings[Restriction.high_slot].runs, 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
@@ -52,6 +52,7 @@ class RestrictionTestCase(IntegrationTestCase):
         try:
             self.fit.validate(skip_checks)
         except ValidationError as e:
+            self.assert_check(restriction, False)
             error_data = e.args[0]
             if item not in error_data:
                 return None
@@ -60,7 +61,16 @@ class RestrictionTestCase(IntegrationTestCase):
                 return None
             return item_error[restriction]
         else:
+            self.assert_check(restriction, True)
             return None
 
+    def assert_check(self, restriction, expected):
+        """Verify that fail-fast check agrees with validation results."""
+        for restriction_obj in (
+            self.fit._restriction._RestrictionService__restrictions
+        ):
+            if restriction_obj.type is restriction:
+                self.assertIs(restriction_obj._check(), expected)
+
     def get_log(self, name='eos.restriction*'):
         return IntegrationTestCase.get_log(self, name=name)
@@ -0,0 +1,266 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Coordinates
+from eos import Drone
+from eos import FighterSquad
+from eos import Fit
+from eos import ModuleHigh
+from eos import Orientation
+from eos import Ship
+from eos import SolarSystem
+from eos import State
+from eos.const.eve import AttrId
+from eos.const.eve import EffectCategoryId
+from eos.const.eve import EffectId
+from eos.const.eve import FighterAbilityId
+from eos.eve_obj.type import AbilityData
+from tests.integration.solar_system.testcase import SolarSystemTestCase
+
+
+class TestSolarSystemAoe(SolarSystemTestCase):
+
+    def setUp(self):
+        SolarSystemTestCase.setUp(self)
+        self.mkattr(attr_id=AttrId.em_dmg)
+        self.mkattr(attr_id=AttrId.therm_dmg)
+        self.mkattr(attr_id=AttrId.kin_dmg)
+        self.mkattr(attr_id=AttrId.expl_dmg)
+        self.mkattr(attr_id=AttrId.emp_field_range)
+        self.cycle_attr = self.mkattr()
+        self.smartbomb_effect = self.mkeffect(
+            effect_id=EffectId.emp_wave,
+            category_id=EffectCategoryId.active,
+            duration_attr_id=self.cycle_attr.id,
+            range_attr_id=AttrId.emp_field_range)
+        self.solar_system = SolarSystem()
+
+    def make_ship(self, x, y, z):
+        fit = Fit(self.solar_system)
+        ship = Ship(self.mktype().id)
+        fit.ship = ship
+        ship.coordinate = Coordinates(x, y, z)
+        return ship
+
+    def make_smartbomb(self, aoe_range, em_dmg=10):
+        effect = self.smartbomb_effect
+        return ModuleHigh(
+            self.mktype(
+                attrs={
+                    AttrId.em_dmg: em_dmg,
+                    AttrId.therm_dmg: 20,
+                    AttrId.kin_dmg: 30,
+                    AttrId.expl_dmg: 40,
+                    AttrId.emp_field_range: aoe_range,
+                    self.cycle_attr.id: 5000},
+                effects=[effect],
+                default_effect=effect).id,
+            state=State.active)
+
+    def test_smartbomb(self):
+        ship1 = self.make_ship(0, 0, 0)
+        ship2 = self.make_ship(3000, 0, 0)
+        ship3 = self.make_ship(10000, 0, 0)
+        drone = Drone(self.mktype().id)
+        ship1._fit.drones.add(drone)
+        drone.coordinate = Coordinates(0, 1000, 0)
+        ship1._fit.modules.high.append(self.make_smartbomb(5000))
+        # Action
+        volleys = self.solar_system.get_aoe_volley()
+        # Verification
+        # Smartbomb hits everything around its carrier, including carrier's
+        # own drones
+        self.assertEqual(set(volleys), {ship2, drone})
+        self.assertAlmostEqual(volleys[ship2].em, 10)
+        self.assertAlmostEqual(volleys[ship2].thermal, 20)
+        self.assertAlmostEqual(volleys[ship2].kinetic, 30)
+        self.assertAlmostEqual(volleys[ship2].explosive, 40)
+        self.assertAlmostEqual(volleys[ship2].total, 100)
+        self.assertAlmostEqual(volleys[drone].total, 100)
+        self.assertNotIn(ship3, volleys)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_smartbomb_dps(self):
+        ship1 = self.make_ship(0, 0, 0)
+        ship2 = self.make_ship(3000, 0, 0)
+        ship1._fit.modules.high.append(self.make_smartbomb(5000))
+        # Action
+        dpss = self.solar_system.get_aoe_dps()
+        # Verification
+        self.assertEqual(set(dpss), {ship2})
+        self.assertAlmostEqual(dpss[ship2].em, 2)
+        self.assertAlmostEqual(dpss[ship2].total, 20)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_smartbomb_aggregation(self):
+        ship1 = self.make_ship(0, 0, 0)
+        ship2 = self.make_ship(6000, 0, 0)
+        ship3 = self.make_ship(3000, 0, 0)
+        ship1._fit.modules.high.append(self.make_smartbomb(5000))
+        ship1._fit.modules.high.append(self.make_smartbomb(5000, em_dmg=0))
+        ship2._fit.modules.high.append(self.make_smartbomb(5000))
+        # Action
+        volleys = self.solar_system.get_aoe_volley()
+        # Verification
+        self.assertEqual(set(volleys), {ship3})
+        self.assertAlmostEqual(volleys[ship3].em, 20)
+        self.assertAlmostEqual(volleys[ship3].total, 290)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_smartbomb_moved(self):
+        ship1 = self.make_ship(0, 0, 0)
+        ship2 = self.make_ship(3000, 0, 0)
+        ship1._fit.modules.high.append(self.make_smartbomb(5000))
+        # Action
+        ship2.coordinate = Coordinates(3000, 5000, 0)
+        # Verification
+        self.assertEqual(self.solar_system.get_aoe_volley(), {})
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_smartbomb_no_range(self):
+        ship1 = self.make_ship(0, 0, 0)
+        self.make_ship(3000, 0, 0)
+        effect = self.smartbomb_effect
+        ship1._fit.modules.high.append(ModuleHigh(
+            self.mktype(
+                attrs={AttrId.em_dmg: 10, self.cycle_attr.id: 5000},
+                effects=[effect],
+                default_effect=effect).id,
+            state=State.active))
+        # Verification
+        self.assertEqual(self.solar_system.get_aoe_volley(), {})
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_smartbomb_not_running(self):
+        ship1 = self.make_ship(0, 0, 0)
+        self.make_ship(3000, 0, 0)
+        item = self.make_smartbomb(5000)
+        item.state = State.online
+        ship1._fit.modules.high.append(item)
+        # Verification
+        self.assertEqual(self.solar_system.get_aoe_volley(), {})
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_fit_stats_filter(self):
+        ship1 = self.make_ship(0, 0, 0)
+        ship2 = self.make_ship(3000, 0, 0)
+        item1 = self.make_smartbomb(5000)
+        item2 = self.make_smartbomb(5000, em_dmg=50)
+        ship1._fit.modules.high.append(item1)
+        ship1._fit.modules.high.append(item2)
+        # Action
+        volleys = ship1._fit.stats.get_aoe_volley(
+            item_filter=lambda i: i is item2)
+        # Verification
+        self.assertEqual(set(volleys), {ship2})
+        self.assertAlmostEqual(volleys[ship2].em, 50)
+        self.assertAlmostEqual(volleys[ship2].total, 140)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_fighter_bomb(self):
+        self.mkattr(attr_id=AttrId.fighter_squadron_max_size)
+        self.mkattr(attr_id=AttrId.max_velocity)
+        self.mkattr(attr_id=AttrId.explosion_delay)
+        effect_item = self.mkeffect(
+            effect_id=EffectId.fighter_ability_launch_bomb,
+            category_id=EffectCategoryId.active)
+        effect_charge = self.mkeffect(
+            effect_id=EffectId.bomb_launching,
+            category_id=EffectCategoryId.active)
+        bomb_type = self.mktype(
+            attrs={
+                AttrId.em_dmg: 100,
+                AttrId.max_velocity: 2000,
+                AttrId.explosion_delay: 5000,
+                AttrId.emp_field_range: 3000},
+            effects=[effect_charge],
+            default_effect=effect_charge)
+        ship1 = self.make_ship(0, 0, 0)
+        ship2 = self.make_ship(0, 12000, 0)
+        ship3 = self.make_ship(0, 0, 10000)
+        item = FighterSquad(
+            self.mktype(
+                attrs={
+                    AttrId.fighter_ability_launch_bomb_type: bomb_type.id,
+                    AttrId.fighter_squadron_max_size: 3},
+                effects=[effect_item],
+                default_effect=effect_item,
+                abilities_data={
+                    FighterAbilityId.launch_bomb: AbilityData(0, 3)}).id,
+            state=State.active)
+        ship1._fit.fighters.add(item)
+        item.orientation = Orientation(0, 5, 0)
+        # Action
+        volleys = self.solar_system.get_aoe_volley()
+        # Verification
+        # Bombs explode 10 km away in the direction squad is facing
+        self.assertEqual(set(volleys), {ship2})
+        self.assertAlmostEqual(volleys[ship2].em, 300)
+        self.assertAlmostEqual(volleys[ship2].total, 300)
+        # Action
+        item.orientation = Orientation(0, 0, 1)
+        # Verification
+        volleys = self.solar_system.get_aoe_volley()
+        self.assertEqual(set(volleys), {ship3})
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_doomsday_direct(self):
+        effect = self.mkeffect(
+            effect_id=EffectId.super_weapon_amarr,
+            category_id=EffectCategoryId.target,
+            duration_attr_id=self.cycle_attr.id)
+        ship1 = self.make_ship(0, 0, 0)
+        ship2 = self.make_ship(100000, 0, 0)
+        self.make_ship(100001, 0, 0)
+        item = ModuleHigh(
+            self.mktype(
+                attrs={AttrId.em_dmg: 52000, self.cycle_attr.id: 250000},
+                effects=[effect],
+                default_effect=effect).id,
+            state=State.active)
+        ship1._fit.modules.high.append(item)
+        # Verification
+        self.assertEqual(self.solar_system.get_aoe_volley(), {})
+        # Action
+        item.target = ship2
+        # Verification
+        volleys = self.solar_system.get_aoe_volley()
+        self.assertEqual(set(volleys), {ship2})
+        self.assertAlmostEqual(volleys[ship2].em, 52000)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
@@ -0,0 +1,459 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import math
+
+from eos import Charge
+from eos import Coordinates
+from eos import FighterSquad
+from eos import Fit
+from eos import Implant
+from eos import ModuleHigh
+from eos import ModuleMid
+from eos import Ship
+from eos import State
+from eos.const.eos import ModAffecteeFilter
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eve import AttrId
+from eos.const.eve import EffectCategoryId
+from eos.const.eve import EffectId
+from eos.const.eve import FighterAbilityId
+from eos.eve_obj.type import AbilityData
+from tests.integration.solar_system.testcase import SolarSystemTestCase
+
+
+class TestIncoming(SolarSystemTestCase):
+
+    def setUp(self):
+        SolarSystemTestCase.setUp(self)
+        self.mkattr(attr_id=AttrId.armor_dmg_amount)
+        self.mkattr(attr_id=AttrId.shield_bonus)
+        self.mkattr(attr_id=AttrId.max_range)
+        self.mkattr(attr_id=AttrId.falloff)
+        self.falloff_attr = self.mkattr()
+        self.mkattr(attr_id=AttrId.max_velocity)
+        self.mkattr(attr_id=AttrId.speed_factor)
+        self.cycle_attr = self.mkattr()
+        self.fit = Fit()
+        self.fit.ship = Ship(self.mktype().id)
+        self.tgt_fit = Fit(self.fit.solar_system)
+        self.tgt_fit.ship = Ship(self.mktype(
+            attrs={AttrId.max_velocity: 200}).id)
+
+    def make_rep(self, effect_id, attr_id, amount):
+        effect = self.mkeffect(
+            effect_id=effect_id,
+            category_id=EffectCategoryId.target,
+            duration_attr_id=self.cycle_attr.id,
+            range_attr_id=AttrId.max_range,
+            falloff_attr_id=self.falloff_attr.id)
+        item = ModuleMid(
+            self.mktype(
+                attrs={
+                    attr_id: amount,
+                    AttrId.max_range: 5000,
+                    self.falloff_attr.id: 2000,
+                    self.cycle_attr.id: 5000},
+                effects=[effect],
+                default_effect=effect).id,
+            state=State.active)
+        self.fit.modules.mid.append(item)
+        return item
+
+    def make_web(self):
+        effect = self.mkeffect(
+            effect_id=EffectId.remote_webifier_falloff,
+            category_id=EffectCategoryId.target,
+            range_attr_id=AttrId.max_range,
+            falloff_attr_id=self.falloff_attr.id)
+        item = ModuleMid(
+            self.mktype(
+                attrs={
+                    AttrId.speed_factor: -60,
+                    AttrId.max_range: 10000,
+                    self.falloff_attr.id: 5000},
+                effects=[effect],
+                default_effect=effect).id,
+            state=State.active)
+        self.fit.modules.mid.append(item)
+        return item
+
+    def test_no_projections(self):
+        # Verification
+        incoming = self.tgt_fit.ship.incoming
+        self.assertAlmostEqual(incoming.dps.total, 0)
+        self.assertAlmostEqual(incoming.rps.total, 0)
+        self.assertEqual(incoming.ewar, {})
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_item_not_in_fit(self):
+        ship = Ship(self.mktype().id)
+        # Verification
+        incoming = ship.incoming
+        self.assertAlmostEqual(incoming.dps.total, 0)
+        self.assertAlmostEqual(incoming.rps.total, 0)
+        self.assertEqual(incoming.ewar, {})
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_reps(self):
+        item1 = self.make_rep(
+            EffectId.ship_module_remote_armor_repairer,
+            AttrId.armor_dmg_amount, 500)
+        item2 = self.make_rep(
+            EffectId.ship_module_remote_shield_booster,
+            AttrId.shield_bonus, 300)
+        # Action
+        item1.target = self.tgt_fit.ship
+        item2.target = self.tgt_fit.ship
+        # Verification
+        rps = self.tgt_fit.ship.incoming.rps
+        self.assertAlmostEqual(rps.hull, 0)
+        self.assertAlmostEqual(rps.armor, 100)
+        self.assertAlmostEqual(rps.shield, 60)
+        # Action
+        item1.target = None
+        # Verification
+        rps = self.tgt_fit.ship.incoming.rps
+        self.assertAlmostEqual(rps.armor, 0)
+        self.assertAlmostEqual(rps.shield, 60)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_reps_state_switch(self):
+        item = self.make_rep(
+            EffectId.ship_module_remote_armor_repairer,
+            AttrId.armor_dmg_amount, 500)
+        item.target = self.tgt_fit.ship
+        self.assertAlmostEqual(self.tgt_fit.ship.incoming.rps.armor, 100)
+        # Action
+        item.state = State.online
+        # Verification
+        self.assertAlmostEqual(self.tgt_fit.ship.incoming.rps.armor, 0)
+        # Action
+        item.state = State.active
+        # Verification
+        self.assertAlmostEqual(self.tgt_fit.ship.incoming.rps.armor, 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_reps_attr_change(self):
+        bonus_attr = self.mkattr()
+        modifier = self.mkmod(
+            affectee_filter=ModAffecteeFilter.domain,
+            affectee_domain=ModDomain.ship,
+            affectee_attr_id=AttrId.armor_dmg_amount,
+            operator=ModOperator.post_mul,
+            affector_attr_id=bonus_attr.id)
+        effect = self.mkeffect(
+            category_id=EffectCategoryId.passive,
+            modifiers=[modifier])
+        implant = Implant(self.mktype(
+            attrs={bonus_attr.id: 1.5},
+            effects=[effect]).id)
+        item = self.make_rep(
+            EffectId.ship_module_remote_armor_repairer,
+            AttrId.armor_dmg_amount, 500)
+        item.target = self.tgt_fit.ship
+        self.assertAlmostEqual(self.tgt_fit.ship.incoming.rps.armor, 100)
+        # Action
+        self.fit.implants.add(implant)
+        # Verification
+        self.assertAlmostEqual(self.tgt_fit.ship.incoming.rps.armor, 150)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_reps_range(self):
+        item = self.make_rep(
+            EffectId.ship_module_remote_armor_repairer,
+            AttrId.armor_dmg_amount, 500)
+        item.target = self.tgt_fit.ship
+        self.assertAlmostEqual(self.tgt_fit.ship.incoming.rps.armor, 100)
+        # Action
+        self.tgt_fit.ship.coordinate = Coordinates(7000, 0, 0)
+        # Verification
+        self.assertAlmostEqual(self.tgt_fit.ship.incoming.rps.armor, 50)
+        # Action
+        self.fit.ship.coordinate = Coordinates(2000, 0, 0)
+        # Verification
+        self.assertAlmostEqual(self.tgt_fit.ship.incoming.rps.armor, 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_ewar(self):
+        item = self.make_web()
+        # Action
+        item.target = self.tgt_fit.ship
+        # Verification
+        ewar = self.tgt_fit.ship.incoming.ewar
+        self.assertEqual(len(ewar), 1)
+        self.assertEqual(len(ewar[AttrId.max_velocity]), 1)
+        mod_op, mod_value, range_mult = ewar[AttrId.max_velocity][0]
+        self.assertEqual(mod_op, ModOperator.post_percent)
+        self.assertAlmostEqual(mod_value, -60)
+        self.assertAlmostEqual(range_mult, 1)
+        # Action
+        self.tgt_fit.ship.coordinate = Coordinates(15000, 0, 0)
+        # Verification
+        ewar = self.tgt_fit.ship.incoming.ewar
+        mod_op, mod_value, range_mult = ewar[AttrId.max_velocity][0]
+        self.assertEqual(mod_op, ModOperator.post_percent)
+        self.assertAlmostEqual(mod_value, -60)
+        self.assertAlmostEqual(range_mult, 0.5)
+        # Action
+        item.target = None
+        # Verification
+        self.assertEqual(self.tgt_fit.ship.incoming.ewar, {})
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_ewar_operator(self):
+        # Modification values are reported unscaled along with operator, as
+        # range multiplier applies differently depending on operator
+        src_attr = self.mkattr()
+        modifier = self.mkmod(
+            affectee_filter=ModAffecteeFilter.item,
+            affectee_domain=ModDomain.target,
+            affectee_attr_id=AttrId.max_velocity,
+            operator=ModOperator.post_mul,
+            affector_attr_id=src_attr.id)
+        effect = self.mkeffect(
+            category_id=EffectCategoryId.target,
+            range_attr_id=AttrId.max_range,
+            falloff_attr_id=self.falloff_attr.id,
+            modifiers=[modifier])
+        item = ModuleMid(
+            self.mktype(
+                attrs={
+                    src_attr.id: 0.4,
+                    AttrId.max_range: 10000,
+                    self.falloff_attr.id: 5000},
+                effects=[effect],
+                default_effect=effect).id,
+            state=State.active)
+        self.fit.modules.mid.append(item)
+        item.target = self.tgt_fit.ship
+        # Action
+        self.tgt_fit.ship.coordinate = Coordinates(15000, 0, 0)
+        # Verification
+        ewar = self.tgt_fit.ship.incoming.ewar
+        mod_op, mod_value, range_mult = ewar[AttrId.max_velocity][0]
+        self.assertEqual(mod_op, ModOperator.post_mul)
+        self.assertAlmostEqual(mod_value, 0.4)
+        self.assertAlmostEqual(range_mult, 0.5)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_reps_carrier_replacement(self):
+        item = self.make_rep(
+            EffectId.ship_module_remote_armor_repairer,
+            AttrId.armor_dmg_amount, 500)
+        item.target = self.tgt_fit.ship
+        self.tgt_fit.ship.coordinate = Coordinates(7000, 0, 0)
+        self.assertAlmostEqual(self.tgt_fit.ship.incoming.rps.armor, 50)
+        ship = Ship(self.mktype().id)
+        ship.coordinate = Coordinates(7000, 0, 0)
+        # Action
+        self.fit.ship = ship
+        # Verification
+        self.assertAlmostEqual(self.tgt_fit.ship.incoming.rps.armor, 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_reps_carrier_removal(self):
+        # Projectors without carrier have no location, and their strength is
+        # not reduced
+        item = self.make_rep(
+            EffectId.ship_module_remote_armor_repairer,
+            AttrId.armor_dmg_amount, 500)
+        item.target = self.tgt_fit.ship
+        self.tgt_fit.ship.coordinate = Coordinates(7000, 0, 0)
+        self.assertAlmostEqual(self.tgt_fit.ship.incoming.rps.armor, 50)
+        # Action
+        self.fit.ship = None
+        # Verification
+        self.assertAlmostEqual(self.tgt_fit.ship.incoming.rps.armor, 100)
+        # Action
+        self.fit.ship = Ship(self.mktype().id)
+        # Verification
+        self.assertAlmostEqual(self.tgt_fit.ship.incoming.rps.armor, 50)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def make_turret(self):
+        self.mkattr(attr_id=AttrId.capacity)
+        self.mkattr(attr_id=AttrId.volume)
+        self.mkattr(attr_id=AttrId.charge_rate)
+        self.mkattr(attr_id=AttrId.dmg_mult)
+        self.mkattr(attr_id=AttrId.em_dmg)
+        self.mkattr(attr_id=AttrId.therm_dmg)
+        self.mkattr(attr_id=AttrId.kin_dmg)
+        self.mkattr(attr_id=AttrId.expl_dmg)
+        effect = self.mkeffect(
+            effect_id=EffectId.projectile_fired,
+            category_id=EffectCategoryId.target,
+            duration_attr_id=self.cycle_attr.id,
+            range_attr_id=AttrId.max_range,
+            falloff_attr_id=AttrId.falloff)
+        item = ModuleHigh(
+            self.mktype(
+                attrs={
+                    AttrId.capacity: 2.0,
+                    AttrId.charge_rate: 1.0,
+                    AttrId.dmg_mult: 2,
+                    AttrId.max_range: 10000,
+                    AttrId.falloff: 5000,
+                    self.cycle_attr.id: 2000},
+                effects=[effect],
+                default_effect=effect).id,
+            state=State.active)
+        self.fit.modules.high.append(item)
+        return item
+
+    def make_charge(self, mult=1):
+        return Charge(self.mktype(attrs={
+            AttrId.volume: 1.0,
+            AttrId.em_dmg: 1.2 * mult,
+            AttrId.therm_dmg: 2.4 * mult,
+            AttrId.kin_dmg: 4.8 * mult,
+            AttrId.expl_dmg: 9.6 * mult}).id)
+
+    def test_dps(self):
+        item = self.make_turret()
+        item.charge = self.make_charge()
+        # Action
+        item.target = self.tgt_fit.ship
+        # Verification
+        self.assertAlmostEqual(
+            self.tgt_fit.ship.incoming.dps.total, 18.2709)
+        # Action
+        self.tgt_fit.ship.coordinate = Coordinates(0, 0, 15000)
+        # Verification
+        self.assertAlmostEqual(self.tgt_fit.ship.incoming.dps.total, 7.1109)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_dps_charge_switch(self):
+        item = self.make_turret()
+        item.charge = self.make_charge()
+        item.target = self.tgt_fit.ship
+        self.assertAlmostEqual(
+            self.tgt_fit.ship.incoming.dps.total, 18.2709)
+        # Action
+        item.charge = self.make_charge(mult=2)
+        # Verification
+        self.assertAlmostEqual(
+            self.tgt_fit.ship.incoming.dps.total, 36.5418)
+        # Action
+        item.charge = None
+        # Verification
+        self.assertAlmostEqual(self.tgt_fit.ship.incoming.dps.total, 0)
+        # Action
+        item.charge = self.make_charge()
+        # Verification
+        self.assertAlmostEqual(
+            self.tgt_fit.ship.incoming.dps.total, 18.2709)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_dps_unapplied_dealer(self):
+        self.mkattr(attr_id=AttrId.fighter_ability_attack_missile_dmg_mult)
+        self.mkattr(attr_id=AttrId.fighter_ability_attack_missile_dmg_em)
+        self.mkattr(attr_id=AttrId.fighter_squadron_max_size)
+        effect = self.mkeffect(
+            effect_id=EffectId.fighter_ability_attack_m,
+            category_id=EffectCategoryId.target,
+            duration_attr_id=self.cycle_attr.id)
+        item = FighterSquad(
+            self.mktype(
+                attrs={
+                    AttrId.fighter_ability_attack_missile_dmg_mult: 2,
+                    AttrId.fighter_ability_attack_missile_dmg_em: 50,
+                    AttrId.fighter_squadron_max_size: 9,
+                    self.cycle_attr.id: 4000},
+                effects=[effect],
+                default_effect=effect,
+                abilities_data={
+                    FighterAbilityId.pulse_cannon: AbilityData(0, math.inf)}
+            ).id,
+            state=State.active)
+        self.fit.fighters.add(item)
+        turret = self.make_turret()
+        turret.charge = self.make_charge()
+        # Action
+        item.add_target(self.tgt_fit.ship)
+        turret.target = self.tgt_fit.ship
+        # Verification
+        # Damage application of fighters is not supported, they are not taken
+        # into account
+        self.assertAlmostEqual(
+            self.tgt_fit.ship.incoming.dps.total, 18.2709)
+        # Cleanup
+        item.remove_target(self.tgt_fit.ship)
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_cached(self):
+        item = self.make_rep(
+            EffectId.ship_module_remote_armor_repairer,
+            AttrId.armor_dmg_amount, 500)
+        item.target = self.tgt_fit.ship
+        # Verification
+        self.assertIs(
+            self.tgt_fit.ship.incoming, self.tgt_fit.ship.incoming)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_cached_unrelated_move(self):
+        item = self.make_rep(
+            EffectId.ship_module_remote_armor_repairer,
+            AttrId.armor_dmg_amount, 500)
+        item.target = self.tgt_fit.ship
+        other_fit = Fit(self.fit.solar_system)
+        other_fit.ship = Ship(self.mktype().id)
+        incoming = self.tgt_fit.ship.incoming
+        # Action
+        other_fit.ship.coordinate = Coordinates(1000, 0, 0)
+        # Verification
+        self.assertIs(self.tgt_fit.ship.incoming, incoming)
+        # Action
+        self.fit.ship.coordinate = Coordinates(7000, 0, 0)
+        # Verification
+        self.assertIsNot(self.tgt_fit.ship.incoming, incoming)
+        self.assertAlmostEqual(self.tgt_fit.ship.incoming.rps.armor, 50)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
@@ -0,0 +1,214 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Coordinates
+from eos import Drone
+from eos import Fit
+from eos import Ship
+from eos import SolarSystem
+from eos.const.eve import AttrId
+from eos.solar_system.exception import ItemSolarSystemMismatchError
+from tests.integration.solar_system.testcase import SolarSystemTestCase
+
+
+class TestSolarSystemRange(SolarSystemTestCase):
+
+    def setUp(self):
+        SolarSystemTestCase.setUp(self)
+        self.mkattr(attr_id=AttrId.radius)
+        self.solar_system = SolarSystem()
+
+    def make_ship(self, x, y, z, attrs=None):
+        fit = Fit(self.solar_system)
+        ship = Ship(self.mktype(attrs=attrs).id)
+        fit.ship = ship
+        ship.coordinate = Coordinates(x, y, z)
+        return ship
+
+    def test_items_within(self):
+        ship1 = self.make_ship(0, 0, 0)
+        ship2 = self.make_ship(5000, 0, 0)
+        ship3 = self.make_ship(20000, 0, 0)
+        ship4 = self.make_ship(0, -30000, 0)
+        # Verification
+        self.assertEqual(self.solar_system.items_within(ship1, 10000), {ship2})
+        self.assertEqual(
+            self.solar_system.items_within(ship1, 25000), {ship2, ship3})
+        self.assertEqual(
+            self.solar_system.items_within(ship4, 30000), {ship1})
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_items_within_boundary(self):
+        ship1 = self.make_ship(0, 0, 0)
+        ship2 = self.make_ship(3000, 4000, 0)
+        # Verification
+        self.assertEqual(self.solar_system.items_within(ship1, 5000), {ship2})
+        self.assertEqual(self.solar_system.items_within(ship1, 4999), set())
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_items_within_cell_border(self):
+        # Items are close to each other, but are in different grid cells
+        ship1 = self.make_ship(-1, -1, -1)
+        ship2 = self.make_ship(1, 1, 1)
+        # Verification
+        self.assertEqual(self.solar_system.items_within(ship1, 4), {ship2})
+        self.assertEqual(self.solar_system.items_within(ship2, 4), {ship1})
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_items_within_huge_range(self):
+        ship1 = self.make_ship(0, 0, 0)
+        ship2 = self.make_ship(5000, 0, 0)
+        ship3 = self.make_ship(-900000, 100000, 300000)
+        ship4 = self.make_ship(1e12, 0, 0)
+        # Verification
+        self.assertEqual(
+            self.solar_system.items_within(ship1, 1e6), {ship2, ship3})
+        self.assertEqual(
+            self.solar_system.items_within(ship1, 1e13), {ship2, ship3, ship4})
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_items_within_drone(self):
+        ship = self.make_ship(0, 0, 0)
+        drone = Drone(self.mktype().id)
+        ship._fit.drones.add(drone)
+        drone.coordinate = Coordinates(0, 500, 0)
+        # Verification
+        self.assertEqual(self.solar_system.items_within(ship, 1000), {drone})
+        self.assertEqual(self.solar_system.items_within(drone, 1000), {ship})
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_items_within_moved(self):
+        ship1 = self.make_ship(0, 0, 0)
+        ship2 = self.make_ship(5000, 0, 0)
+        # Action
+        ship2.coordinate = Coordinates(50000, 0, 0)
+        # Verification
+        self.assertEqual(self.solar_system.items_within(ship1, 10000), set())
+        # Action
+        ship1.coordinate = Coordinates(45000, 0, 0)
+        # Verification
+        self.assertEqual(self.solar_system.items_within(ship1, 10000), {ship2})
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_items_within_removed(self):
+        ship1 = self.make_ship(0, 0, 0)
+        ship2 = self.make_ship(5000, 0, 0)
+        # Action
+        self.solar_system.fits.remove(ship2._fit)
+        # Verification
+        self.assertEqual(self.solar_system.items_within(ship1, 10000), set())
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_items_within_moved_outside(self):
+        ship1 = self.make_ship(0, 0, 0)
+        ship2 = self.make_ship(5000, 0, 0)
+        fit2 = ship2._fit
+        self.solar_system.fits.remove(fit2)
+        # Action
+        ship2.coordinate = Coordinates(1000, 0, 0)
+        self.solar_system.fits.add(fit2)
+        # Verification
+        self.assertEqual(self.solar_system.items_within(ship1, 2000), {ship2})
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_items_within_not_loaded(self):
+        ship1 = self.make_ship(0, 0, 0)
+        fit2 = Fit(self.solar_system)
+        fit2.ship = Ship(self.allocate_type_id())
+        # Verification
+        self.assertEqual(self.solar_system.items_within(ship1, 10000), set())
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_items_within_other_solsys(self):
+        self.make_ship(0, 0, 0)
+        fit = Fit()
+        ship = Ship(self.mktype().id)
+        fit.ship = ship
+        # Verification
+        with self.assertRaises(ItemSolarSystemMismatchError):
+            self.solar_system.items_within(ship, 10000)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_ctc_range(self):
+        ship1 = self.make_ship(0, 0, 0, attrs={AttrId.radius: 100})
+        ship2 = self.make_ship(3000, 4000, 0, attrs={AttrId.radius: 200})
+        # Verification
+        self.assertAlmostEqual(
+            self.solar_system.get_ctc_range(ship1, ship2), 5000)
+        self.assertAlmostEqual(
+            self.solar_system.get_sts_range(ship1, ship2), 4700)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_ctc_range_matrix(self):
+        ship1 = self.make_ship(0, 0, 0)
+        ship2 = self.make_ship(3000, 4000, 0)
+        ship3 = self.make_ship(0, 0, -1000)
+        # Verification
+        matrix = self.solar_system.get_ctc_range_matrix((ship1, ship2, ship3))
+        self.assertEqual(len(matrix), 3)
+        self.assertAlmostEqual(matrix[0][0], 0)
+        self.assertAlmostEqual(matrix[0][1], 5000)
+        self.assertAlmostEqual(matrix[0][2], 1000)
+        self.assertAlmostEqual(matrix[1][0], 5000)
+        self.assertAlmostEqual(matrix[1][1], 0)
+        self.assertAlmostEqual(matrix[1][2], 26000000 ** 0.5)
+        self.assertAlmostEqual(matrix[2][0], 1000)
+        self.assertAlmostEqual(matrix[2][1], 26000000 ** 0.5)
+        self.assertAlmostEqual(matrix[2][2], 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_log_entries(0)
+
+    def test_ctc_range_matrix_other_solsys(self):
+        ship1 = self.make_ship(0, 0, 0)
+        fit = Fit()
+        ship2 = Ship(self.mktype().id)
+        fit.ship = ship2
+        # Verification
+        with self.assertRaises(ItemSolarSystemMismatchError):
+            self.solar_system.get_ctc_range_matrix((ship1, ship2))
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.solar_system)
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
@@ -0,0 +1,182 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Rig
+from eos import Ship
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eos import ModAffecteeFilter
+from eos.const.eve import EffectCategoryId
+from tests.integration.source_switch.testcase import SourceSwitchTestCase
+
+
+class TestSourceSwitchDiff(SourceSwitchTestCase):
+    """Check that only items with changed types are reloaded on switch."""
+
+    def setUp(self):
+        SourceSwitchTestCase.setUp(self)
+        self.src_attr_id = self.allocate_attr_id('src1', 'src2')
+        self.tgt_attr_id = self.allocate_attr_id('src1', 'src2')
+        self.max_attr_id = self.allocate_attr_id('src1', 'src2')
+        self.modifier = self.mkmod(
+            affectee_filter=ModAffecteeFilter.domain,
+            affectee_domain=ModDomain.ship,
+            affectee_attr_id=self.tgt_attr_id,
+            operator=ModOperator.post_percent,
+            affector_attr_id=self.src_attr_id)
+        self.effect_id = self.allocate_effect_id('src1', 'src2')
+        self.ship_type_id = self.allocate_type_id('src1', 'src2')
+        self.rig_type_id = self.allocate_type_id('src1', 'src2')
+
+    def mkattrs(self, max_default1=1000, max_default2=1000):
+        for src in ('src1', 'src2'):
+            self.mkattr(src=src, attr_id=self.src_attr_id)
+            self.mkattr(
+                src=src, attr_id=self.tgt_attr_id,
+                max_attr_id=self.max_attr_id)
+        self.mkattr(
+            src='src1', attr_id=self.max_attr_id, default_value=max_default1)
+        self.mkattr(
+            src='src2', attr_id=self.max_attr_id, default_value=max_default2)
+
+    def mkship_type(self, src, src_value):
+        effect = self.mkeffect(
+            src=src,
+            effect_id=self.effect_id,
+            category_id=EffectCategoryId.passive,
+            modifiers=[self.modifier])
+        return self.mktype(
+            src=src,
+            type_id=self.ship_type_id,
+            attrs={self.src_attr_id: src_value},
+            effects=[effect])
+
+    def mkrig_type(self, src, tgt_value):
+        return self.mktype(
+            src=src,
+            type_id=self.rig_type_id,
+            attrs={self.tgt_attr_id: tgt_value})
+
+    def test_unchanged(self):
+        self.mkattrs()
+        ship_type = self.mkship_type('src1', 10)
+        self.mkship_type('src2', 10)
+        rig_type = self.mkrig_type('src1', 50)
+        self.mkrig_type('src2', 50)
+        ship = Ship(self.ship_type_id)
+        rig = Rig(self.rig_type_id)
+        self.fit.ship = ship
+        self.fit.rigs.add(rig)
+        self.assertAlmostEqual(rig.attrs[self.tgt_attr_id], 55)
+        # Action
+        self.fit.solar_system.source = 'src2'
+        # Verification
+        self.assertIs(ship._type, ship_type)
+        self.assertIs(rig._type, rig_type)
+        self.assertAlmostEqual(rig.attrs[self.tgt_attr_id], 55)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_changed_affector(self):
+        self.mkattrs()
+        ship_type = self.mkship_type('src1', 10)
+        self.mkship_type('src2', 20)
+        rig_type = self.mkrig_type('src1', 50)
+        self.mkrig_type('src2', 50)
+        ship = Ship(self.ship_type_id)
+        rig = Rig(self.rig_type_id)
+        self.fit.ship = ship
+        self.fit.rigs.add(rig)
+        self.assertAlmostEqual(rig.attrs[self.tgt_attr_id], 55)
+        # Action
+        self.fit.solar_system.source = 'src2'
+        # Verification
+        self.assertIsNot(ship._type, ship_type)
+        self.assertIs(rig._type, rig_type)
+        self.assertAlmostEqual(rig.attrs[self.tgt_attr_id], 60)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_changed_affectee(self):
+        self.mkattrs()
+        ship_type = self.mkship_type('src1', 10)
+        self.mkship_type('src2', 10)
+        rig_type = self.mkrig_type('src1', 50)
+        self.mkrig_type('src2', 100)
+        ship = Ship(self.ship_type_id)
+        rig = Rig(self.rig_type_id)
+        self.fit.ship = ship
+        self.fit.rigs.add(rig)
+        self.assertAlmostEqual(rig.attrs[self.tgt_attr_id], 55)
+        # Action
+        self.fit.solar_system.source = 'src2'
+        # Verification
+        self.assertIs(ship._type, ship_type)
+        self.assertIsNot(rig._type, rig_type)
+        self.assertAlmostEqual(rig.attrs[self.tgt_attr_id], 110)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_changed_attr_metadata(self):
+        # Types are the same, but cap of the attribute is defined differently
+        self.mkattrs(max_default1=54, max_default2=57)
+        self.mkship_type('src1', 10)
+        self.mkship_type('src2', 10)
+        rig_type = self.mkrig_type('src1', 50)
+        self.mkrig_type('src2', 50)
+        ship = Ship(self.ship_type_id)
+        rig = Rig(self.rig_type_id)
+        self.fit.ship = ship
+        self.fit.rigs.add(rig)
+        self.assertAlmostEqual(rig.attrs[self.tgt_attr_id], 54)
+        # Action
+        self.fit.solar_system.source = 'src2'
+        # Verification
+        self.assertIs(rig._type, rig_type)
+        self.assertAlmostEqual(rig.attrs[self.tgt_attr_id], 55)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_missing_type(self):
+        self.mkattrs()
+        self.mkship_type('src1', 10)
+        self.mkship_type('src2', 10)
+        self.mkrig_type('src1', 50)
+        ship = Ship(self.ship_type_id)
+        rig = Rig(self.rig_type_id)
+        self.fit.ship = ship
+        self.fit.rigs.add(rig)
+        self.assertAlmostEqual(rig.attrs[self.tgt_attr_id], 55)
+        # Action
+        self.fit.solar_system.source = 'src2'
+        # Verification
+        self.assertFalse(rig._is_loaded)
+        # Action
+        self.fit.solar_system.source = 'src1'
+        # Verification
+        self.assertAlmostEqual(rig.attrs[self.tgt_attr_id], 55)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
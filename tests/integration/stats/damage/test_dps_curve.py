@@ -0,0 +1,258 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import math
+
+from eos import Charge
+from eos import FighterSquad
+from eos import ModuleHigh
+from eos import ResistProfile
+from eos import State
+from eos import TgtData
+from eos.const.eve import AttrId
+from eos.const.eve import EffectCategoryId
+from eos.const.eve import EffectId
+from eos.const.eve import FighterAbilityId
+from eos.eve_obj.type import AbilityData
+from tests.integration.stats.testcase import StatsTestCase
+
+
+class TestStatsDmgDpsCurve(StatsTestCase):
+
+    def setUp(self):
+        StatsTestCase.setUp(self)
+        self.mkattr(attr_id=AttrId.em_dmg)
+        self.mkattr(attr_id=AttrId.therm_dmg)
+        self.mkattr(attr_id=AttrId.kin_dmg)
+        self.mkattr(attr_id=AttrId.expl_dmg)
+        self.mkattr(attr_id=AttrId.dmg_mult)
+        self.mkattr(attr_id=AttrId.module_reactivation_delay, default_value=0)
+        self.mkattr(attr_id=AttrId.volume)
+        self.mkattr(attr_id=AttrId.capacity)
+        self.mkattr(attr_id=AttrId.reload_time)
+        self.mkattr(attr_id=AttrId.charge_rate)
+        self.mkattr(attr_id=AttrId.max_range)
+        self.mkattr(attr_id=AttrId.falloff)
+        self.mkattr(attr_id=AttrId.tracking_speed)
+        self.cycle_attr = self.mkattr()
+        self.dd_effect = self.mkeffect(
+            effect_id=EffectId.projectile_fired,
+            category_id=EffectCategoryId.target,
+            duration_attr_id=self.cycle_attr.id,
+            range_attr_id=AttrId.max_range,
+            falloff_attr_id=AttrId.falloff,
+            tracking_speed_attr_id=AttrId.tracking_speed)
+
+    def make_turret(self, group_id, optimal, falloff, cycle_time):
+        item = ModuleHigh(
+            self.mktype(
+                group_id=group_id,
+                attrs={
+                    AttrId.dmg_mult: 2,
+                    AttrId.capacity: 1,
+                    AttrId.charge_rate: 1,
+                    AttrId.max_range: optimal,
+                    AttrId.falloff: falloff,
+                    AttrId.tracking_speed: 0.05,
+                    self.cycle_attr.id: cycle_time,
+                    AttrId.reload_time: 2000},
+                effects=[self.dd_effect],
+                default_effect=self.dd_effect).id,
+            state=State.active)
+        item.charge = Charge(self.mktype(attrs={
+            AttrId.em_dmg: 1.2,
+            AttrId.therm_dmg: 2.4,
+            AttrId.kin_dmg: 4.8,
+            AttrId.expl_dmg: 9.6,
+            AttrId.volume: 1}).id)
+        return item
+
+    def make_smartbomb(self):
+        effect = self.mkeffect(
+            effect_id=EffectId.emp_wave,
+            category_id=EffectCategoryId.active,
+            duration_attr_id=self.cycle_attr.id)
+        return ModuleHigh(
+            self.mktype(
+                attrs={
+                    AttrId.em_dmg: 50,
+                    self.cycle_attr.id: 5000},
+                effects=[effect],
+                default_effect=effect).id,
+            state=State.active)
+
+    def make_fighter(self):
+        self.mkattr(attr_id=AttrId.fighter_ability_attack_missile_dmg_mult)
+        self.mkattr(attr_id=AttrId.fighter_ability_attack_missile_dmg_em)
+        self.mkattr(attr_id=AttrId.fighter_squadron_max_size)
+        effect = self.mkeffect(
+            effect_id=EffectId.fighter_ability_attack_m,
+            category_id=EffectCategoryId.target,
+            duration_attr_id=self.cycle_attr.id)
+        return FighterSquad(
+            self.mktype(
+                attrs={
+                    AttrId.fighter_ability_attack_missile_dmg_mult: 2,
+                    AttrId.fighter_ability_attack_missile_dmg_em: 50,
+                    AttrId.fighter_squadron_max_size: 9,
+                    self.cycle_attr.id: 4000},
+                effects=[effect],
+                default_effect=effect,
+                abilities_data={
+                    FighterAbilityId.pulse_cannon: AbilityData(0, math.inf)}
+            ).id,
+            state=State.active)
+
+    def test_empty(self):
+        # Action
+        curve = self.fit.stats.get_dps_curve((0, 1000))
+        # Verification
+        self.assertEqual(curve.ranges, (0, 1000))
+        self.assertEqual(curve.em, (0, 0))
+        self.assertEqual(curve.thermal, (0, 0))
+        self.assertEqual(curve.kinetic, (0, 0))
+        self.assertEqual(curve.explosive, (0, 0))
+        self.assertEqual(curve.total, (0, 0))
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_single(self):
+        self.fit.modules.high.append(
+            self.make_turret(None, 10000, 5000, 2000))
+        # Action
+        curve = self.fit.stats.get_dps_curve([0, 15000])
+        # Verification
+        self.assertEqual(curve.ranges, (0, 15000))
+        self.assertEqual(len(curve.em), 2)
+        self.assertAlmostEqual(curve.em[0], 1.2 * 1.01505)
+        self.assertAlmostEqual(curve.thermal[0], 2.4 * 1.01505)
+        self.assertAlmostEqual(curve.kinetic[0], 4.8 * 1.01505)
+        self.assertAlmostEqual(curve.explosive[0], 9.6 * 1.01505)
+        self.assertAlmostEqual(curve.total[0], 18 * 1.01505)
+        self.assertAlmostEqual(curve.em[1], 1.2 * 0.39505)
+        self.assertAlmostEqual(curve.thermal[1], 2.4 * 0.39505)
+        self.assertAlmostEqual(curve.kinetic[1], 4.8 * 0.39505)
+        self.assertAlmostEqual(curve.explosive[1], 9.6 * 0.39505)
+        self.assertAlmostEqual(curve.total[1], 18 * 0.39505)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_multiple(self):
+        self.fit.modules.high.append(
+            self.make_turret(None, 10000, 5000, 2000))
+        self.fit.modules.high.append(
+            self.make_turret(None, 1000, 1000, 4000))
+        # Action
+        curve = self.fit.stats.get_dps_curve((0, 2000, 15000))
+        # Verification
+        self.assertAlmostEqual(curve.total[0], 27 * 1.01505)
+        self.assertAlmostEqual(curve.total[1], 18 * 1.01505 + 9 * 0.39505)
+        self.assertAlmostEqual(curve.total[2], 18 * 0.39505)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_unapplied_dealers(self):
+        # Damage application of smartbombs and fighters is not supported, they
+        # should not be taken into account
+        self.fit.modules.high.append(
+            self.make_turret(None, 10000, 5000, 2000))
+        self.fit.modules.high.append(self.make_smartbomb())
+        self.fit.fighters.add(self.make_fighter())
+        # Action
+        curve = self.fit.stats.get_dps_curve([0, 1000])
+        # Verification
+        self.assertAlmostEqual(curve.em[0], 1.2 * 1.01505)
+        self.assertAlmostEqual(curve.total[0], 18 * 1.01505)
+        self.assertAlmostEqual(curve.total[1], 18 * 1.01505)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_arguments_target(self):
+        self.fit.modules.high.append(
+            self.make_turret(None, 10000, 5000, 2000))
+        # Action
+        # Range of target data should be ignored
+        curve = self.fit.stats.get_dps_curve(
+            (0, 15000), target=TgtData(range=50000, angular_speed=0.05))
+        # Verification
+        self.assertAlmostEqual(curve.total[0], 18 * 0.39505)
+        self.assertAlmostEqual(curve.total[1], 18 * 0.1788)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_arguments_custom_filter(self):
+        self.fit.modules.high.append(
+            self.make_turret(None, 10000, 5000, 2000))
+        self.fit.modules.high.append(
+            self.make_turret(55, 1000, 1000, 4000))
+        # Action
+        curve = self.fit.stats.get_dps_curve(
+            (0, 2000), item_filter=lambda i: i._type.group_id == 55)
+        # Verification
+        self.assertAlmostEqual(curve.total[0], 9 * 1.01505)
+        self.assertAlmostEqual(curve.total[1], 9 * 0.39505)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_arguments_custom_reload(self):
+        self.fit.modules.high.append(
+            self.make_turret(None, 10000, 5000, 3000))
+        # Action
+        curve = self.fit.stats.get_dps_curve((0,), reload=True)
+        # Verification
+        self.assertAlmostEqual(curve.total[0], 7.2 * 1.01505)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_arguments_custom_profile(self):
+        self.fit.modules.high.append(
+            self.make_turret(None, 10000, 5000, 2000))
+        # Action
+        curve = self.fit.stats.get_dps_curve(
+            (0,), tgt_resists=ResistProfile(0, 1, 1, 1))
+        # Verification
+        self.assertAlmostEqual(curve.em[0], 1.2 * 1.01505)
+        self.assertAlmostEqual(curve.thermal[0], 0)
+        self.assertAlmostEqual(curve.kinetic[0], 0)
+        self.assertAlmostEqual(curve.explosive[0], 0)
+        self.assertAlmostEqual(curve.total[0], 1.2 * 1.01505)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_no_ranges(self):
+        self.fit.modules.high.append(
+            self.make_turret(None, 10000, 5000, 2000))
+        # Action
+        curve = self.fit.stats.get_dps_curve(())
+        # Verification
+        self.assertEqual(curve.ranges, ())
+        self.assertEqual(curve.total, ())
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
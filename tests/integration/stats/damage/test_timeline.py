@@ -0,0 +1,300 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Charge
+from eos import FighterSquad
+from eos import ModuleHigh
+from eos import ResistProfile
+from eos import State
+from eos import TgtData
+from eos.const.eve import AttrId
+from eos.const.eve import EffectCategoryId
+from eos.const.eve import EffectId
+from eos.const.eve import FighterAbilityId
+from eos.eve_obj.type import AbilityData
+from tests.integration.stats.testcase import StatsTestCase
+
+
+class TestStatsDmgTimeline(StatsTestCase):
+
+    def setUp(self):
+        StatsTestCase.setUp(self)
+        self.mkattr(attr_id=AttrId.em_dmg)
+        self.mkattr(attr_id=AttrId.therm_dmg)
+        self.mkattr(attr_id=AttrId.kin_dmg)
+        self.mkattr(attr_id=AttrId.expl_dmg)
+        self.mkattr(attr_id=AttrId.dmg_mult)
+        self.mkattr(attr_id=AttrId.module_reactivation_delay, default_value=0)
+        self.mkattr(attr_id=AttrId.volume)
+        self.mkattr(attr_id=AttrId.capacity)
+        self.mkattr(attr_id=AttrId.reload_time)
+        self.mkattr(attr_id=AttrId.charge_rate)
+        self.mkattr(attr_id=AttrId.max_range)
+        self.mkattr(attr_id=AttrId.falloff)
+        self.cycle_attr = self.mkattr()
+        self.dd_effect = self.mkeffect(
+            effect_id=EffectId.projectile_fired,
+            category_id=EffectCategoryId.target,
+            duration_attr_id=self.cycle_attr.id,
+            range_attr_id=AttrId.max_range,
+            falloff_attr_id=AttrId.falloff)
+
+    def make_turret(self, attrs=None, group_id=None):
+        base_attrs = {
+            AttrId.dmg_mult: 2,
+            AttrId.capacity: 2,
+            AttrId.charge_rate: 1,
+            AttrId.max_range: 10000,
+            AttrId.falloff: 5000,
+            self.cycle_attr.id: 2000,
+            AttrId.reload_time: 10000}
+        if attrs is not None:
+            base_attrs.update(attrs)
+        item = ModuleHigh(
+            self.mktype(
+                group_id=group_id,
+                attrs=base_attrs,
+                effects=[self.dd_effect],
+                default_effect=self.dd_effect).id,
+            state=State.active)
+        item.charge = Charge(self.mktype(attrs={
+            AttrId.em_dmg: 1.2,
+            AttrId.therm_dmg: 2.4,
+            AttrId.kin_dmg: 4.8,
+            AttrId.expl_dmg: 9.6,
+            AttrId.volume: 1}).id)
+        return item
+
+    def test_empty(self):
+        # Action
+        timeline = self.fit.stats.get_dmg_timeline((0, 10))
+        # Verification
+        self.assertEqual(timeline.times, (0, 10))
+        self.assertEqual(timeline.em, (0, 0))
+        self.assertEqual(timeline.thermal, (0, 0))
+        self.assertEqual(timeline.kinetic, (0, 0))
+        self.assertEqual(timeline.explosive, (0, 0))
+        self.assertEqual(timeline.total, (0, 0))
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_reload(self):
+        self.fit.modules.high.append(self.make_turret())
+        # Action
+        # Turret fires at 0 and 2, reloads, and then fires at 14, 16, 28, 30
+        timeline = self.fit.stats.get_dmg_timeline(
+            (0, 1, 2, 13.9, 14, 28, 30))
+        # Verification
+        self.assertEqual(timeline.times, (0, 1, 2, 13.9, 14, 28, 30))
+        self.assertAlmostEqual(timeline.em[0], 2.4)
+        self.assertAlmostEqual(timeline.thermal[0], 4.8)
+        self.assertAlmostEqual(timeline.kinetic[0], 9.6)
+        self.assertAlmostEqual(timeline.explosive[0], 19.2)
+        self.assertAlmostEqual(timeline.total[0], 36)
+        self.assertAlmostEqual(timeline.total[1], 36)
+        self.assertAlmostEqual(timeline.total[2], 72)
+        self.assertAlmostEqual(timeline.total[3], 72)
+        self.assertAlmostEqual(timeline.total[4], 108)
+        self.assertAlmostEqual(timeline.total[5], 180)
+        self.assertAlmostEqual(timeline.total[6], 216)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_reactivation_delay(self):
+        self.fit.modules.high.append(self.make_turret({
+            AttrId.capacity: 3,
+            AttrId.module_reactivation_delay: 1000}))
+        # Action
+        # Shots at 0, 3, 6, then reload, and shots at 18, 21
+        timeline = self.fit.stats.get_dmg_timeline((0, 3, 6, 17, 18, 21))
+        # Verification
+        self.assertAlmostEqual(timeline.total[0], 36)
+        self.assertAlmostEqual(timeline.total[1], 72)
+        self.assertAlmostEqual(timeline.total[2], 108)
+        self.assertAlmostEqual(timeline.total[3], 108)
+        self.assertAlmostEqual(timeline.total[4], 144)
+        self.assertAlmostEqual(timeline.total[5], 180)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_multiple(self):
+        self.fit.modules.high.append(self.make_turret())
+        self.fit.modules.high.append(self.make_turret({
+            self.cycle_attr.id: 5000}))
+        # Action
+        timeline = self.fit.stats.get_dmg_timeline((0, 4, 5, 100))
+        # Verification
+        # Second turret fires at 0 and 5, then reloads and fires at 20, 25,
+        # 40, 45, 60, 65, 80, 85, 100; first turret fires at 0, 2, 14, 16,
+        # 28, 30, 42, 44, 56, 58, 70, 72, 84, 86, 98, 100
+        self.assertAlmostEqual(timeline.total[0], 72)
+        self.assertAlmostEqual(timeline.total[1], 108)
+        self.assertAlmostEqual(timeline.total[2], 144)
+        self.assertAlmostEqual(timeline.total[3], 36 * 27)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_fighter_cooldown(self):
+        self.mkattr(attr_id=AttrId.fighter_ability_missiles_dmg_mult)
+        self.mkattr(attr_id=AttrId.fighter_ability_missiles_dmg_em)
+        self.mkattr(attr_id=AttrId.fighter_squadron_max_size)
+        effect = self.mkeffect(
+            effect_id=EffectId.fighter_ability_missiles,
+            category_id=EffectCategoryId.target,
+            duration_attr_id=self.cycle_attr.id)
+        item = FighterSquad(
+            self.mktype(
+                attrs={
+                    AttrId.fighter_ability_missiles_dmg_mult: 1,
+                    AttrId.fighter_ability_missiles_dmg_em: 10,
+                    AttrId.fighter_squadron_max_size: 3,
+                    self.cycle_attr.id: 4000},
+                effects=[effect],
+                default_effect=effect,
+                abilities_data={
+                    FighterAbilityId.heavy_rocket_salvo_em: AbilityData(
+                        10, 2)}).id,
+            state=State.active)
+        self.fit.fighters.add(item)
+        # Action
+        # Fighters fire at 0 and 10 and then run out of charges
+        timeline = self.fit.stats.get_dmg_timeline((9, 10, 1000))
+        # Verification
+        self.assertAlmostEqual(timeline.em[0], 30)
+        self.assertAlmostEqual(timeline.em[1], 60)
+        self.assertAlmostEqual(timeline.em[2], 60)
+        self.assertAlmostEqual(timeline.total[2], 60)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_times_unordered(self):
+        self.fit.modules.high.append(self.make_turret())
+        # Action
+        timeline = self.fit.stats.get_dmg_timeline((14, 0, 2, 0))
+        # Verification
+        self.assertEqual(timeline.times, (14, 0, 2, 0))
+        self.assertAlmostEqual(timeline.total[0], 108)
+        self.assertAlmostEqual(timeline.total[1], 36)
+        self.assertAlmostEqual(timeline.total[2], 72)
+        self.assertAlmostEqual(timeline.total[3], 36)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_arguments_target(self):
+        self.fit.modules.high.append(self.make_turret())
+        # Action
+        timeline = self.fit.stats.get_dmg_timeline(
+            (2,), target=TgtData(range=15000))
+        # Verification
+        self.assertAlmostEqual(timeline.total[0], 72 * 0.39505)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_arguments_target_unapplied_dealers(self):
+        self.fit.modules.high.append(self.make_turret())
+        smartbomb_effect = self.mkeffect(
+            effect_id=EffectId.emp_wave,
+            category_id=EffectCategoryId.active,
+            duration_attr_id=self.cycle_attr.id)
+        self.fit.modules.high.append(ModuleHigh(
+            self.mktype(
+                attrs={AttrId.em_dmg: 50, self.cycle_attr.id: 5000},
+                effects=[smartbomb_effect],
+                default_effect=smartbomb_effect).id,
+            state=State.active))
+        self.mkattr(attr_id=AttrId.fighter_ability_missiles_dmg_mult)
+        self.mkattr(attr_id=AttrId.fighter_ability_missiles_dmg_em)
+        self.mkattr(attr_id=AttrId.fighter_squadron_max_size)
+        fighter_effect = self.mkeffect(
+            effect_id=EffectId.fighter_ability_missiles,
+            category_id=EffectCategoryId.target,
+            duration_attr_id=self.cycle_attr.id)
+        self.fit.fighters.add(FighterSquad(
+            self.mktype(
+                attrs={
+                    AttrId.fighter_ability_missiles_dmg_mult: 1,
+                    AttrId.fighter_ability_missiles_dmg_em: 10,
+                    AttrId.fighter_squadron_max_size: 3,
+                    self.cycle_attr.id: 4000},
+                effects=[fighter_effect],
+                default_effect=fighter_effect,
+                abilities_data={
+                    FighterAbilityId.heavy_rocket_salvo_em: AbilityData(
+                        10, 2)}).id,
+            state=State.active))
+        # Action
+        timeline = self.fit.stats.get_dmg_timeline((2,))
+        applied_timeline = self.fit.stats.get_dmg_timeline(
+            (2,), target=TgtData(range=15000))
+        # Verification
+        self.assertAlmostEqual(timeline.total[0], 72 + 50 + 30)
+        # Damage application of smartbombs and fighters is not supported, they
+        # are not taken into account when target is specified
+        self.assertAlmostEqual(applied_timeline.total[0], 72 * 0.39505)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_arguments_custom_filter(self):
+        self.fit.modules.high.append(self.make_turret())
+        self.fit.modules.high.append(self.make_turret(
+            {self.cycle_attr.id: 5000}, group_id=55))
+        # Action
+        timeline = self.fit.stats.get_dmg_timeline(
+            (4,), item_filter=lambda i: i._type.group_id == 55)
+        # Verification
+        self.assertAlmostEqual(timeline.total[0], 36)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_arguments_custom_profile(self):
+        self.fit.modules.high.append(self.make_turret())
+        # Action
+        timeline = self.fit.stats.get_dmg_timeline(
+            (2,), tgt_resists=ResistProfile(0, 1, 1, 1))
+        # Verification
+        self.assertAlmostEqual(timeline.em[0], 4.8)
+        self.assertAlmostEqual(timeline.thermal[0], 0)
+        self.assertAlmostEqual(timeline.kinetic[0], 0)
+        self.assertAlmostEqual(timeline.explosive[0], 0)
+        self.assertAlmostEqual(timeline.total[0], 4.8)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_no_times(self):
+        self.fit.modules.high.append(self.make_turret())
+        # Action
+        timeline = self.fit.stats.get_dmg_timeline(())
+        # Verification
+        self.assertEqual(timeline.times, ())
+        self.assertEqual(timeline.total, ())
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
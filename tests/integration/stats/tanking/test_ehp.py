@@ -98,3 +98,52 @@ class TestEhp(StatsTestCase):
         # Cleanup
         self.assert_solsys_buffers_empty(self.fit.solar_system)
         self.assert_log_entries(0)
+
+    def test_relay_batch(self):
+        self.fit.ship = Ship(self.mktype(attrs={
+            AttrId.hp: 10,
+            AttrId.em_dmg_resonance: 0.5,
+            AttrId.therm_dmg_resonance: 0.5,
+            AttrId.kin_dmg_resonance: 0.5,
+            AttrId.expl_dmg_resonance: 0.5,
+            AttrId.armor_hp: 15,
+            AttrId.armor_em_dmg_resonance: 0.5,
+            AttrId.armor_therm_dmg_resonance: 0.5,
+            AttrId.armor_kin_dmg_resonance: 0.5,
+            AttrId.armor_expl_dmg_resonance: 0.5,
+            AttrId.shield_capacity: 20,
+            AttrId.shield_em_dmg_resonance: 1,
+            AttrId.shield_therm_dmg_resonance: 0.5,
+            AttrId.shield_kin_dmg_resonance: 0.5,
+            AttrId.shield_expl_dmg_resonance: 0.5}).id)
+        # Action
+        ehp_stats = self.fit.stats.get_ehp_batch((
+            DmgProfile(1, 1, 1, 1), DmgProfile(0, 1, 0, 0)))
+        # Verification
+        self.assertEqual(len(ehp_stats), 2)
+        self.assertAlmostEqual(ehp_stats[0].hull, 20)
+        self.assertAlmostEqual(ehp_stats[0].armor, 30)
+        self.assertAlmostEqual(ehp_stats[0].shield, 32)
+        self.assertAlmostEqual(ehp_stats[0].total, 82)
+        self.assertAlmostEqual(ehp_stats[1].hull, 20)
+        self.assertAlmostEqual(ehp_stats[1].armor, 30)
+        self.assertAlmostEqual(ehp_stats[1].shield, 40)
+        self.assertAlmostEqual(ehp_stats[1].total, 90)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_ship_absent_batch(self):
+        # Action
+        ehp_stats = self.fit.stats.get_ehp_batch((
+            DmgProfile(1, 1, 1, 1), DmgProfile(0, 1, 0, 0)))
+        # Verification
+        self.assertEqual(len(ehp_stats), 2)
+        for ehp_stat in ehp_stats:
+            self.assertAlmostEqual(ehp_stat.hull, 0)
+            self.assertAlmostEqual(ehp_stat.armor, 0)
+            self.assertAlmostEqual(ehp_stat.shield, 0)
+            self.assertAlmostEqual(ehp_stat.total, 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
@@ -262,6 +262,8 @@ class IntegrationTestCase(EosTestCase):
             ignore_attrs=(
                 # Disallow to investigate parent
                 ('Fit', 'solar_system'),
+                # Disallow to investigate fleet, it is parent-like object
+                ('Fit', '_fleet'),
                 # Allowed to always reside on fit
                 ('Fit', '_Fit__incoming_dmg_default'),
                 # Allowed to always reside on fit
@@ -269,7 +271,13 @@ class IntegrationTestCase(EosTestCase):
                 # Restriction registers are always in subscribers
                 ('Fit', '_FitMsgBroker__subscribers'),
                 # Service is allowed to keep list of restrictions permanently
-                ('RestrictionService', '_RestrictionService__restrictions')))
+                ('RestrictionService', '_RestrictionService__restrictions'),
+                # Service is allowed to keep track of restrictions to revalidate
+                ('RestrictionService',
+                 '_RestrictionService__dirty_restrictions'),
+                ('RestrictionService',
+                 '_RestrictionService__msg_type_restrictions'),
+                ('RestrictionService', '_RestrictionService__timings')))
         # Report
         if entry_num:
             msg = '{} entries in fit buffers: buffers must be empty'.format(
@@ -0,0 +1,84 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import subprocess
+import sys
+
+
+def run_code(code):
+    return subprocess.check_output((sys.executable, '-c', code)).decode()
+
+
+def test_import_lazy():
+    output = run_code(
+        'import sys, eos; '
+        'print(sorted(m for m in sys.modules if m.startswith("eos.")))')
+    assert output.strip() == '[]'
+
+
+def test_attr_access():
+    output = run_code('import eos; print(eos.Fit.__module__)')
+    assert output.strip() == 'eos.fit'
+
+
+def test_attr_unknown():
+    output = run_code(
+        'import eos\n'
+        'try:\n'
+        '    eos.Nonexistent\n'
+        'except AttributeError:\n'
+        '    print("error")')
+    assert output.strip() == 'error'
+
+
+def test_customizations_deferred():
+    output = run_code(
+        'import sys, eos; eos.Fit; '
+        'print("eos.eve_obj.custom.propulsion_modules" in sys.modules); '
+        'from eos.eve_obj.effect import EffectFactory; '
+        'EffectFactory.make(1); '
+        'print("eos.eve_obj.custom.propulsion_modules" in sys.modules)')
+    assert output.split() == ['False', 'True']
+
+
+def test_import_eager_on_old_python():
+    output = run_code(
+        'import sys; sys.version_info = (3, 6, 0); '
+        'import eos; '
+        'print(all(name in vars(eos) for name in eos.__all__)); '
+        'print("eos.fit" in sys.modules)')
+    assert output.split() == ['True', 'True']
+
+
+def test_customizations_retried_on_failure():
+    output = run_code(
+        'import sys\n'
+        'from eos.eve_obj.registry import CustomizationRegistry\n'
+        'module_name = "eos.eve_obj.custom.propulsion_modules"\n'
+        'sys.modules[module_name] = None\n'
+        'try:\n'
+        '    CustomizationRegistry.load()\n'
+        'except ImportError:\n'
+        '    print("error")\n'
+        'del sys.modules[module_name]\n'
+        'CustomizationRegistry.load()\n'
+        'print(module_name in sys.modules)')
+    assert output.split() == ['error', 'True']
@@ -0,0 +1,271 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import pickle
+import weakref
+
+import pytest
+
+from eos.const.eos import ModAffecteeFilter
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eos import State
+from eos.const.eve import AttrId
+from eos.const.eve import EffectCategoryId
+from eos.const.eve import EffectId
+from eos.eve_obj.attribute import Attribute
+from eos.eve_obj.effect import Effect
+from eos.eve_obj.effect import EffectFactory
+from eos.eve_obj.modifier import DogmaModifier
+from eos.eve_obj.type import Type
+from eos.pubsub.message import AttrsValueChanged
+from eos.pubsub.message import EffectApplied
+from eos.pubsub.message import ItemLoaded
+from eos.pubsub.message import StatesActivated
+from eos.stats_container import Coordinates
+from eos.stats_container import DmgProfile
+from eos.stats_container import DmgStats
+from eos.stats_container import ItemHP
+from eos.stats_container import Orientation
+from eos.stats_container import ResistProfile
+from eos.stats_container import TankingLayers
+from eos.stats_container import TgtData
+from eos.util.cached_property import cached_property
+
+
+def make_modifier():
+    return DogmaModifier(
+        affectee_filter=ModAffecteeFilter.item,
+        affectee_domain=ModDomain.ship,
+        affectee_attr_id=1,
+        operator=ModOperator.post_percent,
+        affector_attr_id=2)
+
+
+def make_effect():
+    return Effect(
+        effect_id=100,
+        category_id=EffectCategoryId.passive,
+        modifiers=(make_modifier(),))
+
+
+def make_type():
+    return Type(
+        type_id=1000,
+        group_id=10,
+        category_id=7,
+        attrs={
+            AttrId.required_skill_1: 3300,
+            AttrId.required_skill_1_level: 2},
+        effects=(make_effect(),))
+
+
+SLOTTED_OBJECT_FACTORIES = (
+    make_type,
+    make_effect,
+    make_modifier,
+    lambda: Attribute(attr_id=1),
+    lambda: EffectFactory.make(EffectId.ship_module_remote_hull_repairer),
+    lambda: ItemLoaded(None),
+    lambda: StatesActivated(None, {State.online}),
+    lambda: EffectApplied(None, 100, ()),
+    lambda: AttrsValueChanged({}),
+    lambda: DmgStats(1, 2, 3, 4),
+    lambda: DmgProfile(1, 2, 3, 4),
+    lambda: ResistProfile(0.1, 0.2, 0.3, 0.4),
+    lambda: ItemHP(1, 2, 3),
+    lambda: TankingLayers(1, 2, 3),
+    lambda: Coordinates(1, 2, 3),
+    lambda: Orientation(1, 2, 3),
+    lambda: TgtData(range=1))
+
+
+@pytest.mark.parametrize('factory', SLOTTED_OBJECT_FACTORIES)
+def test_no_instance_dict(factory):
+    obj = factory()
+
+    assert not hasattr(obj, '__dict__')
+
+
+@pytest.mark.parametrize('factory', (
+    make_type, make_effect, lambda: Attribute(attr_id=1)))
+def test_shareable_eve_objects_weakref(factory):
+    obj = factory()
+
+    assert weakref.ref(obj)() is obj
+
+
+def test_type_attributes():
+    item_type = make_type()
+
+    assert item_type.id == 1000
+    assert item_type.group_id == 10
+    assert item_type.category_id == 7
+    assert item_type.attrs[AttrId.required_skill_1] == 3300
+    assert list(item_type.effects) == [100]
+    assert item_type.default_effect is None
+    assert item_type.abilities_data == {}
+
+
+def test_type_cached_properties():
+    item_type = make_type()
+
+    required_skills = item_type.required_skills
+    fingerprint = item_type._fingerprint
+
+    assert required_skills == {3300: 2}
+    assert item_type.required_skills is required_skills
+    assert item_type.max_state == State.offline
+    assert item_type.effects_data == {}
+    assert item_type._fingerprint is fingerprint
+    assert fingerprint == make_type()._fingerprint
+
+
+def test_effect_cached_properties():
+    effect = make_effect()
+
+    local_modifiers = effect.local_modifiers
+
+    assert local_modifiers == effect.modifiers
+    assert effect.local_modifiers is local_modifiers
+    assert effect.projected_modifiers == ()
+    assert effect._state == State.offline
+    assert effect._fingerprint == make_effect()._fingerprint
+
+
+def test_customized_effect_mutable_until_shared():
+    # Customizations modify effects after they are created
+    effect = make_effect()
+    effect.category_id = EffectCategoryId.online
+    effect.modifiers = ()
+
+    assert effect._state == State.online
+    assert effect.local_modifiers == ()
+
+
+def test_modifier_attributes():
+    modifier = make_modifier()
+
+    assert modifier.affectee_filter == ModAffecteeFilter.item
+    assert modifier.affectee_domain == ModDomain.ship
+    assert modifier.affectee_filter_extra_arg is None
+    assert modifier.affectee_attr_id == 1
+    assert modifier.operator == ModOperator.post_percent
+    assert modifier.affector_attr_id == 2
+    assert modifier._fingerprint == make_modifier()._fingerprint
+
+
+def test_message_fit_assignable():
+    msg = ItemLoaded(None)
+    msg.fit = 'fit'
+
+    assert msg.fit == 'fit'
+    assert repr(msg) == '<ItemLoaded(fit=fit, item=None)>'
+
+
+@pytest.mark.parametrize('factory, attr_name', (
+    (lambda: DmgStats(1, 2, 3, 4), 'em'),
+    (lambda: DmgStats(1, 2, 3, 4), 'total'),
+    (lambda: ItemHP(1, 2, 3), 'total'),
+    (lambda: Coordinates(1, 2, 3), 'x'),
+    (lambda: TgtData(range=1), 'range')))
+def test_stats_container_immutable(factory, attr_name):
+    container = factory()
+
+    with pytest.raises(AttributeError):
+        setattr(container, attr_name, 5)
+    with pytest.raises(AttributeError):
+        container.extra = 5
+
+
+def test_dmg_stats_equivalence():
+    dmg_stats = DmgStats(1, 2, 3, 4, mult=2)
+
+    assert dmg_stats.total == 20
+    assert tuple(dmg_stats) == (2, 4, 6, 8, 20)
+    assert dmg_stats == DmgStats(2, 4, 6, 8)
+    assert hash(dmg_stats) == hash(DmgStats(2, 4, 6, 8))
+    assert repr(dmg_stats) == (
+        '<DmgStats(em=2, thermal=4, kinetic=6, explosive=8, total=20)>')
+
+
+def test_item_hp_equivalence():
+    item_hp = ItemHP(1, 2, 3)
+
+    assert item_hp.total == 6
+    assert tuple(item_hp) == (1, 2, 3, 6)
+    assert item_hp == TankingLayers(1, 2, 3)
+
+
+@pytest.mark.parametrize('container', (
+    DmgStats(1, 2, 3, 4),
+    ItemHP(1, 2, 3),
+    Orientation(1, 2, 3),
+    TgtData(range=1, velocity=2)))
+def test_stats_container_pickle(container):
+    restored = pickle.loads(pickle.dumps(container))
+
+    assert restored == container
+    assert tuple(restored) == tuple(container)
+
+
+def test_cached_property_instance_dict():
+    class Container:
+
+        def __init__(self):
+            self.calls = 0
+
+        @cached_property
+        def value(self):
+            self.calls += 1
+            return self.calls
+
+    container = Container()
+
+    assert container.value == 1
+    assert container.value == 1
+    assert vars(container)['value'] == 1
+    # Cache is cleared by deleting attribute
+    del container.value
+    assert container.value == 2
+
+
+def test_cached_property_slots():
+    class Container:
+
+        __slots__ = ('calls', '_cached_value')
+
+        def __init__(self):
+            self.calls = 0
+
+        @cached_property
+        def _value(self):
+            self.calls += 1
+            return self.calls
+
+    container = Container()
+
+    assert container._value == 1
+    assert container._value == 1
+    assert container._cached_value == 1
+    # Cache is cleared by deleting slot value
+    del container._cached_value
+    assert container._value == 2